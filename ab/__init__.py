@@ -1,21 +1,73 @@
-"""ABConnect SDK — typed Python client for ABConnect APIs."""
-
-from ab.api.pagination import paginate
-from ab.client import ABConnectAPI
-from ab.exceptions import (
-    ABConnectError,
-    AuthenticationError,
-    ConfigurationError,
-    RequestError,
-    ValidationError,
-)
+"""ABConnect SDK — typed Python client for ABConnect APIs.
+
+The public names below are imported on first access (PEP 562
+``__getattr__``), so ``import ab`` — and every ``ab.*`` submodule import,
+such as the ``ab`` CLI's — does not load the HTTP, auth and pydantic stack
+until something uses it.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from ab.api.columns import to_columns, to_dataframe
+    from ab.api.pagination import iter_items, paginate
+    from ab.async_client import AsyncABConnectAPI
+    from ab.client import ABConnectAPI
+    from ab.exceptions import (
+        ABConnectError,
+        AuthenticationError,
+        ConfigurationError,
+        RequestError,
+        ValidationError,
+    )
+    from ab.factory import ClientFactory
+    from ab.startup import warmup
+
+_EXPORTS = {
+    "ABConnectAPI": "ab.client",
+    "ABConnectError": "ab.exceptions",
+    "AsyncABConnectAPI": "ab.async_client",
+    "AuthenticationError": "ab.exceptions",
+    "ClientFactory": "ab.factory",
+    "ConfigurationError": "ab.exceptions",
+    "RequestError": "ab.exceptions",
+    "ValidationError": "ab.exceptions",
+    "iter_items": "ab.api.pagination",
+    "paginate": "ab.api.pagination",
+    "to_columns": "ab.api.columns",
+    "to_dataframe": "ab.api.columns",
+    "warmup": "ab.startup",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     "ABConnectAPI",
     "ABConnectError",
+    "AsyncABConnectAPI",
     "AuthenticationError",
+    "ClientFactory",
     "ConfigurationError",
     "RequestError",
     "ValidationError",
+    "iter_items",
     "paginate",
+    "to_columns",
+    "to_dataframe",
+    "warmup",
 ]
@@ -1,5 +1,37 @@
-"""API layer — endpoints, models, and routing."""
+"""API layer — endpoints, models, and routing.
 
-from ab.api.pagination import paginate
+Re-exports are resolved on first access, like :mod:`ab`'s, so importing a
+single module such as :mod:`ab.api.route` stays cheap.
+"""
 
-__all__ = ["paginate"]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from ab.api.lazy import LazyList, ModelView
+    from ab.api.pagination import iter_items, paginate
+
+_EXPORTS = {
+    "LazyList": "ab.api.lazy",
+    "ModelView": "ab.api.lazy",
+    "iter_items": "ab.api.pagination",
+    "paginate": "ab.api.pagination",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = ["LazyList", "ModelView", "iter_items", "paginate"]
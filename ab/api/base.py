@@ -2,16 +2,102 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
+import json
 import logging
 import re
-from typing import Any, Optional, Tuple, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
+from pydantic import TypeAdapter, ValidationError
+from typing_extensions import TypedDict
+
+from ab.api.download import DEFAULT_CHUNK_SIZE, Destination, save
+from ab.api.lazy import LazyList, ModelView, decode_json, lazy_enabled
 from ab.api.route import Route
+from ab.api.streaming import AsyncItemStream, ItemStream, streaming_enabled
+from ab.api.trusted import trusted_enabled, trusted_validator
 from ab.http import HttpClient
 
 logger = logging.getLogger(__name__)
 
 _LIST_RE = re.compile(r"^List\[(\w+)]$")
+_PASSTHROUGH_TYPES = ("bytes", "str", "int", "bool")
+
+
+def _parse_type_string(type_str: str) -> Tuple[bool, str]:
+    m = _LIST_RE.match(type_str)
+    if m:
+        return True, m.group(1)
+    return False, type_str
+
+
+@functools.lru_cache(maxsize=None)
+def _model_class(name: str) -> Type:
+    from ab.api import models
+
+    return getattr(models, name)
+
+
+@functools.lru_cache(maxsize=None)
+def _response_adapter(type_str: str) -> Optional[TypeAdapter]:
+    """Compile a route's ``response_model`` string once into a :class:`TypeAdapter`.
+
+    Returns ``None`` for types that are passed through uncast.
+    """
+    is_list, name = _parse_type_string(type_str)
+    if name in _PASSTHROUGH_TYPES:
+        return None
+    model_cls = _model_class(name)
+    return TypeAdapter(List[model_cls] if is_list else model_cls)
+
+
+@functools.lru_cache(maxsize=None)
+def _page_adapter(item_model: str) -> TypeAdapter:
+    """Adapter for a paginated envelope whose ``items`` are *item_model* instances.
+
+    Unknown envelope keys are ignored, as :meth:`BaseEndpoint._cast_page` does.
+    """
+    envelope = TypedDict(  # type: ignore[misc]
+        f"_{item_model}Page",
+        {
+            "items": List[_model_class(item_model)],
+            "pageNumber": int,
+            "totalPages": int,
+            "totalItems": int,
+            "hasPreviousPage": bool,
+            "hasNextPage": bool,
+        },
+        total=False,
+    )
+    return TypeAdapter(envelope)
+
+
+def _adapter(type_str: str) -> Any:
+    """:func:`_response_adapter`, or inside ``api.trusted()`` its unvalidated counterpart."""
+    if not trusted_enabled():
+        return _response_adapter(type_str)
+    is_list, name = _parse_type_string(type_str)
+    if name in _PASSTHROUGH_TYPES:
+        return None
+    return trusted_validator(_model_class(name), "list" if is_list else "model")
+
+
+def _page_validator(item_model: str) -> Any:
+    """:func:`_page_adapter`, or inside ``api.trusted()`` its unvalidated counterpart."""
+    if trusted_enabled():
+        return trusted_validator(_model_class(item_model), "page")
+    return _page_adapter(item_model)
+
+
+class _Decoded:
+    """A response the transport already validated from bytes (see ``_json_decoder``)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
 
 
 class BaseEndpoint:
@@ -29,19 +115,13 @@ class BaseEndpoint:
     # ------------------------------------------------------------------
 
     def _resolve_model(self, name: str) -> Type:
-        """Lazily resolve a model name string to its class."""
-        from ab.api import models
-
-        is_list, inner = self._parse_type_string(name)
-        cls = getattr(models, inner)
-        return cls
+        """Lazily resolve a model name string to its class (cached)."""
+        is_list, inner = _parse_type_string(name)
+        return _model_class(inner)
 
     @staticmethod
     def _parse_type_string(type_str: str) -> Tuple[bool, str]:
-        m = _LIST_RE.match(type_str)
-        if m:
-            return True, m.group(1)
-        return False, type_str
+        return _parse_type_string(type_str)
 
     @staticmethod
     def _unwrap_list_from_dict(
@@ -83,22 +163,40 @@ class BaseEndpoint:
         )
         return response[key]
 
-    def _request(
-        self, route: Route, *, client: Optional[HttpClient] = None, **kwargs: Any
-    ) -> Any:
-        """Dispatch a :class:`Route` through the HTTP client.
+    @staticmethod
+    def _then(result: Any, fn: Callable[[Any], Any]) -> Any:
+        """Apply *fn* to *result*, deferring until awaited when it is awaitable.
+
+        Lets one endpoint method body serve both transports: on the sync
+        :class:`~ab.http.HttpClient` *fn* runs immediately, while on
+        :class:`~ab.async_http.AsyncHttpClient` a coroutine is returned that
+        awaits *result* first. If *fn* itself returns an awaitable (a chained
+        call), that is awaited too.
+        """
+        if not inspect.isawaitable(result):
+            return fn(result)
 
-        Args:
-            route: The route to dispatch.
-            client: Override the default client for this request.  Used by
-                endpoints that span multiple API surfaces (e.g. Jobs).
-            **kwargs: Forwarded to :meth:`HttpClient.request`.
+        async def _chain() -> Any:
+            value = fn(await result)
+            if inspect.isawaitable(value):
+                value = await value
+            return value
 
-        Handles:
-        - request model validation (if route.request_model is set and
-          ``json`` is in kwargs)
-        - response model casting (single or ``List[Model]``)
-        """
+        return _chain()
+
+    @staticmethod
+    def _gather(results: List[Any]) -> Any:
+        """Collect per-item results into a list, concurrently when awaitable."""
+        if not any(inspect.isawaitable(r) for r in results):
+            return results
+
+        async def _all() -> List[Any]:
+            return list(await asyncio.gather(*results))
+
+        return _all()
+
+    def _prepare_kwargs(self, route: Route, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate outbound body/query params and apply route-level flags."""
         # Validate outbound body
         if "json" in kwargs and route.request_model:
             model_cls = self._resolve_model(route.request_model)
@@ -113,12 +211,120 @@ class BaseEndpoint:
             if hasattr(model_cls, "check"):
                 kwargs["params"] = model_cls.check(params)
 
-        target = client or self._client
         if route.auth_optional:
             kwargs.setdefault("auth_optional", True)
+        if route.cache_ttl is not None:
+            kwargs.setdefault("cache_ttl", route.cache_ttl)
+        return kwargs
+
+    def _request(
+        self, route: Route, *, client: Optional[HttpClient] = None, **kwargs: Any
+    ) -> Any:
+        """Dispatch a :class:`Route` through the HTTP client.
+
+        Args:
+            route: The route to dispatch.
+            client: Override the default client for this request.  Used by
+                endpoints that span multiple API surfaces (e.g. Jobs).
+            **kwargs: Forwarded to :meth:`HttpClient.request`.
+
+        Handles:
+        - request model validation (if route.request_model is set and
+          ``json`` is in kwargs)
+        - response model casting (single or ``List[Model]``)
+        - inside ``api.streaming()``, ``List[Model]`` routes return an item
+          iterator over the streamed body (see :mod:`ab.api.streaming`)
+
+        When the client is an :class:`~ab.async_http.AsyncHttpClient` the
+        return value is a coroutine resolving to the same cast result.
+        """
+        kwargs = self._prepare_kwargs(route, kwargs)
+        target = client or self._client
+        if streaming_enabled() and self._streams(route):
+            kwargs.pop("cache_ttl", None)
+            response = target.request(route.method, route.path, stream=True, **kwargs)
+            return self._then(response, lambda resp: self._stream_response(route, resp))
+        # Real transports validate straight from the body bytes (or, for lazy
+        # views, only parse them); duck-typed clients (test doubles) keep the
+        # decoded-JSON contract.
+        if isinstance(target, HttpClient) and "decode" not in kwargs:
+            decoder = decode_json if lazy_enabled() else self._json_decoder(route)
+            if decoder is not None:
+                kwargs["decode"] = decoder
         response = target.request(route.method, route.path, **kwargs)
+        return self._then(response, lambda resp: self._finish_response(route, resp))
+
+    @staticmethod
+    def _streams(route: Route) -> bool:
+        """Whether *route* returns ``List[Model]`` and so can be streamed item by item."""
+        if route.response_model is None:
+            return False
+        is_list, model_name = _parse_type_string(route.response_model)
+        return is_list and model_name not in _PASSTHROUGH_TYPES
+
+    def _stream_response(self, route: Route, response: Any) -> Any:
+        """Wrap a streamed list response in an :mod:`ab.api.streaming` item iterator."""
+        if response is None or isinstance(response, (list, dict)):
+            # duck-typed clients (test doubles) hand back decoded JSON
+            return iter(self._cast_response(route, response) or ())
+        _, model_name = _parse_type_string(route.response_model)
+        if lazy_enabled():
+            model_cls = _model_class(model_name)
+
+            def decode(raw: bytes) -> Any:
+                value = decode_json(raw)
+                return ModelView(model_cls, value) if isinstance(value, dict) else value
+        else:
+            decode = _adapter(model_name).validate_json
+        stream_cls = AsyncItemStream if inspect.iscoroutinefunction(getattr(response, "aclose", None)) else ItemStream
+        return stream_cls(response, decode, model_name=model_name, path=route.path)
+
+    def _download(
+        self,
+        route: Route,
+        dest: Destination,
+        *,
+        filename: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        client: Optional[HttpClient] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Dispatch a binary :class:`Route`, streaming its body to *dest*.
 
-        # Cast response to model(s)
+        Returns a :class:`~ab.api.download.Download` (a coroutine resolving
+        to one on the async client); see :mod:`ab.api.download`.
+        """
+        kwargs = self._prepare_kwargs(route, kwargs)
+        kwargs.pop("cache_ttl", None)
+        target = client or self._client
+        response = target.request(route.method, route.path, stream=True, **kwargs)
+        return self._then(response, lambda resp: save(resp, dest, filename, chunk_size=chunk_size))
+
+    def _json_decoder(self, route: Route) -> Optional[Callable[[bytes], _Decoded]]:
+        """Return a bytes → model(s) decoder for *route*, or ``None`` if uncast."""
+        if route.response_model is None:
+            return None
+        adapter = _adapter(route.response_model)
+        if adapter is None:
+            return None
+
+        def decode(body: bytes) -> _Decoded:
+            try:
+                return _Decoded(adapter.validate_json(body))
+            except ValidationError:
+                # Shapes the adapter cannot take directly (e.g. a list wrapped
+                # in a dict) — and genuine errors, re-raised by the slow path.
+                return _Decoded(self._cast_response(route, json.loads(body)))
+
+        return decode
+
+    def _finish_response(self, route: Route, response: Any) -> Any:
+        if isinstance(response, _Decoded):
+            return response.value
+        return self._cast_response(route, response)
+
+    def _cast_response(self, route: Route, response: Any) -> Any:
+        """Cast a decoded response to the route's response model(s)."""
         if route.response_model is None:
             return response
 
@@ -130,13 +336,16 @@ class BaseEndpoint:
         if route.response_model == "bytes":
             return response
 
-        is_list, model_name = self._parse_type_string(route.response_model)
+        is_list, model_name = _parse_type_string(route.response_model)
 
         # Primitive types
         if model_name in ("str", "int", "bool"):
             return response
 
-        model_cls = self._resolve_model(model_name)
+        adapter = _adapter(route.response_model)
+
+        if lazy_enabled():
+            return self._lazy_response(route, response, is_list, model_name)
 
         if is_list:
             if isinstance(response, list):
@@ -153,35 +362,70 @@ class BaseEndpoint:
                     route.path,
                 )
                 return response
-            return [model_cls.model_validate(item) for item in items]
+            return adapter.validate_python(items)
         else:
-            return model_cls.model_validate(response)
+            return adapter.validate_python(response)
+
+    def _lazy_response(self, route: Route, response: Any, is_list: bool, model_name: str) -> Any:
+        """Wrap a decoded payload in :mod:`ab.api.lazy` views instead of building models."""
+        model_cls = _model_class(model_name)
+        if is_list:
+            items = response
+            if isinstance(response, dict):
+                items = self._unwrap_list_from_dict(response, model_name, route.path)
+            return LazyList(model_cls, items) if isinstance(items, list) else items
+        return ModelView(model_cls, response) if isinstance(response, dict) else response
 
     def _paginated_request(self, route: Route, item_model: str, **kwargs: Any) -> Any:
         """Dispatch a route expecting a PaginatedList response."""
-        from ab.api.models.shared import PaginatedList
+        kwargs = self._prepare_kwargs(route, kwargs)
+        if isinstance(self._client, HttpClient) and "decode" not in kwargs:
+            kwargs["decode"] = decode_json if lazy_enabled() else self._page_decoder(item_model)
+        response = self._client.request(route.method, route.path, **kwargs)
+        return self._then(
+            response,
+            lambda resp: resp.value if isinstance(resp, _Decoded) else self._cast_page(resp, item_model),
+        )
 
-        # Validate outbound query params (mirrors _request logic)
-        if "params" in kwargs and route.params_model:
-            model_cls = self._resolve_model(route.params_model)
-            params = kwargs["params"]
-            if hasattr(model_cls, "check"):
-                kwargs["params"] = model_cls.check(params)
+    def _page_decoder(self, item_model: str) -> Callable[[bytes], _Decoded]:
+        """Return a bytes → :class:`PaginatedList` decoder for *item_model* pages."""
+        adapter = _page_validator(item_model)
 
-        if route.auth_optional:
-            kwargs.setdefault("auth_optional", True)
-        response = self._client.request(route.method, route.path, **kwargs)
+        def decode(body: bytes) -> _Decoded:
+            try:
+                page = adapter.validate_json(body)
+            except ValidationError:
+                # Non-dict bodies and genuine errors take the dict path
+                return _Decoded(self._cast_page(json.loads(body), item_model))
+            return _Decoded(self._page(page, page.get("items", [])))
+
+        return decode
+
+    def _cast_page(self, response: Any, item_model: str) -> Any:
+        """Build a :class:`PaginatedList` from a decoded page payload."""
         if response is None:
             return None
 
-        model_cls = self._resolve_model(item_model)
-        items = [model_cls.model_validate(item) for item in response.get("items", [])]
+        raw_items = response.get("items", [])
+        if lazy_enabled() and isinstance(raw_items, list):
+            items: Any = LazyList(_model_class(item_model), raw_items)
+        else:
+            items = _adapter(f"List[{item_model}]").validate_python(raw_items)
+        return self._page(response, items)
+
+    @staticmethod
+    def _page(response: Dict[str, Any], items: List[Any]) -> Any:
+        """Wrap validated *items* with the envelope fields of *response*."""
+        from ab.api.models.shared import PaginatedList
 
-        return PaginatedList(
-            items=items,
+        envelope = dict(
             page_number=response.get("pageNumber", 0),
             total_pages=response.get("totalPages", 0),
             total_items=response.get("totalItems", 0),
             has_previous_page=response.get("hasPreviousPage", False),
             has_next_page=response.get("hasNextPage", False),
         )
+        if isinstance(items, LazyList):
+            # Validation would copy the view into a plain list of views
+            return PaginatedList.model_construct(items=items, **envelope)
+        return PaginatedList(items=items, **envelope)
@@ -0,0 +1,240 @@
+"""Columnar export of list and paginated responses.
+
+:func:`to_columns` turns a list result, a :class:`~ab.api.models.shared.PaginatedList`
+or a stream of pages (e.g. :func:`~ab.api.pagination.paginate`) into one
+column per model field, without a ``model_dump()`` per row::
+
+    from ab import paginate, to_columns, to_dataframe
+
+    cols = to_columns(api.reports.sales(data=criteria))
+    with api.lazy():
+        df = to_dataframe(paginate(api.catalog.list, page_size=500, prefetch=4))
+
+Columns are sized up front from ``total_items`` (or ``size_hint``) and filled
+page by page, so only one page of responses is alive at a time. ``float``
+fields are packed into ``array('d')`` buffers (missing values become ``NaN``);
+every other field is a ``list``. Under ``api.lazy()`` rows arrive as decoded
+JSON and each column is validated in one call with the field's own type, so no
+model object is ever built; nested models and fields with custom validators
+keep their raw JSON value.
+
+:func:`to_numpy` and :func:`to_dataframe` need ``numpy`` / ``pandas``
+(``pip install "annex-abconnect[pandas]"``).
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import types
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+from ab.api.lazy import LazyList, ModelView, _adapter_config, _fields
+from ab.api.models.shared import PaginatedList
+from ab.exceptions import ConfigurationError
+
+_NAN = math.nan
+
+Columns = Dict[str, MutableSequence[Any]]
+
+
+def _scalar(annotation: Any) -> Any:
+    """Strip ``Optional[...]`` from *annotation*."""
+    if get_origin(annotation) is Union or get_origin(annotation) is types.UnionType:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+@functools.lru_cache(maxsize=None)
+def _column_adapter(model: Type[BaseModel], name: str) -> Optional[TypeAdapter]:
+    """A ``List[<field type>]`` adapter for validating one raw column, or ``None`` to keep raw values."""
+    spec = _fields(model)[name]
+    if spec.kind != "value" or spec.target is None:
+        return None
+    return TypeAdapter(List[model.model_fields[name].annotation], config=_adapter_config(model))
+
+
+def _chunks(result: Any) -> Iterator[Tuple[Sequence[Any], Optional[int], Optional[Type[BaseModel]]]]:
+    """Yield ``(rows, total_hint, model)`` for a single result or each page of a stream."""
+    if isinstance(result, PaginatedList):
+        items = result.items
+        yield items, result.total_items or None, items._model if isinstance(items, LazyList) else None
+        return
+    if isinstance(result, LazyList):
+        yield result, len(result), result._model
+        return
+    if isinstance(result, (list, tuple)) and not (result and isinstance(result[0], (PaginatedList, LazyList, list))):
+        yield result, len(result), None
+        return
+    for page in result:
+        yield from _chunks(page)
+
+
+def _pick(row: Dict[str, Any], keys: Sequence[str]) -> Any:
+    for key in keys:
+        if key in row:
+            return row[key]
+    return None
+
+
+def _model_of(rows: Sequence[Any]) -> Optional[Type[BaseModel]]:
+    for row in rows:
+        if isinstance(row, ModelView):
+            return row.model_class
+        if isinstance(row, BaseModel):
+            return type(row)
+    return None
+
+
+class _Builder:
+    def __init__(self, model: Type[BaseModel], fields: Optional[Sequence[str]], by_alias: bool, size: int) -> None:
+        specs = model.model_fields
+        names = list(fields) if fields is not None else list(specs)
+        unknown = [n for n in names if n not in specs]
+        if unknown:
+            raise ValueError(f"{model.__name__} has no field(s) {', '.join(unknown)}")
+        self.model = model
+        self.names = names
+        self.keys = {n: _fields(model)[n].keys for n in names}
+        self.floats = {n for n in names if _scalar(specs[n].annotation) is float}
+        self.labels = {n: (specs[n].alias or n) if by_alias else n for n in names}
+        self.columns: Columns = {n: self._empty(n, size) for n in names}
+        self.length = 0
+
+    def _empty(self, name: str, size: int) -> MutableSequence[Any]:
+        return array("d", [_NAN]) * size if name in self.floats else [None] * size
+
+    def extend(self, rows: Sequence[Any]) -> None:
+        if not rows:
+            return
+        if isinstance(rows, LazyList):
+            raw = rows.raw
+        else:
+            raw = [row.raw if isinstance(row, ModelView) and row._full is None else row for row in rows]
+        start, end = self.length, self.length + len(raw)
+        decoded = all(isinstance(row, dict) for row in raw)
+        for name in self.names:
+            if decoded:
+                values = self._from_raw(raw, name)
+            else:
+                values = [(r.to_model() if isinstance(r, ModelView) else r).__dict__.get(name) for r in raw]
+            column = self.columns[name]
+            if end > len(column):
+                column.extend(self._empty(name, end - len(column)))
+            if name in self.floats:
+                values = array("d", [_NAN if v is None else v for v in values])
+            column[start:end] = values
+        self.length = end
+
+    def _from_raw(self, rows: List[Dict[str, Any]], name: str) -> List[Any]:
+        key, *fallbacks = self.keys[name]
+        if fallbacks:
+            values = [row[key] if key in row else _pick(row, fallbacks) for row in rows]
+        else:
+            values = [row.get(key) for row in rows]
+        adapter = _column_adapter(self.model, name)
+        return adapter.validate_python(values) if adapter is not None else values
+
+    def finish(self) -> Columns:
+        for column in self.columns.values():
+            del column[self.length:]
+        return {self.labels[n]: self.columns[n] for n in self.names}
+
+
+def to_columns(
+    result: Any,
+    fields: Optional[Sequence[str]] = None,
+    *,
+    model: Optional[Type[BaseModel]] = None,
+    by_alias: bool = False,
+    size_hint: Optional[int] = None,
+) -> Columns:
+    """Convert a list result, a page or a stream of pages into columns.
+
+    Args:
+        result: A ``list`` of models or views, a :class:`LazyList`, a
+            :class:`PaginatedList`, or an iterable of any of these (one per
+            page).
+        fields: Field names to export, in order (default: every field).
+        model: Model class for rows given as plain dicts.
+        by_alias: Name columns by the API's JSON keys instead of field names.
+        size_hint: Expected total rows, when the result does not report
+            ``total_items``.
+
+    Returns:
+        ``{column: values}``; empty when there are no rows and no *model*.
+    """
+    builder: Optional[_Builder] = None
+    for rows, total, chunk_model in _chunks(result):
+        if builder is None:
+            row_model = model or chunk_model or _model_of(rows)
+            if row_model is None:
+                if rows:
+                    raise ValueError("to_columns needs model= for rows given as plain dicts")
+                continue
+            builder = _Builder(row_model, fields, by_alias, size_hint or total or len(rows))
+        builder.extend(rows)
+    if builder is None:
+        return _Builder(model, fields, by_alias, 0).finish() if model is not None else {}
+    return builder.finish()
+
+
+def to_numpy(result: Any, fields: Optional[Sequence[str]] = None, **kwargs: Any) -> Dict[str, Any]:
+    """Like :func:`to_columns`, with every column as a NumPy array.
+
+    ``float`` columns are zero-copy ``float64`` views, ``int`` / ``bool``
+    columns without missing values become native arrays, everything else an
+    ``object`` array.
+    """
+    try:
+        import numpy as np
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ConfigurationError(
+            "to_numpy requires numpy; install it with 'pip install \"annex-abconnect[pandas]\"'"
+        ) from exc
+    arrays: Dict[str, Any] = {}
+    for label, column in to_columns(result, fields, **kwargs).items():
+        if isinstance(column, array):
+            arrays[label] = np.frombuffer(column, dtype=np.float64)
+        elif column and all(type(v) is int for v in column):
+            arrays[label] = np.asarray(column, dtype=np.int64)
+        elif column and all(type(v) is bool for v in column):
+            arrays[label] = np.asarray(column, dtype=np.bool_)
+        else:
+            values = np.empty(len(column), dtype=object)
+            values[:] = column
+            arrays[label] = values
+    return arrays
+
+
+def to_dataframe(result: Any, fields: Optional[Sequence[str]] = None, **kwargs: Any) -> Any:
+    """Like :func:`to_columns`, as a :class:`pandas.DataFrame` (one column per field).
+
+    ``pyarrow.Table.from_pandas`` turns the frame into an Arrow table.
+    """
+    try:
+        import pandas as pd
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ConfigurationError(
+            "to_dataframe requires pandas; install it with 'pip install \"annex-abconnect[pandas]\"'"
+        ) from exc
+    return pd.DataFrame(to_numpy(result, fields, **kwargs), copy=False)
+
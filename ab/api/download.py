@@ -0,0 +1,166 @@
+"""Stream binary responses (documents, labels, form PDFs) to disk or a stream.
+
+Binary routes normally return the whole body as ``bytes`` — form routes as
+``{filename: bytes}`` — so a batch of large PDFs is held in memory at once.
+Passing ``dest=`` to those methods instead writes the body in chunks as it
+arrives, so memory stays constant whatever the file size:
+
+    >>> api.documents.get(doc.path, dest="archive/")
+    Download(filename='label.pdf', path=PosixPath('archive/label.pdf'), size=48213, ...)
+    >>> with open("bol.pdf", "wb") as fh:
+    ...     api.jobs.form.bill_of_lading(2000000, dest=fh)
+
+*dest* is a file path, an existing directory (the file is named after the
+document), or any binary object with ``write()`` — an open file, a socket
+file, ``sys.stdout.buffer``. Files are written to a temporary name and renamed
+into place once complete, so an interrupted download never leaves a partial
+file behind. Each download reports its size, the server's ``Content-Length``
+and a SHA-256 of the body; a body shorter than its ``Content-Length`` raises
+:class:`~ab.exceptions.RequestError`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import inspect
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Awaitable, Iterator, Optional, Union
+
+from ab.exceptions import RequestError
+
+#: Where a download goes: a file path, an existing directory, or a binary writable.
+Destination = Union[str, Path, IO[bytes]]
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+@dataclass(frozen=True)
+class Download:
+    """Outcome of a streamed download.
+
+    Attributes:
+        filename: The file name the SDK gave the body (``bol_2000000.pdf``).
+        path: Where it was written, or ``None`` for a stream destination.
+        size: Bytes written.
+        content_length: The server's ``Content-Length``, when sent.
+        content_type: The response ``Content-Type``.
+        sha256: Hex SHA-256 of the bytes written.
+    """
+
+    filename: str
+    path: Optional[Path]
+    size: int
+    content_length: Optional[int]
+    content_type: Optional[str]
+    sha256: str
+
+
+class _Sink:
+    """Write chunks to *dest*, hashing and counting them on the way."""
+
+    def __init__(self, dest: Destination, filename: str) -> None:
+        self.filename = filename
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self.path: Optional[Path] = None
+        self._tmp: Optional[str] = None
+        if isinstance(dest, (str, Path)):
+            path = Path(dest)
+            self.path = path / filename if path.is_dir() else path
+            fd, self._tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".part")
+            self._fh: IO[bytes] = os.fdopen(fd, "wb")
+        else:
+            self._fh = dest
+
+    def write(self, chunk: bytes) -> None:
+        if chunk:
+            self._fh.write(chunk)
+            self._digest.update(chunk)
+            self.size += len(chunk)
+
+    def commit(self, headers: Any) -> Download:
+        """Check the body against ``Content-Length`` and move the file into place."""
+        length = headers.get("Content-Length")
+        content_length = int(length) if length and length.isdigit() else None
+        # Length checks only hold for identity-encoded bodies; gzip is
+        # decoded on the fly and the counts differ.
+        if content_length is not None and not headers.get("Content-Encoding") and self.size != content_length:
+            raise RequestError(0, f"{self.filename}: received {self.size} of {content_length} bytes")
+        if self._tmp is not None:
+            self._fh.close()
+            os.replace(self._tmp, self.path)
+            self._tmp = None
+        else:
+            with contextlib.suppress(AttributeError, OSError):
+                self._fh.flush()
+        return Download(
+            filename=self.filename,
+            path=self.path,
+            size=self.size,
+            content_length=content_length,
+            content_type=headers.get("Content-Type"),
+            sha256=self._digest.hexdigest(),
+        )
+
+    def discard(self) -> None:
+        if self._tmp is not None:
+            self._fh.close()
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._tmp)
+            self._tmp = None
+
+
+def _headers(response: Any) -> Any:
+    return {} if response is None else response.headers
+
+
+def save(
+    response: Any, dest: Destination, filename: str, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Union[Download, Awaitable[Download]]:
+    """Write a streamed response body to *dest* and close the response.
+
+    *response* is what ``HttpClient.request(..., stream=True)`` returns:
+    a :class:`requests.Response`, an ``httpx`` response (the result is then
+    awaitable), or ``None`` for a 204.
+    """
+    if response is not None and inspect.iscoroutinefunction(getattr(response, "aclose", None)):
+        return _save_async(response, dest, filename, chunk_size)
+    sink: Optional[_Sink] = None
+    try:
+        # Opened inside the ``try`` so a bad destination still releases the connection.
+        sink = _Sink(dest, filename)
+        for chunk in iter_chunks(response, chunk_size):
+            sink.write(chunk)
+        return sink.commit(_headers(response))
+    finally:
+        if sink is not None:
+            sink.discard()
+        if response is not None:
+            response.close()
+
+
+async def _save_async(response: Any, dest: Destination, filename: str, chunk_size: int) -> Download:
+    sink: Optional[_Sink] = None
+    try:
+        sink = _Sink(dest, filename)
+        async for chunk in response.aiter_bytes(chunk_size):
+            sink.write(chunk)
+        return sink.commit(response.headers)
+    finally:
+        if sink is not None:
+            sink.discard()
+        await response.aclose()
+
+
+def iter_chunks(response: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield a streamed ``requests`` response body in chunks, closing it at the end."""
+    if response is None:
+        return
+    try:
+        yield from response.iter_content(chunk_size)
+    finally:
+        response.close()
@@ -141,7 +141,7 @@ class CatalogEndpoint(BaseEndpoint):
 
         Docs: https://ab-sdk.readthedocs.io/en/latest/api/catalog/delete.html
         """
-        self._request(_DELETE.bind(id=catalog_id))
+        return self._request(_DELETE.bind(id=catalog_id))
 
     def bulk_insert(self, *, data: BulkInsertRequest | dict) -> None:
         """POST /Bulk/insert.
@@ -45,7 +45,7 @@ _AVAILABLE = Route("GET", "/companies/availableByCurrentUser", response_model="L
 
 # Brands (008)
 _GET_BRANDS = Route("GET", "/companies/brands", response_model="List[CompanyBrand]")
-_GET_BRANDS_TREE = Route("GET", "/companies/brandstree", response_model="List[BrandTree]")
+_GET_BRANDS_TREE = Route("GET", "/companies/brandstree", response_model="List[BrandTree]", cache_ttl=3600)
 
 # Geo Settings (008)
 _GET_GEO_AREA_COMPANIES = Route("GET", "/companies/geoAreaCompanies")
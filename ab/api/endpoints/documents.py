@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import inspect
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Union
+from typing import IO, TYPE_CHECKING, Awaitable, Union
 
 from ab.api.base import BaseEndpoint
+from ab.api.download import Destination, Download
 from ab.api.models.documents import DocumentUploadRequest, DocumentUploadResponse
 from ab.api.models.enums import DocumentType
 from ab.api.route import Route
 
 if TYPE_CHECKING:
+    from ab.api.helpers.mirror import MirrorReport
+    from ab.api.helpers.uploads import BulkUpload, MultipartBody, UploadManifest
     from ab.api.models.documents import Document, DocumentUpdateRequest
 
 _UPLOAD = Route(
@@ -38,6 +42,11 @@ def _file_part(file: FileSource, filename: str | None) -> tuple[str, object]:
     return filename, file
 
 
+def _basename(doc_path: str) -> str:
+    """File name for a downloaded document: the last segment of its storage path."""
+    return doc_path.replace("\\", "/").rstrip("/").rsplit("/", 1)[-1] or "document"
+
+
 class DocumentsEndpoint(BaseEndpoint):
     """Operations on documents (ACPortal API)."""
 
@@ -93,12 +102,27 @@ class DocumentsEndpoint(BaseEndpoint):
         )
         data = form.model_dump(by_alias=True, exclude_none=True)
         part_name, source = _file_part(file_path, filename)
+        owned = isinstance(file_path, (str, Path))
         try:
             files = {"file": (part_name, source, "application/octet-stream")}
-            return self._request(_UPLOAD, files=files, data=data)
-        finally:
-            if isinstance(file_path, (str, Path)):
+            result = self._request(_UPLOAD, files=files, data=data)
+        except BaseException:
+            if owned:
                 source.close()
+            raise
+        if owned and inspect.isawaitable(result):
+            return self._close_after(result, source)
+        if owned:
+            source.close()
+        return result
+
+    @staticmethod
+    async def _close_after(pending: Awaitable[DocumentUploadResponse], source: IO[bytes]) -> DocumentUploadResponse:
+        """Await an async upload, closing the file handle it streams from."""
+        try:
+            return await pending
+        finally:
+            source.close()
 
     def upload_item_photo(
         self,
@@ -158,7 +182,8 @@ class DocumentsEndpoint(BaseEndpoint):
         Returns one :class:`~ab.api.models.documents.DocumentUploadResponse`
         per file, in the same order as ``file_paths`` (always a list, even for
         a single file — unlike the legacy SDK's variable return). Every file is
-        attached to the same ``item_ids``.
+        attached to the same ``item_ids``. On the async client the uploads run
+        concurrently.
 
         Args:
             job_display_id: Job display ID the photos belong to.
@@ -175,7 +200,7 @@ class DocumentsEndpoint(BaseEndpoint):
         """
         if filenames is not None and len(filenames) != len(file_paths):
             raise ValueError("filenames must have one entry per file_paths entry")
-        return [
+        return self._gather([
             self.upload_item_photo(
                 job_display_id=job_display_id,
                 item_ids=item_ids,
@@ -185,7 +210,93 @@ class DocumentsEndpoint(BaseEndpoint):
                 filename=filenames[i] if filenames else None,
             )
             for i, file_path in enumerate(file_paths)
-        ]
+        ])
+
+    def upload_many(
+        self,
+        uploads: list[BulkUpload | tuple],
+        *,
+        max_workers: int = 8,
+        retries: int = 2,
+        manifest: str | Path | UploadManifest | None = None,
+        shared: int = 0,
+        tags: list[str] | None = None,
+    ) -> list[DocumentUploadResponse | BaseException]:
+        """Upload many documents concurrently, streaming each file from disk.
+
+        Each entry is a ``(job_display_id, item_ids, file)`` tuple, optionally
+        followed by ``filename`` and ``document_type`` (default item photo) —
+        see :class:`~ab.api.helpers.uploads.BulkUpload`. Files are sent over a
+        pool of *max_workers* threads without being read into memory, and a
+        file that fails transiently is retried up to *retries* more times.
+
+        With *manifest* (a JSON-lines path), completed uploads are recorded
+        there; running the same batch again after an interruption skips them
+        and returns their recorded responses.
+
+        Synchronous client only.
+
+        Args:
+            uploads: The files to upload. File-like sources must be
+                seekable; a pipe or socket raises :class:`ValueError` before
+                any upload starts.
+            max_workers: Concurrent uploads.
+            retries: Extra attempts per file after a connection error, 408,
+                429 or 503. Other 5xx errors are not retried, since the
+                document may already exist.
+            manifest: Path of the resume manifest (or an
+                :class:`~ab.api.helpers.uploads.UploadManifest`).
+            shared: Sharing bitmask applied to every document.
+            tags: Tags applied to every document.
+
+        Returns:
+            list: One entry per upload, in input order — the
+            :class:`DocumentUploadResponse`, or the exception that upload
+            raised (one failure never aborts the rest).
+        """
+        from ab.api.helpers.uploads import bulk_upload
+
+        return bulk_upload(
+            self, uploads, max_workers=max_workers, retries=retries, manifest=manifest, shared=shared, tags=tags
+        )
+
+    def mirror(
+        self,
+        job_display_ids: list[str | int],
+        root: str | Path,
+        *,
+        max_workers: int = 8,
+        link_jobs: bool = True,
+    ) -> MirrorReport:
+        """Mirror the documents of *job_display_ids* into the directory *root*.
+
+        Lists every job's documents and downloads, concurrently, only those
+        the mirror's SQLite index does not already hold (new documents, a
+        changed storage path, or a missing local copy). Identical content is
+        stored once and linked into each job's folder; documents a job no
+        longer lists are removed. Run it again to pick up changes — see
+        :class:`~ab.api.helpers.mirror.DocumentMirror` for the layout.
+
+        Synchronous client only.
+
+        Args:
+            job_display_ids: Jobs to mirror.
+            root: Mirror directory.
+            max_workers: Concurrent listings and downloads.
+            link_jobs: Populate ``<root>/<job>/<id>_<name>`` links; ``False``
+                keeps only the content-addressed store.
+
+        Returns:
+            MirrorReport: Counts of downloaded, deduplicated, unchanged and
+            removed documents, and any failures.
+        """
+        from ab.api.helpers.mirror import mirror_documents
+
+        return mirror_documents(self, job_display_ids, root, max_workers=max_workers, link_jobs=link_jobs)
+
+    def _upload_body(self, body: MultipartBody) -> DocumentUploadResponse:
+        """``POST /documents`` with a pre-encoded, streamed multipart body."""
+        return self._request(_UPLOAD, data=body, headers={"Content-Type": body.content_type})
 
     def list(self, job_display_id: str | int) -> list[Document]:
         """GET /documents/list
@@ -196,31 +307,40 @@ class DocumentsEndpoint(BaseEndpoint):
         """
         return self._request(_LIST, params=dict(job_display_id=str(job_display_id)))
 
-    def get(self, doc_path: str) -> bytes:
+    def get(self, doc_path: str, *, dest: Destination | None = None) -> bytes | Download:
         """``GET /documents/get/{docPath}`` — download a document as raw bytes.
 
         Args:
             doc_path: The document's storage path, as returned in
                 ``Document.path`` by :meth:`list` (may contain ``/``
                 separators).
+            dest: Stream the body to this file path, directory or binary
+                stream instead of returning it; a
+                :class:`~ab.api.download.Download` is returned.
 
         Response model: bytes
 
         Docs: https://ab-sdk.readthedocs.io/en/latest/api/documents/get.html
         """
+        if dest is not None:
+            return self._download(_GET.bind(docPath=doc_path), dest, filename=_basename(doc_path))
         return self._request(_GET.bind(docPath=doc_path))
 
-    def get_thumbnail(self, doc_path: str) -> bytes:
+    def get_thumbnail(self, doc_path: str, *, dest: Destination | None = None) -> bytes | Download:
         """``GET /documents/get/thumbnail/{docPath}`` — document thumbnail bytes.
 
         Args:
             doc_path: The document's storage path, as returned in ``Document.path``
                 (or ``Document.thumbnail_path``) by :meth:`list`.
+            dest: Stream the thumbnail to a file path, directory or binary
+                stream; a :class:`~ab.api.download.Download` is returned.
 
         Response model: bytes
 
         Docs: https://ab-sdk.readthedocs.io/en/latest/api/documents/get_thumbnail.html
         """
+        if dest is not None:
+            return self._download(_GET_THUMBNAIL.bind(docPath=doc_path), dest, filename=_basename(doc_path))
         return self._request(_GET_THUMBNAIL.bind(docPath=doc_path))
 
     def hide(self, doc_id: int) -> None:
@@ -7,6 +7,7 @@ This file handles two API surfaces. ACPortal routes use the default
 
 from __future__ import annotations
 
+import inspect
 import warnings
 from typing import TYPE_CHECKING
 
@@ -209,6 +210,7 @@ class JobsEndpoint(BaseEndpoint):
         self._abc_client = abc_client
         self._resolver = resolver
 
+        from ab.api.helpers import SyncOnly
         from ab.api.helpers.agent import AgentHelpers as _AgentHelpers
         from ab.api.helpers.items import JobItemsHelpers as _JobItemsHelpers
         from ab.api.helpers.timeline import TimelineHelpers as _TimelineHelpers
@@ -216,6 +218,10 @@ class JobsEndpoint(BaseEndpoint):
         self.agent: AgentHelpers = _AgentHelpers(self, self._resolver)
         self.tasks: TimelineHelpers = _TimelineHelpers(self)
         self.items: JobItemsHelpers = _JobItemsHelpers(self)
+        if inspect.iscoroutinefunction(getattr(acportal_client, "request", None)):
+            # Get-then-set helpers chain blocking calls; fail loudly on the async client.
+            self.tasks = SyncOnly("api.jobs.tasks")  # type: ignore[assignment]
+            self.items = SyncOnly("api.jobs.items")  # type: ignore[assignment]
 
         # Subgroups (instances share the parent's HttpClient).
         self.note = JobNoteEndpoint(acportal_client)
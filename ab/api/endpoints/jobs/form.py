@@ -32,10 +32,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import IO
+
+    from ab.api.download import Destination, Download
     from ab.api.models.forms import FormsShipmentPlan
 
 from ab.api.base import BaseEndpoint
 from ab.api.route import Route
+from ab.api.streaming import buffered_responses
 
 _INVOICE = Route("GET", "/job/{jobDisplayId}/form/invoice", params_model="FormTypeParams", response_model="bytes")
 _INVOICE_EDITABLE = Route("GET", "/job/{jobDisplayId}/form/invoice/editable", response_model="bytes")
@@ -59,17 +64,31 @@ _CC_AUTH = Route("GET", "/job/{jobDisplayId}/form/credit-card-authorization", re
 _USAR = Route("GET", "/job/{jobDisplayId}/form/usar", params_model="FormTypeParams", response_model="bytes")
 _USAR_EDITABLE = Route("GET", "/job/{jobDisplayId}/form/usar/editable", response_model="bytes")
 
+#: Shipment-plan transport types each BOL helper picks from, in preference order.
+_PLAN_TRANSPORT_TYPES = {"bol": ("LTL", "Delivery"), "hbl": ("House",), "pbl": ("PickUp",)}
+
 
 class JobFormEndpoint(BaseEndpoint):
     """Job-scoped form generation (ACPortal API).
 
     Most methods return ``{filename: bytes}`` (PDF content). Use
     :meth:`shipments` to get JSON shipment plan data for BOL selection.
+
+    Every PDF method also takes ``dest=`` — a file path, directory or binary
+    stream — to stream the PDF there in chunks instead of returning it; it
+    then returns a :class:`~ab.api.download.Download` (see
+    :mod:`ab.api.download`). A directory gets the same file name the dict
+    form uses.
     """
 
-    def _pdf(self, route: Route, job_display_id: int, name: str, **kw: Any) -> dict[str, bytes]:
+    def _pdf(
+        self, route: Route, job_display_id: int, name: str, *, dest: Destination | None = None, **kw: Any
+    ) -> dict[str, bytes] | Download:
+        filename = f"{name}_{job_display_id}.pdf"
+        if dest is not None:
+            return self._download(route.bind(jobDisplayId=job_display_id), dest, filename=filename, **kw)
         data = self._request(route.bind(jobDisplayId=job_display_id), **kw)
-        return {f"{name}_{job_display_id}.pdf": data}
+        return self._then(data, lambda content: {filename: content})
 
     # ------------------------------------------------------------------
     # JSON route (shipment-plan discovery)
@@ -90,13 +109,15 @@ class JobFormEndpoint(BaseEndpoint):
     # PDF routes
     # ------------------------------------------------------------------
 
-    def invoice(self, job_display_id: int, *, type: Optional[str] = None) -> dict[str, bytes]:
+    def invoice(
+        self, job_display_id: int, *, type: Optional[str] = None, dest: Destination | None = None
+    ) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/invoice``"""
-        return self._pdf(_INVOICE, job_display_id, "invoice", params=dict(type=type))
+        return self._pdf(_INVOICE, job_display_id, "invoice", dest=dest, params=dict(type=type))
 
-    def invoice_editable(self, job_display_id: int) -> dict[str, bytes]:
+    def invoice_editable(self, job_display_id: int, *, dest: Destination | None = None) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/invoice/editable``"""
-        return self._pdf(_INVOICE_EDITABLE, job_display_id, "invoice_editable")
+        return self._pdf(_INVOICE_EDITABLE, job_display_id, "invoice_editable", dest=dest)
 
     def bill_of_lading(
         self,
@@ -104,103 +125,180 @@ class JobFormEndpoint(BaseEndpoint):
         *,
         shipment_plan_id: Optional[str] = None,
         provider_option_index: Optional[int] = None,
-    ) -> dict[str, bytes]:
+        dest: Destination | None = None,
+    ) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/bill-of-lading``"""
         return self._pdf(
-            _BOL, job_display_id, "bol",
+            _BOL, job_display_id, "bol", dest=dest,
             params=dict(shipment_plan_id=shipment_plan_id, provider_option_index=provider_option_index),
         )
 
-    def packing_slip(self, job_display_id: int) -> dict[str, bytes]:
+    def packing_slip(self, job_display_id: int, *, dest: Destination | None = None) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/packing-slip``"""
-        return self._pdf(_PACKING_SLIP, job_display_id, "packing_slip")
+        return self._pdf(_PACKING_SLIP, job_display_id, "packing_slip", dest=dest)
 
-    def customer_quote(self, job_display_id: int) -> dict[str, bytes]:
+    def customer_quote(self, job_display_id: int, *, dest: Destination | None = None) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/customer-quote``"""
-        return self._pdf(_CUSTOMER_QUOTE, job_display_id, "customer_quote")
+        return self._pdf(_CUSTOMER_QUOTE, job_display_id, "customer_quote", dest=dest)
 
-    def quick_sale(self, job_display_id: int) -> dict[str, bytes]:
+    def quick_sale(self, job_display_id: int, *, dest: Destination | None = None) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/quick-sale``"""
-        return self._pdf(_QUICK_SALE, job_display_id, "quick_sale")
+        return self._pdf(_QUICK_SALE, job_display_id, "quick_sale", dest=dest)
 
-    def operations(self, job_display_id: int, *, ops_type: Optional[str] = None) -> dict[str, bytes]:
+    def operations(
+        self, job_display_id: int, *, ops_type: Optional[str] = None, dest: Destination | None = None
+    ) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/operations``"""
-        return self._pdf(_OPERATIONS, job_display_id, "operations", params=dict(ops_type=ops_type))
+        return self._pdf(_OPERATIONS, job_display_id, "operations", dest=dest, params=dict(ops_type=ops_type))
 
-    def address_label(self, job_display_id: int) -> dict[str, bytes]:
+    def address_label(self, job_display_id: int, *, dest: Destination | None = None) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/address-label``"""
-        return self._pdf(_ADDRESS_LABEL, job_display_id, "address_label")
+        return self._pdf(_ADDRESS_LABEL, job_display_id, "address_label", dest=dest)
 
-    def item_labels(self, job_display_id: int) -> dict[str, bytes]:
+    def item_labels(self, job_display_id: int, *, dest: Destination | None = None) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/item-labels``"""
-        return self._pdf(_ITEM_LABELS, job_display_id, "item_labels")
+        return self._pdf(_ITEM_LABELS, job_display_id, "item_labels", dest=dest)
 
     def packaging_labels(
         self,
         job_display_id: int,
         *,
         shipment_plan_id: Optional[str] = None,
-    ) -> dict[str, bytes]:
+        dest: Destination | None = None,
+    ) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/packaging-labels``"""
         return self._pdf(
-            _PACKAGING_LABELS, job_display_id, "packaging_labels",
+            _PACKAGING_LABELS, job_display_id, "packaging_labels", dest=dest,
             params=dict(shipment_plan_id=shipment_plan_id),
         )
 
-    def packaging_specification(self, job_display_id: int) -> dict[str, bytes]:
+    def packaging_specification(
+        self, job_display_id: int, *, dest: Destination | None = None
+    ) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/packaging-specification``"""
-        return self._pdf(_PACKAGING_SPEC, job_display_id, "packaging_spec")
+        return self._pdf(_PACKAGING_SPEC, job_display_id, "packaging_spec", dest=dest)
 
-    def credit_card_authorization(self, job_display_id: int) -> dict[str, bytes]:
+    def credit_card_authorization(
+        self, job_display_id: int, *, dest: Destination | None = None
+    ) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/credit-card-authorization``"""
-        return self._pdf(_CC_AUTH, job_display_id, "cc_auth")
+        return self._pdf(_CC_AUTH, job_display_id, "cc_auth", dest=dest)
 
-    def usar(self, job_display_id: int, *, type: Optional[str] = None) -> dict[str, bytes]:
+    def usar(
+        self, job_display_id: int, *, type: Optional[str] = None, dest: Destination | None = None
+    ) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/usar``"""
-        return self._pdf(_USAR, job_display_id, "usar", params=dict(type=type))
+        return self._pdf(_USAR, job_display_id, "usar", dest=dest, params=dict(type=type))
 
-    def usar_editable(self, job_display_id: int) -> dict[str, bytes]:
+    def usar_editable(self, job_display_id: int, *, dest: Destination | None = None) -> dict[str, bytes] | Download:
         """``GET /job/{jobDisplayId}/form/usar/editable``"""
-        return self._pdf(_USAR_EDITABLE, job_display_id, "usar_editable")
+        return self._pdf(_USAR_EDITABLE, job_display_id, "usar_editable", dest=dest)
+
+    # ------------------------------------------------------------------
+    # Batch generation
+    # ------------------------------------------------------------------
+
+    def batch(
+        self,
+        job_display_ids: list[int],
+        kinds: list[str],
+        dest: str | Path | IO[bytes],
+        *,
+        max_workers: int = 8,
+        merged: str | Path | IO[bytes] | None = None,
+    ) -> list[Download | BaseException]:
+        """Generate several forms for many jobs concurrently into a ZIP or directory.
+
+        >>> api.jobs.form.batch(job_ids, ["bol", "packing_slip", "item_labels"], "dispatch.zip")
+
+        Each job's shipment plans are listed once and shared by every BOL
+        kind requested for it. PDFs stream to disk as they arrive — into
+        *dest* when it is a directory, or into the archive when *dest* ends
+        in ``.zip`` (or is a binary stream). See :mod:`ab.api.helpers.forms`.
+
+        Synchronous client only.
+
+        Args:
+            job_display_ids: Jobs to generate forms for.
+            kinds: PDF method names of this group (``"bol"``,
+                ``"packing_slip"``, ``"item_labels"``, ...).
+            dest: Output directory, ``.zip`` path or binary stream.
+            max_workers: Concurrent requests.
+            merged: Also write every PDF, in job order, as one PDF here
+                (requires the ``pdf`` extra).
+
+        Returns:
+            list: One entry per distinct ``(job, kind)``, jobs in input order
+            and kinds in the order given — the :class:`~ab.api.download.Download`
+            (named ``<kind>_<job>.pdf``), or the exception raised for that form.
+        """
+        from ab.api.helpers.forms import generate_forms
+
+        return generate_forms(self, job_display_ids, kinds, dest, max_workers=max_workers, merged=merged)
 
     # ------------------------------------------------------------------
     # Convenience helpers (transport-type aware BOL selection)
     # ------------------------------------------------------------------
 
+    def _shipment_plans(self, job_display_id: int) -> list[FormsShipmentPlan]:
+        """:meth:`shipments` as a list even inside ``api.streaming()`` — plans are searched more than once."""
+        with buffered_responses():
+            return self.shipments(job_display_id)
+
     def _find_plan(self, job_display_id: int, *transport_types: str) -> FormsShipmentPlan:
         """Find a shipment plan by transport-type preference order."""
-        plans = self.shipments(job_display_id)
-        for tt in transport_types:
-            for plan in plans:
-                if plan.transport_type == tt:
-                    return plan
-        raise ValueError(f"No shipment plan with transportType in {transport_types}")
-
-    def ops(self, job_display_id: int, *, ops_type: Optional[str] = None) -> dict[str, bytes]:
+        return self._then(self._shipment_plans(job_display_id), lambda plans: _pick_plan(plans, transport_types))
+
+    def _plan_pdf(
+        self, job_display_id: int, name: str, *, dest: Destination | None = None
+    ) -> dict[str, bytes] | Download:
+        """BOL PDF *name* (``bol``/``hbl``/``pbl``/``dbl``), choosing its shipment plan first."""
+        return self._then(
+            self._shipment_plans(job_display_id), lambda plans: self._plan_form(job_display_id, name, plans, dest=dest)
+        )
+
+    def _plan_form(
+        self, job_display_id: int, name: str, plans: list[FormsShipmentPlan], *, dest: Destination | None = None
+    ) -> dict[str, bytes] | Download:
+        """BOL PDF *name* for a job whose shipment *plans* are already known."""
+        plan = _delivery_plan(plans) if name == "dbl" else _pick_plan(plans, _PLAN_TRANSPORT_TYPES[name])
+        return self._pdf(_BOL, job_display_id, name, dest=dest, params=dict(shipment_plan_id=plan.job_shipment_id))
+
+    def ops(
+        self, job_display_id: int, *, ops_type: Optional[str] = None, dest: Destination | None = None
+    ) -> dict[str, bytes] | Download:
         """Alias for :meth:`operations` that prefixes the PDF filename with ``ops_``."""
-        return self._pdf(_OPERATIONS, job_display_id, "ops", params=dict(ops_type=ops_type))
+        return self._pdf(_OPERATIONS, job_display_id, "ops", dest=dest, params=dict(ops_type=ops_type))
 
-    def bol(self, job_display_id: int) -> dict[str, bytes]:
+    def bol(self, job_display_id: int, *, dest: Destination | None = None) -> dict[str, bytes] | Download:
         """BOL for the freight leg (LTL preferred, falls back to Delivery)."""
-        plan = self._find_plan(job_display_id, "LTL", "Delivery")
-        return self._pdf(_BOL, job_display_id, "bol", params=dict(shipment_plan_id=plan.job_shipment_id))
+        return self._plan_pdf(job_display_id, "bol", dest=dest)
 
-    def hbl(self, job_display_id: int) -> dict[str, bytes]:
+    def hbl(self, job_display_id: int, *, dest: Destination | None = None) -> dict[str, bytes] | Download:
         """House Bill of Lading."""
-        plan = self._find_plan(job_display_id, "House")
-        return self._pdf(_BOL, job_display_id, "hbl", params=dict(shipment_plan_id=plan.job_shipment_id))
+        return self._plan_pdf(job_display_id, "hbl", dest=dest)
 
-    def pbl(self, job_display_id: int) -> dict[str, bytes]:
+    def pbl(self, job_display_id: int, *, dest: Destination | None = None) -> dict[str, bytes] | Download:
         """Pickup Bill of Lading."""
-        plan = self._find_plan(job_display_id, "PickUp")
-        return self._pdf(_BOL, job_display_id, "pbl", params=dict(shipment_plan_id=plan.job_shipment_id))
+        return self._plan_pdf(job_display_id, "pbl", dest=dest)
 
-    def dbl(self, job_display_id: int) -> dict[str, bytes]:
+    def dbl(self, job_display_id: int, *, dest: Destination | None = None) -> dict[str, bytes] | Download:
         """Delivery Bill of Lading (only valid when an LTL leg exists)."""
-        plans = self.shipments(job_display_id)
-        if not any(p.transport_type == "LTL" for p in plans):
-            raise ValueError("No LTL shipment plan exists -- Delivery BOL not applicable")
-        delivery = next((p for p in plans if p.transport_type == "Delivery"), None)
-        if delivery is None:
-            raise ValueError("No Delivery shipment plan found")
-        return self._pdf(_BOL, job_display_id, "dbl", params=dict(shipment_plan_id=delivery.job_shipment_id))
+        return self._plan_pdf(job_display_id, "dbl", dest=dest)
+
+
+def _pick_plan(plans: list[FormsShipmentPlan], transport_types: tuple[str, ...]) -> FormsShipmentPlan:
+    for tt in transport_types:
+        for plan in plans:
+            if plan.transport_type == tt:
+                return plan
+    raise ValueError(f"No shipment plan with transportType in {transport_types}")
+
+
+def _delivery_plan(plans: list[FormsShipmentPlan]) -> FormsShipmentPlan:
+    if not any(p.transport_type == "LTL" for p in plans):
+        raise ValueError("No LTL shipment plan exists -- Delivery BOL not applicable")
+    delivery = next((p for p in plans if p.transport_type == "Delivery"), None)
+    if delivery is None:
+        raise ValueError("No Delivery shipment plan found")
+    return delivery
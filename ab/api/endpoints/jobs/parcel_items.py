@@ -30,6 +30,7 @@ if TYPE_CHECKING:
 
 from ab.api.base import BaseEndpoint
 from ab.api.route import Route
+from ab.api.streaming import buffered_responses
 
 _LIST = Route("GET", "/job/{jobDisplayId}/parcelitems", response_model="List[ParcelItem]")
 # POST /parcelitems is replace-all (SaveAllParcelItemsRequest): the body's
@@ -98,23 +99,30 @@ class JobParcelItemsEndpoint(BaseEndpoint):
         new_item = {k: v for k, v in new_item.items() if v is not None}
 
         allowed = {f.alias or n for n, f in _Save.model_fields.items()}
-        existing = self.list(job_display_id)
-        before_ids = {p.id for p in existing if getattr(p, "id", None) is not None}
-        payload = [
-            {k: v for k, v in p.model_dump(by_alias=True, exclude_none=True).items() if k in allowed}
-            for p in existing
-        ]
-        payload.append(new_item)
-
-        resp = self._request(
-            _SAVE.bind(jobDisplayId=job_display_id),
-            json={"parcelItems": payload, "forceUpdate": True},
-        )
-        after = list(getattr(resp, "parcel_items", None) or [])
-        for p in after:
-            if getattr(p, "id", None) is not None and p.id not in before_ids:
-                return p
-        return after[-1] if after else self._resolve_model("ParcelItem").model_validate(new_item)
+
+        def _save_all(existing: list[ParcelItem]) -> ParcelItem:
+            before_ids = {p.id for p in existing if getattr(p, "id", None) is not None}
+            payload = [
+                {k: v for k, v in p.model_dump(by_alias=True, exclude_none=True).items() if k in allowed}
+                for p in existing
+            ]
+            payload.append(new_item)
+            resp = self._request(
+                _SAVE.bind(jobDisplayId=job_display_id),
+                json={"parcelItems": payload, "forceUpdate": True},
+            )
+            return self._then(resp, lambda saved: _pick_new(saved, before_ids))
+
+        def _pick_new(resp: object, before_ids: set) -> ParcelItem:
+            after = list(getattr(resp, "parcel_items", None) or [])
+            for p in after:
+                if getattr(p, "id", None) is not None and p.id not in before_ids:
+                    return p
+            return after[-1] if after else self._resolve_model("ParcelItem").model_validate(new_item)
+
+        with buffered_responses():  # the current items are read twice
+            existing = self.list(job_display_id)
+        return self._then(existing, _save_all)
 
     def delete(self, job_display_id: int, parcel_item_id: str) -> ServiceBaseResponse:
         """``DELETE /job/{jobDisplayId}/parcelitems/{parcelItemId}``
@@ -94,8 +94,7 @@ class JobTimelineEndpoint(BaseEndpoint):
 
     def list(self, job_display_id: int) -> list[TimelineTask]:
         """``GET /job/{jobDisplayId}/timeline`` — convenience returning just tasks."""
-        resp = self.response(job_display_id)
-        return resp.tasks or []
+        return self._then(self.response(job_display_id), lambda resp: resp.tasks or [])
 
     def create_task(
         self,
@@ -168,15 +167,13 @@ class JobTimelineEndpoint(BaseEndpoint):
 
         Returns ``None`` when no agent is assigned for the given task code.
         """
+        from ab.api.models.jobs import TimelineAgent as _TA
+
         resp = self._client.request(
             _GET_AGENT.method,
             _GET_AGENT.bind(jobDisplayId=job_display_id, taskCode=task_code).path,
         )
-        if resp is None:
-            return None
-        from ab.api.models.jobs import TimelineAgent as _TA
-
-        return _TA.model_validate(resp)
+        return self._then(resp, lambda data: None if data is None else _TA.model_validate(data))
 
     def increment_status(
         self,
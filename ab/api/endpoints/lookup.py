@@ -24,21 +24,33 @@ from ab.api.base import BaseEndpoint
 from ab.api.models.enums import MasterConstantKey
 from ab.api.route import Route
 
-_CONTACT_TYPES = Route("GET", "/lookup/contactTypes", response_model="List[ContactTypeEntity]")
-_COUNTRIES = Route("GET", "/lookup/countries", response_model="List[CountryCodeDto]")
-_JOB_STATUSES = Route("GET", "/lookup/jobStatuses", response_model="List[JobStatus]")
+#: Reference data changes rarely; see ab.http_cache (opt-in via ABCONNECT_HTTP_CACHE).
+_REFERENCE_TTL = 3600
+
+_CONTACT_TYPES = Route(
+    "GET", "/lookup/contactTypes", response_model="List[ContactTypeEntity]", cache_ttl=_REFERENCE_TTL,
+)
+_COUNTRIES = Route("GET", "/lookup/countries", response_model="List[CountryCodeDto]", cache_ttl=_REFERENCE_TTL)
+_JOB_STATUSES = Route("GET", "/lookup/jobStatuses", response_model="List[JobStatus]", cache_ttl=_REFERENCE_TTL)
 _ITEMS = Route("GET", "/lookup/items", params_model="LookupItemsParams", response_model="List[LookupItem]")
 
 # Extended lookup routes (008)
-_GET_BY_KEY = Route("GET", "/lookup/{masterConstantKey}", response_model="List[LookupValue]")
-_GET_BY_KEY_AND_ID = Route("GET", "/lookup/{masterConstantKey}/{valueId}", response_model="LookupValue")
+_GET_BY_KEY = Route(
+    "GET", "/lookup/{masterConstantKey}", response_model="List[LookupValue]", cache_ttl=_REFERENCE_TTL,
+)
+_GET_BY_KEY_AND_ID = Route(
+    "GET", "/lookup/{masterConstantKey}/{valueId}", response_model="LookupValue", cache_ttl=_REFERENCE_TTL,
+)
 _ACCESS_KEYS = Route("GET", "/lookup/accessKeys", response_model="List[AccessKey]")
 _ACCESS_KEY = Route("GET", "/lookup/accessKey/{accessKey}", response_model="AccessKeySetup")
 _PPC_CAMPAIGNS = Route("GET", "/lookup/PPCCampaigns", response_model="List[PPCCampaign]")
-_PARCEL_PACKAGE_TYPES = Route("GET", "/lookup/parcelPackageTypes", response_model="List[ParcelPackageType]")
+_PARCEL_PACKAGE_TYPES = Route(
+    "GET", "/lookup/parcelPackageTypes", response_model="List[ParcelPackageType]", cache_ttl=_REFERENCE_TTL,
+)
 _DOCUMENT_TYPES = Route(
     "GET", "/lookup/documentTypes",
     params_model="LookupDocumentTypesParams", response_model="List[DocumentTypeBySource]",
+    cache_ttl=_REFERENCE_TTL,
 )
 _COMMON_INSURANCE = Route("GET", "/lookup/comonInsurance", response_model="List[CommonInsuranceSlab]")
 _DENSITY_CLASS_MAP = Route(
@@ -46,8 +58,12 @@ _DENSITY_CLASS_MAP = Route(
     params_model="LookupDensityClassMapParams",
     response_model="List[DensityClassEntry]",
 )
-_REFER_CATEGORIES = Route("GET", "/lookup/referCategory", response_model="List[LookupValue]")
-_REFER_CATEGORY_HIERARCHY = Route("GET", "/lookup/referCategoryHeirachy", response_model="List[LookupValue]")
+_REFER_CATEGORIES = Route(
+    "GET", "/lookup/referCategory", response_model="List[LookupValue]", cache_ttl=_REFERENCE_TTL,
+)
+_REFER_CATEGORY_HIERARCHY = Route(
+    "GET", "/lookup/referCategoryHeirachy", response_model="List[LookupValue]", cache_ttl=_REFERENCE_TTL,
+)
 _RESET_CACHE = Route("GET", "/lookup/resetMasterConstantCache")
 
 
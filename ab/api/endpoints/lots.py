@@ -115,7 +115,7 @@ class LotsEndpoint(BaseEndpoint):
 
         Docs: https://ab-sdk.readthedocs.io/en/latest/api/lots/delete.html
         """
-        self._request(_DELETE.bind(id=lot_id))
+        return self._request(_DELETE.bind(id=lot_id))
 
     def get_overrides(self, customer_item_ids: List[str]) -> list[LotOverrideDto]:
         """Retrieve lot overrides for the given customer item IDs.
@@ -114,4 +114,4 @@ class SellersEndpoint(BaseEndpoint):
 
         Docs: https://ab-sdk.readthedocs.io/en/latest/api/sellers/delete.html
         """
-        self._request(_DELETE.bind(id=seller_id))
+        return self._request(_DELETE.bind(id=seller_id))
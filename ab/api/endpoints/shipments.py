@@ -12,6 +12,7 @@ import warnings
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from ab.api.download import Destination, Download
     from ab.api.models.shared import ServiceBaseResponse
     from ab.api.models.shipments import (
         Accessorial,
@@ -33,7 +34,9 @@ from ab.api.route import Route
 
 # Non-job-scoped routes (kept here)
 _GET_SHIPMENT = Route("GET", "/shipment", params_model="ShipmentParams", response_model="ShipmentInfo")
-_GET_GLOBAL_ACCESSORIALS = Route("GET", "/shipment/accessorials", response_model="List[GlobalAccessorial]")
+_GET_GLOBAL_ACCESSORIALS = Route(
+    "GET", "/shipment/accessorials", response_model="List[GlobalAccessorial]", cache_ttl=3600,
+)
 _GET_SHIPMENT_DOCUMENT = Route(
     "GET", "/shipment/document/{docId}",
     params_model="ShipmentDocumentParams", response_model="bytes",
@@ -87,12 +90,20 @@ class ShipmentsEndpoint(BaseEndpoint):
         """
         return self._request(_GET_GLOBAL_ACCESSORIALS)
 
-    def get_shipment_document(self, doc_id: str) -> bytes:
+    def get_shipment_document(self, doc_id: str, *, dest: Destination | None = None) -> bytes | Download:
         """``GET /shipment/document/{docId}``
 
+        Pass *dest* (a file path, directory or binary stream) to stream the
+        document there instead; a :class:`~ab.api.download.Download` is
+        returned and a directory gets ``shipment_document_<docId>``.
+
         Docs: https://ab-sdk.readthedocs.io/en/latest/api/shipments/get_shipment_document.html
         Query params: ShipmentDocumentParams
         """
+        if dest is not None:
+            return self._download(
+                _GET_SHIPMENT_DOCUMENT.bind(docId=doc_id), dest, filename=f"shipment_document_{doc_id}"
+            )
         return self._request(_GET_SHIPMENT_DOCUMENT.bind(docId=doc_id))
 
     # ---- Job-scoped (deprecated shims) --------------------------------
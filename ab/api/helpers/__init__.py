@@ -1 +1,17 @@
 """Helper modules providing high-level workflow operations on top of endpoints."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class SyncOnly:
+    """Stands in for a synchronous helper on the async client; any use raises ``TypeError``."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        raise TypeError(f"{self._name} is synchronous; use ABConnectAPI rather than AsyncABConnectAPI")
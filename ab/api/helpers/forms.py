@@ -0,0 +1,226 @@
+"""Batch form generation across many jobs.
+
+Exposed as :meth:`api.jobs.form.batch()
+<ab.api.endpoints.jobs.form.JobFormEndpoint.batch>`. Generating the morning's
+paperwork one call at a time — ``bol(job)``, ``packing_slip(job)``,
+``item_labels(job)`` for every job — is slow, and each BOL helper lists the
+job's shipment plans again before it can pick one. A batch instead:
+
+* runs every ``(job, kind)`` over one bounded worker pool;
+* lists each job's shipment plans once, however many of ``bol``/``hbl``/
+  ``pbl``/``dbl`` are requested for it;
+* streams each PDF to disk (see :mod:`ab.api.download`) and, for a ZIP
+  destination, adds it to the archive as soon as it arrives; and
+* optionally concatenates everything, in job order, into one PDF for label
+  printers. That needs the ``pdf`` extra (``pypdf``).
+
+Synchronous client only, like the other helpers.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import inspect
+import logging
+import os
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import as_completed
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ab.batch import BatchExecutor, BatchResult
+from ab.exceptions import ConfigurationError
+
+if TYPE_CHECKING:
+    from ab.api.download import Download
+    from ab.api.endpoints.jobs.form import JobFormEndpoint
+    from ab.api.models.forms import FormsShipmentPlan
+
+logger = logging.getLogger(__name__)
+
+#: Form kinds :func:`generate_forms` accepts — the PDF methods of ``api.jobs.form``
+#: that need nothing but a job ID.
+FORM_KINDS = (
+    "invoice",
+    "invoice_editable",
+    "bill_of_lading",
+    "packing_slip",
+    "customer_quote",
+    "quick_sale",
+    "operations",
+    "address_label",
+    "item_labels",
+    "packaging_labels",
+    "packaging_specification",
+    "credit_card_authorization",
+    "usar",
+    "usar_editable",
+    "ops",
+    "bol",
+    "hbl",
+    "pbl",
+    "dbl",
+)
+_PLAN_KINDS = frozenset({"bol", "hbl", "pbl", "dbl"})
+
+
+class _PlanCache:
+    """Each job's shipment plans, fetched once and shared by every BOL kind."""
+
+    def __init__(self, form: JobFormEndpoint) -> None:
+        self._form = form
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[threading.Lock, List[Any]]] = {}
+
+    def get(self, job_display_id: Any) -> List[FormsShipmentPlan]:
+        with self._lock:
+            lock, slot = self._entries.setdefault(str(job_display_id), (threading.Lock(), []))
+        with lock:
+            if not slot:
+                try:
+                    slot.append(self._form._shipment_plans(job_display_id))
+                except Exception as exc:  # noqa: BLE001 — every kind of this job reports it
+                    slot.append(exc)
+        if isinstance(slot[0], Exception):
+            raise slot[0]
+        return slot[0]
+
+
+def generate_forms(
+    form: JobFormEndpoint,
+    job_display_ids: Iterable[Union[str, int]],
+    kinds: Sequence[str],
+    dest: Union[str, Path, IO[bytes]],
+    *,
+    max_workers: int = 8,
+    merged: Union[str, Path, IO[bytes], None] = None,
+) -> List[BatchResult[Download]]:
+    """Generate *kinds* for every job into *dest*; see the module docstring.
+
+    Returns one entry per ``(job, kind)`` — jobs in input order, kinds in the
+    order given, repeats of either dropped — holding the
+    :class:`~ab.api.download.Download` or the exception raised for it. Each
+    file is named ``<kind>_<job>.pdf`` after its pair, so every name in the
+    batch is distinct (``bill_of_lading`` and ``bol`` no longer collide).
+    ``Download.path`` is ``None`` for ZIP entries.
+    """
+    if inspect.iscoroutinefunction(getattr(form._client, "request", None)):
+        raise TypeError("batch() is synchronous; use ABConnectAPI rather than AsyncABConnectAPI")
+    unknown = [k for k in kinds if k not in FORM_KINDS]
+    if unknown:
+        raise ValueError(f"Unknown form kind(s) {unknown}; choose from {', '.join(FORM_KINDS)}")
+    if merged is not None:
+        _pdf_writer()  # fail before fetching anything
+    jobs: Dict[str, Any] = {}
+    for job in job_display_ids:
+        jobs.setdefault(str(job), job)
+    tasks = [(job, kind) for job in jobs.values() for kind in dict.fromkeys(kinds)]
+    plans = _PlanCache(form)
+    results: List[BatchResult[Download]] = [None] * len(tasks)  # type: ignore[list-item]
+
+    as_zip = not isinstance(dest, (str, Path)) or Path(dest).suffix.lower() == ".zip"
+    with contextlib.ExitStack() as stack:
+        workdir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="ab-forms-")))
+        if as_zip:
+            archive = stack.enter_context(_ZipSink(dest))
+            out_dir = workdir
+        else:
+            out_dir = Path(dest)
+            out_dir.mkdir(parents=True, exist_ok=True)
+
+        def fetch(job: Any, kind: str) -> Download:
+            path = out_dir / _filename(job, kind)
+            if kind in _PLAN_KINDS:
+                download = form._plan_form(job, kind, plans.get(job), dest=path)
+            else:
+                method: Callable[..., Download] = getattr(form, kind)
+                download = method(job, dest=path)
+            return dataclasses.replace(download, filename=path.name)
+
+        with BatchExecutor(max_workers=max_workers) as batch:
+            futures = {batch.submit(fetch, job, kind): i for i, (job, kind) in enumerate(tasks)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    download = future.result()
+                except Exception as exc:  # noqa: BLE001 — reported in its slot
+                    logger.warning("Form %s for job %s failed: %s", tasks[i][1], tasks[i][0], exc)
+                    results[i] = exc
+                    continue
+                if as_zip:
+                    archive.add(download.path, download.filename)
+                    if merged is None:
+                        os.unlink(download.path)
+                    download = _with_path(download, None)
+                results[i] = download
+
+        if merged is not None:
+            files = [out_dir / r.filename for r in results if not isinstance(r, BaseException)]
+            _merge(files, merged)
+    return results
+
+
+class _ZipSink:
+    """Writes a ZIP to a path (atomically) or to a binary stream."""
+
+    def __init__(self, dest: Union[str, Path, IO[bytes]]) -> None:
+        self._path: Optional[Path] = None
+        self._tmp: Optional[str] = None
+        if isinstance(dest, (str, Path)):
+            self._path = Path(dest)
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, self._tmp = tempfile.mkstemp(dir=self._path.parent, prefix=f".{self._path.name}.", suffix=".part")
+            os.close(fd)
+            target: Any = self._tmp
+        else:
+            target = dest
+        self._zip = zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def add(self, path: Path, name: str) -> None:
+        self._zip.write(path, name)
+
+    def __enter__(self) -> _ZipSink:
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        self._zip.close()
+        if self._tmp is None:
+            return
+        if exc_type is None:
+            os.replace(self._tmp, self._path)
+        else:
+            os.unlink(self._tmp)
+
+
+def _filename(job: Any, kind: str) -> str:
+    return f"{kind}_{job}.pdf"
+
+
+def _with_path(download: Download, path: Optional[Path]) -> Download:
+    return dataclasses.replace(download, path=path)
+
+
+def _pdf_writer() -> Any:
+    try:
+        from pypdf import PdfWriter
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ConfigurationError(
+            "merged= requires pypdf; install it with 'pip install \"annex-abconnect[pdf]\"'"
+        ) from exc
+    return PdfWriter()
+
+
+def _merge(files: List[Path], dest: Union[str, Path, IO[bytes]]) -> None:
+    """Concatenate the pages of *files*, in order, into one PDF at *dest*."""
+    writer = _pdf_writer()
+    for path in files:
+        writer.append(str(path))
+    if isinstance(dest, (str, Path)):
+        with open(dest, "wb") as fh:
+            writer.write(fh)
+    else:
+        writer.write(dest)
+    writer.close()
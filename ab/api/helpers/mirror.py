@@ -0,0 +1,294 @@
+"""Incremental local mirror of job documents, deduplicated by content.
+
+Exposed as :meth:`api.documents.mirror()
+<ab.api.endpoints.documents.DocumentsEndpoint.mirror>` and
+:class:`DocumentMirror`. A mirror directory looks like::
+
+    archive/
+      .index.sqlite3          # what has been mirrored (see below)
+      objects/3f/3f9a…e1      # each distinct file once, named by SHA-256
+      2000000/
+        811_bol.pdf           # hard link (or copy) of its object
+        812_photo.jpg
+
+Each :meth:`~DocumentMirror.sync` lists the documents of the given jobs
+concurrently and looks every one up in a SQLite index of document id, storage
+path, size and hash. Only documents that are new, whose storage path changed,
+or whose local copy is missing or the wrong size are downloaded — streamed
+straight to disk (see :mod:`ab.api.download`) over a bounded worker pool.
+Identical content, however many jobs it is attached to, is stored once under
+``objects/``; job folders link to it. Documents no longer listed for a job
+are removed from its folder, and objects nothing links to are deleted.
+
+The index is updated as each download completes, so an interrupted sync
+resumes where it stopped. Synchronous client only, like the other helpers.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import inspect
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
+
+from ab.api.streaming import buffered_responses
+from ab.batch import BatchExecutor
+
+if TYPE_CHECKING:
+    from ab.api.download import Download
+    from ab.api.endpoints.documents import DocumentsEndpoint
+    from ab.api.models.documents import Document
+
+logger = logging.getLogger(__name__)
+
+_INDEX = ".index.sqlite3"
+_OBJECTS = "objects"
+
+
+@dataclass
+class MirrorReport:
+    """What a :meth:`DocumentMirror.sync` did.
+
+    Attributes:
+        downloaded: Documents fetched from the API.
+        deduplicated: Of those, how many matched content already stored.
+        unchanged: Documents skipped because the index was current.
+        removed: Documents dropped because their job no longer lists them.
+        bytes_downloaded: Body bytes fetched.
+        failed: ``(job, document id or None, exception)`` for each listing
+            or download that failed; the rest of the sync carries on.
+    """
+
+    downloaded: int = 0
+    deduplicated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    bytes_downloaded: int = 0
+    failed: List[Tuple[str, Optional[str], BaseException]] = field(default_factory=list)
+
+
+class DocumentMirror:
+    """A local directory kept in sync with the documents of a set of jobs.
+
+    Args:
+        documents: The ``api.documents`` endpoint to list and download with.
+        root: Mirror directory (created if missing).
+        max_workers: Concurrent listings and downloads.
+        link_jobs: Populate per-job folders; ``False`` keeps only the
+            content-addressed ``objects/`` store and the index
+            (see :meth:`path_for`).
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS ab_document_mirror (
+        job_display_id TEXT NOT NULL,
+        doc_id TEXT NOT NULL,
+        doc_path TEXT NOT NULL,
+        file_name TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        sha256 TEXT NOT NULL,
+        synced_at REAL NOT NULL,
+        PRIMARY KEY (job_display_id, doc_id)
+    )
+    """
+
+    def __init__(
+        self,
+        documents: DocumentsEndpoint,
+        root: Union[str, Path],
+        *,
+        max_workers: int = 8,
+        link_jobs: bool = True,
+    ) -> None:
+        if inspect.iscoroutinefunction(getattr(documents._client, "request", None)):
+            raise TypeError("DocumentMirror is synchronous; use ABConnectAPI rather than AsyncABConnectAPI")
+        self._documents = documents
+        self.root = Path(root).expanduser()
+        self._max_workers = max_workers
+        self._link_jobs = link_jobs
+        (self.root / _OBJECTS).mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.root / _INDEX), timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(self._SCHEMA)
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def sync(self, job_display_ids: Iterable[Union[str, int]]) -> MirrorReport:
+        """Bring the mirror up to date with the documents of *job_display_ids*."""
+        jobs = [str(j) for j in job_display_ids]
+        report = MirrorReport()
+        with BatchExecutor(max_workers=self._max_workers) as batch:
+            with buffered_responses():  # each listing is diffed against the index
+                listings = batch.map(self._documents.list, jobs)
+            pending = {}
+            for job, listing in zip(jobs, listings):
+                if isinstance(listing, BaseException):
+                    report.failed.append((job, None, listing))
+                    continue
+                for doc in self._plan(job, listing, report):
+                    pending[batch.submit(self._fetch, doc.path)] = (job, doc)
+            for future in as_completed(pending):
+                job, doc = pending[future]
+                try:
+                    tmp, download = future.result()
+                except Exception as exc:  # noqa: BLE001 — reported per document
+                    logger.warning("Mirroring document %s of job %s failed: %s", doc.id, job, exc)
+                    report.failed.append((job, str(doc.id), exc))
+                    continue
+                self._store(job, doc, tmp, download, report)
+        self._collect_garbage()
+        return report
+
+    def _plan(self, job: str, listing: List[Document], report: MirrorReport) -> List[Document]:
+        """Return the documents of *job* to download; drop index rows it no longer lists."""
+        rows = {
+            doc_id: (doc_path, file_name, size, sha256)
+            for doc_id, doc_path, file_name, size, sha256 in self._conn.execute(
+                "SELECT doc_id, doc_path, file_name, size, sha256 FROM ab_document_mirror WHERE job_display_id = ?",
+                (job,),
+            )
+        }
+        todo = []
+        listed = set()
+        for doc in listing:
+            if doc.id is None or not doc.path:
+                continue
+            doc_id = str(doc.id)
+            listed.add(doc_id)
+            row = rows.get(doc_id)
+            if row is not None and row[0] == doc.path and self._object_ok(row[3], row[2]):
+                self._link(job, row[1], row[3])
+                report.unchanged += 1
+            else:
+                todo.append(doc)
+        for doc_id in rows.keys() - listed:
+            self._unlink(job, rows[doc_id][1])
+            self._conn.execute(
+                "DELETE FROM ab_document_mirror WHERE job_display_id = ? AND doc_id = ?", (job, doc_id)
+            )
+            report.removed += 1
+        self._conn.commit()
+        return todo
+
+    def _fetch(self, doc_path: str) -> Tuple[str, Download]:
+        """Download *doc_path* to a temporary file under the mirror (runs on a worker)."""
+        fd, tmp = tempfile.mkstemp(dir=self.root / _OBJECTS, prefix=".", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                download = self._documents.get(doc_path, dest=fh)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return tmp, download
+
+    def _store(self, job: str, doc: Document, tmp: str, download: Download, report: MirrorReport) -> None:
+        obj = self._object_path(download.sha256)
+        if obj.exists():
+            os.unlink(tmp)
+            report.deduplicated += 1
+        else:
+            obj.parent.mkdir(exist_ok=True)
+            os.replace(tmp, obj)
+        file_name = _file_name(doc)
+        old = self._conn.execute(
+            "SELECT file_name FROM ab_document_mirror WHERE job_display_id = ? AND doc_id = ?", (job, str(doc.id))
+        ).fetchone()
+        if old is not None and old[0] != file_name:
+            self._unlink(job, old[0])
+        self._link(job, file_name, download.sha256, replace=True)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO ab_document_mirror "
+            "(job_display_id, doc_id, doc_path, file_name, size, sha256, synced_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job, str(doc.id), doc.path, file_name, download.size, download.sha256, time.time()),
+        )
+        self._conn.commit()
+        report.downloaded += 1
+        report.bytes_downloaded += download.size
+
+    # ------------------------------------------------------------------
+    # Local files
+    # ------------------------------------------------------------------
+
+    def path_for(self, job_display_id: Union[str, int], doc_id: Union[str, int]) -> Optional[Path]:
+        """The stored file for a mirrored document, or ``None`` if it is not mirrored."""
+        row = self._conn.execute(
+            "SELECT sha256 FROM ab_document_mirror WHERE job_display_id = ? AND doc_id = ?",
+            (str(job_display_id), str(doc_id)),
+        ).fetchone()
+        return None if row is None else self._object_path(row[0])
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.root / _OBJECTS / sha256[:2] / sha256
+
+    def _object_ok(self, sha256: str, size: int) -> bool:
+        try:
+            return self._object_path(sha256).stat().st_size == size
+        except FileNotFoundError:
+            return False
+
+    def _link(self, job: str, file_name: str, sha256: str, *, replace: bool = False) -> None:
+        if not self._link_jobs:
+            return
+        view = self.root / job / file_name
+        obj = self._object_path(sha256)
+        if view.exists():
+            if not replace and os.path.samefile(view, obj):
+                return
+            if not replace and view.stat().st_size == obj.stat().st_size:
+                return  # a copy, where hard links are unavailable
+            view.unlink()
+        view.parent.mkdir(exist_ok=True)
+        try:
+            os.link(obj, view)
+        except OSError:
+            shutil.copyfile(obj, view)
+
+    def _unlink(self, job: str, file_name: str) -> None:
+        if self._link_jobs:
+            with contextlib.suppress(FileNotFoundError):
+                (self.root / job / file_name).unlink()
+
+    def _collect_garbage(self) -> None:
+        """Delete objects no index row refers to."""
+        live = {sha for (sha,) in self._conn.execute("SELECT DISTINCT sha256 FROM ab_document_mirror")}
+        for obj in (self.root / _OBJECTS).glob("??/*"):
+            if obj.name not in live:
+                obj.unlink()
+
+    def close(self) -> None:
+        """Close the index."""
+        self._conn.close()
+
+    def __enter__(self) -> DocumentMirror:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _file_name(doc: Document) -> str:
+    """``<document id>_<name>`` — unique within a job even when names repeat."""
+    name = doc.file_name or (doc.path or "").replace("\\", "/").rstrip("/").rsplit("/", 1)[-1] or "document"
+    return f"{doc.id}_{Path(name).name}"
+
+
+def mirror_documents(
+    documents: DocumentsEndpoint,
+    job_display_ids: Iterable[Union[str, int]],
+    root: Union[str, Path],
+    **kwargs: object,
+) -> MirrorReport:
+    """One-shot :meth:`DocumentMirror.sync`."""
+    with DocumentMirror(documents, root, **kwargs) as mirror:  # type: ignore[arg-type]
+        return mirror.sync(job_display_ids)
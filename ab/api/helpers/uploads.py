@@ -0,0 +1,284 @@
+"""Bulk document upload — concurrent, streamed and resumable.
+
+Exposed as :meth:`api.documents.upload_many()
+<ab.api.endpoints.documents.DocumentsEndpoint.upload_many>`. Each upload is a
+``(job_display_id, item_ids, file)`` tuple (see :class:`BulkUpload`); a batch
+of them is sent over a bounded worker pool:
+
+* every file is streamed from disk as the request body
+  (:class:`MultipartBody`) rather than read into memory first — ``requests``
+  buffers ``files=`` parts whole. A file-like source must be seekable: the
+  body is sent with a ``Content-Length`` and re-read on a retry, so pipes and
+  sockets are rejected before anything is sent (read them into ``bytes``);
+* a file whose upload fails transiently (connection error, 408, 429 or 503
+  after the transport's own retries) is retried on its own with backoff
+  while the rest of the batch carries on. Other 5xx answers are returned as
+  failures, not retried: the document may have been stored before the error,
+  and a second ``POST`` would duplicate it; and
+* with ``manifest=`` every completed upload is appended to a local JSON-lines
+  file (:class:`UploadManifest`). Re-running the same batch after an
+  interruption skips what the manifest records and returns the stored
+  response for it.
+
+Like the other helpers this composes the existing ``POST /documents`` route;
+it is synchronous and runs on :class:`~ab.client.ABConnectAPI` only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from ab.api.models.documents import DocumentUploadRequest, DocumentUploadResponse
+from ab.api.models.enums import DocumentType
+from ab.batch import BatchExecutor, BatchResult
+from ab.exceptions import RequestError
+from ab.ratelimit import jittered
+
+if TYPE_CHECKING:
+    from ab.api.endpoints.documents import DocumentsEndpoint, FileSource
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 256 * 1024
+# The upload POST is not idempotent: a 500, 502 or 504 may come back after the
+# document was stored, so only answers that say it was not processed are retried.
+_TRANSIENT_STATUS = frozenset({0, 408, 429, 503})
+
+
+class BulkUpload(NamedTuple):
+    """One file of a bulk upload. Plain ``(job, items, file)`` tuples are accepted too.
+
+    Attributes:
+        job_display_id: Job the document belongs to.
+        item_ids: Item UUID, or list of UUIDs, to attach it to (may be empty
+            for non-photo documents).
+        file: A filesystem path, raw ``bytes`` or a seekable binary file-like object.
+        filename: Multipart filename (defaults to the path's name; required
+            for bytes and file-like sources).
+        document_type: Defaults to ``DocumentType.ITEM_PHOTO``.
+    """
+
+    job_display_id: Union[str, int]
+    item_ids: Union[str, List[str], None]
+    file: FileSource
+    filename: Optional[str] = None
+    document_type: Union[DocumentType, int] = DocumentType.ITEM_PHOTO
+
+
+class MultipartBody:
+    """A ``multipart/form-data`` request body streamed from its file source.
+
+    Iterating yields the encoded body in chunks, reading the file as it goes;
+    each iteration starts over, so the transport can resend it on a retry.
+    ``len()`` is the exact body size, sent as ``Content-Length``. Raises
+    :class:`ValueError` for a file-like source that cannot seek, since
+    neither would hold for it.
+    """
+
+    def __init__(self, fields: Dict[str, Any], file: FileSource, filename: str) -> None:
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        _check_source(file)
+        self._file = file
+        head = b"".join(
+            self._part_header(name) + str(item).encode() + b"\r\n"
+            for name, value in fields.items()
+            for item in (value if isinstance(value, list) else [value])
+        )
+        quoted = filename.replace("\\", "\\\\").replace('"', '\\"')
+        self._head = head + self._part_header("file", f'; filename="{quoted}"', "application/octet-stream")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._start = None if isinstance(file, (str, Path, bytes, bytearray)) else file.tell()
+        self._size = self._source_size()
+
+    def _part_header(self, name: str, extra: str = "", content_type: Optional[str] = None) -> bytes:
+        header = f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"{extra}\r\n'
+        if content_type:
+            header += f"Content-Type: {content_type}\r\n"
+        return (header + "\r\n").encode()
+
+    def _source_size(self) -> int:
+        if isinstance(self._file, (str, Path)):
+            return os.stat(self._file).st_size
+        if isinstance(self._file, (bytes, bytearray)):
+            return len(self._file)
+        end = self._file.seek(0, os.SEEK_END)
+        self._file.seek(self._start)
+        return end - self._start
+
+    def __len__(self) -> int:
+        return len(self._head) + self._size + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        if isinstance(self._file, (bytes, bytearray)):
+            yield bytes(self._file)
+        elif isinstance(self._file, (str, Path)):
+            with open(self._file, "rb") as fh:
+                yield from iter(lambda: fh.read(_CHUNK_SIZE), b"")
+        else:
+            self._file.seek(self._start)
+            yield from iter(lambda: self._file.read(_CHUNK_SIZE), b"")
+        yield self._tail
+
+
+def _seekable(file: IO[bytes]) -> bool:
+    try:
+        return bool(file.seekable())
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def _check_source(file: FileSource) -> None:
+    if not isinstance(file, (str, Path, bytes, bytearray)) and not _seekable(file):
+        raise ValueError(
+            f"cannot upload {file!r}: file-like sources must be seekable (not a pipe or socket); "
+            "pass a path, or read it into bytes first"
+        )
+
+
+class UploadManifest:
+    """Append-only JSON-lines record of completed uploads, for resuming.
+
+    Each line holds an upload's key and the server's response. An upload is
+    identified by its job, item IDs, document type and file — a path by its
+    absolute location, size and modification time, bytes by their SHA-256.
+    File-like sources have no stable identity and are never recorded.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._done: Dict[str, Any] = {}
+        self._torn = False
+        try:
+            with self.path.open(encoding="utf-8") as fh:
+                for line in fh:
+                    self._torn = not line.endswith("\n")
+                    try:
+                        entry = json.loads(line)
+                        self._done[entry["key"]] = entry["response"]
+                    except (ValueError, KeyError, TypeError):
+                        continue  # a line torn by an interrupted write
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def key(upload: BulkUpload) -> Optional[str]:
+        """Stable identity of *upload*, or ``None`` if its source has none."""
+        source = upload.file
+        if isinstance(source, (str, Path)):
+            stat = os.stat(source)
+            ident = f"path:{Path(source).resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+        elif isinstance(source, (bytes, bytearray)):
+            ident = f"bytes:{hashlib.sha256(source).hexdigest()}:{upload.filename}"
+        else:
+            return None
+        return json.dumps(
+            [str(upload.job_display_id), _item_list(upload.item_ids), int(upload.document_type), ident]
+        )
+
+    def get(self, key: Optional[str]) -> Optional[DocumentUploadResponse]:
+        """The recorded response for *key* (``None`` if not recorded or empty)."""
+        body = self._done.get(key) if key is not None else None
+        return None if body is None else DocumentUploadResponse.model_validate(body)
+
+    def record(self, key: Optional[str], response: Any) -> None:
+        """Append a completed upload (no-op for a ``None`` key)."""
+        if key is None:
+            return
+        body = response.model_dump(by_alias=True, mode="json") if hasattr(response, "model_dump") else response
+        line = json.dumps({"key": key, "response": body}) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fh:
+                # Start a fresh line after a write cut short by an interruption.
+                fh.write("\n" + line if self._torn else line)
+            self._torn = False
+            self._done[key] = body
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._done
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+
+def _item_list(item_ids: Union[str, List[str], None]) -> List[str]:
+    if item_ids is None:
+        return []
+    return [item_ids] if isinstance(item_ids, str) else [str(i) for i in item_ids]
+
+
+def _filename(upload: BulkUpload) -> str:
+    if upload.filename:
+        return upload.filename
+    if isinstance(upload.file, (str, Path)):
+        return Path(upload.file).name
+    raise ValueError("filename is required when uploading bytes or a file-like object")
+
+
+def bulk_upload(
+    documents: DocumentsEndpoint,
+    uploads: Iterable[Union[BulkUpload, tuple]],
+    *,
+    max_workers: int = 8,
+    retries: int = 2,
+    manifest: Union[str, Path, UploadManifest, None] = None,
+    shared: int = 0,
+    tags: Optional[List[str]] = None,
+) -> List[BatchResult[DocumentUploadResponse]]:
+    """Upload many documents concurrently; see the module docstring.
+
+    Returns one entry per upload, in input order: the
+    :class:`DocumentUploadResponse`, or the exception that upload finally
+    raised. One failure never aborts the others.
+    """
+    if inspect.iscoroutinefunction(getattr(documents._client, "request", None)):
+        raise TypeError("upload_many() is synchronous; use ABConnectAPI rather than AsyncABConnectAPI")
+    if retries < 0:
+        raise ValueError("retries must be >= 0")
+    items = [u if isinstance(u, BulkUpload) else BulkUpload(*u) for u in uploads]
+    for upload in items:
+        _check_source(upload.file)  # before anything is sent
+    record = manifest if isinstance(manifest, UploadManifest) or manifest is None else UploadManifest(manifest)
+
+    def upload_one(upload: BulkUpload) -> DocumentUploadResponse:
+        key = record.key(upload) if record is not None else None
+        if key is not None and key in record:
+            logger.debug("Skipping %s: already uploaded", upload.file)
+            return record.get(key)
+        form = DocumentUploadRequest(
+            job_display_id=str(upload.job_display_id),
+            document_type=upload.document_type,
+            document_type_description="Item Photo" if upload.document_type == DocumentType.ITEM_PHOTO else None,
+            shared=shared,
+            tags=tags,
+            job_items=_item_list(upload.item_ids) or None,
+        )
+        body = MultipartBody(form.model_dump(by_alias=True, exclude_none=True), upload.file, _filename(upload))
+        for attempt in range(1, retries + 2):
+            try:
+                response = documents._upload_body(body)
+                break
+            except RequestError as exc:
+                if attempt > retries or exc.status_code not in _TRANSIENT_STATUS:
+                    raise
+                delay = jittered(min(2 ** attempt, 30))
+                logger.info("Upload of %s failed (%s); retrying in %.1fs", upload.file, exc, delay)
+                time.sleep(delay)
+        if record is not None:
+            record.record(key, response)
+        return response
+
+    with BatchExecutor(max_workers=max_workers) as batch:
+        return batch.map(upload_one, items)
@@ -0,0 +1,254 @@
+"""Lazy, dict-backed views over decoded response payloads.
+
+Inside ``with api.lazy():`` endpoints return :class:`ModelView` /
+:class:`LazyList` objects instead of fully built pydantic models. A view keeps
+the decoded JSON and exposes the same attribute names as its
+:class:`~ab.api.models.base.ResponseModel`; a field is validated (with the
+model's own field type) only when it is read, and nested models and lists are
+wrapped in further views on access. Read-mostly workloads that touch a few
+fields per record skip building everything else::
+
+    with api.lazy():
+        jobs = api.jobs.search_by_details(data=criteria)
+        ids = [j.job_display_id for j in jobs]      # only this field is validated
+
+Views are read-only. Anything that is not a field — ``model_dump()``,
+``model_extra``, helper properties — is answered by the full model, built (and
+validated) once on first use; :meth:`ModelView.to_model` returns it directly.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import types
+from collections.abc import Sequence
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import AliasChoices, BaseModel, ConfigDict, TypeAdapter
+from pydantic_core import from_json
+
+_lazy: ContextVar[bool] = ContextVar("ab_lazy_responses", default=False)
+_MISSING = object()
+
+
+@contextlib.contextmanager
+def lazy_responses() -> Iterator[None]:
+    """Return lazy views from endpoints called inside the block (see :meth:`ab.client.ABConnectAPI.lazy`)."""
+    token = _lazy.set(True)
+    try:
+        yield
+    finally:
+        _lazy.reset(token)
+
+
+def lazy_enabled() -> bool:
+    return _lazy.get()
+
+
+def decode_json(body: bytes) -> Any:
+    """Parse a response body with pydantic-core's JSON parser (repeated keys share one ``str``)."""
+    try:
+        return from_json(body)
+    except ValueError as exc:
+        raise json.JSONDecodeError(str(exc), body.decode("utf-8", "replace"), 0) from exc
+
+
+class _Field(NamedTuple):
+    keys: Tuple[str, ...]
+    #: ``"model"``, ``"list"`` (nested views) or ``"value"`` (validated on read)
+    kind: str
+    target: Any
+    has_default: bool
+    default: Callable[[], Any]
+
+
+def _model_in(annotation: Any) -> Tuple[str, Any]:
+    """Classify *annotation* as a nested model, a list of models, or a plain value."""
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        return _model_in(args[0]) if len(args) == 1 else ("value", None)
+    if origin is list:
+        args = get_args(annotation)
+        if args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+            return "list", args[0]
+        return "value", None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return "model", annotation
+    return "value", None
+
+
+def _adapter_config(model: Type[BaseModel]) -> ConfigDict:
+    """The parts of *model*'s config that change how a single field validates."""
+    return ConfigDict(
+        str_strip_whitespace=model.model_config.get("str_strip_whitespace", False),
+        use_enum_values=model.model_config.get("use_enum_values", False),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _fields(model: Type[BaseModel]) -> Dict[str, _Field]:
+    validated_fields = {
+        name for dec in model.__pydantic_decorators__.field_validators.values() for name in dec.info.fields
+    }
+    config = _adapter_config(model)
+    fields: Dict[str, _Field] = {}
+    for name, info in model.model_fields.items():
+        keys = [k for k in (info.alias, name) if k]
+        if isinstance(info.validation_alias, AliasChoices):
+            keys.extend(a for a in info.validation_alias.choices if isinstance(a, str))
+        elif isinstance(info.validation_alias, str):
+            keys.append(info.validation_alias)
+        kind, target = _model_in(info.annotation)
+        if kind == "value":
+            # Fields with @field_validator hooks are read from the full model
+            target = None if name in validated_fields else TypeAdapter(info.annotation, config=config)
+        fields[name] = _Field(
+            tuple(dict.fromkeys(keys)),
+            kind,
+            target,
+            not info.is_required(),
+            functools.partial(info.get_default, call_default_factory=True),
+        )
+    return fields
+
+
+class ModelView:
+    """Read-only, lazily validated view of one response object.
+
+    Args:
+        model: The :class:`~ab.api.models.base.ResponseModel` subclass it stands for.
+        raw: The decoded JSON object.
+    """
+
+    __slots__ = ("_model", "_raw", "_values", "_full")
+
+    def __init__(self, model: Type[BaseModel], raw: Dict[str, Any]) -> None:
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_raw", raw)
+        object.__setattr__(self, "_values", {})
+        object.__setattr__(self, "_full", None)
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The decoded JSON object behind this view."""
+        return self._raw
+
+    @property
+    def model_class(self) -> Type[BaseModel]:
+        return self._model
+
+    def to_model(self) -> Any:
+        """Build (once) and return the fully validated model."""
+        if self._full is None:
+            object.__setattr__(self, "_full", self._model.model_validate(self._raw))
+        return self._full
+
+    def __getattr__(self, name: str) -> Any:
+        spec = _fields(self._model).get(name)
+        if spec is None:
+            if name.startswith("__"):
+                raise AttributeError(name)
+            return getattr(self.to_model(), name)
+        values = self._values
+        if name in values:
+            return values[name]
+        value = self._read(name, spec)
+        values[name] = value
+        return value
+
+    def _read(self, name: str, spec: _Field) -> Any:
+        if self._full is not None or (spec.kind == "value" and spec.target is None):
+            return getattr(self.to_model(), name)
+        raw = _MISSING
+        for key in spec.keys:
+            if key in self._raw:
+                raw = self._raw[key]
+                break
+        if raw is _MISSING:
+            if not spec.has_default:
+                return getattr(self.to_model(), name)  # raises the model's ValidationError
+            return spec.default()
+        if raw is None:
+            return None
+        if spec.kind == "model" and isinstance(raw, dict):
+            return ModelView(spec.target, raw)
+        if spec.kind == "list" and isinstance(raw, list):
+            return LazyList(spec.target, raw)
+        if spec.kind == "value":
+            return spec.target.validate_python(raw)
+        return getattr(self.to_model(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only; call .to_model() for a mutable copy")
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(_fields(self._model)) | set(dir(self._model)))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ModelView):
+            return self._model is other._model and self._raw == other._raw
+        if isinstance(other, BaseModel):
+            return self.to_model() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"<{self._model.__name__} view keys={len(self._raw)}>"
+
+
+class LazyList(Sequence):
+    """A list of response objects whose :class:`ModelView` items are built on access."""
+
+    __slots__ = ("_model", "_raw", "_views")
+
+    def __init__(self, model: Type[BaseModel], raw: List[Any]) -> None:
+        self._model = model
+        self._raw = raw
+        self._views: List[Optional[Any]] = [None] * len(raw)
+
+    @property
+    def raw(self) -> List[Any]:
+        """The decoded JSON list behind this view."""
+        return self._raw
+
+    def to_models(self) -> List[Any]:
+        """Validate every item and return a plain ``list`` of models."""
+        return [view.to_model() if isinstance(view, ModelView) else view for view in self]
+
+    def to_columns(self, fields: Optional[List[str]] = None, **kwargs: Any) -> Dict[str, Any]:
+        """Return the items as columns, validated column by column (see :func:`ab.api.columns.to_columns`)."""
+        from ab.api.columns import to_columns
+
+        return to_columns(self, fields, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return LazyList(self._model, self._raw[index])
+        view = self._views[index]
+        if view is None:
+            item = self._raw[index]
+            view = ModelView(self._model, item) if isinstance(item, dict) else item
+            self._views[index] = view
+        return view
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self._raw)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (LazyList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"<LazyList[{self._model.__name__}] len={len(self)}>"
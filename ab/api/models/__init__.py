@@ -1,348 +1,492 @@
-"""Re-export all model classes for lazy resolution by Route."""
+"""Re-export all model classes for lazy resolution by Route.
 
-from ab.api.models.account import AccountProfile
-from ab.api.models.address import (
-    AddressIsValidResult,
-    AddressPropertyTypeParams,
-    AddressValidateParams,
-    PropertyType,
-)
-from ab.api.models.autoprice import (
-    QuickQuotePriceBreakdown,
-    QuickQuoteResponse,
-    QuickQuoteResult,
-    QuoteRequestModel,
-    QuoteRequestResponse,
-)
-from ab.api.models.base import ABConnectBaseModel, RequestModel, ResponseModel
+Submodules are imported on first attribute access (PEP 562 ``__getattr__``),
+so ``import ab`` does not load ~300 model classes up front; ``Job`` is only
+imported (from ``ab.api.models.jobs``) the first time something asks for it.
+Models are also declared with ``defer_build=True``, so a class's validator is
+built the first time it validates. Long-lived processes that prefer to pay
+both costs at startup call :func:`ab.warmup`.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from ab.api.models.account import AccountProfile
+    from ab.api.models.address import (
+        AddressIsValidResult,
+        AddressPropertyTypeParams,
+        AddressValidateParams,
+        PropertyType,
+    )
+    from ab.api.models.autoprice import (
+        QuickQuotePriceBreakdown,
+        QuickQuoteResponse,
+        QuickQuoteResult,
+        QuoteRequestModel,
+        QuoteRequestResponse,
+    )
+    from ab.api.models.base import ABConnectBaseModel, RequestModel, ResponseModel
+
+    # Domain models
+    from ab.api.models.catalog import (
+        AddCatalogRequest,
+        BulkInsertCatalogRequest,
+        BulkInsertLotRequest,
+        BulkInsertRequest,
+        BulkInsertSellerRequest,
+        CatalogDto,
+        CatalogExpandedDto,
+        CatalogListParams,
+        CatalogWithSellersDto,
+        UpdateCatalogRequest,
+    )
+    from ab.api.models.commodities import (
+        Commodity,
+        CommodityCreateRequest,
+        CommodityMap,
+        CommodityMapCreateRequest,
+        CommodityMapSearchRequest,
+        CommodityMapUpdateRequest,
+        CommoditySearchRequest,
+        CommoditySuggestionRequest,
+        CommodityUpdateRequest,
+    )
+    from ab.api.models.common import CompanyAddress, Coordinates
+    from ab.api.models.companies import (
+        AccessorialCharge,
+        AccountInformation,
+        AddressData,
+        BrandTree,
+        BTXAccount,
+        CarrierAccount,
+        CarrierAccountSaveRequest,
+        CarrierAccountSearchParams,
+        CompanyBrand,
+        CompanyDetails,
+        CompanyDetailsInfo,
+        CompanyInfo,
+        CompanyInsurance,
+        CompanyInsurancePricing,
+        CompanyPreferences,
+        CompanyPricing,
+        CompanySearchRequest,
+        CompanyServicePricing,
+        CompanySimple,
+        CompanyTaxes,
+        CompanyTaxPricing,
+        EstesAccount,
+        FedExAccount,
+        FileInfo,
+        ForwardAirAccount,
+        GeoSettings,
+        GeoSettingsParams,
+        GeoSettingsSaveRequest,
+        GlobalTranzAccount,
+        InheritFromParams,
+        InsuranceOption,
+        LaborCharge,
+        MaerskAccount,
+        MarkupTier,
+        OverridableAddressData,
+        OverridableField,
+        PackagingLabor,
+        PackagingLaborSaveRequest,
+        PackagingSettings,
+        PackagingSettingsSaveRequest,
+        PackagingTariff,
+        PaymentSettings,
+        RoadRunnerAccount,
+        Royalties,
+        SearchCompanyResponse,
+        SuggestCarriersParams,
+        TariffGroup,
+        TaxCategory,
+        TeamWWAccount,
+        TransportationCharge,
+        UPSAccount,
+        USPSAccount,
+    )
+    from ab.api.models.contacts import (
+        ContactAddressEntry,
+        ContactDetailedInfo,
+        ContactEditParams,
+        ContactEditRequest,
+        ContactEmailEntry,
+        ContactGraphData,
+        ContactHistory,
+        ContactHistoryAggregated,
+        ContactHistoryCreateRequest,
+        ContactHistoryParams,
+        ContactMergePreview,
+        ContactMergeRequest,
+        ContactPhoneEntry,
+        ContactPrimaryDetails,
+        ContactSearchParams,
+        ContactSearchRequest,
+        ContactSimple,
+        EmailDetails,
+        PageOrderedRequest,
+        PhoneDetails,
+        SearchContactEntityResult,
+    )
+    from ab.api.models.dashboard import (
+        DashboardCompanyParams,
+        DashboardCompanyRequest,
+        DashboardItem,
+        DashboardParams,
+        DashboardSummary,
+        GridViewInfo,
+        GridViewState,
+    )
+    from ab.api.models.documents import (
+        Document,
+        DocumentListParams,
+        DocumentUpdateRequest,
+        DocumentUploadRequest,
+        DocumentUploadResponse,
+        UploadedFile,
+    )
+    from ab.api.models.enums import CarrierAPI, DocumentType, MasterConstantKey
+    from ab.api.models.forms import (
+        BillOfLadingParams,
+        FormsShipmentPlan,
+        FormTypeParams,
+        OperationsFormParams,
+        PackagingLabelsParams,
+    )
+    from ab.api.models.jobs import (
+        BaseTimelineTaskRequest,
+        CalendarItem,
+        CarrierAccountInfo,
+        CarrierTaskRequest,
+        ChangeJobAgentRequest,
+        ExtendedOnHoldInfo,
+        FeedbackSaveModel,
+        FreightItemsRequest,
+        FreightProvidersParams,
+        FreightShipment,
+        IncrementStatusRequest,
+        InitialNoteRequest,
+        InTheFieldTaskRequest,
+        ItemNotesRequest,
+        ItemUpdateRequest,
+        Job,
+        JobCreateRequest,
+        JobNote,
+        JobNoteCreateRequest,
+        JobNoteListParams,
+        JobNoteUpdateRequest,
+        JobParcelItemMaterial,
+        JobPrice,
+        JobRfqListParams,
+        JobSaveRequest,
+        JobSearchParams,
+        JobSearchRequest,
+        JobSearchResult,
+        JobUpdatePageConfig,
+        JobUpdateRequest,
+        MarkSmsAsReadModel,
+        OnHoldCommentRequest,
+        OnHoldDetails,
+        OnHoldNoteDetails,
+        OnHoldUser,
+        PackagingContainer,
+        ParcelItem,
+        ParcelItemCreateRequest,
+        ParcelItemSave,
+        ParcelItemsRequest,
+        ParcelItemsResponse,
+        ParcelItemWithMaterials,
+        PricedFreightProvider,
+        RateQuoteRequest,
+        ResolveJobOnHoldResponse,
+        ResolveOnHoldRequest,
+        SaveOnHoldDatesModel,
+        SaveOnHoldRequest,
+        SaveOnHoldResponse,
+        SendDocumentEmailModel,
+        SendEmailRequest,
+        SendSMSModel,
+        ShipmentDetails,
+        ShipmentPlanProvider,
+        ShipmentTrackingDetails,
+        ShipmentTrackingDocument,
+        SimpleTaskRequest,
+        SortByModel,
+        TaskTruckInfoRequest,
+        TimelineAgent,
+        TimelineCreateParams,
+        TimelineResponse,
+        TimelineSaveResponse,
+        TimelineTask,
+        TimelineTaskUpdateRequest,
+        TimeLogPauseRequest,
+        TimeLogRequest,
+        TrackingInfo,
+        TrackingInfoV3,
+        TrackingV3Params,
+        TransferModel,
+        WorkTimeLogRequest,
+    )
+    from ab.api.models.lookup import (
+        AccessKey,
+        AccessKeySetup,
+        CommonInsuranceSlab,
+        ContactTypeEntity,
+        CountryCodeDto,
+        DensityClassEntry,
+        DocumentTypeBySource,
+        JobStatus,
+        LookupDensityClassMapParams,
+        LookupDocumentTypesParams,
+        LookupItem,
+        LookupItemsParams,
+        LookupValue,
+        ParcelPackageType,
+        PPCCampaign,
+    )
+    from ab.api.models.lots import (
+        AddLotRequest,
+        ImageLinkDto,
+        LotCatalogDto,
+        LotCatalogInformationDto,
+        LotDataDto,
+        LotDto,
+        LotListParams,
+        LotOverrideDto,
+        UpdateLotRequest,
+    )
+    from ab.api.models.mixins import (
+        ActiveModel,
+        CompanyAuditModel,
+        CompanyRelatedModel,
+        DateRangeRequestMixin,
+        FullAuditModel,
+        IdentifiedModel,
+        JobAuditModel,
+        JobRelatedModel,
+        PaginatedRequestMixin,
+        SearchableRequestMixin,
+        SortableRequestMixin,
+        TimestampedModel,
+    )
+    from ab.api.models.notes import (
+        GlobalNote,
+        GlobalNoteCreateRequest,
+        GlobalNoteUpdateRequest,
+        NoteRequest,
+        NotesListParams,
+        NotesSuggestUsersParams,
+        SuggestedUser,
+    )
+    from ab.api.models.partners import Partner, PartnerListParams, PartnerSearchRequest
+    from ab.api.models.payments import (
+        ACHCreditTransferRequest,
+        ACHSessionRequest,
+        ACHSessionResponse,
+        AttachBankRequest,
+        BankSourceRequest,
+        PayBySourceRequest,
+        PaymentInfo,
+        PaymentParams,
+        PaymentSource,
+        VerifyACHRequest,
+    )
+    from ab.api.models.reports import (
+        InsuranceReport,
+        InsuranceReportRequest,
+        ReferredByReport,
+        ReferredByReportRequest,
+        RevenueCustomer,
+        SalesForecastReport,
+        SalesForecastReportRequest,
+        SalesForecastSummary,
+        SalesForecastSummaryRequest,
+        Web2LeadReport,
+        Web2LeadRevenueFilter,
+        Web2LeadV2RequestModel,
+    )
+    from ab.api.models.rfq import (
+        AcceptModel,
+        QuoteRequestDisplayInfo,
+        QuoteRequestStatus,
+        RfqAcceptWinnerParams,
+        RfqForJobParams,
+    )
+    from ab.api.models.sellers import (
+        AddSellerRequest,
+        SellerDto,
+        SellerExpandedDto,
+        SellerListParams,
+        UpdateSellerRequest,
+    )
+    from ab.api.models.shared import (
+        BookedDocument,
+        ListRequest,
+        PaginatedList,
+        ServiceBaseResponse,
+        ServiceWarningResponse,
+    )
+    from ab.api.models.shipments import (
+        Accessorial,
+        AccessorialAddRequest,
+        AccessorialOption,
+        GlobalAccessorial,
+        RadioButtonOption,
+        RateQuote,
+        RateQuotesParams,
+        RatesState,
+        ShipmentBookRequest,
+        ShipmentDocumentParams,
+        ShipmentExportData,
+        ShipmentExportRequest,
+        ShipmentInfo,
+        ShipmentOriginDestination,
+        ShipmentParams,
+        ShipmentRateQuoteRequest,
+        ShipmentWeight,
+    )
+    from ab.api.models.users import User, UserCreateRequest, UserRole, UserUpdateRequest
+    from ab.api.models.views import (
+        GridViewAccess,
+        GridViewCreateRequest,
+        GridViewDetails,
+        StoredProcedureColumn,
+    )
+    from ab.api.models.web2lead import Web2LeadGetParams, Web2LeadGETResult, Web2LeadRequest, Web2LeadResponse
+
+_SUBMODULES: Dict[str, Tuple[str, ...]] = {
+    "account": ("AccountProfile",),
+    "address": ("AddressIsValidResult", "AddressPropertyTypeParams", "AddressValidateParams", "PropertyType"),
+    "autoprice": (
+        "QuickQuotePriceBreakdown", "QuickQuoteResponse", "QuickQuoteResult", "QuoteRequestModel",
+        "QuoteRequestResponse",
+    ),
+    "base": ("ABConnectBaseModel", "RequestModel", "ResponseModel"),
+    "catalog": (
+        "AddCatalogRequest", "BulkInsertCatalogRequest", "BulkInsertLotRequest", "BulkInsertRequest",
+        "BulkInsertSellerRequest", "CatalogDto", "CatalogExpandedDto", "CatalogListParams", "CatalogWithSellersDto",
+        "UpdateCatalogRequest",
+    ),
+    "commodities": (
+        "Commodity", "CommodityCreateRequest", "CommodityMap", "CommodityMapCreateRequest", "CommodityMapSearchRequest",
+        "CommodityMapUpdateRequest", "CommoditySearchRequest", "CommoditySuggestionRequest", "CommodityUpdateRequest",
+    ),
+    "common": ("CompanyAddress", "Coordinates"),
+    "companies": (
+        "AccessorialCharge", "AccountInformation", "AddressData", "BTXAccount", "BrandTree", "CarrierAccount",
+        "CarrierAccountSaveRequest", "CarrierAccountSearchParams", "CompanyBrand", "CompanyDetails",
+        "CompanyDetailsInfo", "CompanyInfo", "CompanyInsurance", "CompanyInsurancePricing", "CompanyPreferences",
+        "CompanyPricing", "CompanySearchRequest", "CompanyServicePricing", "CompanySimple", "CompanyTaxPricing",
+        "CompanyTaxes", "EstesAccount", "FedExAccount", "FileInfo", "ForwardAirAccount", "GeoSettings",
+        "GeoSettingsParams", "GeoSettingsSaveRequest", "GlobalTranzAccount", "InheritFromParams", "InsuranceOption",
+        "LaborCharge", "MaerskAccount", "MarkupTier", "OverridableAddressData", "OverridableField", "PackagingLabor",
+        "PackagingLaborSaveRequest", "PackagingSettings", "PackagingSettingsSaveRequest", "PackagingTariff",
+        "PaymentSettings", "RoadRunnerAccount", "Royalties", "SearchCompanyResponse", "SuggestCarriersParams",
+        "TariffGroup", "TaxCategory", "TeamWWAccount", "TransportationCharge", "UPSAccount", "USPSAccount",
+    ),
+    "contacts": (
+        "ContactAddressEntry", "ContactDetailedInfo", "ContactEditParams", "ContactEditRequest", "ContactEmailEntry",
+        "ContactGraphData", "ContactHistory", "ContactHistoryAggregated", "ContactHistoryCreateRequest",
+        "ContactHistoryParams", "ContactMergePreview", "ContactMergeRequest", "ContactPhoneEntry",
+        "ContactPrimaryDetails", "ContactSearchParams", "ContactSearchRequest", "ContactSimple", "EmailDetails",
+        "PageOrderedRequest", "PhoneDetails", "SearchContactEntityResult",
+    ),
+    "dashboard": (
+        "DashboardCompanyParams", "DashboardCompanyRequest", "DashboardItem", "DashboardParams", "DashboardSummary",
+        "GridViewInfo", "GridViewState",
+    ),
+    "documents": (
+        "Document", "DocumentListParams", "DocumentUpdateRequest", "DocumentUploadRequest", "DocumentUploadResponse",
+        "UploadedFile",
+    ),
+    "enums": ("CarrierAPI", "DocumentType", "MasterConstantKey"),
+    "forms": (
+        "BillOfLadingParams", "FormTypeParams", "FormsShipmentPlan", "OperationsFormParams", "PackagingLabelsParams",
+    ),
+    "jobs": (
+        "BaseTimelineTaskRequest", "CalendarItem", "CarrierAccountInfo", "CarrierTaskRequest", "ChangeJobAgentRequest",
+        "ExtendedOnHoldInfo", "FeedbackSaveModel", "FreightItemsRequest", "FreightProvidersParams", "FreightShipment",
+        "InTheFieldTaskRequest", "IncrementStatusRequest", "InitialNoteRequest", "ItemNotesRequest",
+        "ItemUpdateRequest", "Job", "JobCreateRequest", "JobNote", "JobNoteCreateRequest", "JobNoteListParams",
+        "JobNoteUpdateRequest", "JobParcelItemMaterial", "JobPrice", "JobRfqListParams", "JobSaveRequest",
+        "JobSearchParams", "JobSearchRequest", "JobSearchResult", "JobUpdatePageConfig", "JobUpdateRequest",
+        "MarkSmsAsReadModel", "OnHoldCommentRequest", "OnHoldDetails", "OnHoldNoteDetails", "OnHoldUser",
+        "PackagingContainer", "ParcelItem", "ParcelItemCreateRequest", "ParcelItemSave", "ParcelItemWithMaterials",
+        "ParcelItemsRequest", "ParcelItemsResponse", "PricedFreightProvider", "RateQuoteRequest",
+        "ResolveJobOnHoldResponse", "ResolveOnHoldRequest", "SaveOnHoldDatesModel", "SaveOnHoldRequest",
+        "SaveOnHoldResponse", "SendDocumentEmailModel", "SendEmailRequest", "SendSMSModel", "ShipmentDetails",
+        "ShipmentPlanProvider", "ShipmentTrackingDetails", "ShipmentTrackingDocument", "SimpleTaskRequest",
+        "SortByModel", "TaskTruckInfoRequest", "TimeLogPauseRequest", "TimeLogRequest", "TimelineAgent",
+        "TimelineCreateParams", "TimelineResponse", "TimelineSaveResponse", "TimelineTask", "TimelineTaskUpdateRequest",
+        "TrackingInfo", "TrackingInfoV3", "TrackingV3Params", "TransferModel", "WorkTimeLogRequest",
+    ),
+    "lookup": (
+        "AccessKey", "AccessKeySetup", "CommonInsuranceSlab", "ContactTypeEntity", "CountryCodeDto",
+        "DensityClassEntry", "DocumentTypeBySource", "JobStatus", "LookupDensityClassMapParams",
+        "LookupDocumentTypesParams", "LookupItem", "LookupItemsParams", "LookupValue", "PPCCampaign",
+        "ParcelPackageType",
+    ),
+    "lots": (
+        "AddLotRequest", "ImageLinkDto", "LotCatalogDto", "LotCatalogInformationDto", "LotDataDto", "LotDto",
+        "LotListParams", "LotOverrideDto", "UpdateLotRequest",
+    ),
+    "mixins": (
+        "ActiveModel", "CompanyAuditModel", "CompanyRelatedModel", "DateRangeRequestMixin", "FullAuditModel",
+        "IdentifiedModel", "JobAuditModel", "JobRelatedModel", "PaginatedRequestMixin", "SearchableRequestMixin",
+        "SortableRequestMixin", "TimestampedModel",
+    ),
+    "notes": (
+        "GlobalNote", "GlobalNoteCreateRequest", "GlobalNoteUpdateRequest", "NoteRequest", "NotesListParams",
+        "NotesSuggestUsersParams", "SuggestedUser",
+    ),
+    "partners": ("Partner", "PartnerListParams", "PartnerSearchRequest"),
+    "payments": (
+        "ACHCreditTransferRequest", "ACHSessionRequest", "ACHSessionResponse", "AttachBankRequest", "BankSourceRequest",
+        "PayBySourceRequest", "PaymentInfo", "PaymentParams", "PaymentSource", "VerifyACHRequest",
+    ),
+    "reports": (
+        "InsuranceReport", "InsuranceReportRequest", "ReferredByReport", "ReferredByReportRequest", "RevenueCustomer",
+        "SalesForecastReport", "SalesForecastReportRequest", "SalesForecastSummary", "SalesForecastSummaryRequest",
+        "Web2LeadReport", "Web2LeadRevenueFilter", "Web2LeadV2RequestModel",
+    ),
+    "rfq": ("AcceptModel", "QuoteRequestDisplayInfo", "QuoteRequestStatus", "RfqAcceptWinnerParams", "RfqForJobParams"),
+    "sellers": ("AddSellerRequest", "SellerDto", "SellerExpandedDto", "SellerListParams", "UpdateSellerRequest"),
+    "shared": ("BookedDocument", "ListRequest", "PaginatedList", "ServiceBaseResponse", "ServiceWarningResponse"),
+    "shipments": (
+        "Accessorial", "AccessorialAddRequest", "AccessorialOption", "GlobalAccessorial", "RadioButtonOption",
+        "RateQuote", "RateQuotesParams", "RatesState", "ShipmentBookRequest", "ShipmentDocumentParams",
+        "ShipmentExportData", "ShipmentExportRequest", "ShipmentInfo", "ShipmentOriginDestination", "ShipmentParams",
+        "ShipmentRateQuoteRequest", "ShipmentWeight",
+    ),
+    "users": ("User", "UserCreateRequest", "UserRole", "UserUpdateRequest"),
+    "views": ("GridViewAccess", "GridViewCreateRequest", "GridViewDetails", "StoredProcedureColumn"),
+    "web2lead": ("Web2LeadGETResult", "Web2LeadGetParams", "Web2LeadRequest", "Web2LeadResponse"),
+}
+
+_EXPORTS: Dict[str, str] = {name: module for module, names in _SUBMODULES.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+def load_all() -> List[Any]:
+    """Import every model submodule and return the exported classes."""
+    return [__getattr__(name) for name in _EXPORTS]
 
-# Domain models
-from ab.api.models.catalog import (
-    AddCatalogRequest,
-    BulkInsertCatalogRequest,
-    BulkInsertLotRequest,
-    BulkInsertRequest,
-    BulkInsertSellerRequest,
-    CatalogDto,
-    CatalogExpandedDto,
-    CatalogListParams,
-    CatalogWithSellersDto,
-    UpdateCatalogRequest,
-)
-from ab.api.models.commodities import (
-    Commodity,
-    CommodityCreateRequest,
-    CommodityMap,
-    CommodityMapCreateRequest,
-    CommodityMapSearchRequest,
-    CommodityMapUpdateRequest,
-    CommoditySearchRequest,
-    CommoditySuggestionRequest,
-    CommodityUpdateRequest,
-)
-from ab.api.models.common import CompanyAddress, Coordinates
-from ab.api.models.companies import (
-    AccessorialCharge,
-    AccountInformation,
-    AddressData,
-    BrandTree,
-    BTXAccount,
-    CarrierAccount,
-    CarrierAccountSaveRequest,
-    CarrierAccountSearchParams,
-    CompanyBrand,
-    CompanyDetails,
-    CompanyDetailsInfo,
-    CompanyInfo,
-    CompanyInsurance,
-    CompanyInsurancePricing,
-    CompanyPreferences,
-    CompanyPricing,
-    CompanySearchRequest,
-    CompanyServicePricing,
-    CompanySimple,
-    CompanyTaxes,
-    CompanyTaxPricing,
-    EstesAccount,
-    FedExAccount,
-    FileInfo,
-    ForwardAirAccount,
-    GeoSettings,
-    GeoSettingsParams,
-    GeoSettingsSaveRequest,
-    GlobalTranzAccount,
-    InheritFromParams,
-    InsuranceOption,
-    LaborCharge,
-    MaerskAccount,
-    MarkupTier,
-    OverridableAddressData,
-    OverridableField,
-    PackagingLabor,
-    PackagingLaborSaveRequest,
-    PackagingSettings,
-    PackagingSettingsSaveRequest,
-    PackagingTariff,
-    PaymentSettings,
-    RoadRunnerAccount,
-    Royalties,
-    SearchCompanyResponse,
-    SuggestCarriersParams,
-    TariffGroup,
-    TaxCategory,
-    TeamWWAccount,
-    TransportationCharge,
-    UPSAccount,
-    USPSAccount,
-)
-from ab.api.models.contacts import (
-    ContactAddressEntry,
-    ContactDetailedInfo,
-    ContactEditParams,
-    ContactEditRequest,
-    ContactEmailEntry,
-    ContactGraphData,
-    ContactHistory,
-    ContactHistoryAggregated,
-    ContactHistoryCreateRequest,
-    ContactHistoryParams,
-    ContactMergePreview,
-    ContactMergeRequest,
-    ContactPhoneEntry,
-    ContactPrimaryDetails,
-    ContactSearchParams,
-    ContactSearchRequest,
-    ContactSimple,
-    EmailDetails,
-    PageOrderedRequest,
-    PhoneDetails,
-    SearchContactEntityResult,
-)
-from ab.api.models.dashboard import (
-    DashboardCompanyParams,
-    DashboardCompanyRequest,
-    DashboardItem,
-    DashboardParams,
-    DashboardSummary,
-    GridViewInfo,
-    GridViewState,
-)
-from ab.api.models.documents import (
-    Document,
-    DocumentListParams,
-    DocumentUpdateRequest,
-    DocumentUploadRequest,
-    DocumentUploadResponse,
-    UploadedFile,
-)
-from ab.api.models.enums import CarrierAPI, DocumentType, MasterConstantKey
-from ab.api.models.forms import (
-    BillOfLadingParams,
-    FormsShipmentPlan,
-    FormTypeParams,
-    OperationsFormParams,
-    PackagingLabelsParams,
-)
-from ab.api.models.jobs import (
-    BaseTimelineTaskRequest,
-    CalendarItem,
-    CarrierAccountInfo,
-    CarrierTaskRequest,
-    ChangeJobAgentRequest,
-    ExtendedOnHoldInfo,
-    FeedbackSaveModel,
-    FreightItemsRequest,
-    FreightProvidersParams,
-    FreightShipment,
-    IncrementStatusRequest,
-    InitialNoteRequest,
-    InTheFieldTaskRequest,
-    ItemNotesRequest,
-    ItemUpdateRequest,
-    Job,
-    JobCreateRequest,
-    JobNote,
-    JobNoteCreateRequest,
-    JobNoteListParams,
-    JobNoteUpdateRequest,
-    JobParcelItemMaterial,
-    JobPrice,
-    JobRfqListParams,
-    JobSaveRequest,
-    JobSearchParams,
-    JobSearchRequest,
-    JobSearchResult,
-    JobUpdatePageConfig,
-    JobUpdateRequest,
-    MarkSmsAsReadModel,
-    OnHoldCommentRequest,
-    OnHoldDetails,
-    OnHoldNoteDetails,
-    OnHoldUser,
-    PackagingContainer,
-    ParcelItem,
-    ParcelItemCreateRequest,
-    ParcelItemSave,
-    ParcelItemsRequest,
-    ParcelItemsResponse,
-    ParcelItemWithMaterials,
-    PricedFreightProvider,
-    RateQuoteRequest,
-    ResolveJobOnHoldResponse,
-    ResolveOnHoldRequest,
-    SaveOnHoldDatesModel,
-    SaveOnHoldRequest,
-    SaveOnHoldResponse,
-    SendDocumentEmailModel,
-    SendEmailRequest,
-    SendSMSModel,
-    ShipmentDetails,
-    ShipmentPlanProvider,
-    ShipmentTrackingDetails,
-    ShipmentTrackingDocument,
-    SimpleTaskRequest,
-    SortByModel,
-    TaskTruckInfoRequest,
-    TimelineAgent,
-    TimelineCreateParams,
-    TimelineResponse,
-    TimelineSaveResponse,
-    TimelineTask,
-    TimelineTaskUpdateRequest,
-    TimeLogPauseRequest,
-    TimeLogRequest,
-    TrackingInfo,
-    TrackingInfoV3,
-    TrackingV3Params,
-    TransferModel,
-    WorkTimeLogRequest,
-)
-from ab.api.models.lookup import (
-    AccessKey,
-    AccessKeySetup,
-    CommonInsuranceSlab,
-    ContactTypeEntity,
-    CountryCodeDto,
-    DensityClassEntry,
-    DocumentTypeBySource,
-    JobStatus,
-    LookupDensityClassMapParams,
-    LookupDocumentTypesParams,
-    LookupItem,
-    LookupItemsParams,
-    LookupValue,
-    ParcelPackageType,
-    PPCCampaign,
-)
-from ab.api.models.lots import (
-    AddLotRequest,
-    ImageLinkDto,
-    LotCatalogDto,
-    LotCatalogInformationDto,
-    LotDataDto,
-    LotDto,
-    LotListParams,
-    LotOverrideDto,
-    UpdateLotRequest,
-)
-from ab.api.models.mixins import (
-    ActiveModel,
-    CompanyAuditModel,
-    CompanyRelatedModel,
-    DateRangeRequestMixin,
-    FullAuditModel,
-    IdentifiedModel,
-    JobAuditModel,
-    JobRelatedModel,
-    PaginatedRequestMixin,
-    SearchableRequestMixin,
-    SortableRequestMixin,
-    TimestampedModel,
-)
-from ab.api.models.notes import (
-    GlobalNote,
-    GlobalNoteCreateRequest,
-    GlobalNoteUpdateRequest,
-    NoteRequest,
-    NotesListParams,
-    NotesSuggestUsersParams,
-    SuggestedUser,
-)
-from ab.api.models.partners import Partner, PartnerListParams, PartnerSearchRequest
-from ab.api.models.payments import (
-    ACHCreditTransferRequest,
-    ACHSessionRequest,
-    ACHSessionResponse,
-    AttachBankRequest,
-    BankSourceRequest,
-    PayBySourceRequest,
-    PaymentInfo,
-    PaymentParams,
-    PaymentSource,
-    VerifyACHRequest,
-)
-from ab.api.models.reports import (
-    InsuranceReport,
-    InsuranceReportRequest,
-    ReferredByReport,
-    ReferredByReportRequest,
-    RevenueCustomer,
-    SalesForecastReport,
-    SalesForecastReportRequest,
-    SalesForecastSummary,
-    SalesForecastSummaryRequest,
-    Web2LeadReport,
-    Web2LeadRevenueFilter,
-    Web2LeadV2RequestModel,
-)
-from ab.api.models.rfq import (
-    AcceptModel,
-    QuoteRequestDisplayInfo,
-    QuoteRequestStatus,
-    RfqAcceptWinnerParams,
-    RfqForJobParams,
-)
-from ab.api.models.sellers import (
-    AddSellerRequest,
-    SellerDto,
-    SellerExpandedDto,
-    SellerListParams,
-    UpdateSellerRequest,
-)
-from ab.api.models.shared import (
-    BookedDocument,
-    ListRequest,
-    PaginatedList,
-    ServiceBaseResponse,
-    ServiceWarningResponse,
-)
-from ab.api.models.shipments import (
-    Accessorial,
-    AccessorialAddRequest,
-    AccessorialOption,
-    GlobalAccessorial,
-    RadioButtonOption,
-    RateQuote,
-    RateQuotesParams,
-    RatesState,
-    ShipmentBookRequest,
-    ShipmentDocumentParams,
-    ShipmentExportData,
-    ShipmentExportRequest,
-    ShipmentInfo,
-    ShipmentOriginDestination,
-    ShipmentParams,
-    ShipmentRateQuoteRequest,
-    ShipmentWeight,
-)
-from ab.api.models.users import User, UserCreateRequest, UserRole, UserUpdateRequest
-from ab.api.models.views import (
-    GridViewAccess,
-    GridViewCreateRequest,
-    GridViewDetails,
-    StoredProcedureColumn,
-)
-from ab.api.models.web2lead import Web2LeadGetParams, Web2LeadGETResult, Web2LeadRequest, Web2LeadResponse
 
 __all__ = [
     # Base
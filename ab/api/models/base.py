@@ -5,7 +5,8 @@ Provides the model hierarchy:
 - ``ABConnectBaseModel`` — shared config (camelCase aliases, populate_by_name).
 - ``RequestModel`` — ``extra="forbid"`` for strict outbound validation.
 - ``ResponseModel`` — ``extra="allow"`` with ``logger.warning`` for unknown
-  fields, giving production resilience with immediate drift visibility.
+  fields, giving production resilience with immediate drift visibility
+  (once per field; see :mod:`ab.drift`).
 """
 
 from __future__ import annotations
@@ -15,6 +16,8 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 from pydantic import BaseModel, ConfigDict
 
+from ab import drift
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound="ABConnectBaseModel")
@@ -39,6 +42,7 @@ class ABConnectBaseModel(BaseModel):
         alias_generator=_to_camel,
         str_strip_whitespace=True,
         use_enum_values=True,
+        defer_build=True,
     )
 
     @classmethod
@@ -91,9 +95,10 @@ class ResponseModel(ABConnectBaseModel):
     """Base for **inbound** API response bodies.
 
     ``extra="allow"`` keeps deserialization resilient when the API adds new
-    fields.  Unknown fields are stored in ``model_extra`` and a
-    ``logger.warning`` is emitted for each one so drift is immediately
-    visible.
+    fields.  Unknown fields are stored in ``model_extra`` and counted in the
+    process-wide :data:`ab.drift.registry`; a ``logger.warning`` is emitted
+    the first time each ``(model, field)`` pair is seen so drift is
+    immediately visible without flooding the log.
     """
 
     model_config = ConfigDict(
@@ -107,9 +112,10 @@ class ResponseModel(ABConnectBaseModel):
     def model_post_init(self, __context: Any) -> None:
         if self.model_extra:
             cls_name = self.__class__.__name__
-            for field_name in self.model_extra:
-                logger.warning(
-                    "%s received unexpected field '%s' — consider adding it to the model",
-                    cls_name,
-                    field_name,
-                )
+            for field_name, value in self.model_extra.items():
+                if drift.registry.record(cls_name, field_name, value):
+                    logger.warning(
+                        "%s received unexpected field '%s' — consider adding it to the model",
+                        cls_name,
+                        field_name,
+                    )
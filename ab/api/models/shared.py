@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Generic, List, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 
 from pydantic import Field
 
@@ -138,6 +138,18 @@ class PaginatedList(ResponseModel, Generic[T]):
     has_previous_page: bool = Field(False, alias="hasPreviousPage")
     has_next_page: bool = Field(False, alias="hasNextPage")
 
+    def to_columns(self, fields: Optional[List[str]] = None, **kwargs: Any) -> Dict[str, Any]:
+        """Return this page's items as columns (see :func:`ab.api.columns.to_columns`)."""
+        from ab.api.columns import to_columns
+
+        return to_columns(self, fields, **kwargs)
+
+    def to_dataframe(self, fields: Optional[List[str]] = None, **kwargs: Any) -> Any:
+        """Return this page's items as a pandas DataFrame (see :func:`ab.api.columns.to_dataframe`)."""
+        from ab.api.columns import to_dataframe
+
+        return to_dataframe(self, fields, **kwargs)
+
 
 class ListRequest(PaginatedRequestMixin, SortableRequestMixin):
     """Shared request body for paginated list endpoints (Companies, Users)."""
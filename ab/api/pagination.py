@@ -1,8 +1,11 @@
-"""Standalone pagination helper for iterating through paginated list endpoints."""
+"""Standalone pagination helpers for iterating through paginated list endpoints."""
 
 from __future__ import annotations
 
-from typing import Any, Callable, Generator, TypeVar
+import contextvars
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Generator, Optional, TypeVar
 
 from ab.api.models.shared import PaginatedList
 
@@ -11,15 +14,21 @@ T = TypeVar("T")
 
 def paginate(
     list_fn: Callable[..., PaginatedList[T]],
+    *,
+    prefetch: int = 0,
     **kwargs: Any,
 ) -> Generator[PaginatedList[T], None, None]:
     """Yield successive pages from a paginated list endpoint.
 
     Args:
         list_fn: A bound list method (e.g. ``api.catalog.list``).
+        prefetch: When greater than zero, fetch up to this many pages ahead
+            concurrently once the first page reports ``total_pages``. Pages
+            are still yielded strictly in order. ``0`` (default) fetches one
+            page at a time.
         **kwargs: Filter and pagination keyword arguments forwarded to
-            *list_fn*.  ``page_number`` is managed automatically and
-            should not be passed.
+            *list_fn*.  ``page_number`` is the first page to fetch (default
+            ``1``) and is managed automatically after that.
 
     Yields:
         Each :class:`PaginatedList` page in order until the last page.
@@ -29,11 +38,14 @@ def paginate(
         from ab import ABConnectAPI, paginate
 
         api = ABConnectAPI()
-        for page in paginate(api.catalog.list, page_size=10):
+        for page in paginate(api.catalog.list, page_size=10, prefetch=4):
             for item in page.items:
                 print(item.title)
     """
     page_number = kwargs.pop("page_number", 1)
+    if prefetch < 0:
+        raise ValueError("prefetch must be >= 0")
+
     while True:
         result = list_fn(page_number=page_number, **kwargs)
         if result is None:
@@ -42,3 +54,78 @@ def paginate(
         if not result.has_next_page:
             return
         page_number += 1
+        if prefetch and result.total_pages >= page_number:
+            break
+
+    # Prefetch mode: the remaining page count is known, so keep a bounded
+    # window of requests in flight and hand pages back in order.
+    last_page = result.total_pages
+    pool = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="ab-paginate")
+    window: Deque[Future[PaginatedList[T]]] = deque()
+    next_to_submit = page_number
+    try:
+        while True:
+            while next_to_submit <= last_page and len(window) < prefetch:
+                # Each page runs in a copy of the caller's context, so modes such
+                # as ``with api.lazy():`` apply to prefetched pages too.
+                context = contextvars.copy_context()
+                window.append(pool.submit(context.run, list_fn, page_number=next_to_submit, **kwargs))
+                next_to_submit += 1
+            if not window:
+                break
+            result = window.popleft().result()
+            if result is None:
+                return
+            yield result
+        # The collection may have grown since the first page was read.
+        page_number = last_page + 1
+        while result.has_next_page:
+            result = list_fn(page_number=page_number, **kwargs)
+            if result is None:
+                return
+            yield result
+            page_number += 1
+    finally:
+        for future in window:
+            future.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_items(
+    list_fn: Callable[..., PaginatedList[T]],
+    *,
+    prefetch: int = 0,
+    on_page: Optional[Callable[[int], None]] = None,
+    **kwargs: Any,
+) -> Generator[T, None, None]:
+    """Yield individual items across all pages of a paginated list endpoint.
+
+    Built on :func:`paginate`, so *prefetch* and the ``page_number`` start
+    page behave identically.
+
+    Args:
+        list_fn: A bound list method (e.g. ``api.lots.list``).
+        prefetch: Pages to fetch ahead concurrently (see :func:`paginate`).
+        on_page: Resume checkpoint hook, called with a page's number once
+            every item of that page has been consumed. Persist the value and
+            pass ``page_number=<value> + 1`` to restart an interrupted export
+            after the last fully processed page.
+        **kwargs: Forwarded to *list_fn*.
+
+    Example::
+
+        from ab import iter_items
+
+        def save_checkpoint(page):
+            Path("export.ckpt").write_text(str(page))
+
+        start = int(Path("export.ckpt").read_text()) + 1 if Path("export.ckpt").exists() else 1
+        for lot in iter_items(api.lots.list, page_number=start, prefetch=4, on_page=save_checkpoint):
+            writer.writerow(lot.model_dump())
+    """
+    page_number = kwargs.get("page_number", 1)
+    for page in paginate(list_fn, prefetch=prefetch, **kwargs):
+        yield from page.items
+        if on_page is not None:
+            on_page(page_number)
+        page_number += 1
@@ -0,0 +1,284 @@
+"""Registry of every endpoint route, with constant-time lookups.
+
+Routes are declared as module-level :class:`~ab.api.route.Route` constants in
+``ab/api/endpoints/`` and referenced from endpoint methods. The SDK, the CLI
+and the progress tooling all need the same tables — which routes exist, which
+``api.<group>.<method>`` dispatches each one, and which group owns a
+``(method, path)`` — so :data:`registry` builds them once per process:
+
+    >>> from ab.api.registry import registry
+    >>> registry.route_for("jobs", "get").path
+    '/job/{jobDisplayId}'
+    >>> registry.group_for("GET", "/job/{id}")
+    'jobs'
+
+Building means importing every endpoint module and reading method source, so
+the result is written to a manifest (see :mod:`ab.manifest`) keyed by package
+version and reused by later processes until the package changes. The scan is
+lazy — it runs on the first lookup, never at ``import ab``.
+
+Method-to-route matching reads each public method's source for its first
+``self._request(_ROUTE_NAME`` call. Methods that call the transport directly,
+delegate through another helper (``self._pdf(...)``) or wrap another public
+method are not matched; the CLI lists them as helpers.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import importlib
+import inspect
+import pkgutil
+import re
+import threading
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ab import manifest
+from ab.api.route import Route
+
+# Anchored to ``self.`` to prevent false positives on helpers like
+# ``self._paginated_request(`` or ``self._pdf(``.
+_ROUTE_REF_RE = re.compile(r"self\._request\(\s*(_[A-Z_][A-Z0-9_]*)")
+_INIT_ENDPOINT_RE = re.compile(r"self\.(\w+)(?:\s*:\s*\w+)?\s*=\s*(\w+Endpoint)\(")
+_ROUTE_FIELDS = tuple(f.name for f in dataclasses.fields(Route) if f.init and not f.name.startswith("_"))
+_MANIFEST = "routes"
+
+
+def normalize_path(path: str) -> str:
+    """Normalize path parameters for matching.
+
+    Replaces ``{anything}`` with ``{_}`` so that
+    ``/companies/{companyId}/details`` and ``/companies/{id}/details``
+    both become ``/companies/{_}/details``.
+    """
+    return re.sub(r"\{[^}]+\}", "{_}", path)
+
+
+def class_key(cls: type) -> str:
+    """``"module:Qualname"`` — how the registry names an endpoint class."""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def load_class(key: str) -> type:
+    """Import the endpoint class named by :func:`class_key`."""
+    module, _, qualname = key.partition(":")
+    obj: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _iter_endpoint_modules(pkg: ModuleType) -> Iterator[ModuleType]:
+    """Yield every module under *pkg* recursively."""
+    for _importer, mod_name, ispkg in pkgutil.iter_modules(pkg.__path__):
+        module = importlib.import_module(f"{pkg.__name__}.{mod_name}")
+        yield module
+        if ispkg:
+            yield from _iter_endpoint_modules(module)
+
+
+def scan_class(cls: type) -> Dict[str, Route]:
+    """Map *cls*'s public method names to the Route constant each dispatches."""
+    module = inspect.getmodule(cls)
+    if module is None:
+        return {}
+    route_vars = {name: obj for name in dir(module) if isinstance(obj := getattr(module, name, None), Route)}
+    method_routes: Dict[str, Route] = {}
+    for method_name in dir(cls):
+        if method_name.startswith("_"):
+            continue
+        method = getattr(cls, method_name, None)
+        if method is None or not callable(method):
+            continue
+        try:
+            source = inspect.getsource(method)
+        except (OSError, TypeError):
+            continue
+        match = _ROUTE_REF_RE.search(source)
+        if match and match.group(1) in route_vars:
+            method_routes[method_name] = route_vars[match.group(1)]
+    return method_routes
+
+
+def _subgroups(parent_cls: type) -> Dict[str, type]:
+    """Class-level annotations of *parent_cls* whose type is a ``BaseEndpoint`` subclass."""
+    from ab.api.base import BaseEndpoint
+
+    out: Dict[str, type] = {}
+    for name, ann in getattr(parent_cls, "__annotations__", {}).items():
+        if name.startswith("_"):
+            continue
+        # Resolve string annotations against the class module's globals.
+        resolved = getattr(importlib.import_module(parent_cls.__module__), ann, None) if isinstance(ann, str) else ann
+        if isinstance(resolved, type) and issubclass(resolved, BaseEndpoint):
+            out[name] = resolved
+    return out
+
+
+def _scan() -> Dict[str, Any]:
+    """Import every endpoint module and describe its routes in manifest form."""
+    import ab.api.endpoints as endpoints_pkg
+    from ab.api.base import BaseEndpoint
+    from ab.client import ABConnectAPI
+
+    routes: List[Route] = []
+    names: List[Tuple[str, str]] = []
+    index: Dict[int, int] = {}
+    classes: List[type] = []
+    for module in _iter_endpoint_modules(endpoints_pkg):
+        for attr_name in dir(module):
+            obj = getattr(module, attr_name)
+            if isinstance(obj, Route) and id(obj) not in index:
+                index[id(obj)] = len(routes)
+                routes.append(obj)
+                names.append((module.__name__, attr_name))
+            elif isinstance(obj, type) and issubclass(obj, BaseEndpoint) and obj.__module__ == module.__name__:
+                classes.append(obj)
+
+    def route_index(route: Route) -> int:
+        if id(route) not in index:
+            index[id(route)] = len(routes)
+            routes.append(route)
+            names.append(("", ""))
+        return index[id(route)]
+
+    # Group names come from the attributes ABConnectAPI assigns, plus
+    # subgroups declared as class annotations ("jobs.note", ...).
+    groups: List[List[str]] = []
+    source = inspect.getsource(ABConnectAPI._init_endpoints)
+    for match in _INIT_ENDPOINT_RE.finditer(source):
+        cls = getattr(endpoints_pkg, match.group(2), None)
+        if not (isinstance(cls, type) and issubclass(cls, BaseEndpoint)):
+            continue
+        groups.append([match.group(1), class_key(cls)])
+        if cls not in classes:
+            classes.append(cls)
+        for sub_name, sub_cls in _subgroups(cls).items():
+            groups.append([f"{match.group(1)}.{sub_name}", class_key(sub_cls)])
+            if sub_cls not in classes:
+                classes.append(sub_cls)
+
+    return {
+        "routes": [
+            [module, name, {f: getattr(route, f) for f in _ROUTE_FIELDS}]
+            for (module, name), route in zip(names, routes)
+        ],
+        "classes": {
+            class_key(cls): {method: route_index(route) for method, route in scan_class(cls).items()}
+            for cls in classes
+        },
+        "groups": groups,
+    }
+
+
+class RouteRegistry:
+    """Lookup tables over every declared route (see the module docstring).
+
+    Args:
+        data: Prebuilt manifest data; by default it is loaded from the cached
+            manifest or scanned on first use.
+        use_manifest: Read and write the on-disk manifest.
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None, *, use_manifest: bool = True) -> None:
+        self._data = data
+        self._use_manifest = use_manifest
+        self._lock = threading.Lock()
+        self._routes: Optional[List[Route]] = None
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._routes is not None:
+                return
+            data = self._data
+            if data is None and self._use_manifest:
+                data = manifest.load(_MANIFEST)
+            if data is None:
+                data = _scan()
+                if self._use_manifest:
+                    manifest.store(_MANIFEST, data)
+            self._data = data
+            routes = [Route(**fields) for _module, _name, fields in data["routes"]]
+            self._constants = {(module, name): routes[i] for i, (module, name, _f) in enumerate(data["routes"])}
+            self._classes = {
+                key: {method: routes[i] for method, i in methods.items()} for key, methods in data["classes"].items()
+            }
+            self._groups = dict(data["groups"])
+            self._by_path: Dict[Tuple[str, str], List[Route]] = {}
+            for route in routes:
+                self._by_path.setdefault((route.method, normalize_path(route.path)), []).append(route)
+            self._path_groups: Dict[Tuple[str, str], str] = {}
+            for group, key in self._groups.items():
+                for _method_name, route in sorted(self._classes.get(key, {}).items()):
+                    self._path_groups.setdefault((route.method, normalize_path(route.path)), group)
+            self._routes = routes
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def routes(self) -> List[Route]:
+        """Every declared route, in endpoint-module order."""
+        self._load()
+        return list(self._routes)
+
+    def constant(self, module: str, name: str) -> Optional[Route]:
+        """The Route declared as *name* in endpoint *module*."""
+        self._load()
+        return self._constants.get((module, name))
+
+    def lookup(self, method: str, path: str) -> List[Route]:
+        """Routes for ``(method, path)``; placeholder names in *path* do not matter."""
+        self._load()
+        return list(self._by_path.get((method.upper(), normalize_path(path)), ()))
+
+    def group_for(self, method: str, path: str) -> Optional[str]:
+        """The ``api.<group>`` that exposes ``(method, path)``, if any."""
+        self._load()
+        return self._path_groups.get((method.upper(), normalize_path(path)))
+
+    def groups(self) -> Dict[str, str]:
+        """``{group: class key}`` for every ``api.<group>``, subgroups after their parent."""
+        self._load()
+        return dict(self._groups)
+
+    def methods(self, group: str) -> Dict[str, Route]:
+        """``{method name: Route}`` for the routed methods of ``api.<group>``."""
+        self._load()
+        return dict(self._classes.get(self._groups.get(group, ""), {}))
+
+    def route_for(self, group: str, method_name: str) -> Optional[Route]:
+        """The Route ``api.<group>.<method_name>()`` dispatches, if any."""
+        self._load()
+        return self._classes.get(self._groups.get(group, ""), {}).get(method_name)
+
+    def routes_for_class(self, cls: type) -> Dict[str, Route]:
+        """``{method name: Route}`` for an endpoint class (scanned if not an SDK class)."""
+        self._load()
+        known = self._classes.get(class_key(cls))
+        return dict(known) if known is not None else scan_class(cls)
+
+    def path_groups(self) -> Dict[Tuple[str, str], str]:
+        """``{(method, normalized path): group}`` for every routed method."""
+        self._load()
+        return dict(self._path_groups)
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def to_manifest(self) -> Dict[str, Any]:
+        """The registry as JSON-serialisable data (accepted back as ``data=``)."""
+        self._load()
+        return self._data
+
+    def reset(self) -> None:
+        """Forget the loaded tables; the next lookup reloads or rescans."""
+        with self._lock:
+            self._data = None
+            self._routes = None
+
+
+#: The registry the SDK, CLI and progress tooling share.
+registry = RouteRegistry()
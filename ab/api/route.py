@@ -4,7 +4,24 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import quote
+
+from ab.exceptions import ValidationError
+
+_PARAM_RE = re.compile(r"\{([^}]+)\}")
+#: Bound routes kept per template; hot loops over the same IDs hit it.
+_BOUND_CACHE_SIZE = 256
+# RFC 3986 path characters plus ``/`` and ``%`` (already-encoded values pass unchanged)
+_SAFE = "/%:@!$&'()*+,;=-._~"
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9/%:@!$&'()*+,;=\-._~]")
+
+
+def _quote(value: Any) -> str:
+    if value is None:
+        raise ValueError("None")
+    text = str(value)
+    return quote(text, safe=_SAFE) if _UNSAFE_RE.search(text) else text
 
 
 @dataclass(frozen=True)
@@ -28,32 +45,81 @@ class Route:
     #: AccessKey-authenticated autoprice quote endpoints): a token is attached
     #: when one is available, but an anonymous client may call it too.
     auth_optional: bool = False
+    #: Seconds a GET response may be served from the client's response cache
+    #: (see :mod:`ab.http_cache`). ``None`` (default) never caches. Only set
+    #: it for reference data that is identical for every caller.
+    cache_ttl: Optional[float] = None
 
     # Private: extracted ``{param}`` names — populated in __post_init__
     _path_params: frozenset[str] = field(default=frozenset(), repr=False, compare=False)
+    # Private: the template split into literals (even indexes) and names (odd)
+    _parts: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    # Private: LRU of bound routes keyed by the ``bind`` keyword items (with
+    # each value's type, so ``1``, ``1.0`` and ``True`` stay distinct)
+    _bound: Dict[Tuple[Tuple[str, type, Any], ...], Route] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         # frozen=True requires object.__setattr__ for post-init mutation
-        names = frozenset(re.findall(r"\{([^}]+)\}", self.path))
-        object.__setattr__(self, "_path_params", names)
+        parts = tuple(_PARAM_RE.split(self.path))
+        object.__setattr__(self, "_parts", parts)
+        object.__setattr__(self, "_path_params", frozenset(parts[1::2]))
 
-    def bind(self, **params: str) -> Route:
+    def bind(self, **params: Any) -> Route:
         """Return a new ``Route`` with path parameters substituted.
 
+        Every ``{param}`` in the template must be given exactly once and not
+        be ``None``; values are URL-encoded (``/`` and existing ``%XX``
+        escapes are kept). The template is parsed once, when the route is
+        declared, and the last few hundred bound routes are kept per template,
+        so repeated calls with the same values return the same instance.
+
         >>> r = Route("GET", "/companies/{companyId}/details")
         >>> bound = r.bind(companyId="abc-123")
         >>> bound.path
         '/companies/abc-123/details'
         """
-        new_path = self.path
-        for key, value in params.items():
-            new_path = new_path.replace(f"{{{key}}}", str(value))
-        return Route(
-            method=self.method,
-            path=new_path,
-            request_model=self.request_model,
-            params_model=self.params_model,
-            response_model=self.response_model,
-            api_surface=self.api_surface,
-            auth_optional=self.auth_optional,
-        )
+        key = tuple((k, type(v), v) for k, v in params.items())
+        cache = self._bound
+        try:
+            bound = cache.pop(key, None)
+        except TypeError:  # unhashable value — bind without the cache
+            return self._format(params)
+        if bound is None:
+            bound = self._format(params)
+            if len(cache) >= _BOUND_CACHE_SIZE:
+                try:
+                    del cache[next(iter(cache))]
+                except (KeyError, RuntimeError, StopIteration):  # concurrent eviction
+                    pass
+        cache[key] = bound  # (re)insert as most recently used
+        return bound
+
+    def _format(self, params: Dict[str, Any]) -> Route:
+        parts = list(self._parts)
+        try:
+            for i in range(1, len(parts), 2):
+                parts[i] = _quote(params[parts[i]])
+        except (KeyError, ValueError):
+            parts = []
+        if not parts or len(params) != len(self._path_params):
+            problems = [
+                f"{label}: {', '.join(sorted(names))}"
+                for label, names in (
+                    ("missing", self._path_params - params.keys()),
+                    ("None", {k for k, v in params.items() if v is None}),
+                    ("unknown", params.keys() - self._path_params),
+                )
+                if names
+            ]
+            raise ValidationError(f"{self.method} {self.path}: path parameters {'; '.join(problems)}")
+        # Copy the declared route without re-running __post_init__
+        bound = object.__new__(Route)
+        state = bound.__dict__
+        state.update(self.__dict__)
+        state["path"] = "".join(parts)
+        state["_parts"] = (state["path"],)
+        state["_path_params"] = frozenset()
+        state["_bound"] = {}
+        return bound
@@ -0,0 +1,365 @@
+"""Incremental decoding of large list responses into model iterators.
+
+A list route normally reads the whole body, parses it into a JSON tree and
+then builds every model, so peak memory is a few times the payload. Inside
+``with api.streaming():`` routes whose response model is ``List[Model]``
+return an :class:`ItemStream` instead: the body is read in chunks, each array
+element is cut out of the byte stream as soon as it is complete and validated
+on its own, so only one chunk and one record are held at a time::
+
+    with api.streaming():
+        rows = api.reports.sales(data=criteria)
+    with rows, open("forecast.jsonl", "w") as out:
+        for row in rows:
+            out.write(row.model_dump_json() + "\\n")
+
+Both a bare ``[...]`` body and the ``{"items": [...]}`` wrapper that
+:meth:`~ab.api.base.BaseEndpoint._unwrap_list_from_dict` handles are
+recognised. In a wrapper the first array-valued key is streamed and the rest
+of the object is skipped. This differs from the whole-body path when a
+wrapper holds several arrays: ``_unwrap_list_from_dict`` prefers the key
+named after the model even if it comes later (``{"tags": [...], "users":
+[...]}`` gives ``users`` there but ``tags`` here), because choosing it would
+mean holding every earlier array until the object closes. Combined with ``api.lazy()`` the stream yields
+:class:`~ab.api.lazy.ModelView` objects instead of models.
+
+The mode covers the calls made in the block, not lists the SDK fetches for
+its own use: helpers that search a listing more than once (BOL plan
+selection, parcel-item saves, the document mirror) make those calls inside
+:func:`buffered_responses` and get a plain list.
+
+A stream is single-pass and holds the connection open until it is exhausted
+or closed — use it as a context manager when iteration may stop early. On
+:class:`~ab.async_client.AsyncABConnectAPI` the awaited call returns an
+:class:`AsyncItemStream` (``async for``). Malformed or truncated bodies raise
+:class:`~ab.exceptions.RequestError`, as they do outside the mode.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import re
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+from pydantic import ValidationError
+
+from ab.exceptions import RequestError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_streaming: ContextVar[bool] = ContextVar("ab_streaming_responses", default=False)
+
+#: Chunk size used when reading a streamed list body.
+CHUNK_SIZE = 64 * 1024
+
+# Outside a string only brackets, separators and quotes matter; a string is
+# consumed whole (escapes included) so nothing inside it is mistaken for
+# structure. Group 1 is empty when the closing quote has not arrived yet.
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*(")?|[][{},:]')
+# Within an element: everything up to the next bracket, strings skipped whole.
+_INSIDE = re.compile(rb'(?:[^"\[\]{}]++|"[^"\\]*+(?:\\.[^"\\]*+)*+")*+')
+_NON_SPACE = re.compile(rb"\S")
+
+
+@contextlib.contextmanager
+def streaming_responses() -> Iterator[None]:
+    """Return item streams from list endpoints called in the block (see :meth:`ab.client.ABConnectAPI.streaming`)."""
+    token = _streaming.set(True)
+    try:
+        yield
+    finally:
+        _streaming.reset(token)
+
+
+@contextlib.contextmanager
+def buffered_responses() -> Iterator[None]:
+    """Return whole lists inside the block, even within :func:`streaming_responses`.
+
+    For SDK-internal calls whose result is iterated more than once.
+    """
+    token = _streaming.set(False)
+    try:
+        yield
+    finally:
+        _streaming.reset(token)
+
+
+def streaming_enabled() -> bool:
+    return _streaming.get()
+
+
+class ArrayScanner:
+    """Cuts the elements of a JSON array out of a body fed in chunks.
+
+    :meth:`feed` returns the raw bytes of every element completed so far;
+    :meth:`finish` checks that the body ended where the array did. The body
+    may be a bare array or an object wrapping one (``{"items": [...]}``); in
+    an object the first array-valued key is used, whatever its name (see the
+    module docstring). Only the unconsumed tail of the current element is
+    buffered.
+    """
+
+    def __init__(self, model_name: str = "", path: str = "", status_code: int = 0) -> None:
+        self._model_name = model_name
+        self._path = path
+        self._status_code = status_code
+        self._buf = bytearray()
+        self._pos = 0
+        self._depth = 0
+        #: ``None`` until the first significant byte, then ``"list"``, ``"dict"`` or ``"scalar"``
+        self._shape: Optional[str] = None
+        # depth of the streamed array once found, and where its pending element begins
+        self._target: Optional[int] = None
+        self._item_start = 0
+        self._separated = False
+        self._key = b""
+        self._after_colon = False
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        """``True`` once the streamed array (or the wrapper holding none) has closed."""
+        return self._done
+
+    def feed(self, data: bytes) -> List[bytes]:
+        if self._done:
+            return []
+        self._buf += data
+        if self._shape == "scalar" or (self._shape is None and not self._start()):
+            return []
+        buf = self._buf
+        items: List[bytes] = []
+        pos = self._pos
+        while not self._done:
+            if self._target is not None and self._depth > self._target:
+                # inside an element only brackets matter: skip to the next one in one call
+                start = _INSIDE.match(buf, pos).end()
+                if start == len(buf) or buf[start] == 0x22:
+                    pos = start  # wait for more data (or the rest of a string)
+                    break
+                char, end = buf[start], start + 1
+            else:
+                m = _TOKEN.search(buf, pos)
+                if m is None:
+                    pos = len(buf)
+                    break
+                start, end = m.span()
+                char = buf[start]
+            if char == 0x22:  # '"'
+                if m.group(1) is None:
+                    pos = start  # wait for the rest of the string
+                    break
+                if self._depth == 1:
+                    self._key = bytes(buf[start + 1:end - 1])
+                self._after_colon = False
+            elif char == 0x3A:  # ':'
+                self._after_colon = self._depth == 1
+            elif char == 0x5B or char == 0x7B:  # '[' '{'
+                self._depth += 1
+                if char == 0x5B and self._after_colon and self._target is None:
+                    self._choose(end)
+                self._after_colon = False
+            elif char == 0x5D or char == 0x7D:  # ']' '}'
+                if self._depth == self._target:
+                    self._cut(items, start, last=True)
+                    self._done = True
+                self._depth -= 1
+                if self._depth == 0:
+                    self._done = True
+            else:  # ','
+                if self._depth == self._target:
+                    self._cut(items, start, last=False)
+                    self._item_start = end
+                self._after_colon = False
+            pos = end
+        self._compact(pos)
+        return items
+
+    def finish(self) -> None:
+        """Raise :class:`~ab.exceptions.RequestError` if the body ended before the array did."""
+        if self._shape == "scalar":
+            if bytes(self._buf).strip() != b"null":
+                logger.error(
+                    "List[%s] expected list or dict, got a scalar. Route: %s", self._model_name, self._path
+                )
+        elif self._shape is not None and not self._done:
+            self._invalid()
+        elif self._shape == "dict" and self._target is None:
+            logger.error(
+                "List[%s] response is a dict with no list-valued keys. Route: %s", self._model_name, self._path
+            )
+
+    # ------------------------------------------------------------------
+
+    def _start(self) -> bool:
+        m = _NON_SPACE.search(self._buf)
+        if m is None:
+            self._buf.clear()
+            return False
+        first = self._buf[m.start()]
+        if first == 0x5B:  # '['
+            self._shape = "list"
+            self._depth = 1
+            self._choose(m.end())
+        elif first == 0x7B:  # '{'
+            self._shape = "dict"
+            self._depth = 1
+        else:
+            self._shape = "scalar"  # ``null`` or an error — small, checked by finish()
+            return False
+        self._pos = m.end()
+        return True
+
+    def _choose(self, start: int) -> None:
+        self._target = self._depth
+        self._item_start = start
+        if self._shape == "dict":
+            logger.warning(
+                "List[%s] response wrapped in dict; unwrapped from key '%s'. Route: %s",
+                self._model_name,
+                self._key.decode("utf-8", "replace"),
+                self._path,
+            )
+
+    def _cut(self, items: List[bytes], end: int, *, last: bool) -> None:
+        item = bytes(self._buf[self._item_start:end]).strip()
+        if item:
+            items.append(item)
+        elif not last or self._separated:
+            self._invalid()  # ``[1,,2]`` or ``[1,]``
+        self._separated = not last
+
+    def _compact(self, pos: int) -> None:
+        keep = self._item_start if self._target is not None and not self._done else pos
+        if keep:
+            del self._buf[:keep]
+            if self._target is not None:
+                self._item_start -= keep
+        self._pos = pos - keep
+
+    def _invalid(self) -> None:
+        raise RequestError(self._status_code, "Response was not valid JSON")
+
+
+def iter_array_items(
+    chunks: Iterable[bytes], model_name: str = "", path: str = "", status_code: int = 0
+) -> Iterator[bytes]:
+    """Yield the raw bytes of each element of the JSON array spread over *chunks*."""
+    scanner = ArrayScanner(model_name, path, status_code)
+    for chunk in chunks:
+        yield from scanner.feed(chunk)
+        if scanner.done:
+            break
+    scanner.finish()
+
+
+class ItemStream(Generic[T]):
+    """Single-pass iterator over the validated items of a streamed list response.
+
+    Closes the underlying response when exhausted, on error, or on
+    :meth:`close` / leaving a ``with`` block.
+    """
+
+    def __init__(
+        self,
+        response: Any,
+        decode: Callable[[bytes], T],
+        *,
+        model_name: str = "",
+        path: str = "",
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self._response = response
+        self._items = self._generate(decode, model_name, path, chunk_size)
+
+    def _generate(self, decode: Callable[[bytes], T], model_name: str, path: str, chunk_size: int) -> Iterator[T]:
+        response = self._response
+        try:
+            if response is None:
+                return
+            chunks = response.iter_content(chunk_size)
+            for raw in iter_array_items(chunks, model_name, path, response.status_code):
+                yield _decode_item(decode, raw, response)
+        finally:
+            self.close()
+
+    def __iter__(self) -> Iterator[T]:
+        return self
+
+    def __next__(self) -> T:
+        return next(self._items)
+
+    def close(self) -> None:
+        response, self._response = self._response, None
+        if response is not None:
+            response.close()
+
+    def __enter__(self) -> ItemStream[T]:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._items.close()
+        self.close()
+
+
+class AsyncItemStream(Generic[T]):
+    """:class:`ItemStream` for ``httpx`` responses (``async for``)."""
+
+    def __init__(
+        self,
+        response: Any,
+        decode: Callable[[bytes], T],
+        *,
+        model_name: str = "",
+        path: str = "",
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self._response = response
+        self._items = self._generate(decode, model_name, path, chunk_size)
+
+    async def _generate(
+        self, decode: Callable[[bytes], T], model_name: str, path: str, chunk_size: int
+    ) -> AsyncIterator[T]:
+        response = self._response
+        scanner = ArrayScanner(model_name, path, response.status_code)
+        try:
+            async for chunk in response.aiter_bytes(chunk_size):
+                for raw in scanner.feed(chunk):
+                    yield _decode_item(decode, raw, response)
+                if scanner.done:
+                    break
+            scanner.finish()
+        finally:
+            await self.aclose()
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self
+
+    async def __anext__(self) -> T:
+        return await self._items.__anext__()
+
+    async def aclose(self) -> None:
+        response, self._response = self._response, None
+        if response is not None:
+            await response.aclose()
+
+    async def __aenter__(self) -> AsyncItemStream[T]:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._items.aclose()
+        await self.aclose()
+
+
+def _decode_item(decode: Callable[[bytes], T], raw: bytes, response: Any) -> T:
+    try:
+        return decode(raw)
+    except ValidationError as exc:
+        if any(err["type"] == "json_invalid" for err in exc.errors()):
+            raise RequestError(response.status_code, "Response was not valid JSON") from exc
+        raise
+
@@ -0,0 +1,145 @@
+"""Unvalidated model construction for trusted, read-heavy workloads.
+
+Inside ``with api.trusted():`` endpoints build their response models without
+validating them — the equivalent of :meth:`~pydantic.BaseModel.model_construct`
+applied all the way down. Fields typed as a model or a list of models still
+hold instances of those classes, so attribute access reads as usual::
+
+    with api.trusted():
+        page = api.catalog.list(page_number=1, page_size=500)
+    for catalog in page.items:
+        print(catalog.id, catalog.lots[0].lot_number if catalog.lots else None)
+
+Nothing else is checked or converted: scalar fields hold the JSON value as
+sent (dates and UUIDs stay strings, whitespace is not stripped), a missing
+required field reads as ``None``, and unknown keys are kept in
+``model_extra`` without drift accounting. Use it for bulk reads of data you
+trust the API to shape correctly.
+
+A recursive ``model_construct`` in Python is slower than pydantic-core's
+validation, so the field values are collected by a pydantic-core validator
+compiled once per model from a schema that accepts any value for every
+field; only the instance itself is created in Python. That keeps it level
+with the validating path (``scripts/bench_decode.py``), not ahead of it.
+``api.lazy()`` takes precedence when both are active.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Tuple, Type
+
+from pydantic import AliasChoices, BaseModel
+from pydantic_core import SchemaValidator
+from pydantic_core import core_schema as cs
+
+from ab.api.lazy import _model_in
+
+_trusted: ContextVar[bool] = ContextVar("ab_trusted_responses", default=False)
+_object_setattr = object.__setattr__
+
+#: Envelope keys of a paginated response (see ``BaseEndpoint._page``).
+_PAGE_KEYS = ("pageNumber", "totalPages", "totalItems", "hasPreviousPage", "hasNextPage")
+
+
+@contextlib.contextmanager
+def trusted_responses() -> Iterator[None]:
+    """Build unvalidated models from endpoints called inside the block (see :meth:`ab.client.ABConnectAPI.trusted`)."""
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+def trusted_enabled() -> bool:
+    return _trusted.get()
+
+
+def _ref(model: Type[BaseModel]) -> str:
+    return f"{model.__module__}.{model.__qualname__}"
+
+
+def _nested(model: Type[BaseModel]) -> Any:
+    # A value of the wrong shape is kept as sent rather than rejected.
+    return cs.union_schema([cs.definition_reference_schema(_ref(model)), cs.any_schema()], mode="left_to_right")
+
+
+def _builder(model: Type[BaseModel]) -> Callable[[Tuple[Dict[str, Any], Any, set]], BaseModel]:
+    # What ``model_construct`` does once the field values are collected.
+    new = model.__new__
+    keep_extra = model.model_config.get("extra") == "allow"
+
+    def build(parts: Tuple[Dict[str, Any], Any, set]) -> BaseModel:
+        values, extra, fields_set = parts
+        instance = new(model)
+        _object_setattr(instance, "__dict__", values)
+        _object_setattr(instance, "__pydantic_fields_set__", fields_set)
+        _object_setattr(instance, "__pydantic_extra__", extra if keep_extra else None)
+        _object_setattr(instance, "__pydantic_private__", None)
+        return instance
+
+    return build
+
+
+def _model_schema(model: Type[BaseModel], definitions: Dict[str, Any]) -> None:
+    ref = _ref(model)
+    if ref in definitions:
+        return
+    definitions[ref] = None  # placeholder while (possibly recursive) fields are built
+    fields = {}
+    for name, info in model.model_fields.items():
+        kind, target = _model_in(info.annotation)
+        if kind == "model":
+            _model_schema(target, definitions)
+            schema = _nested(target)
+        elif kind == "list":
+            _model_schema(target, definitions)
+            schema = cs.union_schema([cs.list_schema(_nested(target)), cs.any_schema()], mode="left_to_right")
+        else:
+            schema = cs.any_schema()
+        if info.default_factory is not None:
+            schema = cs.with_default_schema(schema, default_factory=info.default_factory)
+        else:
+            schema = cs.with_default_schema(schema, default=None if info.is_required() else info.default)
+        keys = [k for k in (info.alias, name) if k]
+        if isinstance(info.validation_alias, AliasChoices):
+            keys.extend(a for a in info.validation_alias.choices if isinstance(a, str))
+        elif isinstance(info.validation_alias, str):
+            keys.append(info.validation_alias)
+        fields[name] = cs.model_field(schema, validation_alias=[[k] for k in dict.fromkeys(keys)])
+    extra = "allow" if model.model_config.get("extra") == "allow" else "ignore"
+    # A bare fields schema, not ``model_schema``: pydantic-core would compile
+    # that to the class's own validating validator. The instance is built by
+    # ``_builder`` from the collected values, leaving the class untouched.
+    definitions[ref] = cs.no_info_after_validator_function(
+        _builder(model), cs.model_fields_schema(fields, extra_behavior=extra), ref=ref
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def trusted_validator(model: Type[BaseModel], shape: str = "model") -> SchemaValidator:
+    """A validator that builds *model* without validating it.
+
+    *shape* is ``"model"`` for one object, ``"list"`` for a list of them, or
+    ``"page"`` for a paginated envelope whose ``items`` are *model*. Like a
+    :class:`~pydantic.TypeAdapter` it offers ``validate_json`` and
+    ``validate_python``; compiled once per model and shape.
+    """
+    definitions: Dict[str, Any] = {}
+    _model_schema(model, definitions)
+    if shape == "list":
+        root = cs.list_schema(_nested(model))
+    elif shape == "page":
+        root = cs.typed_dict_schema(
+            {
+                "items": cs.typed_dict_field(cs.list_schema(_nested(model)), required=False),
+                **{key: cs.typed_dict_field(cs.any_schema(), required=False) for key in _PAGE_KEYS},
+            },
+            extra_behavior="ignore",
+        )
+    else:
+        root = cs.definition_reference_schema(_ref(model))
+    return SchemaValidator(cs.definitions_schema(root, list(definitions.values())))
@@ -0,0 +1,65 @@
+"""AsyncABConnectAPI — asyncio flavour of :class:`~ab.client.ABConnectAPI`."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional
+
+from ab.async_http import _DEFAULT_MAX_CONNECTIONS, AsyncHttpClient
+from ab.client import ABConnectAPI
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncABConnectAPI(ABConnectAPI):
+    """Asyncio SDK entry point.
+
+    Exposes exactly the same endpoint groups as :class:`ABConnectAPI`
+    (including the ``api.jobs.*`` subgroups), built by the same
+    ``_init_endpoints`` and dispatched through the same :class:`~ab.api.route.Route`
+    objects. The only difference is the transport: every surface uses an
+    :class:`~ab.async_http.AsyncHttpClient`, so endpoint methods return
+    awaitables resolving to the usual typed models::
+
+        async with AsyncABConnectAPI(env="staging") as api:
+            jobs = await asyncio.gather(*(api.jobs.get(i) for i in job_ids))
+
+    Configuration, token storage and credentials behave as in
+    :class:`ABConnectAPI`. The composite helpers that orchestrate several
+    dependent calls (``api.jobs.tasks``, ``api.jobs.items``) remain
+    synchronous and raise :class:`TypeError` here; use :class:`ABConnectAPI`
+    for those. Company-code lookups
+    through :class:`~ab.cache.CodeResolver` are still blocking on a cache
+    miss.
+
+    Args:
+        max_connections: Pooled connection limit per API surface, which also
+            caps concurrent in-flight requests per surface.
+        **kwargs: Forwarded to :class:`ABConnectAPI`.
+    """
+
+    def __init__(self, *, max_connections: int = _DEFAULT_MAX_CONNECTIONS, **kwargs: Any) -> None:
+        self._max_connections = max_connections
+        super().__init__(**kwargs)
+
+    def _make_http_client(self, surface: str, base_url: str, extra_headers: Optional[Any]) -> AsyncHttpClient:
+        # A factory's rate limiters and response cache are shared; its pooled
+        # ``requests`` sessions are not (httpx keeps its own pool).
+        return AsyncHttpClient(
+            base_url,
+            self._settings,
+            self._token_storage,
+            max_connections=self._max_connections,
+            **self._transport_kwargs(surface, extra_headers),
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled connections of all three API surfaces."""
+        for client in (self._acportal, self._catalog, self._abc):
+            await client.aclose()
+
+    async def __aenter__(self) -> AsyncABConnectAPI:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
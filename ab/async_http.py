@@ -0,0 +1,234 @@
+"""Asyncio HTTP client for all ABConnect API surfaces.
+
+:class:`AsyncHttpClient` is the awaitable twin of :class:`~ab.http.HttpClient`:
+the same Bearer JWT injection, extra headers, timeout, retry-with-backoff and
+response decoding, but running on an :class:`httpx.AsyncClient` so a single
+event loop can keep hundreds of requests in flight without a thread per call.
+
+``httpx`` is an optional dependency — install it with
+``pip install "annex-abconnect[async]"``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+from ab.auth.base import Token, TokenStorage
+from ab.auth.manager import TokenManager
+from ab.config import ABConnectSettings
+from ab.exceptions import AuthenticationError, ConfigurationError, RequestError
+from ab.http import HttpClient
+from ab.http_cache import ResponseCache
+from ab.ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_CONNECTIONS = 100
+
+
+class AsyncHttpClient(HttpClient):
+    """Awaitable HTTP transport shared by endpoint classes on the async client.
+
+    :meth:`request` is a coroutine; :class:`~ab.api.base.BaseEndpoint` detects
+    the awaitable and defers model casting until it resolves, so endpoint
+    classes need no async-specific code.
+
+    Token acquisition reuses :class:`~ab.http.HttpClient`'s grant logic. The
+    fast path (a cached, unexpired token) never leaves the event loop; when a
+    refresh is due it runs once in a worker thread while concurrent callers
+    wait on an :class:`asyncio.Lock` and then reuse the new token.
+
+    Args:
+        max_connections: Upper bound on pooled connections (and therefore
+            on concurrent in-flight requests) for this surface.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        settings: ABConnectSettings,
+        token_storage: TokenStorage,
+        *,
+        allow_password_fallback: bool = True,
+        extra_headers: Optional[Union[Dict[str, str], Callable[[], Dict[str, str]]]] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        token_manager: Optional[TokenManager] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ) -> None:
+        try:
+            import httpx
+        except ImportError as exc:  # pragma: no cover - depends on environment
+            raise ConfigurationError(
+                "AsyncHttpClient requires httpx; install it with "
+                "'pip install \"annex-abconnect[async]\"'"
+            ) from exc
+        super().__init__(
+            base_url,
+            settings,
+            token_storage,
+            allow_password_fallback=allow_password_fallback,
+            extra_headers=extra_headers,
+            max_concurrency=max_concurrency,
+            rate_limiter=rate_limiter,
+            token_manager=token_manager,
+            response_cache=response_cache,
+        )
+        self._httpx = httpx
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._async_session: Optional[Any] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._async_slots: Optional[asyncio.Semaphore] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def session(self) -> Any:
+        """The underlying :class:`httpx.AsyncClient`, created on first use."""
+        if self._async_session is None:
+            self._async_session = self._httpx.AsyncClient(
+                limits=self._limits,
+                timeout=self._settings.timeout,
+            )
+        return self._async_session
+
+    async def aclose(self) -> None:
+        """Close pooled connections. Safe to call more than once."""
+        if self._async_session is not None:
+            await self._async_session.aclose()
+            self._async_session = None
+
+    # ------------------------------------------------------------------
+    # Authentication
+    # ------------------------------------------------------------------
+
+    async def _ensure_token_async(self) -> Token:
+        token = self._token_manager.peek()
+        if token is not None:
+            return token
+
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        async with self._token_lock:
+            # Another coroutine may have refreshed while we waited.
+            token = self._token_storage.get_token()
+            if token and not token.expired:
+                return token
+            return await asyncio.to_thread(self._ensure_token)
+
+    # ------------------------------------------------------------------
+    # Request helpers
+    # ------------------------------------------------------------------
+
+    async def request(  # type: ignore[override]
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        data: Any = None,
+        files: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
+        auth_optional: bool = False,
+        cache_ttl: Optional[float] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
+        stream: bool = False,
+    ) -> Any:
+        """Send an HTTP request with auth, timeout, and retry logic.
+
+        Mirrors :meth:`HttpClient.request`. With *raw* the
+        :class:`httpx.Response` is returned instead of the decoded body; with
+        *stream* a successful one is returned unread, to be consumed with
+        ``aiter_bytes()`` and closed with ``aclose()``.
+        """
+        if auth_optional:
+            try:
+                token = await self._ensure_token_async()
+            except AuthenticationError:
+                token = None
+        else:
+            token = await self._ensure_token_async()
+        url = f"{self._base_url}{path}"
+        req_headers = self._build_headers(token, headers)
+        if params:
+            # requests drops None-valued params; httpx would send them empty.
+            params = {k: v for k, v in params.items() if v is not None}
+        cache_key, cached = self._cache_lookup(method, url, params, cache_ttl, raw or stream)
+        if cached is not None:
+            if cached.fresh(cache_ttl):
+                return cached.decode(decode)
+            req_headers.update(cached.validators())
+
+        for attempt in range(1, self._settings.max_attempts + 1):
+            logger.debug("%s %s (attempt %d)", method.upper(), url, attempt)
+            wait = self._rate_limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            try:
+                async with self._async_slot():
+                    req = self.session.build_request(
+                        method.upper(),
+                        url,
+                        headers=req_headers,
+                        params=params,
+                        json=json,
+                        data=data,
+                        files=files,
+                        timeout=self._settings.timeout,
+                    )
+                    resp = await self.session.send(req, stream=stream)
+            except self._httpx.HTTPError as exc:
+                if attempt < self._settings.max_attempts:
+                    await self._async_backoff(self._backoff_delay(attempt))
+                    continue
+                raise RequestError(0, str(exc)) from exc
+
+            delay = self._retry_delay(resp, attempt)
+            if delay is not None:
+                if stream:
+                    await resp.aclose()
+                await self._async_backoff(delay)
+                continue
+
+            if raw:
+                return resp
+            if stream:
+                if 200 <= resp.status_code < 300 and resp.status_code != 204:
+                    return resp
+                await resp.aread()
+                await resp.aclose()
+                return self._handle_response(resp)
+
+            if cache_key is not None:
+                return self._cache_response(cache_key, cached, resp, decode)
+            return self._handle_response(resp, decode)
+
+        # Should not reach here, but just in case
+        raise RequestError(0, f"Request failed after {self._settings.max_attempts} attempts")
+
+    def _async_slot(self) -> Any:
+        """Async counterpart of the per-surface ``max_concurrency`` cap."""
+        if not self._max_concurrency:
+            return contextlib.nullcontext()
+        if self._async_slots is None:
+            self._async_slots = asyncio.Semaphore(self._max_concurrency)
+        return self._async_slots
+
+    @staticmethod
+    async def _async_backoff(delay: float) -> None:
+        if delay <= 0:
+            return
+        logger.info("Retrying in %.1fs…", delay)
+        await asyncio.sleep(delay)
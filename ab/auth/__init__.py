@@ -1,8 +1,9 @@
 """Authentication backends for the ABConnect SDK."""
 
 from ab.auth.base import Token, TokenStorage
-from ab.auth.db import DbTokenStorage
+from ab.auth.db import DbTokenStorage, SqliteConnectionPool, TokenCache
 from ab.auth.file import FileTokenStorage
+from ab.auth.manager import TokenManager
 from ab.auth.memory import MemoryTokenStorage
 from ab.auth.session import SessionTokenStorage
 
@@ -13,4 +14,7 @@ __all__ = [
     "MemoryTokenStorage",
     "SessionTokenStorage",
     "DbTokenStorage",
+    "TokenManager",
+    "TokenCache",
+    "SqliteConnectionPool",
 ]
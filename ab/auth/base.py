@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import contextlib
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, ContextManager, Optional
 
 
 @dataclass
@@ -42,6 +43,13 @@ class Token:
 class TokenStorage(ABC):
     """Abstract interface for persisting OAuth2 tokens."""
 
+    #: Whether :class:`~ab.auth.manager.TokenManager` may refresh a token
+    #: nearing expiry from a background thread. Storages tied to one request
+    #: (e.g. a Django session) set this to ``False``: a background
+    #: ``save_token`` could land after the request has finished, or race it
+    #: from another thread. They refresh in the calling thread once expired.
+    refresh_in_background: ClassVar[bool] = True
+
     @abstractmethod
     def get_token(self) -> Optional[Token]:
         """Return the current token, refreshing if necessary."""
@@ -53,3 +61,12 @@ class TokenStorage(ABC):
     @abstractmethod
     def clear_token(self) -> None:
         """Remove any persisted token."""
+
+    def refresh_lock(self) -> ContextManager[None]:
+        """Lock held while a token is refreshed or granted.
+
+        Backends shared between processes override this so only one process
+        talks to the identity server; the others wait, then re-read the
+        token it saved. The default is a no-op.
+        """
+        return contextlib.nullcontext()
@@ -6,15 +6,24 @@ Suitable for multi-user web applications where each user has their own session.
 The schema is a single table; tokens are stored as JSON blobs of
 ``Token.as_dict()``. The default constructor accepts any DB-API 2.0
 connection; the :meth:`from_path` convenience opens a SQLite file.
+
+For web applications that build a storage per request, share one
+:class:`TokenCache` (skips the ``SELECT`` while a session's token is fresh)
+and one :class:`SqliteConnectionPool` (WAL mode, one connection per
+concurrent caller) across all instances.
 """
 
 from __future__ import annotations
 
+import contextlib
 import json
+import queue
 import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Iterator, Optional, Tuple, Union
 
 from ab.auth.base import Token, TokenStorage
 
@@ -29,30 +38,196 @@ CREATE TABLE IF NOT EXISTS {_TABLE} (
 """
 
 
+class TokenCache:
+    """Process-wide read-through cache of tokens keyed by session ID.
+
+    Share one instance between every :class:`DbTokenStorage` backed by the
+    same database. An entry is served until the token expires or *ttl*
+    seconds pass, whichever comes first; the *ttl* bounds how long a token
+    refreshed by another process can go unnoticed.
+
+    Every write (:meth:`put` without *generation*, :meth:`invalidate`,
+    :meth:`clear`) bumps a :meth:`generation` counter. A reader takes the
+    generation before its ``SELECT`` and passes it to :meth:`put`, which then
+    drops the token if a write happened meanwhile, so a row read just before
+    a save or delete can never be cached over it.
+
+    Args:
+        ttl: Maximum seconds an entry is served without re-reading the row.
+        max_entries: Least-recently-used entries beyond this are evicted.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 10_000) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[Token, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def get(self, session_id: str) -> Optional[Token]:
+        """Return the cached token for *session_id*, or ``None`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            token, stale_at = entry
+            if time.time() >= stale_at:
+                del self._entries[session_id]
+                return None
+            self._entries.move_to_end(session_id)
+            return token
+
+    def generation(self) -> int:
+        """Counter bumped by every write; see :meth:`put`."""
+        with self._lock:
+            return self._generation
+
+    def put(self, session_id: str, token: Token, generation: Optional[int] = None) -> None:
+        """Cache *token* for *session_id* (expired tokens are not cached).
+
+        Writers omit *generation*. A reader passes the :meth:`generation` it
+        saw before reading *token*; the token is then cached only if no write
+        has happened since.
+        """
+        stale_at = min(token.expires_at, time.time() + self._ttl)
+        with self._lock:
+            if generation is not None:
+                if generation != self._generation:
+                    return
+            else:
+                self._generation += 1
+            if stale_at <= time.time():
+                self._entries.pop(session_id, None)
+                return
+            self._entries[session_id] = (token, stale_at)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop any cached token for *session_id*."""
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached token."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteConnectionPool:
+    """Thread-safe pool of SQLite connections to one database file.
+
+    Each caller checks out its own connection, so concurrent sessions do not
+    serialise on a single :class:`sqlite3.Connection`. In WAL mode readers
+    never block on the writer. The token schema is created on construction.
+
+    Args:
+        path: SQLite database file.
+        size: Maximum connections open at once; further callers wait.
+        wal: Switch the database to write-ahead logging.
+        timeout: Seconds SQLite waits on a locked database before raising.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        size: int = 8,
+        wal: bool = True,
+        timeout: float = 30.0,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self._path = str(path)
+        self._wal = wal
+        self._timeout = timeout
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        with self.connection() as conn:
+            DbTokenStorage.init_schema(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, timeout=self._timeout, check_same_thread=False)
+        if self._wal:
+            _enable_wal(conn)
+        return conn
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out a connection for the duration of the ``with`` block."""
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                self._idle.put(conn)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _enable_wal(conn: sqlite3.Connection) -> None:
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+
 class DbTokenStorage(TokenStorage):
     """Stores tokens in a database, keyed by session ID.
 
     Args:
-        connection: A DB-API 2.0 connection (e.g., :class:`sqlite3.Connection`).
-            Caller is responsible for the connection lifecycle.
+        connection: A DB-API 2.0 connection (e.g., :class:`sqlite3.Connection`)
+            or a :class:`SqliteConnectionPool`. Caller is responsible for the
+            connection lifecycle.
         session_id: The opaque session identifier this storage instance manages.
             Multiple instances with different session IDs can share the same
             connection without interference.
+        cache: Optional shared :class:`TokenCache`. Reads are served from it
+            while the token is fresh; saves write through and clears
+            invalidate.
 
     The schema is created automatically on first instantiation. Use
     :meth:`from_path` to open a SQLite file directly.
     """
 
-    def __init__(self, connection: Any, session_id: str) -> None:
-        self._conn = connection
+    def __init__(self, connection: Any, session_id: str, *, cache: Optional[TokenCache] = None) -> None:
+        self._pool = connection if isinstance(connection, SqliteConnectionPool) else None
+        self._conn = None if self._pool is not None else connection
         self._session_id = session_id
-        self.init_schema(connection)
+        self._cache = cache
+        if self._conn is not None:
+            self.init_schema(self._conn)
 
     @classmethod
-    def from_path(cls, path: Union[str, Path], session_id: str) -> "DbTokenStorage":
+    def from_path(
+        cls,
+        path: Union[str, Path],
+        session_id: str,
+        *,
+        wal: bool = False,
+        cache: Optional[TokenCache] = None,
+    ) -> "DbTokenStorage":
         """Open a SQLite database at *path* and return a storage instance."""
         conn = sqlite3.connect(str(path))
-        return cls(conn, session_id)
+        if wal:
+            _enable_wal(conn)
+        return cls(conn, session_id, cache=cache)
 
     @staticmethod
     def init_schema(connection: Any) -> None:
@@ -61,37 +236,65 @@ class DbTokenStorage(TokenStorage):
         cur.execute(_SCHEMA)
         connection.commit()
 
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[Any]:
+        if self._pool is not None:
+            with self._pool.connection() as conn:
+                yield conn
+        else:
+            yield self._conn
+
     def get_token(self) -> Optional[Token]:
-        cur = self._conn.cursor()
-        cur.execute(
-            f"SELECT token_json FROM {_TABLE} WHERE session_id = ?",
-            (self._session_id,),
-        )
-        row = cur.fetchone()
+        generation = None
+        if self._cache is not None:
+            cached = self._cache.get(self._session_id)
+            if cached is not None:
+                return cached
+            # Taken before the SELECT: a save or clear committed after it
+            # makes the row read below stale, and put() then skips it.
+            generation = self._cache.generation()
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                f"SELECT token_json FROM {_TABLE} WHERE session_id = ?",
+                (self._session_id,),
+            )
+            row = cur.fetchone()
         if row is None:
             return None
         # Deserialization failure raises explicitly (per spec FR-005)
         data = json.loads(row[0])
-        return Token.from_dict(data)
+        token = Token.from_dict(data)
+        if self._cache is not None:
+            self._cache.put(self._session_id, token, generation)
+        return token
 
     def save_token(self, token: Token) -> None:
         now = time.time()
         token_json = json.dumps(token.as_dict())
-        cur = self._conn.cursor()
-        cur.execute(
-            f"""INSERT INTO {_TABLE} (session_id, token_json, created_at, updated_at)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(session_id) DO UPDATE SET
-                    token_json = excluded.token_json,
-                    updated_at = excluded.updated_at""",
-            (self._session_id, token_json, now, now),
-        )
-        self._conn.commit()
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                f"""INSERT INTO {_TABLE} (session_id, token_json, created_at, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(session_id) DO UPDATE SET
+                        token_json = excluded.token_json,
+                        updated_at = excluded.updated_at""",
+                (self._session_id, token_json, now, now),
+            )
+            conn.commit()
+        if self._cache is not None:
+            self._cache.put(self._session_id, token)
 
     def clear_token(self) -> None:
-        cur = self._conn.cursor()
-        cur.execute(
-            f"DELETE FROM {_TABLE} WHERE session_id = ?",
-            (self._session_id,),
-        )
-        self._conn.commit()
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                f"DELETE FROM {_TABLE} WHERE session_id = ?",
+                (self._session_id,),
+            )
+            conn.commit()
+        # After the commit, as in save_token; the generation bump keeps a
+        # get_token that read the row before the DELETE from re-caching it.
+        if self._cache is not None:
+            self._cache.invalidate(self._session_id)
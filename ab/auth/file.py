@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 
 from ab.auth.base import Token, TokenStorage
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,6 +24,12 @@ class FileTokenStorage(TokenStorage):
 
     The environment suffix prevents staging and production tokens from
     contaminating each other.
+
+    The file is re-read whenever it changes on disk, so processes sharing it
+    (gunicorn or celery workers) pick up each other's refreshed tokens. With
+    ``lock=True`` refreshes are additionally serialised through an advisory
+    ``flock`` on ``<token file>.lock``: one process calls the identity server
+    while the others wait and then reuse its token.
     """
 
     def __init__(
@@ -27,6 +39,7 @@ class FileTokenStorage(TokenStorage):
         username: str | None = None,
         client_id: str | None = None,
         token_dir: str | Path | None = None,
+        lock: bool = False,
     ) -> None:
         cache_dir = Path(token_dir).expanduser() if token_dir is not None else Path.home() / ".cache" / "ab"
         cache_dir.mkdir(parents=True, exist_ok=True)
@@ -34,6 +47,10 @@ class FileTokenStorage(TokenStorage):
         scoped_name = self._scoped_filename(environment, username=username, client_id=client_id)
         self._path = cache_dir / scoped_name
         self._token: Optional[Token] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._lock_enabled = lock
+        if lock and fcntl is None:
+            logger.warning("Token file locking is not supported on this platform; continuing without it")
         self._load()
 
     @staticmethod
@@ -63,15 +80,40 @@ class FileTokenStorage(TokenStorage):
             load_path = legacy_path
         if load_path.is_file():
             try:
+                self._stamp = self._file_stamp()
                 data = json.loads(load_path.read_text())
                 self._token = Token.from_dict(data)
             except Exception:
                 logger.warning("Failed to load cached token from %s", load_path)
                 self._token = None
 
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        """Identify the current token file version (``os.replace`` swaps inodes)."""
+        try:
+            st = os.stat(self._path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_ino)
+
     def get_token(self) -> Optional[Token]:
+        stamp = self._file_stamp()
+        if stamp is not None and stamp != getattr(self, "_stamp", None):
+            self._load()
         return self._token
 
+    @contextlib.contextmanager
+    def refresh_lock(self) -> Iterator[None]:
+        if not getattr(self, "_lock_enabled", False) or fcntl is None:
+            yield
+            return
+        lock_path = self._path.with_name(f"{self._path.name}.lock")
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # closing the descriptor releases the flock
+
     def save_token(self, token: Token) -> None:
         self._token = token
         tmp_path = self._path.with_name(f"{self._path.name}.tmp")
@@ -81,6 +123,7 @@ class FileTokenStorage(TokenStorage):
                 f.write(json.dumps(token.as_dict()))
             os.replace(tmp_path, self._path)
             os.chmod(self._path, 0o600)
+            self._stamp = self._file_stamp()
         except Exception:
             logger.warning("Failed to write token to %s", self._path)
             try:
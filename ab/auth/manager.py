@@ -0,0 +1,198 @@
+"""Shared, single-flight token acquisition for all API surfaces.
+
+:class:`TokenManager` owns the OAuth2 grants (password and refresh) that
+:class:`~ab.http.HttpClient` used to run per surface. One manager is shared by
+the ACPortal, Catalog and ABC clients of an :class:`~ab.client.ABConnectAPI`,
+so:
+
+* at most one refresh or password grant is in flight at a time — concurrent
+  callers (threads or surfaces) wait for it and reuse the result. Storage
+  backends shared between processes extend this across processes through
+  :meth:`~ab.auth.base.TokenStorage.refresh_lock`; and
+* a token nearing ``expires_at`` is refreshed by a background thread while
+  requests keep using the still-valid token, so no request pays the
+  identity-server round trip in steady state.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Optional
+
+import requests
+
+from ab.auth.base import Token, TokenStorage
+from ab.config import ABConnectSettings
+from ab.exceptions import AuthenticationError
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_EXPIRY_BUFFER = 300  # seconds
+#: Start a background refresh this many seconds before ``Token.expires_at``.
+_REFRESH_AHEAD = 120  # seconds
+
+
+class TokenManager:
+    """Coordinates token refresh for every client sharing a :class:`TokenStorage`.
+
+    Args:
+        settings: SDK settings (identity URL, client credentials, timeout).
+        token_storage: Where tokens are read from and persisted to.
+        allow_password_fallback: Fall back to the configured username and
+            password when no refreshable token is available.
+        refresh_ahead: Seconds before ``expires_at`` at which a background
+            refresh starts. ``0`` disables proactive refresh, as does a
+            storage whose ``refresh_in_background`` is ``False``.
+    """
+
+    def __init__(
+        self,
+        settings: ABConnectSettings,
+        token_storage: TokenStorage,
+        *,
+        allow_password_fallback: bool = True,
+        refresh_ahead: float = _REFRESH_AHEAD,
+    ) -> None:
+        self._settings = settings
+        self._token_storage = token_storage
+        self._allow_password_fallback = allow_password_fallback
+        self._refresh_ahead = refresh_ahead
+        # Held for the duration of any grant; acquiring it is "joining the flight".
+        self._lock = threading.Lock()
+
+    @property
+    def token_storage(self) -> TokenStorage:
+        return self._token_storage
+
+    @property
+    def allow_password_fallback(self) -> bool:
+        return self._allow_password_fallback
+
+    # ------------------------------------------------------------------
+    # Token access
+    # ------------------------------------------------------------------
+
+    def peek(self) -> Optional[Token]:
+        """Return the stored token if still valid, without blocking.
+
+        Schedules a background refresh when the token is inside the
+        refresh-ahead window. Returns ``None`` when a blocking
+        :meth:`get_token` is required.
+        """
+        token = self._token_storage.get_token()
+        if token is None or token.expired:
+            return None
+        if (
+            self._refresh_ahead
+            and self._token_storage.refresh_in_background
+            and token.refresh_token
+            and token.expires_at - time.time() <= self._refresh_ahead
+        ):
+            self._refresh_in_background()
+        return token
+
+    def get_token(self) -> Token:
+        """Return a valid access token, authenticating or refreshing as needed."""
+        token = self.peek()
+        if token is not None:
+            return token
+
+        with self._lock, self._token_storage.refresh_lock():
+            # Another caller (or process) may have completed the grant while we waited.
+            token = self._token_storage.get_token()
+            if token and not token.expired:
+                return token
+
+            # Try refresh first
+            if token and token.refresh_token:
+                refreshed = self.refresh_token(token.refresh_token)
+                if refreshed:
+                    return refreshed
+
+            if not self._allow_password_fallback:
+                if token is not None:
+                    self._token_storage.clear_token()
+                raise AuthenticationError("No valid ABConnect token is available for this session")
+
+            # Fall back to password grant
+            return self.password_grant_with(
+                username=self._settings.username,
+                password=self._settings.password,
+            )
+
+    def _refresh_in_background(self) -> None:
+        if not self._lock.acquire(blocking=False):
+            return  # a grant is already in flight
+        thread = threading.Thread(target=self._background_refresh, name="ab-token-refresh", daemon=True)
+        try:
+            thread.start()
+        except Exception:
+            self._lock.release()
+            raise
+
+    def _background_refresh(self) -> None:
+        try:
+            with self._token_storage.refresh_lock():
+                token = self._token_storage.get_token()
+                if token is None or not token.refresh_token:
+                    return
+                if token.expires_at - time.time() > self._refresh_ahead:
+                    return  # refreshed elsewhere meanwhile
+                if self.refresh_token(token.refresh_token) is not None:
+                    logger.debug("Token refreshed ahead of expiry")
+        except Exception:
+            logger.info("Background token refresh failed; will retry on expiry", exc_info=True)
+        finally:
+            self._lock.release()
+
+    # ------------------------------------------------------------------
+    # Grants
+    # ------------------------------------------------------------------
+
+    def password_grant_with(self, *, username: str, password: str) -> Token:
+        """Password grant using caller-supplied credentials."""
+        if not username or not password:
+            raise AuthenticationError("Password grant requires username and password")
+        data = {
+            "grant_type": "password",
+            "username": username,
+            "password": password,
+            "client_id": self._settings.client_id,
+            "client_secret": self._settings.client_secret,
+            "scope": "offline_access",
+        }
+        resp = requests.post(self._settings.identity_url, data=data, timeout=self._settings.timeout)
+        if not resp.ok:
+            raise AuthenticationError(
+                f"Login failed for {username}: {resp.status_code} {resp.text}"
+            )
+        return self.store_token(resp.json())
+
+    def refresh_token(self, refresh_token: str) -> Optional[Token]:
+        """Exchange *refresh_token* for a new token; ``None`` if the grant fails."""
+        data = {
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+            "client_id": self._settings.client_id,
+            "client_secret": self._settings.client_secret,
+        }
+        try:
+            resp = requests.post(self._settings.identity_url, data=data, timeout=self._settings.timeout)
+            if resp.ok:
+                return self.store_token(resp.json())
+        except Exception:
+            logger.info("Refresh token failed, will attempt password grant")
+        return None
+
+    def store_token(self, payload: dict) -> Token:
+        """Build a :class:`Token` from an identity-server payload and persist it."""
+        token = Token(
+            access_token=payload["access_token"],
+            refresh_token=payload.get("refresh_token"),
+            expires_at=time.time() + payload.get("expires_in", 3600) - _TOKEN_EXPIRY_BUFFER,
+            token_type=payload.get("token_type", "Bearer"),
+        )
+        self._token_storage.save_token(token)
+        return token
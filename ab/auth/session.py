@@ -18,8 +18,13 @@ class SessionTokenStorage(TokenStorage):
     Args:
         request: A Django ``HttpRequest`` whose ``.session`` attribute
             will be used for persistence.
+
+    Tokens are never refreshed from a background thread: the session is only
+    safe to write from the request that owns it.
     """
 
+    refresh_in_background = False
+
     def __init__(self, request: Any) -> None:
         self._request = request
         self._token: Optional[Token] = None
@@ -0,0 +1,105 @@
+"""Concurrent fan-out of endpoint calls over a bounded thread pool.
+
+Production scripts commonly loop ``api.jobs.get(id)`` over thousands of IDs.
+:class:`BatchExecutor` dispatches those calls concurrently while keeping the
+ordinary endpoint path (``BaseEndpoint._request`` → ``HttpClient.request``),
+so routing, model casting and validation are identical to a serial loop.
+
+Per-surface caps configured through ``ABCONNECT_ACPORTAL_MAX_CONCURRENCY``
+(and the Catalog / ABC equivalents) are enforced by each
+:class:`~ab.http.HttpClient`, so they hold across every batch and thread.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+#: A batch outcome: the call's return value, or the exception it raised.
+BatchResult = Union[T, BaseException]
+
+
+class BatchExecutor:
+    """Runs endpoint calls concurrently and collects results in input order.
+
+    A failing item never aborts the batch: its exception is returned in its
+    slot instead of a value (like ``asyncio.gather(return_exceptions=True)``).
+    Use :meth:`raise_first` to turn that back into fail-fast behaviour.
+
+    Usage::
+
+        with api.batch(max_workers=16) as batch:
+            jobs = batch.map(api.jobs.get, job_ids)
+            tracking = batch.map(api.jobs.tracking.v3, job_ids)
+
+        for job_id, job in zip(job_ids, jobs):
+            if isinstance(job, Exception):
+                print(job_id, "failed:", job)
+
+    Args:
+        max_workers: Size of the worker pool shared by every call submitted
+            through this executor.
+    """
+
+    def __init__(self, max_workers: int = 8) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self._max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ab-batch")
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        """Schedule a single call and return its :class:`~concurrent.futures.Future`.
+
+        The call runs in a copy of the caller's context, so per-call modes such
+        as ``with api.lazy():`` carry over to the worker thread.
+        """
+        return self._pool.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+    def map(self, fn: Callable[..., T], items: Iterable[Any], /, **kwargs: Any) -> List[BatchResult[T]]:
+        """Call ``fn(item, **kwargs)`` for every item concurrently.
+
+        Returns one entry per item, in input order — the return value or the
+        exception raised for that item.
+        """
+        futures = [self.submit(fn, item, **kwargs) for item in items]
+        return [self._outcome(f) for f in futures]
+
+    def run(self, calls: Iterable[Callable[[], T]]) -> List[BatchResult[T]]:
+        """Run heterogeneous zero-argument callables (e.g. ``functools.partial``)."""
+        futures = [self.submit(call) for call in calls]
+        return [self._outcome(f) for f in futures]
+
+    @staticmethod
+    def raise_first(results: List[BatchResult[T]]) -> List[T]:
+        """Return *results* unchanged, or raise the first exception among them."""
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results  # type: ignore[return-value]
+
+    @staticmethod
+    def _outcome(future: Future[T]) -> BatchResult[T]:
+        try:
+            return future.result()
+        except Exception as exc:
+            logger.debug("Batch item failed: %r", exc)
+            return exc
+
+    def close(self) -> None:
+        """Wait for in-flight calls and release the worker threads."""
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> BatchExecutor:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<BatchExecutor max_workers={self._max_workers}>"
@@ -1,66 +1,283 @@
 """Cache-based code-to-UUID resolution (FR-012).
 
-Provides a per-client in-memory cache that lazily resolves friendly
-codes (e.g., CompanyCode ``"9999AZ"``) to their UUID equivalents via
-an external lookup service.
+Resolves friendly codes (e.g., CompanyCode ``"9999AZ"``) to their UUID
+equivalents via an external lookup service. Results are kept in a pluggable
+:class:`ResolverBackend` with a TTL:
+
+* :class:`MemoryResolverBackend` — in-process LRU. By default every client in
+  the process shares one, so new clients start warm.
+* :class:`SqliteResolverBackend` — a SQLite file shared across processes
+  (``ABCONNECT_RESOLVER_CACHE_PATH``).
+
+Failed lookups are cached too (for a shorter TTL) so an unknown code does not
+cost a round trip on every call. Keys are namespaced by the API base URL, the
+cache service URL and the API secret, so clients for different environments or
+accounts sharing a backend never see each other's entries.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import Dict, Optional
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import requests
 
+from ab.config import ABConnectSettings
 from ab.http import HttpClient
 
 logger = logging.getLogger(__name__)
 
 _CACHE_URL = "https://tasks.abconnect.co/cache/{key}"
+#: Backend value recording that a code could not be resolved.
+NEGATIVE = ""
+
+
+class ResolverBackend(ABC):
+    """Storage for resolved codes. Values are UUIDs or :data:`NEGATIVE`."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for *key*, or ``None`` if absent or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Cache *value* for *key* for *ttl* seconds."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every cached entry."""
+
+
+class MemoryResolverBackend(ResolverBackend):
+    """Thread-safe in-process LRU of resolved codes."""
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteResolverBackend(ResolverBackend):
+    """Resolved codes in a SQLite file shared by every process using it."""
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS ab_code_cache (
+        code TEXT PRIMARY KEY,
+        value TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    )
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self._path = Path(path).expanduser()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._path), timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(self._SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM ab_code_cache WHERE code = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ab_code_cache (code, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM ab_code_cache")
+            self._conn.commit()
+
+
+_shared_backend = MemoryResolverBackend()
+_sqlite_backends: Dict[str, SqliteResolverBackend] = {}
+_sqlite_backends_lock = threading.Lock()
+
+
+_lookup_session: Optional[requests.Session] = None
+_lookup_session_lock = threading.Lock()
+
+
+def _session() -> requests.Session:
+    """Keep-alive session for the cache service, shared by every resolver."""
+    global _lookup_session
+    if _lookup_session is None:
+        with _lookup_session_lock:
+            if _lookup_session is None:
+                _lookup_session = requests.Session()
+    return _lookup_session
+
+
+def _namespace(base_url: str, api_secret: str) -> str:
+    """Key prefix for one environment and account; the secret itself is never stored."""
+    identity = "\n".join((base_url.rstrip("/"), _CACHE_URL, api_secret))
+    return hashlib.sha256(identity.encode()).hexdigest()[:16]
+
+
+def _sqlite_backend(path: str) -> SqliteResolverBackend:
+    """One backend (and connection) per cache file per process."""
+    with _sqlite_backends_lock:
+        backend = _sqlite_backends.get(path)
+        if backend is None:
+            backend = _sqlite_backends[path] = SqliteResolverBackend(path)
+        return backend
 
 
 class CodeResolver:
     """Resolves friendly codes to UUIDs using the ABConnect cache service.
 
-    The resolver maintains an in-memory dict populated lazily on first
-    lookup.  Cache is per-client-instance.
+    Args:
+        client: The ACPortal :class:`HttpClient` this resolver serves.
+        api_secret: Key for the cache service.
+        backend: Where resolutions are cached. Defaults to a process-wide
+            :class:`MemoryResolverBackend` shared by every client.
+        ttl: Seconds a resolved UUID is trusted.
+        negative_ttl: Seconds a failed lookup is remembered before retrying.
+        namespace: Prefix for this resolver's backend keys. Defaults to one
+            derived from ``client.base_url`` and *api_secret*, so a shared
+            backend keeps environments and accounts apart.
     """
 
-    def __init__(self, client: HttpClient, api_secret: str) -> None:
+    def __init__(
+        self,
+        client: HttpClient,
+        api_secret: str,
+        *,
+        backend: Optional[ResolverBackend] = None,
+        ttl: float = 86_400,
+        negative_ttl: float = 300,
+        namespace: Optional[str] = None,
+    ) -> None:
         self._client = client
         self._api_secret = api_secret
-        self._cache: Dict[str, str] = {}
+        self._backend = backend if backend is not None else _shared_backend
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._namespace = namespace if namespace is not None else _namespace(client.base_url, api_secret)
+
+    @classmethod
+    def from_settings(cls, client: HttpClient, settings: ABConnectSettings) -> CodeResolver:
+        """Build a resolver using ``ABCONNECT_RESOLVER_CACHE_PATH`` when set."""
+        path = settings.resolver_cache_path
+        backend = _sqlite_backend(str(Path(path).expanduser())) if path else None
+        return cls(client, settings.client_secret, backend=backend)
+
+    @property
+    def backend(self) -> ResolverBackend:
+        return self._backend
 
     def resolve(self, code_or_uuid: str) -> str:
         """Return the UUID for *code_or_uuid*.
 
         If the value is already a UUID (contains ``-`` and is 36 chars)
-        it is returned unchanged.  Otherwise the cache service is queried.
+        it is returned unchanged.  Otherwise the cache backend, then the
+        cache service, is queried.
         """
         if self._looks_like_uuid(code_or_uuid):
             return code_or_uuid
 
         upper = code_or_uuid.upper()
-        if upper in self._cache:
-            return self._cache[upper]
+        cached = self._backend.get(self._key(upper))
+        if cached is None:
+            cached = self._fetch(upper)
+        # Fall back — let the API decide
+        return cached or code_or_uuid
 
-        resolved = self._lookup(upper)
-        if resolved:
-            self._cache[upper] = resolved
-            return resolved
+    def warm(self, codes: Iterable[str], *, max_workers: int = 8) -> Dict[str, str]:
+        """Resolve many codes concurrently and cache the results.
 
-        # Fall back — let the API decide
-        return code_or_uuid
+        Returns a mapping of each input code to its UUID (or to itself when
+        it could not be resolved), so the result can be used directly.
+        """
+        codes = list(dict.fromkeys(codes))
+        pending = [
+            upper
+            for upper in dict.fromkeys(c.upper() for c in codes if not self._looks_like_uuid(c))
+            if self._backend.get(self._key(upper)) is None
+        ]
+        fetched: Dict[str, str] = {}
+        if pending:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ab-resolve") as pool:
+                fetched = dict(zip(pending, pool.map(self._fetch, pending)))
+        # Failed lookups are not cached, so answer from *fetched* rather than asking again.
+        return {
+            code: (fetched[code.upper()] or code) if code.upper() in fetched else self.resolve(code)
+            for code in codes
+        }
 
-    def _lookup(self, key: str) -> Optional[str]:
-        import requests as _requests
+    def _fetch(self, key: str) -> str:
+        """Look *key* up remotely and cache the outcome.
+
+        A definitive miss is cached as :data:`NEGATIVE` for ``negative_ttl``;
+        an error or timeout is not cached, so the next call asks again.
+        """
+        resolved = self._lookup(key)
+        if resolved is None:
+            return NEGATIVE
+        self._backend.set(self._key(key), resolved, self._ttl if resolved else self._negative_ttl)
+        return resolved
 
+    def _key(self, code: str) -> str:
+        return f"{self._namespace}:{code}"
+
+    def _lookup(self, key: str) -> Optional[str]:
+        """Return the UUID, :data:`NEGATIVE` (404 or empty 200), or ``None`` if the service failed."""
         url = _CACHE_URL.format(key=key)
         try:
-            resp = _requests.get(url, headers={"x-api-key": self._api_secret}, timeout=10)
-            if resp.ok and resp.text:
-                return resp.text.strip()
+            resp = _session().get(url, headers={"x-api-key": self._api_secret}, timeout=10)
         except Exception:
             logger.warning("Cache lookup failed for %s", key)
-        return None
+            return None
+        if resp.status_code == 404:
+            return NEGATIVE
+        if not resp.ok:
+            logger.warning("Cache lookup failed for %s: HTTP %s", key, resp.status_code)
+            return None
+        return (resp.text or "").strip()
 
     @staticmethod
     def _looks_like_uuid(value: str) -> bool:
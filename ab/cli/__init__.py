@@ -1,13 +1,28 @@
-"""ABConnect endpoint CLI — ``ab`` (production) and ``abs`` (staging)."""
+"""ABConnect endpoint CLI — ``ab`` (production) and ``abs`` (staging).
+
+Both hand their arguments to a running ``ab --daemon`` when there is one
+(see :mod:`ab.cli.daemon`) and run them in-process otherwise.
+"""
+
+import sys
 
 from ab.cli.__main__ import main
 
 
+def _run(env: str | None) -> None:
+    from ab.cli.daemon import forward
+
+    code = forward(sys.argv[1:], env)
+    if code is not None:
+        sys.exit(code)
+    main(env=env)
+
+
 def main_prod() -> None:
     """Entry point for ``ab`` — production API."""
-    main(env=None)
+    _run(env=None)
 
 
 def main_staging() -> None:
     """Entry point for ``abs`` — staging API."""
-    main(env="staging")
+    _run(env="staging")
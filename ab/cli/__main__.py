@@ -8,6 +8,8 @@ Calls ABConnect API endpoints directly from the terminal::
     ab addr.validate --line1="123 Main"  # dot syntax
     ab addr --list                       # list methods in endpoint
     ab addr validate --help              # show method parameters
+    ab shell                             # interactive prompt, one client
+    ab --daemon                          # serve later ab calls (see ab.cli.daemon)
 """
 
 from __future__ import annotations
@@ -17,7 +19,7 @@ import sys
 from typing import Any
 
 from ab.cli.aliases import ALIASES
-from ab.cli.discovery import EndpointInfo, MethodInfo, discover_endpoints_from_class
+from ab.cli.discovery import EndpointInfo, MethodInfo, load_endpoints
 from ab.cli.formatter import format_result
 from ab.cli.parser import is_help_token, parse_cli_args
 
@@ -186,13 +188,22 @@ def _create_api(env: str | None) -> Any:
 # ------------------------------------------------------------------
 
 
-def main(env: str | None = None) -> None:
+def main(env: str | None = None, *, argv: list[str] | None = None, api: Any = None) -> None:
     """Core CLI dispatcher.
 
     Args:
         env: ``None`` for production, ``"staging"`` for staging.
+        argv: Arguments to dispatch (default ``sys.argv[1:]``).
+        api: An already-initialised client to call through, as the shell
+            and daemon pass; by default one is created for the call.
     """
-    args = sys.argv[1:]
+    args = sys.argv[1:] if argv is None else argv
+
+    if args and args[0] in ("shell", "--daemon", "--daemon-stop"):
+        from ab.cli import daemon
+
+        {"shell": daemon.shell, "--daemon": daemon.serve, "--daemon-stop": daemon.stop}[args[0]](env)
+        sys.exit(0)
 
     # Pop the global --json flag before per-method arg parsing sees it.
     as_json = "--json" in args
@@ -201,7 +212,7 @@ def main(env: str | None = None) -> None:
 
     # --list / help at top level don't need credentials
     if not args or args == ["--list"] or (len(args) == 1 and is_help_token(args[0])):
-        registry = discover_endpoints_from_class()
+        registry = load_endpoints()
         _list_all(registry)
         sys.exit(0)
 
@@ -216,8 +227,9 @@ def main(env: str | None = None) -> None:
         method_part = None
         rest = args[1:]
 
-    # Class-level discovery for --list operations (no credentials)
-    registry = discover_endpoints_from_class()
+    # Class-level discovery for --list operations (no credentials), read
+    # from the cached manifest so only the dispatched call imports endpoints
+    registry = load_endpoints()
 
     resolved = _resolve_module(mod_part, registry)
     if resolved is None:
@@ -269,7 +281,8 @@ def main(env: str | None = None) -> None:
     positional, keyword = parse_cli_args(rest, method)
 
     # Now we need a live client — create it
-    api = _create_api(env)
+    if api is None:
+        api = _create_api(env)
 
     # Get the live endpoint instance (walking dotted path for subgroups
     # such as "jobs.note" -> api.jobs.note) and the bound method.
@@ -0,0 +1,274 @@
+"""Keep one warm client for many ``ab`` commands.
+
+Every ``ab ...`` process imports the SDK, loads settings, reads the token
+file and opens new TLS connections before making its one request. Two ways
+to pay that once:
+
+* ``ab shell`` — an interactive prompt; each line is an ``ab`` command line
+  (``jobs get 2000000``) dispatched through the same :class:`ABConnectAPI`.
+* ``ab --daemon`` — serve on a Unix socket until ``ab --daemon-stop``. While
+  it runs, ``ab``/``abs`` forward their arguments to it and print its output,
+  so a shell loop of ``ab`` calls costs one HTTP round trip per command.
+
+The socket is ``$ABCONNECT_DAEMON_SOCKET`` if set (``off`` disables
+forwarding), else ``ab-<env>.sock`` in a private per-user directory under
+``$XDG_RUNTIME_DIR`` (or the temp directory); that directory must belong to
+the current user and be closed to everyone else (0700), or the daemon refuses
+to bind and ``ab`` runs commands itself. Forwarded commands run in the
+caller's working directory, so relative paths mean what they would locally.
+The daemon keeps the settings and credentials it started with; restart it
+after changing them. Commands run one at a time, in arrival order.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+_COMMANDS = ("shell", "--daemon", "--daemon-stop")
+
+#: Seconds to wait for a connection, and for the reply to a forwarded command.
+_CONNECT_TIMEOUT = 2.0
+_REPLY_TIMEOUT = 600.0
+
+
+def socket_path(env: str | None) -> Path | None:
+    """The daemon socket for *env*, or ``None`` when forwarding is disabled."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    configured = os.environ.get("ABCONNECT_DAEMON_SOCKET")
+    if configured is not None:
+        return None if configured.strip().lower() in ("", "0", "off", "false") else Path(configured).expanduser()
+    return _default_dir() / f"ab-{env or 'production'}.sock"
+
+
+def _default_dir() -> Path:
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    user = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    return Path(base) / f"abconnect-{user}"
+
+
+def _check_private(path: Path) -> None:
+    """Raise :class:`OSError` unless the default socket directory is ours alone.
+
+    ``/tmp/abconnect-<uid>`` can be created by anyone before the daemon first
+    runs; a directory another user owns or can write to could hold their
+    socket, which would then receive our command lines. An explicit
+    ``$ABCONNECT_DAEMON_SOCKET`` is the user's own choice and is not checked.
+    """
+    if path.parent != _default_dir() or not hasattr(os, "getuid"):
+        return
+    info = path.parent.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) & 0o077:
+        raise OSError(f"refusing to use {path.parent}: it must be a directory owned by you with mode 0700")
+
+
+def _connect(path: Path) -> socket.socket:
+    _check_private(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(_CONNECT_TIMEOUT)
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _exchange(sock: socket.socket, request: dict[str, Any]) -> dict[str, Any]:
+    with sock:
+        sock.settimeout(_REPLY_TIMEOUT)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as reader:
+            return json.loads(reader.readline())
+
+
+def _call(path: Path, request: dict[str, Any]) -> dict[str, Any]:
+    return _exchange(_connect(path), request)
+
+
+def forward(argv: list[str], env: str | None) -> int | None:
+    """Run *argv* on a running daemon; return its exit code, or ``None`` if none answers."""
+    if argv and argv[0] in _COMMANDS:
+        return None
+    path = socket_path(env)
+    if path is None or not path.exists():
+        return None
+    try:
+        sock = _connect(path)
+    except OSError:
+        return None
+    # Once the command is sent it may have run, so a lost reply is an error
+    # rather than a reason to run it again locally.
+    try:
+        reply = _exchange(sock, {"argv": argv, "cwd": os.getcwd()})
+    except (OSError, ValueError) as exc:
+        print(f"Error: no reply from the ab daemon on {path}: {exc}", file=sys.stderr)
+        return 1
+    sys.stdout.write(reply["stdout"])
+    sys.stderr.write(reply["stderr"])
+    return reply["code"]
+
+
+def run(argv: list[str], env: str | None, api: Any, cwd: str | None = None) -> tuple[int, str, str]:
+    """Dispatch one ``ab`` command line through *api*; return ``(code, stdout, stderr)``.
+
+    With *cwd*, the command runs in that directory (the forwarding client's).
+    """
+    from ab.cli.__main__ import main
+
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            with contextlib.chdir(cwd) if cwd else contextlib.nullcontext():
+                main(env, argv=argv, api=api)
+        except SystemExit as exc:
+            code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+            if isinstance(exc.code, str):
+                print(exc.code, file=sys.stderr)
+        except Exception as exc:  # noqa: BLE001 — report, keep serving
+            print(f"Error: {exc}", file=sys.stderr)
+            code = 1
+    return code, out.getvalue(), err.getvalue()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: _Server
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        argv = list(request.get("argv", []))
+        if request.get("stop"):
+            reply: dict[str, Any] = {"code": 0, "stdout": "", "stderr": "ab daemon stopped\n"}
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        elif argv and argv[0] in _COMMANDS:
+            reply = {"code": 1, "stdout": "", "stderr": f"'{argv[0]}' cannot be forwarded to the daemon\n"}
+        else:
+            code, stdout, stderr = run(argv, self.server.env, self.server.api, request.get("cwd"))
+            reply = {"code": code, "stdout": stdout, "stderr": stderr}
+        self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+
+class _Server(socketserver.UnixStreamServer):
+    def __init__(self, path: Path, env: str | None, api: Any) -> None:
+        self.env = env
+        self.api = api
+        super().__init__(str(path), _Handler)
+
+
+def _bind(path: Path, env: str | None, api: Any) -> _Server:
+    """Bind *path* (0600, in a 0700 directory), replacing a stale socket."""
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _check_private(path)
+    if path.exists():
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(str(path))
+        except OSError:
+            path.unlink()
+        else:
+            raise OSError(f"an ab daemon is already listening on {path}")
+    old_umask = os.umask(0o177)
+    try:
+        return _Server(path, env, api)
+    finally:
+        os.umask(old_umask)
+
+
+def serve(env: str | None, *, api: Any = None, path: Path | None = None, ready: threading.Event | None = None) -> None:
+    """Run the daemon in the foreground until ``ab --daemon-stop``.
+
+    Args:
+        env: ``None`` for production, ``"staging"`` for staging.
+        api: Client to dispatch through (default: a new one, warmed up).
+        path: Socket path (default :func:`socket_path`).
+        ready: Set once the socket accepts connections.
+    """
+    from ab.cli.__main__ import _create_api
+
+    path = path or socket_path(env)
+    if path is None:
+        sys.exit("ABCONNECT_DAEMON_SOCKET is off; set it to a socket path to run the daemon")
+    if api is None:
+        import ab
+
+        api = _create_api(env)
+        ab.warmup()
+    try:
+        server = _bind(path, env, api)
+    except OSError as exc:
+        sys.exit(str(exc))
+    print(f"ab daemon listening on {path}", file=sys.stderr)
+    if ready is not None:
+        ready.set()
+    try:
+        with server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+
+
+def stop(env: str | None) -> None:
+    """Ask the daemon for *env* to exit."""
+    path = socket_path(env)
+    try:
+        if path is None:
+            raise FileNotFoundError
+        reply = _call(path, {"stop": True})
+    except (OSError, ValueError):
+        sys.exit(f"no ab daemon is listening on {path}")
+    sys.stderr.write(reply["stderr"])
+
+
+def shell(env: str | None, *, api: Any = None) -> None:
+    """Read ``ab`` command lines from stdin and run them through one client."""
+    import shlex
+
+    from ab.cli.__main__ import _create_api
+
+    api = api if api is not None else _create_api(env)
+    interactive = sys.stdin.isatty()
+    if interactive:
+        with contextlib.suppress(ImportError):
+            import readline  # noqa: F401 — line editing and history for input()
+        print("ab shell — enter ab commands ('jobs get 2000000', '--list'); 'exit' to quit", file=sys.stderr)
+    while True:
+        try:
+            line = input("ab> " if interactive else "")
+        except EOFError:
+            break
+        except KeyboardInterrupt:
+            print(file=sys.stderr)
+            continue
+        try:
+            argv = shlex.split(line)
+        except ValueError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            continue
+        if not argv:
+            continue
+        if argv[0] in ("exit", "quit"):
+            break
+        if argv[0] in _COMMANDS:
+            print(f"'{argv[0]}' is not available inside the shell", file=sys.stderr)
+            continue
+        _code, stdout, stderr = run(argv, env, api)
+        sys.stdout.write(stdout)
+        sys.stderr.write(stderr)
@@ -158,15 +158,13 @@ def _format_return_annotation(ann: Any) -> str:
 def discover_endpoints_from_class() -> dict[str, EndpointInfo]:
     """Discover endpoint groups by inspecting ABConnectAPI._init_endpoints.
 
-    This approach avoids instantiating the client (no credentials needed)
-    by parsing the attribute assignments in ``_init_endpoints``.
+    This approach avoids instantiating the client (no credentials needed):
+    group names, classes and method routes come from the shared
+    :data:`~ab.api.registry.registry`, which parses the attribute assignments
+    in ``_init_endpoints`` (plus subgroups such as ``jobs.note``).
     """
-    import re
-
-    from ab.api.base import BaseEndpoint
+    from ab.api.registry import load_class, registry
     from ab.cli.aliases import ALIASES
-    from ab.cli.route_resolver import resolve_routes_for_class
-    from ab.client import ABConnectAPI
 
     endpoints: dict[str, EndpointInfo] = {}
 
@@ -175,92 +173,29 @@ def discover_endpoints_from_class() -> dict[str, EndpointInfo]:
     for alias, target in ALIASES.items():
         reverse_aliases.setdefault(target, []).append(alias)
 
-    # Inspect _init_endpoints source to find attribute name → class mappings
-    source = inspect.getsource(ABConnectAPI._init_endpoints)
-    # Parse lines like: self.address: AddressEndpoint = AddressEndpoint(self._acportal)
-
-    for match in re.finditer(r"self\.(\w+)(?:\s*:\s*\w+)?\s*=\s*(\w+Endpoint)\(", source):
-        attr_name = match.group(1)
-        class_name = match.group(2)
-
-        # Resolve the class from the endpoints package
-        from ab.api import endpoints as ep_module
-
-        cls = getattr(ep_module, class_name, None)
-        if cls is None or not (isinstance(cls, type) and issubclass(cls, BaseEndpoint)):
-            continue
-
+    for name, key in registry.groups().items():
+        cls = load_class(key)
         methods = _extract_methods(cls)
 
         # Resolve method → Route mapping
-        method_routes = resolve_routes_for_class(cls)
+        method_routes = registry.methods(name)
         for m in methods:
             if m.name in method_routes:
                 m.route = method_routes[m.name]
 
-        # Compute path_root from collected Route paths
-        path_root = _compute_path_root(method_routes)
-
-        endpoints[attr_name] = EndpointInfo(
-            name=attr_name,
+        # Subgroups ("<parent>.<sub>") are reached through their parent, so
+        # they carry no aliases of their own.
+        endpoints[name] = EndpointInfo(
+            name=name,
             endpoint_class=cls,
             methods=methods,
-            aliases=sorted(reverse_aliases.get(attr_name, [])),
-            path_root=path_root,
+            aliases=[] if "." in name else sorted(reverse_aliases.get(name, [])),
+            path_root=_compute_path_root(method_routes),
         )
 
-        # Discover subgroups declared as class-level annotations whose type
-        # is a BaseEndpoint subclass. Register each under the namespaced
-        # name "<parent>.<sub>" so the CLI can dispatch "ab jobs note ...".
-        for sub_attr_name, sub_cls in _discover_subgroups(cls).items():
-            sub_methods = _extract_methods(sub_cls)
-            sub_method_routes = resolve_routes_for_class(sub_cls)
-            for sm in sub_methods:
-                if sm.name in sub_method_routes:
-                    sm.route = sub_method_routes[sm.name]
-
-            sub_name = f"{attr_name}.{sub_attr_name}"
-            endpoints[sub_name] = EndpointInfo(
-                name=sub_name,
-                endpoint_class=sub_cls,
-                methods=sub_methods,
-                aliases=[],
-                path_root=_compute_path_root(sub_method_routes),
-            )
-
     return endpoints
 
 
-def _discover_subgroups(parent_cls: type) -> dict[str, type]:
-    """Find class-level annotations whose type is a ``BaseEndpoint`` subclass.
-
-    Used to expose ``api.jobs.note``, ``api.jobs.on_hold``, etc. as
-    discoverable CLI endpoints with hierarchical names like ``jobs.note``.
-    """
-    from ab.api.base import BaseEndpoint
-
-    out: dict[str, type] = {}
-    try:
-        hints = parent_cls.__annotations__
-    except AttributeError:
-        return out
-    for name, ann in hints.items():
-        if name.startswith("_"):
-            continue
-        # Resolve string annotations against the class module's globals.
-        resolved = ann
-        if isinstance(ann, str):
-            mod = getattr(parent_cls, "__module__", None)
-            if mod:
-                import importlib
-
-                module = importlib.import_module(mod)
-                resolved = getattr(module, ann, None)
-        if isinstance(resolved, type) and issubclass(resolved, BaseEndpoint):
-            out[name] = resolved
-    return out
-
-
 def _compute_path_root(method_routes: dict[str, Route]) -> str | None:
     """Extract the common first path segment from a set of Routes."""
     if not method_routes:
@@ -334,3 +269,117 @@ def discover_endpoints_from_instance(api: object) -> dict[str, EndpointInfo]:
         )
 
     return endpoints
+
+
+# ------------------------------------------------------------------
+# Cached manifest
+#
+# Class discovery imports every endpoint module and calls
+# inspect.signature on every method. The CLI instead reads the same
+# EndpointInfo tree from a JSON manifest (see ab.manifest), rebuilt
+# whenever the package's files change.
+# ------------------------------------------------------------------
+
+_MANIFEST = "cli"
+_ANNOTATION_TYPES: dict[str, type] = {t.__name__: t for t in (bool, dict, float, int, str)}
+_JSON_DEFAULTS = (type(None), bool, int, float, str)
+
+
+def _param_to_manifest(p: ParamInfo) -> dict[str, Any]:
+    out: dict[str, Any] = {"name": p.name, "cli_name": p.cli_name, "required": p.required, "kind": p.kind}
+    if isinstance(p.annotation, type):
+        if _ANNOTATION_TYPES.get(p.annotation.__name__) is not p.annotation:
+            raise TypeError(f"cannot record annotation {p.annotation!r} of {p.name}")
+        out["type"] = p.annotation.__name__
+    elif p.annotation is not None:
+        out["annotation"] = str(p.annotation)
+    if p.default is not inspect.Parameter.empty:
+        if not isinstance(p.default, _JSON_DEFAULTS):
+            raise TypeError(f"cannot record default {p.default!r} of {p.name}")
+        out["default"] = p.default
+    return out
+
+
+def _param_from_manifest(data: dict[str, Any]) -> ParamInfo:
+    annotation = _ANNOTATION_TYPES[data["type"]] if "type" in data else data.get("annotation")
+    return ParamInfo(
+        name=data["name"],
+        cli_name=data["cli_name"],
+        annotation=annotation,
+        default=data.get("default", inspect.Parameter.empty),
+        required=data["required"],
+        kind=data["kind"],
+    )
+
+
+def endpoints_to_manifest(endpoints: dict[str, EndpointInfo]) -> dict[str, Any]:
+    """Serialise class-discovered endpoints for :func:`endpoints_from_manifest`.
+
+    Raises:
+        TypeError: A parameter annotation or default has no JSON form.
+    """
+    from ab.api.registry import _ROUTE_FIELDS
+
+    return {
+        name: {
+            "aliases": info.aliases,
+            "path_root": info.path_root,
+            "methods": [
+                {
+                    "name": m.name,
+                    "positional": [_param_to_manifest(p) for p in m.positional_params],
+                    "keyword": [_param_to_manifest(p) for p in m.keyword_params],
+                    "docstring": m.docstring,
+                    "returns": m.return_annotation,
+                    "route": None if m.route is None else {f: getattr(m.route, f) for f in _ROUTE_FIELDS},
+                }
+                for m in info.methods
+            ],
+        }
+        for name, info in endpoints.items()
+    }
+
+
+def endpoints_from_manifest(data: dict[str, Any]) -> dict[str, EndpointInfo]:
+    """Rebuild :func:`discover_endpoints_from_class` output without importing endpoints.
+
+    ``endpoint_class`` is left ``None``.
+    """
+    return {
+        name: EndpointInfo(
+            name=name,
+            methods=[
+                MethodInfo(
+                    name=m["name"],
+                    positional_params=[_param_from_manifest(p) for p in m["positional"]],
+                    keyword_params=[_param_from_manifest(p) for p in m["keyword"]],
+                    docstring=m["docstring"],
+                    route=None if m["route"] is None else Route(**m["route"]),
+                    return_annotation=m["returns"],
+                )
+                for m in info["methods"]
+            ],
+            aliases=info["aliases"],
+            path_root=info["path_root"],
+        )
+        for name, info in data.items()
+    }
+
+
+def load_endpoints() -> dict[str, EndpointInfo]:
+    """Endpoint groups for the CLI — from the cached manifest when it is current.
+
+    Falls back to :func:`discover_endpoints_from_class` (and caches its
+    result) when there is no manifest for the installed package.
+    """
+    from ab import manifest
+
+    data = manifest.load(_MANIFEST)
+    if data is not None:
+        return endpoints_from_manifest(data)
+    endpoints = discover_endpoints_from_class()
+    try:
+        manifest.store(_MANIFEST, endpoints_to_manifest(endpoints))
+    except TypeError:
+        pass
+    return endpoints
@@ -14,6 +14,7 @@ without it falls back to JSON.
 
 from __future__ import annotations
 
+import dataclasses
 import json
 from typing import Any
 
@@ -56,5 +57,9 @@ def format_result(result: Any, *, as_json: bool = False) -> str:
     if isinstance(result, dict):
         return json.dumps(result, indent=2)
 
+    # Result records such as ab.api.download.Download
+    if dataclasses.is_dataclass(result) and not isinstance(result, type):
+        return json.dumps(dataclasses.asdict(result), indent=2, default=str)
+
     # Primitive types (str, int, bool, float)
     return str(result)
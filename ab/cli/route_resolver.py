@@ -11,7 +11,7 @@ Known limitations
   in JobsEndpoint, ``upload``/``get`` in DocumentsEndpoint.
 - Methods that delegate through a private helper (e.g. ``self._pdf()`` in
   FormsEndpoint) will NOT be matched unless the helper is added to the
-  regex alternation below.
+  regex alternation in :mod:`ab.api.registry`.
 - Wrapper methods that call another public method instead of ``_request``
   (e.g. ``get_timeline`` → ``get_timeline_response``) will NOT be matched.
 
@@ -21,48 +21,19 @@ listings — a graceful degradation, not an error.
 
 from __future__ import annotations
 
-import inspect
 import re
 
+from ab.api.registry import registry
 from ab.api.route import Route
 
-# Anchored to ``self.`` to prevent false positives on helpers like
-# ``self._paginated_request(`` or ``self._pdf(``.
-_ROUTE_REF_RE = re.compile(r"self\._request\(\s*(_[A-Z_][A-Z0-9_]*)")
-
 
 def resolve_routes_for_class(cls: type) -> dict[str, Route]:
-    """Map method names to their Route constants via source introspection."""
-    module = inspect.getmodule(cls)
-    if module is None:
-        return {}
-
-    # Collect all Route constants in the module
-    route_vars: dict[str, Route] = {}
-    for name in dir(module):
-        obj = getattr(module, name, None)
-        if isinstance(obj, Route):
-            route_vars[name] = obj
+    """Map method names to their Route constants via source introspection.
 
-    # For each public method, find which Route it references
-    method_routes: dict[str, Route] = {}
-    for method_name in dir(cls):
-        if method_name.startswith("_"):
-            continue
-        method = getattr(cls, method_name, None)
-        if method is None or not callable(method):
-            continue
-        try:
-            source = inspect.getsource(method)
-        except (OSError, TypeError):
-            continue
-        match = _ROUTE_REF_RE.search(source)
-        if match:
-            route_name = match.group(1)
-            if route_name in route_vars:
-                method_routes[method_name] = route_vars[route_name]
-
-    return method_routes
+    SDK endpoint classes are answered from the shared
+    :data:`~ab.api.registry.registry`; other classes are scanned directly.
+    """
+    return registry.routes_for_class(cls)
 
 
 def path_param_to_constant(param: str) -> str:
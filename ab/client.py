@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, Optional
 
 from ab.auth.base import Token, TokenStorage
 from ab.auth.file import FileTokenStorage
+from ab.auth.manager import TokenManager
 from ab.auth.session import SessionTokenStorage
 from ab.cache import CodeResolver
 from ab.config import load_settings
 from ab.http import HttpClient
+from ab.http_cache import ResponseCache
+from ab.ratelimit import RateLimiter
 
 if TYPE_CHECKING:
     from ab.api.endpoints import (
@@ -39,6 +42,8 @@ if TYPE_CHECKING:
         ViewsEndpoint,
         Web2LeadEndpoint,
     )
+    from ab.batch import BatchExecutor
+    from ab.factory import ClientFactory
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +109,7 @@ class ABConnectAPI:
         allow_password_fallback: Optional[bool] = None,
         anonymous: bool = False,
         extra_headers: Optional[Any] = None,
+        factory: Optional[ClientFactory] = None,
     ) -> None:
         """See class docstring. Additional keyword args:
 
@@ -117,6 +123,9 @@ class ABConnectAPI:
                 ``dict`` — of headers attached to every request on all three
                 API surfaces (e.g. ``X-Correlation-ID`` / ``traceparent``).
                 Per-call ``headers=`` still win on conflict.
+            factory: A process-wide :class:`~ab.factory.ClientFactory`. Its
+                parsed settings, pooled sessions, rate limiters and code
+                resolver are reused; *env* and *env_file* are ignored.
         """
         if anonymous and token_storage is None:
             from ab.auth.memory import MemoryTokenStorage
@@ -125,11 +134,15 @@ class ABConnectAPI:
             if allow_password_fallback is None:
                 allow_password_fallback = False
         external_storage = token_storage is not None or request is not None
-        self._settings = load_settings(
-            env=env,
-            env_file=env_file,
-            require_credentials=not external_storage,
-        )
+        self._factory = factory
+        if factory is not None:
+            self._settings = factory.settings
+        else:
+            self._settings = load_settings(
+                env=env,
+                env_file=env_file,
+                require_credentials=not external_storage,
+            )
         self._allow_password_fallback = (
             True if allow_password_fallback is None else allow_password_fallback
         )
@@ -144,41 +157,78 @@ class ABConnectAPI:
                 environment=self._settings.environment,
                 username=self._settings.username,
                 client_id=self._settings.client_id,
+                lock=self._settings.token_file_lock,
             )
 
-        # HTTP clients — one per API surface
-        self._acportal = HttpClient(
-            self._settings.acportal_base_url,
-            self._settings,
-            self._token_storage,
-            allow_password_fallback=self._allow_password_fallback,
-            extra_headers=extra_headers,
-        )
-        self._catalog = HttpClient(
-            self._settings.catalog_base_url,
-            self._settings,
-            self._token_storage,
-            allow_password_fallback=self._allow_password_fallback,
-            extra_headers=extra_headers,
-        )
-        self._abc = HttpClient(
-            self._settings.abc_base_url,
+        # One token manager for all surfaces: refreshes are single-flight
+        # and happen in the background ahead of expiry.
+        self._token_manager = TokenManager(
             self._settings,
             self._token_storage,
             allow_password_fallback=self._allow_password_fallback,
-            extra_headers=extra_headers,
         )
 
+        # Opt-in GET response cache, shared by all surfaces (keys include the URL)
+        if factory is not None:
+            self._response_cache = factory.response_cache
+        else:
+            self._response_cache = ResponseCache.from_settings(self._settings)
+
+        # HTTP clients — one per API surface
+        self._acportal = self._make_http_client("acportal", self._settings.acportal_base_url, extra_headers)
+        self._catalog = self._make_http_client("catalog", self._settings.catalog_base_url, extra_headers)
+        self._abc = self._make_http_client("abc", self._settings.abc_base_url, extra_headers)
+
         # Code resolver (uses cache service for code→UUID)
-        self._resolver = CodeResolver(self._acportal, self._settings.client_secret)
+        if factory is not None:
+            self._resolver = factory.resolver
+        else:
+            self._resolver = CodeResolver.from_settings(self._acportal, self._settings)
 
         # Endpoint groups — populated in T048 after all endpoints exist
         self._init_endpoints()
 
+    def _transport_kwargs(self, surface: str, extra_headers: Optional[Any]) -> Dict[str, Any]:
+        """Wiring shared by the sync and async transports of one API surface.
+
+        The token manager, the response cache and — with a factory — the
+        process-wide rate limiter are the same objects whichever transport
+        the client uses.
+        """
+        factory = self._factory
+        return {
+            "allow_password_fallback": self._allow_password_fallback,
+            "extra_headers": extra_headers,
+            "max_concurrency": self._settings.max_concurrency_for(surface),
+            "rate_limiter": (
+                factory.rate_limiter_for(surface)
+                if factory is not None
+                else RateLimiter(self._settings.rate_limit_for(surface))
+            ),
+            "token_manager": self._token_manager,
+            "response_cache": self._response_cache,
+        }
+
+    def _make_http_client(self, surface: str, base_url: str, extra_headers: Optional[Any]) -> HttpClient:
+        """Build the transport for one API surface (overridden by the async client)."""
+        factory = self._factory
+        return HttpClient(
+            base_url,
+            self._settings,
+            self._token_storage,
+            session=factory.session_for(surface) if factory is not None else None,
+            **self._transport_kwargs(surface, extra_headers),
+        )
+
     def _client_for(self, surface: str) -> HttpClient:
         """Return the HttpClient for the given API surface name."""
         return {"acportal": self._acportal, "catalog": self._catalog, "abc": self._abc}[surface]
 
+    @property
+    def resolver(self) -> CodeResolver:
+        """The company-code resolver; ``api.resolver.warm(codes)`` pre-resolves in bulk."""
+        return self._resolver
+
     def login(self, username: str, password: str) -> Token:
         """Authenticate with explicit credentials and prime token storage.
 
@@ -186,7 +236,71 @@ class ABConnectAPI:
         session storage. The token is persisted through the storage backend
         selected at construction time.
         """
-        return self._acportal._password_grant_with(username=username, password=password)
+        return self._token_manager.password_grant_with(username=username, password=password)
+
+    def batch(self, max_workers: int = 8) -> BatchExecutor:
+        """Return a :class:`~ab.batch.BatchExecutor` for concurrent fan-out calls.
+
+        Calls run through the normal endpoint methods (same routes, model
+        casting and validation); results come back in input order with
+        per-item exceptions in place of values. Per-surface caps
+        (``ABCONNECT_<SURFACE>_MAX_CONCURRENCY``) still apply across every
+        batch and thread.
+
+        >>> with api.batch(max_workers=16) as batch:
+        ...     jobs = batch.map(api.jobs.get, job_ids)
+        """
+        from ab.batch import BatchExecutor
+
+        return BatchExecutor(max_workers=max_workers)
+
+    def lazy(self) -> ContextManager[None]:
+        """Return lazy, dict-backed views from endpoint calls inside the block.
+
+        Model responses come back as :class:`~ab.api.lazy.ModelView` (lists as
+        :class:`~ab.api.lazy.LazyList`) with the same attribute names; a field
+        is validated only when read. Applies to the current thread or task and
+        to ``api.batch()`` calls submitted inside the block.
+
+        >>> with api.lazy():
+        ...     ids = [j.job_display_id for j in api.jobs.search_by_details(data=criteria)]
+        """
+        from ab.api.lazy import lazy_responses
+
+        return lazy_responses()
+
+    def trusted(self) -> ContextManager[None]:
+        """Build response models without validating them in endpoint calls inside the block.
+
+        Models, including nested ones, are constructed straight from the JSON
+        (like ``model_construct``): scalar fields keep the values as sent and
+        nothing is checked; see :mod:`ab.api.trusted`. Applies to the current
+        thread or task and to ``api.batch()`` calls submitted inside.
+
+        >>> with api.trusted():
+        ...     page = api.catalog.list(page_number=1, page_size=500)
+        """
+        from ab.api.trusted import trusted_responses
+
+        return trusted_responses()
+
+    def streaming(self) -> ContextManager[None]:
+        """Return item iterators from ``List[Model]`` endpoint calls inside the block.
+
+        The body is parsed incrementally and each record validated as it is
+        reached, so memory stays bounded however long the list; see
+        :mod:`ab.api.streaming`. Like :meth:`lazy`, the mode applies to the
+        current thread or task and to ``api.batch()`` calls submitted inside.
+
+        >>> with api.streaming():
+        ...     users = api.users.list(data={"pageSize": 10000})
+        >>> with users:
+        ...     for user in users:
+        ...         sink.write(user)
+        """
+        from ab.api.streaming import streaming_responses
+
+        return streaming_responses()
 
     def groups(self) -> list[str]:
         """Return the endpoint group names available as ``api.<name>``.
@@ -214,7 +328,7 @@ class ABConnectAPI:
 
     def __repr__(self) -> str:
         env = getattr(self._settings, "environment", None)
-        return f"<ABConnectAPI env={env!r} groups={len(self.groups())}>"
+        return f"<{type(self).__name__} env={env!r} groups={len(self.groups())}>"
 
     def _init_endpoints(self) -> None:
         """Instantiate all endpoint groups as attributes."""
@@ -47,6 +47,37 @@ class ABConnectSettings(BaseSettings):
     access_key: Optional[str] = Field(default=None, description="ABC API access key")
     timeout: int = Field(default=30, description="HTTP request timeout in seconds")
     max_attempts: int = Field(default=3, description="Max total attempts per request (1 initial + retries)")
+    token_file_lock: bool = Field(
+        default=False,
+        description="Serialise token refreshes across processes sharing the token file (advisory flock)",
+    )
+    resolver_cache_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file caching company code to UUID lookups across processes (in-memory when unset)",
+    )
+    http_cache: bool = Field(default=False, description="Cache GET responses of routes that declare cache_ttl")
+    http_cache_path: Optional[str] = Field(
+        default=None, description="SQLite file persisting the HTTP response cache across runs (memory-only when unset)"
+    )
+    http_cache_max_entries: int = Field(default=512, description="Max responses kept by the HTTP response cache")
+    acportal_max_concurrency: Optional[int] = Field(
+        default=None, description="Max concurrent in-flight ACPortal requests (unlimited when unset)"
+    )
+    catalog_max_concurrency: Optional[int] = Field(
+        default=None, description="Max concurrent in-flight Catalog requests (unlimited when unset)"
+    )
+    abc_max_concurrency: Optional[int] = Field(
+        default=None, description="Max concurrent in-flight ABC requests (unlimited when unset)"
+    )
+    acportal_rate_limit: Optional[float] = Field(
+        default=None, description="Client-side ACPortal request rate ceiling in requests/second"
+    )
+    catalog_rate_limit: Optional[float] = Field(
+        default=None, description="Client-side Catalog request rate ceiling in requests/second"
+    )
+    abc_rate_limit: Optional[float] = Field(
+        default=None, description="Client-side ABC request rate ceiling in requests/second"
+    )
 
     @model_validator(mode="after")
     def _validate_required(self) -> "ABConnectSettings":
@@ -67,6 +98,14 @@ class ABConnectSettings(BaseSettings):
             )
         return self
 
+    def max_concurrency_for(self, surface: str) -> Optional[int]:
+        """Return the in-flight request cap for *surface* (``None`` = unlimited)."""
+        return getattr(self, f"{surface}_max_concurrency")
+
+    def rate_limit_for(self, surface: str) -> Optional[float]:
+        """Return the requests/second ceiling for *surface* (``None`` = adaptive only)."""
+        return getattr(self, f"{surface}_rate_limit")
+
     @property
     def identity_url(self) -> str:
         if self.environment == "staging":
@@ -0,0 +1,104 @@
+"""Process-wide registry of response-schema drift.
+
+:class:`~ab.api.models.base.ResponseModel` keeps unknown response fields in
+``model_extra`` and reports each one here instead of logging on every
+instance. The registry records every ``(model, field)`` pair once, with a hit
+counter and a few sample values, and decides when a warning is due: on the
+first sighting and, if ``warn_every`` is set, on every *n*-th hit after it.
+A 5,000-item list with two new server fields therefore costs two log records,
+not 10,000.
+
+Query it with :data:`registry` (``registry.snapshot()``), persist it with
+``registry.export(path)``, and clear it with ``registry.reset()``. The
+``ab.progress`` report summary and app read the same registry.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+_SAMPLE_CHARS = 120
+
+
+@dataclass
+class DriftEntry:
+    """One unknown field seen on one response model."""
+
+    model: str
+    field: str
+    count: int = 0
+    first_seen: float = 0.0
+    last_seen: float = 0.0
+    samples: List[str] = field(default_factory=list)
+
+
+class DriftRegistry:
+    """Thread-safe record of unknown response fields.
+
+    Args:
+        max_samples: Distinct sample values kept per field (as truncated
+            ``repr`` strings).
+        warn_every: Also warn on every *n*-th hit after the first; ``0``
+            warns once per ``(model, field)`` pair.
+    """
+
+    def __init__(self, max_samples: int = 3, warn_every: int = 0) -> None:
+        self.max_samples = max_samples
+        self.warn_every = warn_every
+        self._entries: Dict[Tuple[str, str], DriftEntry] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, field_name: str, value: Any = None) -> bool:
+        """Count one occurrence of *field_name* on *model*; return whether to warn."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get((model, field_name))
+            if entry is None:
+                entry = self._entries[(model, field_name)] = DriftEntry(model, field_name, first_seen=now)
+            entry.count += 1
+            entry.last_seen = now
+            if len(entry.samples) < self.max_samples:
+                sample = repr(value)[:_SAMPLE_CHARS]
+                if sample not in entry.samples:
+                    entry.samples.append(sample)
+            count = entry.count
+        if count == 1:
+            return True
+        return self.warn_every > 0 and (count - 1) % self.warn_every == 0
+
+    def get(self, model: str, field_name: str) -> Optional[DriftEntry]:
+        with self._lock:
+            return self._entries.get((model, field_name))
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Return every entry as a plain dict, most frequent first."""
+        with self._lock:
+            rows = [asdict(e) for e in self._entries.values()]
+        return sorted(rows, key=lambda r: (-r["count"], r["model"], r["field"]))
+
+    def export(self, path: Union[str, Path]) -> Path:
+        """Write :meth:`snapshot` to *path* as JSON and return the path."""
+        path = Path(path)
+        data = {"schema": 1, "exported_at": time.time(), "drift": self.snapshot()}
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        return path
+
+    def reset(self) -> None:
+        """Forget every entry (warnings fire again on the next sighting)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"<DriftRegistry fields={len(self)} warn_every={self.warn_every}>"
+
+
+#: The registry every :class:`~ab.api.models.base.ResponseModel` reports to.
+registry = DriftRegistry()
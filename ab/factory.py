@@ -0,0 +1,151 @@
+"""Process-wide client factory for per-request construction.
+
+Web apps typically build ``ABConnectAPI(request=request)`` for every request.
+Built from scratch, each client parses settings, opens three cold
+:class:`requests.Session` objects (fresh TCP + TLS handshakes) and starts
+with an empty code resolver. A :class:`ClientFactory` is created once per
+process and keeps all of that warm. Its clients swap in only the
+per-request :class:`~ab.auth.base.TokenStorage`.
+"""
+
+from __future__ import annotations
+
+import http.cookiejar
+import logging
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ab.auth.base import TokenStorage
+from ab.auth.memory import MemoryTokenStorage
+from ab.cache import CodeResolver
+from ab.client import ABConnectAPI
+from ab.config import ABConnectSettings, load_settings
+from ab.http import HttpClient
+from ab.http_cache import ResponseCache
+from ab.ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+_SURFACES = ("acportal", "catalog", "abc")
+
+
+class ClientFactory:
+    """Builds lightweight :class:`~ab.client.ABConnectAPI` instances sharing warm state.
+
+    Shared by every client the factory creates:
+
+    * the parsed :class:`~ab.config.ABConnectSettings`;
+    * one keep-alive :class:`requests.Session` per API surface, with a
+      connection pool sized by *pool_maxsize* (cookies are never stored, so
+      one user's responses cannot leak into another's requests);
+    * the per-surface :class:`~ab.ratelimit.RateLimiter`, so
+      ``ABCONNECT_<SURFACE>_RATE_LIMIT`` holds process-wide;
+    * the :class:`~ab.cache.CodeResolver` cache; and
+    * the :class:`~ab.http_cache.ResponseCache`, when ``ABCONNECT_HTTP_CACHE``
+      is enabled.
+
+    Usage::
+
+        # apps.py / settings.py — once per process
+        AB = ClientFactory(env="production", pool_maxsize=32)
+
+        # views.py
+        def job_detail(request, job_id):
+            api = AB.create(request=request)
+            return render(request, "job.html", {"job": api.jobs.get(job_id)})
+
+    Args:
+        env: ``"staging"`` or ``"production"``.
+        env_file: Explicit path to an env file (overrides *env*).
+        pool_connections: Host pools cached per surface session.
+        pool_maxsize: Keep-alive connections kept per host — size it to the
+            number of threads serving requests in this process.
+    """
+
+    def __init__(
+        self,
+        *,
+        env: Optional[str] = None,
+        env_file: Optional[str] = None,
+        pool_connections: int = 4,
+        pool_maxsize: int = 32,
+    ) -> None:
+        self._settings = load_settings(env=env, env_file=env_file, require_credentials=False)
+        self._sessions: Dict[str, requests.Session] = {
+            surface: self._pooled_session(pool_connections, pool_maxsize) for surface in _SURFACES
+        }
+        self._rate_limiters: Dict[str, RateLimiter] = {
+            surface: RateLimiter(self._settings.rate_limit_for(surface)) for surface in _SURFACES
+        }
+        # The resolver authenticates with the client secret, never a user token.
+        resolver_client = HttpClient(
+            self._settings.acportal_base_url,
+            self._settings,
+            MemoryTokenStorage(),
+            allow_password_fallback=False,
+            session=self._sessions["acportal"],
+        )
+        self._resolver = CodeResolver.from_settings(resolver_client, self._settings)
+        self._response_cache = ResponseCache.from_settings(self._settings)
+
+    @staticmethod
+    def _pooled_session(pool_connections: int, pool_maxsize: int) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    @property
+    def settings(self) -> ABConnectSettings:
+        """Settings shared by every client built by this factory."""
+        return self._settings
+
+    @property
+    def resolver(self) -> CodeResolver:
+        """Code resolver whose cache is shared by every client."""
+        return self._resolver
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """GET response cache shared by every client, if enabled."""
+        return self._response_cache
+
+    def session_for(self, surface: str) -> requests.Session:
+        """Return the pooled session for an API surface name."""
+        return self._sessions[surface]
+
+    def rate_limiter_for(self, surface: str) -> RateLimiter:
+        """Return the process-wide rate limiter for an API surface name."""
+        return self._rate_limiters[surface]
+
+    def create(
+        self,
+        *,
+        request: Any = None,
+        token_storage: Optional[TokenStorage] = None,
+        allow_password_fallback: Optional[bool] = None,
+        extra_headers: Optional[Any] = None,
+    ) -> ABConnectAPI:
+        """Build a client bound to *request* (Django session) or *token_storage*.
+
+        Equivalent to ``ABConnectAPI(..., factory=self)``.
+        """
+        return ABConnectAPI(
+            request=request,
+            token_storage=token_storage,
+            allow_password_fallback=allow_password_fallback,
+            extra_headers=extra_headers,
+            factory=self,
+        )
+
+    def close(self) -> None:
+        """Close the pooled connections of all three surfaces."""
+        for session in self._sessions.values():
+            session.close()
+
+    def __repr__(self) -> str:
+        return f"<ClientFactory env={self._settings.environment!r}>"
@@ -1,26 +1,32 @@
 """Unified HTTP client for all ABConnect API surfaces.
 
 Wraps :class:`requests.Session` with connection pooling, Bearer JWT
-injection, timeout enforcement, and retry with exponential backoff for
-transient errors (429, 502, 503).
+injection, timeout enforcement, client-side rate limiting, and retry with
+jittered exponential backoff for transient errors (429, 502, 503). A 429's
+``Retry-After`` header is honoured for every caller on the surface.
 """
 
 from __future__ import annotations
 
+import contextlib
+import json
 import logging
+import threading
 import time
-from typing import Any, Callable, Dict, Mapping, Optional, Union
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
 
 import requests
 
 from ab.auth.base import Token, TokenStorage
+from ab.auth.manager import TokenManager
 from ab.config import ABConnectSettings
 from ab.exceptions import AuthenticationError, RequestError
+from ab.http_cache import CachedResponse, ResponseCache
+from ab.ratelimit import RateLimiter, jittered, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
 _RETRYABLE_STATUS_CODES = {429, 502, 503}
-_TOKEN_EXPIRY_BUFFER = 300  # seconds
 
 
 class HttpClient:
@@ -28,7 +34,8 @@ class HttpClient:
 
     A single :class:`HttpClient` is created per API surface (ACPortal,
     Catalog, ABC) and owns a :class:`requests.Session` for connection
-    pooling.
+    pooling. Token acquisition is delegated to a
+    :class:`~ab.auth.manager.TokenManager`, normally shared by all three.
     """
 
     def __init__(
@@ -39,13 +46,33 @@ class HttpClient:
         *,
         allow_password_fallback: bool = True,
         extra_headers: Optional[Union[Dict[str, str], Callable[[], Dict[str, str]]]] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        token_manager: Optional[TokenManager] = None,
+        session: Optional[requests.Session] = None,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._settings = settings
         self._token_storage = token_storage
-        self._session = requests.Session()
+        # A caller-supplied session (see ab.factory.ClientFactory) is shared, warm and long-lived.
+        self._session = session or requests.Session()
+        self._response_cache = response_cache
         self._allow_password_fallback = allow_password_fallback
         self._extra_headers = extra_headers
+        self._max_concurrency = max_concurrency
+        # Caps in-flight requests on this surface across every thread using it.
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self._rate_limiter = rate_limiter or RateLimiter()
+        # Shared across surfaces by ABConnectAPI so refreshes are single-flight.
+        self._token_manager = token_manager or TokenManager(
+            settings, token_storage, allow_password_fallback=allow_password_fallback
+        )
+
+    @property
+    def base_url(self) -> str:
+        """Root URL requests on this surface are sent to (no trailing slash)."""
+        return self._base_url
 
     # ------------------------------------------------------------------
     # Authentication
@@ -53,24 +80,7 @@ class HttpClient:
 
     def _ensure_token(self) -> Token:
         """Return a valid access token, authenticating or refreshing as needed."""
-        token = self._token_storage.get_token()
-
-        if token and not token.expired:
-            return token
-
-        # Try refresh first
-        if token and token.refresh_token:
-            refreshed = self._refresh_token(token.refresh_token)
-            if refreshed:
-                return refreshed
-
-        if not self._allow_password_fallback:
-            if token is not None:
-                self._token_storage.clear_token()
-            raise AuthenticationError("No valid ABConnect token is available for this session")
-
-        # Fall back to password grant
-        return self._password_grant()
+        return self._token_manager.get_token()
 
     def _password_grant(self) -> Token:
         return self._password_grant_with(
@@ -80,47 +90,13 @@ class HttpClient:
 
     def _password_grant_with(self, *, username: str, password: str) -> Token:
         """Password grant using caller-supplied credentials."""
-        if not username or not password:
-            raise AuthenticationError("Password grant requires username and password")
-        data = {
-            "grant_type": "password",
-            "username": username,
-            "password": password,
-            "client_id": self._settings.client_id,
-            "client_secret": self._settings.client_secret,
-            "scope": "offline_access",
-        }
-        resp = requests.post(self._settings.identity_url, data=data, timeout=self._settings.timeout)
-        if not resp.ok:
-            raise AuthenticationError(
-                f"Login failed for {username}: {resp.status_code} {resp.text}"
-            )
-        return self._store_token(resp.json())
+        return self._token_manager.password_grant_with(username=username, password=password)
 
     def _refresh_token(self, refresh_token: str) -> Optional[Token]:
-        data = {
-            "grant_type": "refresh_token",
-            "refresh_token": refresh_token,
-            "client_id": self._settings.client_id,
-            "client_secret": self._settings.client_secret,
-        }
-        try:
-            resp = requests.post(self._settings.identity_url, data=data, timeout=self._settings.timeout)
-            if resp.ok:
-                return self._store_token(resp.json())
-        except Exception:
-            logger.info("Refresh token failed, will attempt password grant")
-        return None
+        return self._token_manager.refresh_token(refresh_token)
 
     def _store_token(self, payload: dict) -> Token:
-        token = Token(
-            access_token=payload["access_token"],
-            refresh_token=payload.get("refresh_token"),
-            expires_at=time.time() + payload.get("expires_in", 3600) - _TOKEN_EXPIRY_BUFFER,
-            token_type=payload.get("token_type", "Bearer"),
-        )
-        self._token_storage.save_token(token)
-        return token
+        return self._token_manager.store_token(payload)
 
     # ------------------------------------------------------------------
     # Request helpers
@@ -138,6 +114,9 @@ class HttpClient:
         headers: Optional[Dict[str, str]] = None,
         raw: bool = False,
         auth_optional: bool = False,
+        cache_ttl: Optional[float] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
+        stream: bool = False,
     ) -> Any:
         """Send an HTTP request with auth, timeout, and retry logic.
 
@@ -146,6 +125,17 @@ class HttpClient:
         that accept body-level credentials such as an autoprice AccessKey).
         A token is still attached whenever one is available.
 
+        *cache_ttl* (set from ``Route.cache_ttl``) makes a GET eligible for
+        the client's :class:`~ab.http_cache.ResponseCache`, if it has one.
+
+        *decode* replaces ``json.loads`` for JSON bodies: it receives the raw
+        body bytes (endpoints pass a cached pydantic ``validate_json``).
+
+        With *stream* the body is not read: a successful response is returned
+        open for :mod:`ab.api.download` to consume in chunks (error responses
+        still raise :class:`RequestError`, and a 204 returns ``None``).
+        Streamed requests bypass the response cache.
+
         Returns parsed JSON, raw bytes, ``None`` (for 204), or the raw
         :class:`requests.Response` when *raw* is ``True``.
         """
@@ -157,59 +147,142 @@ class HttpClient:
         else:
             token = self._ensure_token()
         url = f"{self._base_url}{path}"
-
-        req_headers: Dict[str, str] = {}
-        if token is not None:
-            req_headers["Authorization"] = f"Bearer {token.access_token}"
-        if self._extra_headers is not None:
-            client_headers = (
-                self._extra_headers() if callable(self._extra_headers) else self._extra_headers
-            )
-            req_headers.update(client_headers or {})
-        if headers:
-            req_headers.update(headers)
-
+        req_headers = self._build_headers(token, headers)
+        cache_key, cached = self._cache_lookup(method, url, params, cache_ttl, raw or stream)
+        if cached is not None:
+            if cached.fresh(cache_ttl):
+                return cached.decode(decode)
+            req_headers.update(cached.validators())
 
         for attempt in range(1, self._settings.max_attempts + 1):
             logger.debug("%s %s (attempt %d)", method.upper(), url, attempt)
+            self._rate_limiter.acquire()
 
             try:
-                resp = self._session.request(
-                    method=method.upper(),
-                    url=url,
-                    headers=req_headers,
-                    params=params,
-                    json=json,
-                    data=data,
-                    files=files,
-                    timeout=self._settings.timeout,
-                )
+                with self._slots or contextlib.nullcontext():
+                    resp = self._session.request(
+                        method=method.upper(),
+                        url=url,
+                        headers=req_headers,
+                        params=params,
+                        json=json,
+                        data=data,
+                        files=files,
+                        timeout=self._settings.timeout,
+                        stream=stream,
+                    )
             except requests.RequestException as exc:
                 if attempt < self._settings.max_attempts:
-                    self._backoff(attempt)
+                    self._backoff(self._backoff_delay(attempt))
                     continue
                 raise RequestError(0, str(exc)) from exc
 
-            if resp.status_code in _RETRYABLE_STATUS_CODES and attempt < self._settings.max_attempts:
-                self._backoff(attempt)
+            delay = self._retry_delay(resp, attempt)
+            if delay is not None:
+                if stream:
+                    resp.close()
+                self._backoff(delay)
                 continue
 
             if raw:
                 return resp
+            if stream:
+                if 200 <= resp.status_code < 300 and resp.status_code != 204:
+                    return resp
+                return self._handle_response(resp)
 
-            return self._handle_response(resp)
+            if cache_key is not None:
+                return self._cache_response(cache_key, cached, resp, decode)
+            return self._handle_response(resp, decode)
 
         # Should not reach here, but just in case
         raise RequestError(0, f"Request failed after {self._settings.max_attempts} attempts")
 
+    def _cache_lookup(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        cache_ttl: Optional[float],
+        raw: bool,
+    ) -> Tuple[Optional[str], Optional[CachedResponse]]:
+        """Return the cache key and any stored entry for a cacheable GET."""
+        if self._response_cache is None or cache_ttl is None or raw or method.upper() != "GET":
+            return None, None
+        key = ResponseCache.key(method, url, params)
+        return key, self._response_cache.get(key)
+
+    def _cache_response(
+        self,
+        key: str,
+        cached: Optional[CachedResponse],
+        resp: Any,
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ) -> Any:
+        """Decode *resp*, answering a 304 from *cached* and storing fresh 200s."""
+        assert self._response_cache is not None
+        if resp.status_code == 304 and cached is not None:
+            self._response_cache.put(
+                key, CachedResponse(cached.body, cached.etag, cached.last_modified, time.time())
+            )
+            return cached.decode(decode)
+        result = self._handle_response(resp, decode)
+        if resp.status_code == 200 and result is not None and not isinstance(result, bytes):
+            self._response_cache.put(
+                key,
+                CachedResponse(
+                    body=resp.text,
+                    etag=resp.headers.get("ETag"),
+                    last_modified=resp.headers.get("Last-Modified"),
+                    stored_at=time.time(),
+                ),
+            )
+        return result
+
+    def _build_headers(self, token: Optional[Token], headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Merge the bearer token, client-wide extra headers and per-call headers."""
+        req_headers: Dict[str, str] = {}
+        if token is not None:
+            req_headers["Authorization"] = f"Bearer {token.access_token}"
+        if self._extra_headers is not None:
+            client_headers = (
+                self._extra_headers() if callable(self._extra_headers) else self._extra_headers
+            )
+            req_headers.update(client_headers or {})
+        if headers:
+            req_headers.update(headers)
+        return req_headers
+
+    def _retry_delay(self, resp: Any, attempt: int) -> Optional[float]:
+        """Feed *resp* to the rate limiter; return the retry delay or ``None`` to stop."""
+        can_retry = attempt < self._settings.max_attempts
+        if resp.status_code == 429:
+            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            self._rate_limiter.on_throttled(retry_after)
+            if not can_retry:
+                return None
+            # With Retry-After the limiter already holds every caller on this
+            # surface until it passes; the next acquire() does the waiting.
+            return 0.0 if retry_after is not None else self._backoff_delay(attempt)
+        if resp.status_code in _RETRYABLE_STATUS_CODES:
+            return self._backoff_delay(attempt) if can_retry else None
+        if 200 <= resp.status_code < 300:
+            self._rate_limiter.on_success()
+        return None
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        return jittered(min(2 ** attempt, 30))
+
     @staticmethod
-    def _backoff(attempt: int) -> None:
-        delay = min(2 ** attempt, 30)
-        logger.info("Retrying in %ds…", delay)
+    def _backoff(delay: float) -> None:
+        if delay <= 0:
+            return
+        logger.info("Retrying in %.1fs…", delay)
         time.sleep(delay)
 
     @staticmethod
-    def _handle_response(resp: requests.Response) -> Any:
+    def _handle_response(resp: requests.Response, decode: Optional[Callable[[bytes], Any]] = None) -> Any:
         if resp.status_code == 204:
             return None
 
@@ -231,6 +304,12 @@ class HttpClient:
         if not resp.content or not resp.text.strip():
             return None
 
+        if decode is not None and isinstance(resp.content, (bytes, bytearray)):
+            try:
+                return decode(resp.content)
+            except json.JSONDecodeError:
+                raise RequestError(resp.status_code, "Response was not valid JSON")
+
         try:
             return resp.json()
         except Exception:
@@ -0,0 +1,164 @@
+"""Opt-in HTTP response cache for reference-data GET routes.
+
+Routes declare a policy with ``Route(..., cache_ttl=seconds)``. When the
+client has a :class:`ResponseCache` (``ABCONNECT_HTTP_CACHE=true``):
+
+* within the TTL a response is served without a network call;
+* after the TTL, a response that carried ``ETag`` / ``Last-Modified`` is
+  revalidated with ``If-None-Match`` / ``If-Modified-Since``; a ``304`` reuses
+  the stored body and restarts the TTL.
+
+Only declare ``cache_ttl`` on routes whose response is the same for every
+caller — keys are the method, URL and query string, not the user.
+
+Bodies are stored as response text and decoded on every hit, so callers never
+share (and cannot mutate) a cached object. With *path* set, entries are also
+written to a SQLite file so CLI runs and short-lived workers start warm.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Union
+from urllib.parse import urlencode
+
+if TYPE_CHECKING:
+    from ab.config import ABConnectSettings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """A stored 200 response body and its validators."""
+
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = 0.0
+
+    def fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def decode(self, decode: Optional[Callable[[bytes], Any]] = None) -> Any:
+        """Decode the stored body, with *decode* (bytes → value) when given."""
+        if decode is not None:
+            return decode(self.body.encode())
+        return json.loads(self.body)
+
+
+class ResponseCache:
+    """Size-bounded LRU of GET responses, optionally backed by SQLite.
+
+    Args:
+        max_entries: Entries kept in memory (and on disk) before the least
+            recently used are evicted.
+        path: Optional SQLite file persisting entries across processes/runs.
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS ab_http_cache (
+        key TEXT PRIMARY KEY,
+        body TEXT NOT NULL,
+        etag TEXT,
+        last_modified TEXT,
+        stored_at REAL NOT NULL
+    )
+    """
+
+    def __init__(self, max_entries: int = 512, path: Optional[Union[str, Path]] = None) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path is not None:
+            db_path = Path(path).expanduser()
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), timeout=30.0, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(self._SCHEMA)
+            self._conn.commit()
+
+    @classmethod
+    def from_settings(cls, settings: ABConnectSettings) -> Optional[ResponseCache]:
+        """Build the cache configured by ``ABCONNECT_HTTP_CACHE*``, or ``None`` when disabled."""
+        if not settings.http_cache:
+            return None
+        return cls(max_entries=settings.http_cache_max_entries, path=settings.http_cache_path)
+
+    @staticmethod
+    def key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Cache key for a request: method, URL and sorted non-``None`` params."""
+        query = urlencode(sorted((k, str(v)) for k, v in (params or {}).items() if v is not None))
+        return f"{method.upper()} {url}?{query}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, stored_at FROM ab_http_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        entry = CachedResponse(*row)
+        self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        self._remember(key, entry)
+        if self._conn is None:
+            return
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO ab_http_cache (key, body, etag, last_modified, stored_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, entry.body, entry.etag, entry.last_modified, entry.stored_at),
+                )
+                self._conn.execute(
+                    "DELETE FROM ab_http_cache WHERE key NOT IN "
+                    "(SELECT key FROM ab_http_cache ORDER BY stored_at DESC LIMIT ?)",
+                    (self._max_entries,),
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                logger.warning("Failed to persist cached response for %s", key)
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM ab_http_cache")
+                self._conn.commit()
+
+    def __len__(self) -> int:
+        return len(self._entries)
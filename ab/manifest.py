@@ -0,0 +1,101 @@
+"""On-disk cache for metadata derived from the SDK's own source.
+
+Route tables and CLI listings are computed by importing and introspecting
+every endpoint module. The result only changes when the installed package
+changes, so it is written once to a JSON manifest named after the package
+version and reused until the package's files change.
+
+Manifests live in ``$ABCONNECT_MANIFEST_DIR`` (default
+``$XDG_CACHE_HOME/abconnect`` or ``~/.cache/abconnect``). Set it to ``off``
+to always recompute. Unreadable, stale or unwritable manifests are ignored.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_SCHEMA = 1
+
+
+def manifest_dir() -> Optional[Path]:
+    """Directory manifests are kept in, or ``None`` when disabled."""
+    configured = os.environ.get("ABCONNECT_MANIFEST_DIR")
+    if configured is not None:
+        return None if configured.strip().lower() in ("", "0", "off", "false") else Path(configured).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "abconnect"
+
+
+@functools.lru_cache(maxsize=None)
+def package_version() -> str:
+    # A wheel install keeps its dist-info next to the package; reading the
+    # version from its name skips importing importlib.metadata (~30 ms).
+    for dist_info in _PACKAGE_DIR.parent.glob("annex_abconnect-*.dist-info"):
+        return dist_info.name[len("annex_abconnect-") : -len(".dist-info")]
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+
+        return version("annex-abconnect")
+    except PackageNotFoundError:
+        return "0+local"
+
+
+@functools.lru_cache(maxsize=None)
+def fingerprint() -> str:
+    """Hash of the size and mtime of every module in the ``ab`` package."""
+    digest = hashlib.sha1(package_version().encode())
+    for path in sorted(_PACKAGE_DIR.rglob("*.py")):
+        stat = path.stat()
+        digest.update(f"{path.relative_to(_PACKAGE_DIR)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _path(name: str) -> Optional[Path]:
+    directory = manifest_dir()
+    return None if directory is None else directory / f"{name}-{package_version()}.json"
+
+
+def load(name: str) -> Optional[Dict[str, Any]]:
+    """Return the cached *name* manifest if it matches the installed package."""
+    path = _path(name)
+    if path is None:
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("schema") != _SCHEMA or data.get("fingerprint") != fingerprint():
+        return None
+    return data.get("data")
+
+
+def store(name: str, data: Dict[str, Any]) -> Optional[Path]:
+    """Write *data* as the *name* manifest (atomically); return the path, or ``None``."""
+    path = _path(name)
+    if path is None:
+        return None
+    payload = {"schema": _SCHEMA, "version": package_version(), "fingerprint": fingerprint(), "data": data}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, separators=(",", ":"))
+        try:
+            os.replace(tmp, path)
+        except OSError:
+            os.unlink(tmp)
+            raise
+    except OSError as exc:
+        logger.debug("Could not write %s manifest to %s: %s", name, path, exc)
+        return None
+    return path
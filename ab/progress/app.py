@@ -7,7 +7,9 @@ A small stdlib ``http.server`` app (no new deps) that complements the static
 - per-endpoint **Four-Way Harmony** (impl / example / fixture+test / Sphinx) with
   real test coverage,
 - **HTTP request/response capture** logged to SQLite (``ab.progress.db``),
-- interactive **sign-off** that the example / tests / Sphinx are acceptable.
+- interactive **sign-off** that the example / tests / Sphinx are acceptable,
+- the **schema drift** (unknown response fields) seen by in-process runs
+  (``GET /api/drift``, cleared by ``POST /api/drift/reset``).
 
 Launch via ``python scripts/serve_progress.py`` then open the printed URL.
 Read-only against the codebase; all mutable state lives in ``progress.db``.
@@ -88,6 +90,10 @@ class _Handler(BaseHTTPRequestHandler):
             q = parse_qs(route.query)
             key = (q.get("endpoint") or [""])[0]
             self._json({"captures": db.list_captures(key) if key else []})
+        elif route.path == "/api/drift":
+            from ab.progress.report import drift_report
+
+            self._json({"drift": drift_report()})
         elif route.path == "/api/endpoint":
             from ab.progress.workbench import endpoint_detail
 
@@ -128,6 +134,11 @@ class _Handler(BaseHTTPRequestHandler):
                 response=body.get("response"),
             )
             return self._json({"ok": True, "id": cid, "captures": db.list_captures(key)})
+        if route.path == "/api/drift/reset":
+            from ab.drift import registry
+
+            registry.reset()
+            return self._json({"ok": True})
         if route.path == "/api/export":
             path = db.export_signoffs()
             return self._json({"ok": True, "path": str(path)})
@@ -119,8 +119,21 @@ def write_report(path: Path | None = None) -> Path:
     return path
 
 
+def drift_report() -> list[dict[str, Any]]:
+    """Return the unknown response fields seen in this process, most frequent first.
+
+    Reads :data:`ab.drift.registry`, so it covers fixtures validated by the
+    gates as well as any live calls made in-process (e.g. app example runs).
+    """
+    from ab.drift import registry
+
+    return registry.snapshot()
+
+
 def report_summary() -> dict[str, int]:
     """Return headline counts for the CLI summary."""
+    from ab.drift import registry
+
     g = _gather()
     gr = g.gate_results
 
@@ -145,6 +158,7 @@ def report_summary() -> dict[str, int]:
         "g4": _passes("g4_doc_accuracy"),
         "g5": _passes("g5_param_routing"),
         "g6": _passes("g6_request_quality"),
+        "drift_fields": len(registry),
     }
 
 
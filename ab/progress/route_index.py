@@ -7,12 +7,9 @@ matched to their authoritative Route definitions.
 
 from __future__ import annotations
 
-import importlib
-import pkgutil
-import re
 from dataclasses import dataclass
 
-import ab.api.endpoints as endpoints_pkg
+from ab.api.registry import normalize_path, registry
 from ab.api.route import Route
 
 
@@ -28,39 +25,11 @@ class RouteInfo:
     api_surface: str  # "acportal" | "catalog" | "abc"
 
 
-def normalize_path(path: str) -> str:
-    """Normalize path parameters for matching.
-
-    Replaces ``{anything}`` with ``{_}`` so that
-    ``/companies/{companyId}/details`` and ``/companies/{id}/details``
-    both become ``/companies/{_}/details``.
-    """
-    return re.sub(r"\{[^}]+\}", "{_}", path)
-
-
 def _collect_routes() -> list[Route]:
-    """Import all endpoint modules (including subpackage modules like
-    ``ab.api.endpoints.jobs.note``) and collect Route instances.
+    """Every Route declared under ``ab/api/endpoints/`` (including subpackage
+    modules like ``ab.api.endpoints.jobs.note``), from the shared registry.
     """
-    routes: list[Route] = []
-    seen: set[int] = set()
-    for module in _iter_endpoint_modules(endpoints_pkg):
-        for attr_name in dir(module):
-            obj = getattr(module, attr_name)
-            if isinstance(obj, Route) and id(obj) not in seen:
-                routes.append(obj)
-                seen.add(id(obj))
-    return routes
-
-
-def _iter_endpoint_modules(pkg):
-    """Yield every module under *pkg* recursively."""
-    for _importer, mod_name, ispkg in pkgutil.iter_modules(pkg.__path__):
-        full = f"{pkg.__name__}.{mod_name}"
-        module = importlib.import_module(full)
-        yield module
-        if ispkg:
-            yield from _iter_endpoint_modules(module)
+    return registry.routes()
 
 
 def index_all_routes() -> dict[tuple[str, str], RouteInfo]:
@@ -375,15 +344,7 @@ def _route_group_map() -> dict[tuple[str, str], str]:
     CLI expose (including subgroups like ``jobs.note``), instead of guessing
     from the URL.
     """
-    from ab.cli.discovery import discover_endpoints_from_class
-
-    out: dict[tuple[str, str], str] = {}
-    for name, info in discover_endpoints_from_class().items():
-        for method in info.methods:
-            if method.route is not None:
-                key = (normalize_path(method.route.path), method.route.method)
-                out.setdefault(key, name)
-    return out
+    return {(path, method): group for (method, path), group in registry.path_groups().items()}
 
 
 def routes_as_endpoint_dicts() -> list[dict[str, str | None]]:
@@ -0,0 +1,156 @@
+"""Client-side rate limiting for a single API surface.
+
+:class:`RateLimiter` is a thread-safe token bucket shared by every thread and
+endpoint using one :class:`~ab.http.HttpClient`. It adapts to server
+throttling with AIMD (additive increase, multiplicative decrease): each 429
+halves the current rate and pauses the whole surface for the server's
+``Retry-After``; each success creeps the rate back toward the configured
+ceiling. Bulk jobs therefore settle at the highest sustainable throughput
+instead of bursting into 429s and backing off in lockstep. A surface with no
+configured rate tracks its recent throughput; the first 429 turns that into
+the ceiling, so the default deployment adapts too.
+
+The limiter never sleeps itself — :meth:`RateLimiter.reserve` returns how long
+the caller must wait, so the sync and async transports share it.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional
+
+logger = logging.getLogger(__name__)
+
+#: Floor for the adaptive rate, as a fraction of the configured rate.
+_MIN_RATE_FRACTION = 0.05
+#: Fraction of the configured rate regained per successful response.
+_RECOVERY_FRACTION = 0.02
+#: Seconds of recent requests used to estimate throughput on an unlimited surface.
+_OBSERVE_WINDOW = 10.0
+_OBSERVE_MAX = 1024
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) to seconds.
+
+    >>> parse_retry_after("7")
+    7.0
+    >>> parse_retry_after(None) is None
+    True
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def jittered(delay: float) -> float:
+    """Spread *delay* over ``[delay / 2, delay]`` so workers do not retry in lockstep."""
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class RateLimiter:
+    """Adaptive token bucket for one API surface.
+
+    Args:
+        rate: Sustained requests per second, or ``None`` for no steady-state
+            limit. Even unlimited, a 429 still pauses the surface for its
+            ``Retry-After`` so concurrent workers stop together, and the
+            throughput observed up to it becomes the adaptive ceiling.
+        burst: Bucket capacity — requests that may go out back-to-back after
+            an idle period. Defaults to one second's worth of *rate*.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be > 0 requests/second")
+        self._max_rate = rate
+        self._rate = rate
+        self._burst = burst if burst is not None else max(1.0, rate or 1.0)
+        self._tokens = self._burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._cooldown_jitter = 0.0
+        # send times while no rate is known, for seeding one on the first 429
+        self._sent: Deque[float] = deque(maxlen=_OBSERVE_MAX)
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Current (possibly reduced) requests-per-second ceiling."""
+        return self._rate
+
+    def reserve(self) -> float:
+        """Claim a request slot and return the seconds to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            if self._blocked_until > now:
+                # Stagger the release so paused workers do not resume in lockstep.
+                wait = self._blocked_until - now + random.uniform(0, self._cooldown_jitter)
+            if self._rate is None:
+                self._sent.append(now)
+                return wait
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            # Tokens may go negative: that debt is the caller's queue position.
+            self._tokens -= 1
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self._rate)
+            return wait
+
+    def acquire(self) -> None:
+        """Blocking :meth:`reserve` for threaded callers."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """Record a 429: halve the rate and pause the surface for *retry_after*."""
+        with self._lock:
+            if self._max_rate is None:
+                self._seed_rate()
+            if self._rate is not None and self._max_rate is not None:
+                self._rate = max(self._max_rate * _MIN_RATE_FRACTION, self._rate / 2)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+                self._cooldown_jitter = min(1.0, retry_after * 0.1)
+            rate = self._rate
+        logger.info("Throttled by server; rate now %s req/s, retry after %ss", rate, retry_after)
+
+    def _seed_rate(self) -> None:
+        """Adopt the throughput observed before the first 429 as the ceiling (lock held)."""
+        now = time.monotonic()
+        while self._sent and now - self._sent[0] > _OBSERVE_WINDOW:
+            self._sent.popleft()
+        span = max(1.0, now - self._sent[0]) if self._sent else 1.0
+        observed = max(1.0, len(self._sent) / span)
+        self._sent.clear()
+        self._max_rate = self._rate = observed
+        self._burst = max(1.0, observed)
+        self._tokens = self._burst
+        self._updated = now
+        logger.info("No rate limit configured; adapting from observed %.1f req/s", observed)
+
+    def on_success(self) -> None:
+        """Record a successful (2xx) response: recover the rate additively."""
+        with self._lock:
+            if self._rate is None or self._max_rate is None or self._rate >= self._max_rate:
+                return
+            self._rate = min(self._max_rate, self._rate + self._max_rate * _RECOVERY_FRACTION)
+
+    def __repr__(self) -> str:
+        return f"<RateLimiter rate={self._rate} max_rate={self._max_rate} burst={self._burst}>"
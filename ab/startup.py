@@ -0,0 +1,52 @@
+"""Ahead-of-time loading for long-lived processes.
+
+``import ab`` stays cheap: :mod:`ab.api.models` imports its submodules on
+first use and every model builds its validator the first time it validates.
+Web workers, daemons and notebooks that would rather pay that once at startup
+than on their first requests call :func:`warmup`.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+_PAGE_RE = re.compile(r"^PaginatedList\[(\w+)]$")
+
+
+def warmup(*, routes: bool = True) -> int:
+    """Import every model, build its validator, and compile route adapters.
+
+    Args:
+        routes: Also compile the cached response
+            :class:`~pydantic.TypeAdapter` for each route's ``response_model``
+            (the page envelope for paginated routes).
+
+    Returns:
+        The number of model classes loaded.
+    """
+    from ab.api import models
+    from ab.api.base import _page_adapter, _response_adapter
+    from ab.api.registry import registry
+
+    start = time.perf_counter()
+    classes = [c for c in models.load_all() if isinstance(c, type) and issubclass(c, BaseModel)]
+    for cls in classes:
+        if not cls.__pydantic_complete__:
+            cls.model_rebuild()
+    if routes:
+        for route in registry.routes():
+            if not route.response_model:
+                continue
+            page = _PAGE_RE.match(route.response_model)
+            if page:
+                _page_adapter(page.group(1))
+            else:
+                _response_adapter(route.response_model)
+    logger.debug("warmup: %d models in %.0f ms", len(classes), (time.perf_counter() - start) * 1e3)
+    return len(classes)
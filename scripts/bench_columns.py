@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: columnar export vs. a list of models for multi-page reports.
+
+Simulates ``--rows`` ``SalesForecastReport`` rows delivered in pages of
+``--page-size`` and compares
+
+* **models** — every page validated into models and kept in one list (what
+  analytics code did before ``model_dump()``-ing each row), and
+* **columns** — ``to_columns()`` over the same pages decoded as under
+  ``api.lazy()``, streamed into pre-sized columns.
+
+Reports wall time, peak traced memory, and the memory still held by the result
+(page bodies are built up front and excluded).
+
+Usage:
+    python scripts/bench_columns.py
+    python scripts/bench_columns.py --rows 1000000 --page-size 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from ab.api.base import _response_adapter  # noqa: E402
+from ab.api.columns import to_columns  # noqa: E402
+from ab.api.lazy import LazyList, decode_json  # noqa: E402
+from ab.api.models.reports import SalesForecastReport  # noqa: E402
+
+
+def _row(i: int) -> dict:
+    return {
+        "franchisee": f"FR{i % 400:04d}",
+        "company": f"Company {i % 5000}",
+        "jobID": str(2_000_000 + i),
+        "jobType": "Regular",
+        "quoteDate": "2026-03-14T10:22:31",
+        "bookedDate": "2026-03-16T08:05:00",
+        "revenue": 1234.5 + i % 97,
+        "profit": 321.25 + i % 13,
+        "grossMargin": 26.02,
+        "status": "Booked",
+        "industry": "Retail",
+        "customerZipCode": f"{10000 + i % 89999}",
+        "intacctDate": None,
+        "totalRecords": 0,
+    }
+
+
+def _pages(rows: int, page_size: int) -> list:
+    """Page bodies as the server sends them."""
+    return [
+        json.dumps([_row(i) for i in range(start, min(rows, start + page_size))]).encode()
+        for start in range(0, rows, page_size)
+    ]
+
+
+def _measure(fn):
+    """Time *fn* untraced, then run it again under ``tracemalloc`` for memory."""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    result = fn()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak, held
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=2_000)
+    args = parser.parse_args()
+    adapter = _response_adapter("List[SalesForecastReport]")
+    bodies = _pages(args.rows, args.page_size)
+
+    def models():
+        rows = []
+        for body in bodies:
+            rows.extend(adapter.validate_json(body))
+        return rows
+
+    def columns():
+        pages = (LazyList(SalesForecastReport, decode_json(body)) for body in bodies)
+        return to_columns(pages, size_hint=args.rows)
+
+    print(f"{args.rows:,} rows in pages of {args.page_size:,}")
+    print(f"{'path':10} {'seconds':>8} {'peak MB':>8} {'held MB':>8}")
+    for name, fn in (("models", models), ("columns", columns)):
+        elapsed, peak, held = _measure(fn)
+        print(f"{name:10} {elapsed:8.2f} {peak / 1e6:8.1f} {held / 1e6:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: response decoding paths on the fixture corpus.
+
+Compares, per fixture model, the legacy path (``json.loads`` then
+``model_validate`` per item) with the cached-:class:`~pydantic.TypeAdapter`
+``validate_json`` path endpoints now use for real transports, and with the
+unvalidated decode ``api.trusted()`` uses (:mod:`ab.api.trusted` — typed
+nested models, no checks). The ``construct`` column times ``json.loads`` +
+a shallow ``model_construct`` (nested models left as dicts) for reference.
+
+A second table compares the ways a paginated envelope
+(``{"items": [...], "pageNumber": ...}``) becomes a ``PaginatedList``:
+through ``json.loads``, validated from bytes, and under ``api.trusted()``.
+
+Each fixture is replicated into a list body of ``--items`` entries so the
+numbers resemble a page of search results.
+
+Usage:
+    python scripts/bench_decode.py
+    python scripts/bench_decode.py --items 200 --repeat 20 --only JobSearchResult CatalogExpandedDto
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = REPO_ROOT / "tests" / "fixtures"
+sys.path.insert(0, str(REPO_ROOT))
+
+from ab.api import models  # noqa: E402
+from ab.api.base import BaseEndpoint, _page_adapter, _response_adapter  # noqa: E402
+from ab.api.trusted import trusted_validator  # noqa: E402
+
+
+def _corpus(only: list[str] | None) -> list[tuple[str, dict]]:
+    corpus = []
+    for path in sorted(FIXTURES_DIR.glob("*.json")):
+        name = path.stem
+        if only and name not in only:
+            continue
+        model_cls = getattr(models, name, None)
+        if model_cls is None or not hasattr(model_cls, "model_validate"):
+            continue
+        data = json.loads(path.read_text())
+        if isinstance(data, dict) and "totalCount" in data:  # captured page envelope
+            data = data.get("data") or data.get("items") or []
+        if isinstance(data, list):
+            if not data:
+                continue
+            data = data[0]
+        if isinstance(data, dict):
+            corpus.append((name, data))
+    return corpus
+
+
+def _time(fn, repeat: int) -> float:
+    """Best-of-*repeat* seconds for one call."""
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100, help="list entries per response body")
+    parser.add_argument("--repeat", type=int, default=10, help="timing repetitions (best is kept)")
+    parser.add_argument("--only", nargs="*", help="restrict to these fixture models")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)  # drift warnings would dominate the timings
+
+    corpus = []
+    for name, item in _corpus(args.only):
+        try:
+            getattr(models, name).model_validate(item)
+        except Exception as exc:  # fixture drifted from its model — not a decode benchmark
+            print(f"{name:34} skipped ({type(exc).__name__})")
+            continue
+        corpus.append((name, item))
+
+    print(f"{'model':34} {'legacy ms':>10} {'adapter ms':>11} {'speedup':>8} {'trusted ms':>11} {'vs adapter':>11} "
+          f"{'construct ms':>13}")
+    totals = [0.0, 0.0, 0.0, 0.0]
+    for name, item in corpus:
+        body = json.dumps([item] * args.items).encode()
+        model_cls = getattr(models, name)
+        adapter = _response_adapter(f"List[{name}]")
+        trusted = trusted_validator(model_cls, "list")
+
+        legacy = _time(lambda: [model_cls.model_validate(i) for i in json.loads(body)], args.repeat)
+        fast = _time(lambda: adapter.validate_json(body), args.repeat)
+        unvalidated = _time(lambda: trusted.validate_json(body), args.repeat)
+        construct = _time(lambda: [model_cls.model_construct(**i) for i in json.loads(body)], args.repeat)
+        for i, value in enumerate((legacy, fast, unvalidated, construct)):
+            totals[i] += value
+        print(f"{name:34} {legacy * 1e3:10.2f} {fast * 1e3:11.2f} {legacy / fast:7.2f}x {unvalidated * 1e3:11.2f} "
+              f"{fast / unvalidated:10.2f}x {construct * 1e3:13.2f}")
+    if totals[1]:
+        print(f"{'TOTAL':34} {totals[0] * 1e3:10.2f} {totals[1] * 1e3:11.2f} {totals[0] / totals[1]:7.2f}x "
+              f"{totals[2] * 1e3:11.2f} {totals[1] / totals[2]:10.2f}x {totals[3] * 1e3:13.2f}")
+
+    print(f"\n{'paginated envelope':34} {'dict ms':>10} {'bytes ms':>11} {'speedup':>8} {'trusted ms':>11}")
+    endpoint = BaseEndpoint(None)
+    page_totals = [0.0, 0.0, 0.0]
+    for name, item in corpus:
+        body = json.dumps({"items": [item] * args.items, "pageNumber": 1, "totalPages": 1}).encode()
+        page_adapter = _page_adapter(name)
+        trusted_page = trusted_validator(getattr(models, name), "page")
+
+        def bytes_path(validator=page_adapter):
+            page = validator.validate_json(body)
+            return endpoint._page(page, page.get("items", []))
+
+        dict_path = _time(lambda: endpoint._cast_page(json.loads(body), name), args.repeat)
+        fast = _time(bytes_path, args.repeat)
+        unvalidated = _time(lambda: bytes_path(trusted_page), args.repeat)
+        for i, value in enumerate((dict_path, fast, unvalidated)):
+            page_totals[i] += value
+        print(f"{name:34} {dict_path * 1e3:10.2f} {fast * 1e3:11.2f} {dict_path / fast:7.2f}x "
+              f"{unvalidated * 1e3:11.2f}")
+    if page_totals[1]:
+        print(f"{'TOTAL':34} {page_totals[0] * 1e3:10.2f} {page_totals[1] * 1e3:11.2f} "
+              f"{page_totals[0] / page_totals[1]:7.2f}x {page_totals[2] * 1e3:11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-call dispatch overhead, excluding the network.
+
+Measures, in microseconds per call:
+
+* ``Route.bind`` — the previous implementation (``str.replace`` per
+  parameter plus a new ``Route`` that re-parses its template) against the
+  compiled one, for unique IDs and for a hot set of repeated IDs; and
+* a full ``api.jobs.get(id)`` — binding, headers, auth, rate limiting and
+  response decoding — with the HTTP session stubbed to return a canned body.
+
+Usage:
+    python scripts/bench_dispatch.py
+    python scripts/bench_dispatch.py --calls 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from ab import ABConnectAPI  # noqa: E402
+from ab.api.route import Route  # noqa: E402
+from ab.auth import MemoryTokenStorage  # noqa: E402
+from ab.auth.base import Token  # noqa: E402
+
+_ROUTE = Route("GET", "/job/{jobDisplayId}", response_model="Job")
+
+
+def _legacy_bind(route: Route, **params: str) -> Route:
+    new_path = route.path
+    for key, value in params.items():
+        new_path = new_path.replace(f"{{{key}}}", str(value))
+    return Route(
+        method=route.method,
+        path=new_path,
+        request_model=route.request_model,
+        params_model=route.params_model,
+        response_model=route.response_model,
+        api_surface=route.api_surface,
+        auth_optional=route.auth_optional,
+        cache_ttl=route.cache_ttl,
+    )
+
+
+def _per_call_us(fn, ids) -> float:
+    start = time.perf_counter()
+    for i in ids:
+        fn(i)
+    return (time.perf_counter() - start) / len(ids) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--hot", type=int, default=100, help="distinct IDs in the repeated-ID run")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    unique = list(range(4_000_000, 4_000_000 + args.calls))
+    repeated = [4_000_000 + i % args.hot for i in range(args.calls)]
+    print(f"{'Route.bind':28} {'before us':>10} {'after us':>9} {'speedup':>8}")
+    for label, ids in (("unique ids", unique), (f"{args.hot} repeated ids", repeated)):
+        _ROUTE._bound.clear()
+        before = _per_call_us(lambda i: _legacy_bind(_ROUTE, jobDisplayId=i), ids)
+        after = _per_call_us(lambda i: _ROUTE.bind(jobDisplayId=i), ids)
+        print(f"  {label:26} {before:10.2f} {after:9.2f} {before / after:7.2f}x")
+
+    body = json.dumps({"jobDisplayId": 1}).encode()
+    resp = MagicMock(status_code=200, headers={"Content-Type": "application/json"}, content=body, text=body.decode())
+    storage = MemoryTokenStorage(Token(access_token="tok", expires_at=time.time() + 3600))
+    with patch.dict(os.environ, {"ABCONNECT_CLIENT_ID": "cid", "ABCONNECT_CLIENT_SECRET": "secret"}):
+        api = ABConnectAPI(token_storage=storage)
+    calls = repeated[: max(1, args.calls // 10)]
+    with patch.object(api._acportal._session, "request", return_value=resp):
+        api.jobs.get(1)
+        per_call = _per_call_us(api.jobs.get, calls)
+    print(f"\napi.jobs.get (stubbed session): {per_call:.1f} us/call over {len(calls):,} calls")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: lazy views vs. validated models for read-mostly access.
+
+For each fixture model, a list body of ``--items`` records is turned into
+(a) validated models, as endpoints return by default, and (b) the
+``api.lazy()`` result (``decode_json`` + :class:`~ab.api.lazy.LazyList`); both
+then read ``--fields`` scalar fields from every record. Reports time and peak
+allocated memory (``tracemalloc``) per path.
+
+Usage:
+    python scripts/bench_lazy.py
+    python scripts/bench_lazy.py --only Job JobSearchResult --items 1000 --fields 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = REPO_ROOT / "tests" / "fixtures"
+sys.path.insert(0, str(REPO_ROOT))
+
+from ab.api import models  # noqa: E402
+from ab.api.base import _response_adapter  # noqa: E402
+from ab.api.lazy import LazyList, _fields, decode_json  # noqa: E402
+
+
+def _time(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak(fn) -> int:
+    """Peak bytes allocated while *fn* runs (its result kept alive until measured)."""
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=500, help="records per response body")
+    parser.add_argument("--fields", type=int, default=2, help="scalar fields read per record")
+    parser.add_argument("--only", nargs="*", default=["Job", "JobSearchResult", "CatalogExpandedDto",
+                                                      "CompanyDetails", "SalesForecastReport"])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{'model':24} {'models ms':>10} {'lazy ms':>8} {'speedup':>8} {'models MB':>10} {'lazy MB':>8}")
+    for name in args.only:
+        path = FIXTURES_DIR / f"{name}.json"
+        model_cls = getattr(models, name, None)
+        if model_cls is None or not path.is_file():
+            continue
+        item = json.loads(path.read_text())
+        if isinstance(item, list):
+            item = item[0] if item else None
+        if not isinstance(item, dict):
+            continue
+        body = json.dumps([item] * args.items).encode()
+        fields = [n for n, f in _fields(model_cls).items() if f.kind == "value" and f.target is not None]
+        fields = [n for n in fields if any(k in item for k in _fields(model_cls)[n].keys)][: args.fields]
+        adapter = _response_adapter(f"List[{name}]")
+
+        def validated():
+            rows = adapter.validate_json(body)
+            return rows, [[getattr(r, f) for f in fields] for r in rows]
+
+        def lazy():
+            rows = LazyList(model_cls, decode_json(body))
+            return rows, [[getattr(r, f) for f in fields] for r in rows]
+
+        full_t, lazy_t = _time(validated), _time(lazy)
+        full_m, lazy_m = _peak(validated), _peak(lazy)
+        print(f"{name:24} {full_t * 1e3:10.2f} {lazy_t * 1e3:8.2f} {full_t / lazy_t:7.2f}x "
+              f"{full_m / 1e6:10.2f} {lazy_m / 1e6:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: streamed list responses vs. the whole-body decode.
+
+For each fixture model, a list body of ``--items`` records is consumed
+(a) as endpoints do by default — the whole body validated into a list of
+models — and (b) as ``api.streaming()`` does, through an
+:class:`~ab.api.streaming.ItemStream` reading the body in chunks. Each path
+keeps only a running count, as a consumer writing rows to a database or file
+would. Reports time and peak allocated memory (``tracemalloc``) per path.
+
+Usage:
+    python scripts/bench_streaming.py
+    python scripts/bench_streaming.py --only JobSearchResult --items 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import requests
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = REPO_ROOT / "tests" / "fixtures"
+sys.path.insert(0, str(REPO_ROOT))
+
+from ab.api import models  # noqa: E402
+from ab.api.base import _response_adapter  # noqa: E402
+from ab.api.streaming import ItemStream  # noqa: E402
+
+
+def _time(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak(fn) -> int:
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def _response(body: bytes) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.raw = io.BytesIO(body)
+    return resp
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000, help="records per response body")
+    parser.add_argument("--only", nargs="*", default=["CompanySimple", "JobSearchResult", "CompanyDetails"])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{'model':24} {'body MB':>8} {'list ms':>9} {'stream ms':>10} {'list MB':>8} {'stream MB':>10}")
+    for name in args.only:
+        path = FIXTURES_DIR / f"{name}.json"
+        if getattr(models, name, None) is None or not path.is_file():
+            continue
+        item = json.loads(path.read_text())
+        if isinstance(item, list):
+            item = item[0] if item else None
+        if not isinstance(item, dict):
+            continue
+        body = json.dumps([item] * args.items).encode()
+        whole = _response_adapter(f"List[{name}]")
+        single = _response_adapter(name)
+
+        def listed():
+            return sum(1 for _ in whole.validate_json(body))
+
+        def streamed():
+            return sum(1 for _ in ItemStream(_response(body), single.validate_json, model_name=name))
+
+        list_t, stream_t = _time(listed), _time(streamed)
+        list_m, stream_m = _peak(listed), _peak(streamed)
+        print(f"{name:24} {len(body) / 1e6:8.1f} {list_t * 1e3:9.1f} {stream_t * 1e3:10.1f} "
+              f"{list_m / 1e6:8.1f} {stream_m / 1e6:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -134,6 +134,8 @@ def _generate_html_report() -> int:
         print(f"    G4 Doc Accuracy:    {s['g4']}/{s['gate_total']}")
         print(f"    G5 Param Routing:   {s['g5']}/{s['gate_total']}")
         print(f"    G6 Request Quality: {s['g6']}/{s['gate_total']}")
+    if s["drift_fields"]:
+        print(f"  Schema drift: {s['drift_fields']} unknown response field(s) (ab.progress.report.drift_report())")
 
     return 0
 
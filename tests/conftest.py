@@ -227,3 +227,17 @@ def api():
     except ConfigurationError:
         pytest.skip("Staging credentials not available")
     return client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _manifest_dir(tmp_path_factory):
+    """Keep route/CLI manifests written during the suite out of the user's cache."""
+    import os
+
+    previous = os.environ.get("ABCONNECT_MANIFEST_DIR")
+    os.environ["ABCONNECT_MANIFEST_DIR"] = str(tmp_path_factory.mktemp("manifests"))
+    yield
+    if previous is None:
+        os.environ.pop("ABCONNECT_MANIFEST_DIR", None)
+    else:
+        os.environ["ABCONNECT_MANIFEST_DIR"] = previous
@@ -0,0 +1,156 @@
+"""Unit tests for AsyncABConnectAPI / AsyncHttpClient."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from ab import AsyncABConnectAPI  # noqa: E402
+from ab.api.models.jobs import Job, TimelineTask  # noqa: E402
+from ab.async_http import AsyncHttpClient  # noqa: E402
+from ab.auth import MemoryTokenStorage  # noqa: E402
+from ab.auth.base import Token  # noqa: E402
+from ab.exceptions import RequestError  # noqa: E402
+
+_ENV = {"ABCONNECT_CLIENT_ID": "cid", "ABCONNECT_CLIENT_SECRET": "secret"}
+
+
+def _make_api(handler) -> AsyncABConnectAPI:
+    storage = MemoryTokenStorage(Token(access_token="tok", expires_at=time.time() + 3600))
+    with patch.dict(os.environ, _ENV, clear=True):
+        api = AsyncABConnectAPI(token_storage=storage)
+    transport = httpx.MockTransport(handler)
+    for client in (api._acportal, api._catalog, api._abc):
+        client._async_session = httpx.AsyncClient(transport=transport)
+    return api
+
+
+def test_mirrors_sync_endpoint_groups():
+    api = _make_api(lambda request: httpx.Response(204))
+    assert "jobs" in api.groups()
+    assert isinstance(api._acportal, AsyncHttpClient)
+    assert api.jobs.timeline._client is api._acportal
+    assert repr(api).startswith("<AsyncABConnectAPI")
+
+
+def test_get_returns_awaitable_typed_model():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"jobDisplayId": 42})
+
+    async def run():
+        async with _make_api(handler) as api:
+            return await api.jobs.get(42)
+
+    job = asyncio.run(run())
+    assert isinstance(job, Job)
+    assert seen[0].url.path == "/api/api/job/42"
+    assert seen[0].headers["Authorization"] == "Bearer tok"
+
+
+def test_concurrent_calls_share_one_loop():
+    def handler(request):
+        job_id = int(request.url.path.rsplit("/", 1)[-1])
+        return httpx.Response(200, json={"jobDisplayId": job_id})
+
+    async def run():
+        async with _make_api(handler) as api:
+            return await asyncio.gather(*(api.jobs.get(i) for i in range(50)))
+
+    jobs = asyncio.run(run())
+    assert [j.job_display_id for j in jobs] == list(range(50))
+
+
+def test_post_processing_helpers_chain_through_awaitables():
+    def handler(request):
+        if request.url.path.endswith("/form/shipments"):
+            return httpx.Response(200, json=[{"jobShipmentID": "plan-1", "transportType": "LTL"}])
+        if request.url.path.endswith("/form/bill-of-lading"):
+            assert request.url.params["shipmentPlanId"] == "plan-1"
+            return httpx.Response(200, content=b"%PDF", headers={"Content-Type": "application/pdf"})
+        if request.url.path.endswith("/timeline"):
+            return httpx.Response(200, json={"tasks": [{"taskCode": "PU"}]})
+        return httpx.Response(404)
+
+    async def run():
+        async with _make_api(handler) as api:
+            return await api.jobs.form.bol(7), await api.jobs.timeline.list(7)
+
+    bol, tasks = asyncio.run(run())
+    assert bol == {"bol_7.pdf": b"%PDF"}
+    assert isinstance(tasks[0], TimelineTask)
+
+
+async def _no_sleep(*_args):
+    return None
+
+
+def test_retries_then_raises_request_error():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, text="busy")
+
+    async def run():
+        async with _make_api(handler) as api:
+            with patch.object(AsyncHttpClient, "_async_backoff", side_effect=_no_sleep):
+                await api.jobs.get(1)
+
+    with pytest.raises(RequestError) as exc_info:
+        asyncio.run(run())
+    assert exc_info.value.status_code == 503
+    assert len(calls) == 3
+
+
+def test_expired_token_is_refreshed_once_for_concurrent_callers():
+    storage = MemoryTokenStorage(Token(access_token="old", refresh_token="r", expires_at=time.time() - 1))
+    with patch.dict(os.environ, _ENV, clear=True):
+        api = AsyncABConnectAPI(token_storage=storage)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"jobDisplayId": 1}))
+    api._acportal._async_session = httpx.AsyncClient(transport=transport)
+
+    refreshes = []
+
+    def fake_refresh(refresh_token):
+        refreshes.append(refresh_token)
+        token = Token(access_token="new", expires_at=time.time() + 3600)
+        storage.save_token(token)
+        return token
+
+    async def run():
+        with patch.object(api._token_manager, "refresh_token", side_effect=fake_refresh):
+            await asyncio.gather(*(api.jobs.get(1) for _ in range(10)))
+        await api.aclose()
+
+    asyncio.run(run())
+    assert refreshes == ["r"]
+
+
+def test_sync_only_helpers_raise_type_error():
+    api = _make_api(lambda request: httpx.Response(204))
+    with pytest.raises(TypeError, match="api.jobs.tasks is synchronous"):
+        api.jobs.tasks.schedule(1, start="2026-03-01")
+    with pytest.raises(TypeError, match="api.jobs.items is synchronous"):
+        api.jobs.items.list_parcel(1)
+
+
+def test_factory_rate_limiters_and_cache_are_shared():
+    from ab.factory import ClientFactory
+
+    with patch.dict(os.environ, _ENV, clear=True):
+        factory = ClientFactory()
+    storage = MemoryTokenStorage(Token(access_token="tok", expires_at=time.time() + 3600))
+    api = AsyncABConnectAPI(token_storage=storage, factory=factory)
+    sync_api = factory.create(token_storage=storage)
+    assert api._acportal._rate_limiter is factory.rate_limiter_for("acportal")
+    assert api._acportal._rate_limiter is sync_api._acportal._rate_limiter
+    assert api._acportal._response_cache is factory.response_cache
@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
+import threading
 import time
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from ab.auth import file as file_storage
 from ab.auth.base import Token
 from ab.auth.file import FileTokenStorage
+from ab.auth.manager import TokenManager
 from ab.auth.session import SessionTokenStorage
+from ab.config import ABConnectSettings
 
 
 class TestToken:
@@ -92,6 +97,46 @@ class TestFileTokenStorage:
         actual = now + expires_in - buffer
         assert abs(expected_expires_at - actual) < 1
 
+    def test_reloads_when_another_process_rewrites_the_file(self, tmp_path):
+        ours = FileTokenStorage(environment="staging", token_dir=tmp_path)
+        theirs = FileTokenStorage(environment="staging", token_dir=tmp_path)
+        ours.save_token(Token(access_token="first", expires_at=time.time() + 600))
+        assert theirs.get_token().access_token == "first"
+
+        theirs.save_token(Token(access_token="second", expires_at=time.time() + 600))
+        assert ours.get_token().access_token == "second"
+
+    @pytest.mark.skipif(file_storage.fcntl is None, reason="flock unavailable on this platform")
+    def test_locked_storages_refresh_once_across_processes(self, tmp_path):
+        expired = Token(access_token="old", refresh_token="r", expires_at=time.time() - 1)
+        FileTokenStorage(environment="staging", token_dir=tmp_path).save_token(expired)
+        with patch.dict(os.environ, {"ABCONNECT_CLIENT_ID": "c", "ABCONNECT_CLIENT_SECRET": "s"}, clear=True):
+            settings = ABConnectSettings(require_credentials=False)
+        # Separate storages and managers stand in for separate worker processes.
+        managers = [
+            TokenManager(settings, FileTokenStorage(environment="staging", token_dir=tmp_path, lock=True))
+            for _ in range(4)
+        ]
+        grants = []
+
+        def slow_post(*args, **kwargs):
+            grants.append(kwargs["data"]["grant_type"])
+            time.sleep(0.05)
+            resp = MagicMock(ok=True)
+            resp.json.return_value = {"access_token": "new", "refresh_token": "r2", "expires_in": 3600}
+            return resp
+
+        results = []
+        with patch("ab.auth.manager.requests.post", side_effect=slow_post):
+            threads = [threading.Thread(target=lambda m=m: results.append(m.get_token())) for m in managers]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert grants == ["refresh_token"]
+        assert [t.access_token for t in results] == ["new"] * 4
+
 
 class TestSessionTokenStorage:
     def test_save_and_get(self):
@@ -207,6 +252,123 @@ class TestDbTokenStorage:
         storage.save_token(Token(access_token="second", expires_at=time.time() + 600))
         assert storage.get_token().access_token == "second"
 
+    def test_cache_serves_reads_until_save_or_clear(self):
+        from ab.auth.db import DbTokenStorage, TokenCache
+        conn = self._conn()
+        cache = TokenCache(ttl=60)
+        storage = DbTokenStorage(conn, "session-1", cache=cache)
+        storage.save_token(Token(access_token="cached", expires_at=time.time() + 600))
+
+        # A row changed behind the cache's back is not re-read while fresh...
+        conn.execute("UPDATE ab_token_sessions SET token_json = ?", (json.dumps({"access_token": "db"}),))
+        conn.commit()
+        assert DbTokenStorage(conn, "session-1", cache=cache).get_token().access_token == "cached"
+
+        # ...but save and clear keep the cache coherent.
+        storage.save_token(Token(access_token="saved", expires_at=time.time() + 600))
+        assert storage.get_token().access_token == "saved"
+        storage.clear_token()
+        assert storage.get_token() is None
+
+    def test_clear_invalidates_after_the_delete_commits(self):
+        from ab.auth.db import DbTokenStorage, TokenCache
+        conn = self._conn()
+        cache = TokenCache(ttl=60)
+        stale = Token(access_token="stale", expires_at=time.time() + 600)
+
+        class RacingConnection:
+            """Lets a concurrent reader re-cache the row while the DELETE is uncommitted."""
+
+            def cursor(self):
+                return conn.cursor()
+
+            def commit(self):
+                cache.put("session-1", stale)
+                conn.commit()
+
+        storage = DbTokenStorage(conn, "session-1", cache=cache)
+        storage.save_token(stale)
+        DbTokenStorage(RacingConnection(), "session-1", cache=cache).clear_token()
+        assert storage.get_token() is None
+
+    @pytest.mark.parametrize("write", ["save", "clear"])
+    def test_read_before_a_write_is_not_cached_over_it(self, write):
+        from ab.auth.db import DbTokenStorage, TokenCache
+        conn = self._conn()
+        cache = TokenCache(ttl=60)
+        writer = DbTokenStorage(conn, "session-1", cache=cache)
+        writer.save_token(Token(access_token="old", expires_at=time.time() + 600))
+        cache.invalidate("session-1")
+
+        class SlowReader:
+            """Selects the old row, then lets the write commit before get_token caches it."""
+
+            def cursor(self):
+                cur = conn.cursor()
+
+                class Cursor:
+                    def execute(self, *args):
+                        cur.execute(*args)
+
+                    def fetchone(self):
+                        row = cur.fetchone()
+                        if write == "save":
+                            writer.save_token(Token(access_token="new", expires_at=time.time() + 600))
+                        else:
+                            writer.clear_token()
+                        return row
+
+                return Cursor()
+
+            def commit(self):
+                conn.commit()
+
+        assert DbTokenStorage(SlowReader(), "session-1", cache=cache).get_token().access_token == "old"
+        expected = "new" if write == "save" else None
+        token = writer.get_token()
+        assert (token and token.access_token) == expected
+
+    def test_cache_honours_token_expiry(self):
+        from ab.auth.db import DbTokenStorage, TokenCache
+        conn = self._conn()
+        cache = TokenCache(ttl=60)
+        storage = DbTokenStorage(conn, "session-1", cache=cache)
+        storage.save_token(Token(access_token="expired", refresh_token="r", expires_at=time.time() - 1))
+        assert len(cache) == 0
+        assert storage.get_token().access_token == "expired"
+
+    def test_cache_evicts_least_recently_used(self):
+        from ab.auth.db import TokenCache
+        cache = TokenCache(max_entries=2)
+        for sid in ("a", "b", "c"):
+            cache.put(sid, Token(access_token=sid, expires_at=time.time() + 600))
+        assert cache.get("a") is None
+        assert cache.get("c").access_token == "c"
+
+    def test_pool_uses_wal_and_serves_concurrent_sessions(self, tmp_path):
+        from ab.auth.db import DbTokenStorage, SqliteConnectionPool
+        pool = SqliteConnectionPool(tmp_path / "auth.sqlite", size=4)
+        with pool.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        errors = []
+
+        def worker(n):
+            try:
+                storage = DbTokenStorage(pool, f"session-{n}")
+                storage.save_token(Token(access_token=f"tok-{n}", expires_at=time.time() + 600))
+                assert storage.get_token().access_token == f"tok-{n}"
+            except Exception as exc:  # pragma: no cover - surfaced below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(12)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        pool.close()
+        assert errors == []
+
 
 class TestMemoryTokenStorage:
     def test_starts_empty_and_round_trips(self):
@@ -0,0 +1,114 @@
+"""Unit tests for BatchExecutor and per-surface concurrency caps."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from functools import partial
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ab import ABConnectAPI
+from ab.api.models.jobs import Job
+from ab.auth import MemoryTokenStorage
+from ab.auth.base import Token
+from ab.batch import BatchExecutor
+from ab.config import ABConnectSettings
+from ab.exceptions import RequestError
+
+_ENV = {"ABCONNECT_CLIENT_ID": "cid", "ABCONNECT_CLIENT_SECRET": "secret"}
+
+
+def _make_api(**env) -> ABConnectAPI:
+    storage = MemoryTokenStorage(Token(access_token="tok", expires_at=time.time() + 3600))
+    with patch.dict(os.environ, {**_ENV, **env}, clear=True):
+        return ABConnectAPI(token_storage=storage)
+
+
+def _json_response(payload):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.headers = {"Content-Type": "application/json"}
+    resp.text = json.dumps(payload)
+    resp.content = resp.text.encode()
+    resp.json.return_value = payload
+    return resp
+
+
+class TestBatchExecutor:
+    def test_map_preserves_input_order(self):
+        def slow_echo(x):
+            time.sleep(0.01 * (5 - x))
+            return x
+
+        with BatchExecutor(max_workers=5) as batch:
+            assert batch.map(slow_echo, range(5)) == [0, 1, 2, 3, 4]
+
+    def test_failures_are_returned_in_place(self):
+        def maybe_fail(x):
+            if x == 2:
+                raise RequestError(404, "missing")
+            return x
+
+        with BatchExecutor(max_workers=3) as batch:
+            results = batch.map(maybe_fail, range(4))
+        assert results[:2] == [0, 1]
+        assert isinstance(results[2], RequestError)
+        assert results[3] == 3
+        with pytest.raises(RequestError):
+            BatchExecutor.raise_first(results)
+
+    def test_run_accepts_heterogeneous_calls(self):
+        with BatchExecutor(max_workers=2) as batch:
+            assert batch.run([partial(pow, 2, 3), partial(str.upper, "a")]) == [8, "A"]
+
+    def test_rejects_empty_pool(self):
+        with pytest.raises(ValueError):
+            BatchExecutor(max_workers=0)
+
+
+class TestApiBatch:
+    def test_batch_goes_through_endpoint_casting(self):
+        api = _make_api()
+
+        def respond(**kwargs):
+            job_id = int(kwargs["url"].rsplit("/", 1)[-1])
+            return _json_response({"jobDisplayId": job_id})
+
+        with patch.object(api._acportal._session, "request", side_effect=respond):
+            with api.batch(max_workers=4) as batch:
+                jobs = batch.map(api.jobs.get, [3, 1, 2])
+
+        assert all(isinstance(j, Job) for j in jobs)
+        assert [j.job_display_id for j in jobs] == [3, 1, 2]
+
+    def test_surface_cap_limits_in_flight_requests(self):
+        api = _make_api(ABCONNECT_ACPORTAL_MAX_CONCURRENCY="2")
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def respond(**kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return _json_response({"jobDisplayId": 1})
+
+        with patch.object(api._acportal._session, "request", side_effect=respond):
+            with api.batch(max_workers=8) as batch:
+                batch.map(api.jobs.get, range(12))
+
+        assert peak <= 2
+
+    def test_settings_expose_per_surface_caps(self):
+        with patch.dict(os.environ, {**_ENV, "ABCONNECT_CATALOG_MAX_CONCURRENCY": "4"}, clear=True):
+            settings = ABConnectSettings(require_credentials=False)
+        assert settings.max_concurrency_for("catalog") == 4
+        assert settings.max_concurrency_for("acportal") is None
@@ -0,0 +1,172 @@
+"""Unit tests for ``api.documents.upload_many`` (ab.api.helpers.uploads)."""
+
+from __future__ import annotations
+
+import email
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ab.api.endpoints.documents import DocumentsEndpoint
+from ab.api.helpers.uploads import BulkUpload, MultipartBody, UploadManifest
+from ab.api.models.documents import DocumentUploadResponse
+from ab.exceptions import RequestError
+
+
+@pytest.fixture
+def photos(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"photo{i}.jpg"
+        path.write_bytes(b"\xff\xd8" + bytes([i]) * 1000)
+        paths.append(path)
+    return paths
+
+
+def _parse(body: MultipartBody) -> dict:
+    raw = b"".join(body)
+    assert len(raw) == len(body)
+    msg = email.message_from_bytes(f"Content-Type: {body.content_type}\r\n\r\n".encode() + raw)
+    parts: dict = {}
+    for part in msg.get_payload():
+        name = part.get_param("name", header="content-disposition")
+        parts.setdefault(name, []).append(part.get_payload(decode=True))
+    return parts
+
+
+def _client(handler):
+    client = MagicMock(name="HttpClient")
+    lock = threading.Lock()
+    seen = []
+
+    def request(method, path, *, data, headers):
+        parts = _parse(data)
+        with lock:
+            seen.append(parts)
+        return handler(parts)
+
+    client.request.side_effect = request
+    return client, seen
+
+
+def _ok(parts):
+    return {"success": True, "fileName": parts["file"][0][:3].hex()}
+
+
+class TestMultipartBody:
+    def test_encodes_fields_and_streams_file(self, photos):
+        body = MultipartBody({"JobDisplayId": "2000000", "JobItems": ["a", "b"]}, photos[0], "photo0.jpg")
+        parts = _parse(body)
+        assert parts["JobDisplayId"] == [b"2000000"]
+        assert parts["JobItems"] == [b"a", b"b"]
+        assert parts["file"] == [photos[0].read_bytes()]
+
+    def test_replays_seekable_stream(self, photos):
+        with photos[1].open("rb") as fh:
+            body = MultipartBody({}, fh, "p.jpg")
+            assert b"".join(body) == b"".join(body)
+
+    def test_rejects_non_seekable_stream(self):
+        read, write = os.pipe()
+        with os.fdopen(read, "rb") as pipe, os.fdopen(write, "wb"):
+            with pytest.raises(ValueError, match="must be seekable"):
+                MultipartBody({}, pipe, "p.jpg")
+
+
+class TestUploadMany:
+    def test_results_in_input_order(self, photos):
+        client, seen = _client(_ok)
+        uploads = [("2000000", "item-1", p) for p in photos]
+        results = DocumentsEndpoint(client).upload_many(uploads, max_workers=3)
+        assert [r.file_name for r in results] == [p.read_bytes()[:3].hex() for p in photos]
+        assert all(isinstance(r, DocumentUploadResponse) for r in results)
+        assert seen[0]["DocumentType"] == [b"6"]
+        assert seen[0]["JobItems"] == [b"item-1"]
+
+    def test_retries_transient_failures_per_file(self, photos):
+        failures = {"count": 0}
+
+        def flaky(parts):
+            if parts["file"][0] == photos[2].read_bytes() and failures["count"] < 2:
+                failures["count"] += 1
+                raise RequestError(503, "unavailable")
+            return _ok(parts)
+
+        client, seen = _client(flaky)
+        with patch("ab.api.helpers.uploads.time.sleep"):
+            results = DocumentsEndpoint(client).upload_many([("1", None, p) for p in photos])
+        assert all(isinstance(r, DocumentUploadResponse) for r in results)
+        assert len(seen) == len(photos) + 2
+
+    @pytest.mark.parametrize("status", [500, 502, 504])
+    def test_server_errors_that_may_have_stored_the_file_are_not_retried(self, photos, status):
+        def broken(parts):
+            if parts["file"][0] == photos[1].read_bytes():
+                raise RequestError(status, "upstream failed")
+            return _ok(parts)
+
+        client, seen = _client(broken)
+        with patch("ab.api.helpers.uploads.time.sleep") as sleep:
+            results = DocumentsEndpoint(client).upload_many([("1", None, p) for p in photos])
+        assert isinstance(results[1], RequestError)
+        assert len(seen) == len(photos)
+        sleep.assert_not_called()
+
+    def test_permanent_failure_is_returned_in_its_slot(self, photos):
+        def reject(parts):
+            if parts["file"][0] == photos[1].read_bytes():
+                raise RequestError(400, "bad type")
+            return _ok(parts)
+
+        client, seen = _client(reject)
+        results = DocumentsEndpoint(client).upload_many([("1", None, p) for p in photos])
+        assert isinstance(results[1], RequestError)
+        assert len(seen) == len(photos)
+
+    def test_manifest_resumes_without_reuploading(self, photos, tmp_path):
+        manifest = tmp_path / "uploads.jsonl"
+
+        def fail_last(parts):
+            if parts["file"][0] == photos[-1].read_bytes():
+                raise RequestError(400, "rejected")
+            return _ok(parts)
+
+        client, _ = _client(fail_last)
+        first = DocumentsEndpoint(client).upload_many([("1", "i", p) for p in photos], manifest=manifest)
+        assert isinstance(first[-1], RequestError)
+        assert len(UploadManifest(manifest)) == len(photos) - 1
+
+        client, seen = _client(_ok)
+        second = DocumentsEndpoint(client).upload_many([("1", "i", p) for p in photos], manifest=manifest)
+        assert len(seen) == 1
+        assert [r.file_name for r in second[:-1]] == [r.file_name for r in first[:-1]]
+        assert len(UploadManifest(manifest)) == len(photos)
+
+    def test_manifest_survives_torn_line(self, photos, tmp_path):
+        manifest = tmp_path / "uploads.jsonl"
+        manifest.write_text('{"key": "x", "resp')
+        record = UploadManifest(manifest)
+        key = record.key(BulkUpload("1", None, photos[0]))
+        record.record(key, {"success": True})
+        assert key in UploadManifest(manifest)
+
+    def test_non_seekable_source_is_rejected_before_sending(self, photos):
+        client, seen = _client(_ok)
+        read, write = os.pipe()
+        with os.fdopen(read, "rb") as pipe, os.fdopen(write, "wb"):
+            uploads = [("1", None, photos[0]), ("1", None, pipe, "p.jpg")]
+            with pytest.raises(ValueError, match="must be seekable"):
+                DocumentsEndpoint(client).upload_many(uploads)
+        assert seen == []
+
+    def test_rejects_async_client(self, photos):
+        client = MagicMock(name="AsyncHttpClient")
+
+        async def request(*args, **kwargs):
+            return None
+
+        client.request = request
+        with pytest.raises(TypeError, match="synchronous"):
+            DocumentsEndpoint(client).upload_many([("1", None, photos[0])])
@@ -0,0 +1,164 @@
+"""Unit tests for CodeResolver and its cache backends."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import ab.cache
+from ab.cache import CodeResolver, MemoryResolverBackend, SqliteResolverBackend
+
+_UUID = "ed282b80-54fe-4f42-bf1b-69103ce1f76c"
+
+
+def _response(text: str, status: int = 200):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.ok = status < 400
+    resp.text = text
+    return resp
+
+
+@pytest.fixture
+def service():
+    """Patch the cache service; maps upper-case codes to UUIDs."""
+    known = {"9999AZ": _UUID}
+    session = MagicMock()
+    session.get.side_effect = lambda url, **kw: _response(known.get(url.rsplit("/", 1)[-1], ""))
+    with patch("ab.cache._session", return_value=session):
+        yield session
+
+
+def _client(base_url: str = "https://portal.abconnect.co/api/api"):
+    return MagicMock(base_url=base_url)
+
+
+def _resolver(backend=None, client=None, secret="secret", **kwargs) -> CodeResolver:
+    backend = MemoryResolverBackend() if backend is None else backend
+    return CodeResolver(client or _client(), secret, backend=backend, **kwargs)
+
+
+class TestCodeResolver:
+    def test_uuid_passthrough_skips_lookup(self, service):
+        assert _resolver().resolve(_UUID) == _UUID
+        service.get.assert_not_called()
+
+    def test_resolution_is_cached(self, service):
+        resolver = _resolver()
+        assert resolver.resolve("9999az") == _UUID
+        assert resolver.resolve("9999AZ") == _UUID
+        assert service.get.call_count == 1
+
+    def test_unknown_code_is_negatively_cached(self, service):
+        resolver = _resolver()
+        assert resolver.resolve("NOPE") == "NOPE"
+        assert resolver.resolve("NOPE") == "NOPE"
+        assert service.get.call_count == 1
+
+    def test_not_found_is_negatively_cached(self, service):
+        service.get.side_effect = lambda url, **kw: _response("", status=404)
+        resolver = _resolver()
+        resolver.resolve("GONE")
+        resolver.resolve("GONE")
+        assert service.get.call_count == 1
+
+    @pytest.mark.parametrize("failure", [_response("oops", status=503), TimeoutError("slow")])
+    def test_service_errors_are_not_cached(self, service, failure):
+        def get(url, **kwargs):
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+
+        service.get.side_effect = get
+        resolver = _resolver()
+        assert resolver.resolve("9999AZ") == "9999AZ"
+        service.get.side_effect = lambda url, **kw: _response(_UUID)
+        assert resolver.resolve("9999AZ") == _UUID
+
+    def test_negative_entry_expires(self, service):
+        resolver = _resolver(negative_ttl=0.01)
+        resolver.resolve("NOPE")
+        time.sleep(0.02)
+        resolver.resolve("NOPE")
+        assert service.get.call_count == 2
+
+    def test_clients_share_the_default_backend(self, service):
+        a = CodeResolver(_client(), "secret")
+        b = CodeResolver(_client(), "secret")
+        assert a.backend is b.backend
+
+    def test_same_environment_and_account_share_entries(self, service):
+        backend = MemoryResolverBackend()
+        _resolver(backend).resolve("9999AZ")
+        assert _resolver(backend).resolve("9999AZ") == _UUID
+        assert service.get.call_count == 1
+
+    @pytest.mark.parametrize(
+        "other",
+        [{"client": _client("https://staging.abconnect.co/api/api")}, {"secret": "other-account"}],
+        ids=["environment", "account"],
+    )
+    def test_environments_and_accounts_do_not_share_entries(self, service, other):
+        backend = MemoryResolverBackend()
+        assert _resolver(backend).resolve("9999AZ") == _UUID
+        assert _resolver(backend).resolve("NOPE") == "NOPE"
+        service.get.side_effect = lambda url, **kw: _response("")
+        assert _resolver(backend, **other).resolve("9999AZ") == "9999AZ"
+        service.get.side_effect = lambda url, **kw: _response(_UUID)
+        assert _resolver(backend, **other).resolve("NOPE") == _UUID
+        assert service.get.call_count == 4
+
+    def test_secret_is_not_stored_in_keys(self, service, tmp_path):
+        path = tmp_path / "codes.sqlite"
+        _resolver(SqliteResolverBackend(path), secret="s3cr3t-value").resolve("9999AZ")
+        assert b"s3cr3t-value" not in path.read_bytes()
+
+    def test_session_is_created_once_across_threads(self):
+        with patch("ab.cache._lookup_session", None), patch("ab.cache.requests.Session") as factory:
+            factory.side_effect = lambda: (time.sleep(0.01), MagicMock())[1]
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                sessions = set(pool.map(lambda _: id(ab.cache._session()), range(16)))
+        assert factory.call_count == 1
+        assert len(sessions) == 1
+
+    def test_warm_resolves_concurrently_and_dedupes(self, service):
+        resolver = _resolver()
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_get(url, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return _response(_UUID if url.endswith("9999AZ") else "")
+
+        service.get.side_effect = slow_get
+        codes = ["9999AZ", "9999az", "A1", "A2", "A3", _UUID]
+        result = resolver.warm(codes, max_workers=4)
+
+        assert result["9999az"] == _UUID
+        assert result["A1"] == "A1"
+        assert result[_UUID] == _UUID
+        assert service.get.call_count == 4
+        assert peak > 1
+
+
+class TestSqliteResolverBackend:
+    def test_shared_between_instances(self, tmp_path):
+        path = tmp_path / "codes.sqlite"
+        SqliteResolverBackend(path).set("9999AZ", _UUID, ttl=60)
+        assert SqliteResolverBackend(path).get("9999AZ") == _UUID
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        backend = SqliteResolverBackend(tmp_path / "codes.sqlite")
+        backend.set("OLD", _UUID, ttl=-1)
+        assert backend.get("OLD") is None
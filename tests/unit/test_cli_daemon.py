@@ -0,0 +1,164 @@
+"""Unit tests for ab.cli.daemon — the ``ab shell`` prompt and ``ab --daemon`` socket server."""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from ab.cli import daemon
+
+
+@pytest.fixture
+def sock(monkeypatch):
+    # AF_UNIX paths are limited to ~100 bytes, so avoid pytest's long tmp_path.
+    directory = Path(tempfile.mkdtemp(prefix="ab"))
+    path = directory / "ab.sock"
+    monkeypatch.setenv("ABCONNECT_DAEMON_SOCKET", str(path))
+    yield path
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def api():
+    api = MagicMock()
+    api.jobs.get.return_value = {"jobDisplayId": 2000000}
+    return api
+
+
+@pytest.fixture
+def running(sock, api):
+    ready = threading.Event()
+    thread = threading.Thread(target=daemon.serve, args=(None,), kwargs={"api": api, "ready": ready}, daemon=True)
+    thread.start()
+    assert ready.wait(5)
+    yield sock
+    if thread.is_alive():
+        daemon.stop(None)
+        thread.join(5)
+
+
+class TestSocketPath:
+    def test_env_override_and_off(self, monkeypatch):
+        monkeypatch.setenv("ABCONNECT_DAEMON_SOCKET", "/tmp/x.sock")
+        assert daemon.socket_path(None) == Path("/tmp/x.sock")
+        monkeypatch.setenv("ABCONNECT_DAEMON_SOCKET", "off")
+        assert daemon.socket_path(None) is None
+
+    def test_default_is_per_env(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("ABCONNECT_DAEMON_SOCKET", raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert daemon.socket_path(None).name == "ab-production.sock"
+        assert daemon.socket_path("staging").name == "ab-staging.sock"
+        assert daemon.socket_path(None).parent.parent == tmp_path
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership")
+    def test_default_dir_open_to_others_is_refused(self, monkeypatch, api):
+        monkeypatch.delenv("ABCONNECT_DAEMON_SOCKET", raising=False)
+        base = Path(tempfile.mkdtemp(prefix="ab"))
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(base))
+        try:
+            path = daemon.socket_path(None)
+            path.parent.mkdir(mode=0o777)
+            path.parent.chmod(0o777)
+            with pytest.raises(OSError, match="mode 0700"):
+                daemon._bind(path, None, api)
+            path.parent.chmod(0o700)
+            daemon._bind(path, None, api).server_close()
+        finally:
+            shutil.rmtree(base, ignore_errors=True)
+
+    def test_client_socket_has_a_timeout(self, running):
+        sock = daemon._connect(running)
+        with sock:
+            assert sock.gettimeout() == daemon._CONNECT_TIMEOUT
+
+
+class TestRun:
+    def test_dispatches_through_given_client(self, api):
+        code, stdout, _ = daemon.run(["jobs", "get", "2000000"], None, api)
+        assert code == 0
+        assert json.loads(stdout) == {"jobDisplayId": 2000000}
+        api.jobs.get.assert_called_once_with("2000000")
+
+    def test_runs_in_given_directory(self, api, tmp_path):
+        api.jobs.get.side_effect = lambda _: {"cwd": os.getcwd()}
+        before = os.getcwd()
+        code, stdout, _ = daemon.run(["jobs", "get", "1"], None, api, cwd=str(tmp_path))
+        assert code == 0
+        assert json.loads(stdout) == {"cwd": str(tmp_path)}
+        assert os.getcwd() == before
+
+    def test_captures_exit_code_and_stderr(self, api):
+        code, stdout, stderr = daemon.run(["no_such_group"], None, api)
+        assert code == 1
+        assert stdout == ""
+        assert "Unknown module" in stderr
+
+
+class TestDaemon:
+    def test_forward_without_daemon_returns_none(self, sock):
+        assert daemon.forward(["--list"], None) is None
+
+    def test_forward_runs_on_daemon(self, running, api, capsys):
+        assert daemon.forward(["jobs", "get", "7"], None) == 0
+        assert daemon.forward(["jobs", "get", "8"], None) == 0
+        assert [c.args for c in api.jobs.get.call_args_list] == [("7",), ("8",)]
+        out = capsys.readouterr().out
+        assert json.JSONDecoder().raw_decode(out)[0] == {"jobDisplayId": 2000000}
+
+    def test_forward_sends_callers_directory(self, running, api, tmp_path, monkeypatch, capsys):
+        api.jobs.get.side_effect = lambda _: {"cwd": os.getcwd()}
+        monkeypatch.chdir(tmp_path)
+        assert daemon.forward(["jobs", "get", "7"], None) == 0
+        assert json.loads(capsys.readouterr().out) == {"cwd": str(tmp_path)}
+
+    def test_forward_reports_daemon_exit_code(self, running, capsys):
+        assert daemon.forward(["no_such_group"], None) == 1
+        assert "Unknown module" in capsys.readouterr().err
+
+    def test_daemon_commands_are_not_forwarded(self, running):
+        assert daemon.forward(["--daemon"], None) is None
+        assert daemon._call(running, {"argv": ["shell"]})["code"] == 1
+
+    def test_socket_is_private(self, running):
+        assert running.stat().st_mode & 0o777 == 0o600
+
+    def test_stop_removes_socket(self, running):
+        daemon.stop(None)
+        for _ in range(50):
+            if not running.exists():
+                break
+            threading.Event().wait(0.1)
+        assert not running.exists()
+
+    def test_second_daemon_refuses_live_socket(self, running, api):
+        with pytest.raises(SystemExit, match="already listening"):
+            daemon.serve(None, api=api)
+
+    def test_stale_socket_is_replaced(self, sock, api):
+        import socket
+
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(sock))
+        stale.close()
+        server = daemon._bind(sock, None, api)
+        server.server_close()
+
+
+class TestShell:
+    def test_runs_each_line(self, api, monkeypatch, capsys):
+        lines = ["jobs get 1", "", "'unterminated", "shell", "jobs get 2", "exit", "jobs get 3"]
+        monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(lines) + "\n"))
+        daemon.shell(None, api=api)
+        assert [c.args for c in api.jobs.get.call_args_list] == [("1",), ("2",)]
+        err = capsys.readouterr().err
+        assert "Error:" in err
+        assert "not available inside the shell" in err
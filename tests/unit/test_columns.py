@@ -0,0 +1,97 @@
+"""Unit tests for columnar export of list and paginated responses."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import math
+from array import array
+from pathlib import Path
+
+import pytest
+
+from ab import to_columns
+from ab.api.lazy import LazyList
+from ab.api.models.catalog import CatalogExpandedDto
+from ab.api.models.jobs import Job
+from ab.api.models.reports import SalesForecastReport
+from ab.api.models.shared import PaginatedList
+
+_FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+_ROWS = [
+    {"jobID": "2000001", "company": " Acme ", "revenue": 100, "profit": None},
+    {"jobID": "2000002", "company": "Globex", "revenue": 250.5, "profit": 40.25},
+]
+
+
+def _page(rows, number, total_pages, total_items, model=SalesForecastReport):
+    return PaginatedList.model_construct(
+        items=LazyList(model, rows),
+        page_number=number,
+        total_pages=total_pages,
+        total_items=total_items,
+        has_next_page=number < total_pages,
+    )
+
+
+class TestToColumns:
+    def test_models_and_raw_rows_give_the_same_columns(self):
+        models = [SalesForecastReport.model_validate(r) for r in _ROWS]
+        fields = ["job_id", "company", "revenue"]
+        assert to_columns(models, fields) == to_columns(LazyList(SalesForecastReport, _ROWS), fields)
+
+    def test_float_fields_are_packed_with_nan_for_missing(self):
+        cols = to_columns(LazyList(SalesForecastReport, _ROWS), ["revenue", "profit"])
+        assert isinstance(cols["revenue"], array)
+        assert list(cols["revenue"]) == [100.0, 250.5]
+        assert math.isnan(cols["profit"][0])
+
+    def test_raw_columns_validated_with_field_types(self):
+        cols = to_columns(LazyList(Job, [{"modifiedDate": "2026-01-02T03:04:05"}]), ["modified_date"])
+        assert cols["modified_date"] == [datetime.datetime(2026, 1, 2, 3, 4, 5)]
+
+    def test_field_selection_and_aliases(self):
+        cols = to_columns(LazyList(SalesForecastReport, _ROWS), ["job_id"], by_alias=True)
+        assert cols == {"jobID": ["2000001", "2000002"]}
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(ValueError, match="no field"):
+            to_columns(LazyList(SalesForecastReport, _ROWS), ["nope"])
+
+    def test_plain_dicts_need_a_model(self):
+        with pytest.raises(ValueError, match="model="):
+            to_columns(_ROWS)
+        assert to_columns(_ROWS, ["job_id"], model=SalesForecastReport) == {"job_id": ["2000001", "2000002"]}
+
+    def test_empty_result(self):
+        assert to_columns([]) == {}
+        assert to_columns([], ["revenue"], model=SalesForecastReport) == {"revenue": array("d")}
+
+
+class TestPages:
+    def test_pages_stream_into_one_set_of_columns(self):
+        pages = [_page(_ROWS, 1, 2, 3), _page(_ROWS[:1], 2, 2, 3)]
+        cols = to_columns(iter(pages), ["job_id", "revenue"])
+        assert cols["job_id"] == ["2000001", "2000002", "2000001"]
+        assert list(cols["revenue"]) == [100.0, 250.5, 100.0]
+
+    def test_columns_grow_past_a_low_total(self):
+        cols = to_columns([_page(_ROWS, 1, 2, 1), _page(_ROWS, 2, 2, 1)], ["job_id"])
+        assert len(cols["job_id"]) == 4
+
+    def test_columns_trimmed_to_rows_received(self):
+        cols = to_columns(_page(_ROWS, 1, 1, 50), ["revenue"])
+        assert len(cols["revenue"]) == 2
+
+    def test_paginated_list_method(self):
+        item = json.loads((_FIXTURES / "CatalogExpandedDto.json").read_text())
+        page = PaginatedList[CatalogExpandedDto].model_validate({"items": [item], "totalItems": 1})
+        assert page.to_columns(["id", "title"]) == {"id": [item["id"]], "title": [item["title"]]}
+
+
+class TestDataFrame:
+    def test_dataframe(self):
+        pytest.importorskip("pandas")
+        frame = _page(_ROWS, 1, 1, 2).to_dataframe(["job_id", "revenue"])
+        assert list(frame.columns) == ["job_id", "revenue"]
+        assert frame["revenue"].dtype == "float64"
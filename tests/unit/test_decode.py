@@ -0,0 +1,92 @@
+"""Unit tests for bytes-to-model decoding with cached TypeAdapters."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from ab import ABConnectAPI
+from ab.api.base import _response_adapter
+from ab.api.models.catalog import CatalogExpandedDto
+from ab.api.models.lookup import CountryCodeDto
+from ab.api.models.shared import PaginatedList
+from ab.auth import MemoryTokenStorage
+from ab.auth.base import Token
+from ab.exceptions import RequestError
+
+_ENV = {"ABCONNECT_CLIENT_ID": "cid", "ABCONNECT_CLIENT_SECRET": "secret"}
+_FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+
+
+def _api() -> ABConnectAPI:
+    storage = MemoryTokenStorage(Token(access_token="tok", expires_at=time.time() + 3600))
+    with patch.dict(os.environ, _ENV, clear=True):
+        return ABConnectAPI(token_storage=storage)
+
+
+def _response(text: str):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.headers = {"Content-Type": "application/json"}
+    resp.text = text
+    resp.content = text.encode()
+    return resp
+
+
+class TestResponseAdapter:
+    def test_adapters_are_cached_per_type_string(self):
+        assert _response_adapter("List[CountryCodeDto]") is _response_adapter("List[CountryCodeDto]")
+
+    def test_passthrough_types_have_no_adapter(self):
+        assert _response_adapter("bytes") is None
+        assert _response_adapter("str") is None
+
+
+class TestEndpointDecoding:
+    def test_models_validated_straight_from_bytes(self):
+        api = _api()
+        body = json.dumps([{"id": "US", "name": "United States"}])
+        resp = _response(body)
+        with patch.object(api._acportal._session, "request", return_value=resp):
+            countries = api.lookup.get_countries()
+        assert isinstance(countries[0], CountryCodeDto)
+        resp.json.assert_not_called()
+
+    def test_wrapped_list_falls_back_to_unwrapping(self):
+        api = _api()
+        body = json.dumps({"modifiedDate": "2026-01-01", "items": [{"id": "US", "name": "United States"}]})
+        with patch.object(api._acportal._session, "request", return_value=_response(body)):
+            countries = api.lookup.get_countries()
+        assert [c.id for c in countries] == ["US"]
+
+    def test_invalid_json_raises_request_error(self):
+        api = _api()
+        with patch.object(api._acportal._session, "request", return_value=_response("<html>oops</html>")):
+            with pytest.raises(RequestError, match="not valid JSON"):
+                api.lookup.get_countries()
+
+
+class TestPageDecoding:
+    def test_envelope_validated_from_bytes(self):
+        api = _api()
+        item = json.loads((_FIXTURES / "CatalogExpandedDto.json").read_text())
+        body = json.dumps({"items": [item, item], "pageNumber": 2, "totalPages": 3, "totalItems": 52, "extra": 1})
+        resp = _response(body)
+        with patch.object(api._catalog._session, "request", return_value=resp):
+            page = api.catalog.list(page_number=2)
+        assert isinstance(page, PaginatedList)
+        assert all(isinstance(i, CatalogExpandedDto) for i in page.items)
+        assert (page.page_number, page.total_pages, page.total_items) == (2, 3, 52)
+        resp.json.assert_not_called()
+
+    def test_invalid_envelope_takes_the_dict_path(self):
+        api = _api()
+        with patch.object(api._catalog._session, "request", return_value=_response('{"items": "nope"}')):
+            with pytest.raises(ValidationError):
+                api.catalog.list()
@@ -0,0 +1,115 @@
+"""Unit tests for the incremental document mirror (ab.api.helpers.mirror)."""
+
+from __future__ import annotations
+
+import io
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from ab.api.endpoints.documents import DocumentsEndpoint
+from ab.api.helpers.mirror import DocumentMirror
+from ab.exceptions import RequestError
+
+
+class FakeServer:
+    """Answers ``documents.list`` and ``documents.get`` from in-memory tables."""
+
+    def __init__(self) -> None:
+        self.listings: dict = {}
+        self.blobs: dict = {}
+        self.fetched: list = []
+        self.client = MagicMock(name="HttpClient")
+        self.client.request.side_effect = self.request
+
+    def add(self, job: str, doc_id: int, path: str, body: bytes, name: str = "file.pdf") -> None:
+        self.listings.setdefault(job, []).append({"id": doc_id, "path": path, "fileName": name})
+        self.blobs[path] = body
+
+    def request(self, method, path, **kwargs):
+        if path == "/documents/list":
+            return list(self.listings.get(kwargs["params"]["jobDisplayId"], []))
+        doc_path = path.removeprefix("/documents/get/")
+        self.fetched.append(doc_path)
+        if doc_path not in self.blobs:
+            raise RequestError(404, "gone")
+        body = self.blobs[doc_path]
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.headers.update({"Content-Type": "application/pdf", "Content-Length": str(len(body))})
+        resp.raw = io.BytesIO(body)
+        return resp
+
+
+@pytest.fixture
+def server():
+    return FakeServer()
+
+
+@pytest.fixture
+def documents(server):
+    return DocumentsEndpoint(server.client)
+
+
+def test_first_sync_downloads_and_links(server, documents, tmp_path):
+    server.add("100", 1, "jobs/100/bol.pdf", b"bol-100", "bol.pdf")
+    server.add("200", 2, "jobs/200/photo.jpg", b"photo-200", "photo.jpg")
+    report = documents.mirror(["100", "200"], tmp_path, max_workers=2)
+    assert report.downloaded == 2 and report.unchanged == 0 and not report.failed
+    assert (tmp_path / "100" / "1_bol.pdf").read_bytes() == b"bol-100"
+    assert (tmp_path / "200" / "2_photo.jpg").read_bytes() == b"photo-200"
+
+
+def test_second_sync_downloads_only_new_documents(server, documents, tmp_path):
+    server.add("100", 1, "jobs/100/bol.pdf", b"bol-100")
+    documents.mirror(["100"], tmp_path)
+    server.add("100", 3, "jobs/100/new.pdf", b"new")
+    server.fetched.clear()
+    report = documents.mirror(["100"], tmp_path)
+    assert server.fetched == ["jobs/100/new.pdf"]
+    assert (report.downloaded, report.unchanged) == (1, 1)
+
+
+def test_identical_content_is_stored_once(server, documents, tmp_path):
+    server.add("100", 1, "jobs/100/terms.pdf", b"same terms")
+    server.add("200", 2, "jobs/200/terms.pdf", b"same terms")
+    report = documents.mirror(["100", "200"], tmp_path)
+    assert report.deduplicated == 1
+    assert len(list((tmp_path / "objects").glob("??/*"))) == 1
+    with DocumentMirror(documents, tmp_path) as mirror:
+        assert mirror.path_for("100", 1) == mirror.path_for("200", 2)
+
+
+def test_missing_local_copy_is_refetched(server, documents, tmp_path):
+    server.add("100", 1, "jobs/100/bol.pdf", b"bol-100")
+    documents.mirror(["100"], tmp_path)
+    for obj in (tmp_path / "objects").glob("??/*"):
+        obj.unlink()
+    server.fetched.clear()
+    report = documents.mirror(["100"], tmp_path)
+    assert server.fetched == ["jobs/100/bol.pdf"]
+    assert report.downloaded == 1
+
+
+def test_removed_documents_are_pruned(server, documents, tmp_path):
+    server.add("100", 1, "jobs/100/a.pdf", b"a", "a.pdf")
+    server.add("100", 2, "jobs/100/b.pdf", b"b", "b.pdf")
+    documents.mirror(["100"], tmp_path)
+    server.listings["100"] = server.listings["100"][:1]
+    report = documents.mirror(["100"], tmp_path)
+    assert report.removed == 1
+    assert not (tmp_path / "100" / "2_b.pdf").exists()
+    assert len(list((tmp_path / "objects").glob("??/*"))) == 1
+
+
+def test_failed_download_is_reported_and_retried_next_run(server, documents, tmp_path):
+    server.add("100", 1, "jobs/100/a.pdf", b"a")
+    server.listings["100"].append({"id": 9, "path": "jobs/100/missing.pdf"})
+    report = documents.mirror(["100"], tmp_path)
+    assert report.downloaded == 1
+    assert [(job, doc_id) for job, doc_id, _exc in report.failed] == [("100", "9")]
+    assert not list((tmp_path / "objects").glob(".*.part"))
+    server.fetched.clear()
+    documents.mirror(["100"], tmp_path)
+    assert server.fetched == ["jobs/100/missing.pdf"]
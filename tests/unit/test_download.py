@@ -0,0 +1,121 @@
+"""Unit tests for streamed downloads (``dest=`` on binary endpoints)."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from ab import ABConnectAPI
+from ab.api.download import Download, save
+from ab.auth import MemoryTokenStorage
+from ab.auth.base import Token
+from ab.exceptions import RequestError
+
+_ENV = {"ABCONNECT_CLIENT_ID": "cid", "ABCONNECT_CLIENT_SECRET": "secret"}
+_BODY = b"%PDF-1.7\n" + bytes(range(256)) * 2000
+
+
+def _response(body: bytes = _BODY, status: int = 200, **headers: str) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update({"Content-Type": "application/pdf", "Content-Length": str(len(body)), **headers})
+    resp.raw = io.BytesIO(body)
+    return resp
+
+
+@pytest.fixture
+def api():
+    storage = MemoryTokenStorage(Token(access_token="tok", expires_at=time.time() + 3600))
+    with patch.dict(os.environ, _ENV, clear=True):
+        yield ABConnectAPI(token_storage=storage)
+
+
+class TestSave:
+    def test_writes_file_and_reports_checksum(self, tmp_path):
+        result = save(_response(), tmp_path / "out.pdf", "doc.pdf", chunk_size=4096)
+        assert result == Download(
+            filename="doc.pdf",
+            path=tmp_path / "out.pdf",
+            size=len(_BODY),
+            content_length=len(_BODY),
+            content_type="application/pdf",
+            sha256=hashlib.sha256(_BODY).hexdigest(),
+        )
+        assert (tmp_path / "out.pdf").read_bytes() == _BODY
+
+    def test_directory_uses_filename(self, tmp_path):
+        result = save(_response(), tmp_path, "doc.pdf")
+        assert result.path == tmp_path / "doc.pdf"
+        assert result.path.read_bytes() == _BODY
+
+    def test_stream_destination(self):
+        sink = io.BytesIO()
+        result = save(_response(), sink, "doc.pdf")
+        assert result.path is None
+        assert sink.getvalue() == _BODY
+
+    def test_truncated_body_raises_and_leaves_no_file(self, tmp_path):
+        resp = _response(_BODY[:100], **{"Content-Length": str(len(_BODY))})
+        with pytest.raises(RequestError, match="received 100 of"):
+            save(resp, tmp_path / "out.pdf", "doc.pdf")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_bad_destination_closes_the_response(self, tmp_path):
+        resp = _response()
+        with pytest.raises(FileNotFoundError):
+            save(resp, tmp_path / "missing" / "out.pdf", "doc.pdf")
+        assert resp.raw.closed
+
+
+class TestEndpoints:
+    def test_document_get_streams(self, api, tmp_path):
+        with patch.object(api._acportal._session, "request", return_value=_response()) as request:
+            result = api.documents.get("jobs/2000000/label.pdf", dest=tmp_path)
+        assert request.call_args.kwargs["stream"] is True
+        assert result.path == tmp_path / "label.pdf"
+        assert result.path.read_bytes() == _BODY
+
+    def test_document_get_without_dest_returns_bytes(self, api):
+        with patch.object(api._acportal._session, "request", return_value=_response()):
+            assert api.documents.get("label.pdf") == _BODY
+
+    def test_form_pdf_uses_dict_filename(self, api, tmp_path):
+        with patch.object(api._acportal._session, "request", return_value=_response()):
+            result = api.jobs.form.bill_of_lading(2000000, shipment_plan_id="p1", dest=tmp_path)
+        assert result.filename == "bol_2000000.pdf"
+        assert result.path.read_bytes() == _BODY
+
+    def test_error_status_raises(self, api, tmp_path):
+        resp = _response(b'{"message": "not found"}', status=404, **{"Content-Type": "application/json"})
+        with patch.object(api._acportal._session, "request", return_value=resp):
+            with pytest.raises(RequestError) as exc:
+                api.shipments.get_shipment_document("d1", dest=tmp_path)
+        assert exc.value.status_code == 404
+        assert list(tmp_path.iterdir()) == []
+
+
+def test_async_download(tmp_path):
+    httpx = pytest.importorskip("httpx")
+    from ab import AsyncABConnectAPI
+
+    storage = MemoryTokenStorage(Token(access_token="tok", expires_at=time.time() + 3600))
+    with patch.dict(os.environ, _ENV, clear=True):
+        api = AsyncABConnectAPI(token_storage=storage)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=_BODY))
+    api._acportal._async_session = httpx.AsyncClient(transport=transport)
+
+    async def run():
+        async with api:
+            return await api.jobs.form.invoice(2000000, dest=tmp_path)
+
+    result = asyncio.run(run())
+    assert result.path == tmp_path / "invoice_2000000.pdf"
+    assert result.sha256 == hashlib.sha256(_BODY).hexdigest()
+    assert result.path.read_bytes() == _BODY
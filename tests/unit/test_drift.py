@@ -0,0 +1,68 @@
+"""Unit tests for the process-wide schema-drift registry."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Optional
+
+import pytest
+
+from ab.api.models.base import ResponseModel
+from ab.drift import DriftRegistry, registry
+
+
+class _Widget(ResponseModel):
+    name: Optional[str] = None
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+class TestDriftRegistry:
+    def test_warns_once_per_pair(self):
+        reg = DriftRegistry()
+        assert reg.record("M", "a", 1) is True
+        assert reg.record("M", "a", 2) is False
+        assert reg.record("M", "b", 1) is True
+        assert reg.get("M", "a").count == 2
+
+    def test_sampled_warnings(self):
+        reg = DriftRegistry(warn_every=3)
+        assert [reg.record("M", "a") for _ in range(7)] == [True, False, False, True, False, False, True]
+
+    def test_samples_are_distinct_and_capped(self):
+        reg = DriftRegistry(max_samples=2)
+        for value in (1, 1, 2, 3):
+            reg.record("M", "a", value)
+        assert reg.get("M", "a").samples == ["1", "2"]
+
+    def test_export_and_reset(self, tmp_path):
+        reg = DriftRegistry()
+        reg.record("M", "a", "x")
+        data = json.loads(reg.export(tmp_path / "drift.json").read_text())
+        assert data["drift"][0]["model"] == "M"
+        assert data["drift"][0]["samples"] == ["'x'"]
+        reg.reset()
+        assert len(reg) == 0
+
+
+class TestResponseModelDrift:
+    def test_bulk_list_logs_each_unknown_field_once(self, caplog):
+        rows = [{"name": f"w{i}", "newA": i, "newB": True} for i in range(500)]
+        with caplog.at_level(logging.WARNING, logger="ab.api.models.base"):
+            for row in rows:
+                _Widget.model_validate(row)
+        assert len(caplog.records) == 2
+        assert registry.get("_Widget", "newA").count == 500
+        assert registry.get("_Widget", "newB").count == 500
+
+    def test_progress_report_reads_the_registry(self):
+        from ab.progress.report import drift_report
+
+        _Widget.model_validate({"extra": 1})
+        assert [(r["model"], r["field"]) for r in drift_report()] == [("_Widget", "extra")]
@@ -0,0 +1,57 @@
+"""Unit tests for the process-wide ClientFactory."""
+
+from __future__ import annotations
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ab import ABConnectAPI, ClientFactory
+from ab.auth import MemoryTokenStorage
+from ab.auth.base import Token
+from ab.auth.session import SessionTokenStorage
+
+_ENV = {"ABCONNECT_CLIENT_ID": "cid", "ABCONNECT_CLIENT_SECRET": "secret"}
+
+
+@pytest.fixture
+def factory():
+    with patch.dict(os.environ, _ENV, clear=True):
+        factory = ClientFactory(pool_maxsize=8)
+    yield factory
+    factory.close()
+
+
+def _storage(access_token: str) -> MemoryTokenStorage:
+    return MemoryTokenStorage(Token(access_token=access_token, expires_at=time.time() + 3600))
+
+
+class TestClientFactory:
+    def test_clients_share_transport_state_but_not_tokens(self, factory):
+        a = factory.create(token_storage=_storage("a"))
+        b = factory.create(token_storage=_storage("b"))
+
+        assert isinstance(a, ABConnectAPI)
+        assert a._settings is b._settings is factory.settings
+        assert a._acportal._session is b._acportal._session is factory.session_for("acportal")
+        assert a._catalog._rate_limiter is b._catalog._rate_limiter
+        assert a._resolver is b._resolver is factory.resolver
+        assert a._token_storage is not b._token_storage
+        assert a._acportal._ensure_token().access_token == "a"
+        assert b._acportal._ensure_token().access_token == "b"
+
+    def test_django_request_uses_session_storage(self, factory):
+        request = MagicMock()
+        request.session = {}
+        api = factory.create(request=request)
+        assert isinstance(api._token_storage, SessionTokenStorage)
+
+    def test_pool_size_is_applied(self, factory):
+        adapter = factory.session_for("abc").get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 8
+
+    def test_shared_sessions_never_keep_cookies(self, factory):
+        policy = factory.session_for("acportal").cookies.get_policy()
+        assert policy.is_not_allowed("portal.abconnect.co")
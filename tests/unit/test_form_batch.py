@@ -0,0 +1,146 @@
+"""Unit tests for ``api.jobs.form.batch`` (ab.api.helpers.forms)."""
+
+from __future__ import annotations
+
+import io
+import threading
+import zipfile
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from ab.api.endpoints.jobs.form import JobFormEndpoint
+from ab.api.streaming import streaming_responses
+from ab.exceptions import ConfigurationError, RequestError
+
+_PLANS = [
+    {"jobShipmentID": "ltl-1", "transportType": "LTL"},
+    {"jobShipmentID": "del-1", "transportType": "Delivery"},
+]
+
+
+class FakeForms:
+    def __init__(self) -> None:
+        self.calls: list = []
+        self._lock = threading.Lock()
+        self.client = MagicMock(name="HttpClient")
+        self.client.request.side_effect = self.request
+        self.body = lambda path, params: f"%PDF {path} {params}".encode()
+
+    def request(self, method, path, **kwargs):
+        with self._lock:
+            self.calls.append((path, kwargs.get("params")))
+        job = path.split("/")[2]
+        if path.endswith("/form/shipments"):
+            return list(_PLANS)
+        if job == "404":
+            raise RequestError(404, "no such job")
+        body = self.body(path, kwargs.get("params"))
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.headers["Content-Type"] = "application/pdf"
+        resp.raw = io.BytesIO(body)
+        return resp
+
+
+@pytest.fixture
+def server():
+    return FakeForms()
+
+
+@pytest.fixture
+def form(server):
+    return JobFormEndpoint(server.client)
+
+
+def test_zip_holds_every_form(server, form, tmp_path):
+    archive = tmp_path / "dispatch.zip"
+    results = form.batch([100, 200], ["bol", "packing_slip", "item_labels"], archive, max_workers=4)
+    assert [r.filename for r in results] == [
+        "bol_100.pdf", "packing_slip_100.pdf", "item_labels_100.pdf",
+        "bol_200.pdf", "packing_slip_200.pdf", "item_labels_200.pdf",
+    ]
+    assert all(r.path is None for r in results)
+    with zipfile.ZipFile(archive) as zf:
+        assert sorted(zf.namelist()) == sorted(r.filename for r in results)
+        assert zf.read("bol_100.pdf").startswith(b"%PDF /job/100/form/bill-of-lading")
+
+
+def test_shipment_plans_fetched_once_per_job(server, form, tmp_path):
+    results = form.batch([100, 200], ["bol", "dbl"], tmp_path / "out")
+    plan_lookups = [path for path, _ in server.calls if path.endswith("/form/shipments")]
+    assert sorted(plan_lookups) == ["/job/100/form/shipments", "/job/200/form/shipments"]
+    assert [r.filename for r in results] == ["bol_100.pdf", "dbl_100.pdf", "bol_200.pdf", "dbl_200.pdf"]
+    assert (tmp_path / "out" / "dbl_200.pdf").exists()
+
+
+def test_plan_choice_matches_single_helpers(server, form, tmp_path):
+    form.batch([100], ["bol", "dbl"], tmp_path)
+    params = {p["shipmentPlanId"] for path, p in server.calls if "bill-of-lading" in path}
+    assert params == {"ltl-1", "del-1"}
+
+
+def test_plans_are_lists_inside_streaming_mode(server, form, tmp_path):
+    with streaming_responses():
+        results = form.batch([100], ["bol", "hbl", "dbl"], tmp_path)
+    assert [type(r).__name__ for r in results] == ["Download", "ValueError", "Download"]
+
+
+def test_directory_output_and_failures_in_place(server, form, tmp_path):
+    results = form.batch([100, 404], ["packing_slip"], tmp_path)
+    assert results[0].path == tmp_path / "packing_slip_100.pdf"
+    assert results[0].path.exists()
+    assert isinstance(results[1], RequestError)
+
+
+def test_zip_to_stream(server, form):
+    sink = io.BytesIO()
+    form.batch([100], ["invoice"], sink)
+    with zipfile.ZipFile(io.BytesIO(sink.getvalue())) as zf:
+        assert zf.namelist() == ["invoice_100.pdf"]
+
+
+def test_names_are_unique_per_job_and_kind(server, form, tmp_path):
+    archive = tmp_path / "dispatch.zip"
+    results = form.batch([100, "100", 200, 100], ["bill_of_lading", "bol", "bol"], archive)
+    names = [r.filename for r in results]
+    assert names == ["bill_of_lading_100.pdf", "bol_100.pdf", "bill_of_lading_200.pdf", "bol_200.pdf"]
+    with zipfile.ZipFile(archive) as zf:
+        assert sorted(zf.namelist()) == sorted(names)
+    form.batch([100], ["bill_of_lading", "bol"], tmp_path / "out")
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["bill_of_lading_100.pdf", "bol_100.pdf"]
+
+
+def test_unknown_kind_rejected(form, tmp_path):
+    with pytest.raises(ValueError, match="Unknown form kind"):
+        form.batch([100], ["shipments"], tmp_path)
+
+
+def test_merged_requires_pypdf_or_merges(server, form, tmp_path):
+    try:
+        import pypdf  # noqa: F401
+    except ImportError:
+        with pytest.raises(ConfigurationError, match="pypdf"):
+            form.batch([100], ["bol"], tmp_path, merged=tmp_path / "all.pdf")
+        assert server.calls == []
+    else:
+        pytest.skip("merging is exercised against real PDFs by test_merged_concatenates_in_job_order")
+
+
+def test_merged_concatenates_in_job_order(server, form, tmp_path):
+    pypdf = pytest.importorskip("pypdf")
+
+    def page(path, params):
+        # one blank page per form, its width encoding (job, kind)
+        writer = pypdf.PdfWriter()
+        writer.add_blank_page(width=int(path.split("/")[2]) + ("packing-slip" in path), height=100)
+        out = io.BytesIO()
+        writer.write(out)
+        return out.getvalue()
+
+    server.body = page
+    merged = tmp_path / "all.pdf"
+    form.batch([200, 100], ["invoice", "packing_slip"], tmp_path / "dispatch.zip", max_workers=4, merged=merged)
+    widths = [float(p.mediabox.width) for p in pypdf.PdfReader(merged).pages]
+    assert widths == [200, 201, 100, 101]
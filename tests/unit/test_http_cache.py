@@ -0,0 +1,112 @@
+"""Unit tests for the opt-in HTTP response cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+from ab import ABConnectAPI
+from ab.api.models.lookup import CountryCodeDto
+from ab.api.route import Route
+from ab.auth import MemoryTokenStorage
+from ab.auth.base import Token
+from ab.config import ABConnectSettings
+from ab.http import HttpClient
+from ab.http_cache import CachedResponse, ResponseCache
+
+_ENV = {"ABCONNECT_CLIENT_ID": "cid", "ABCONNECT_CLIENT_SECRET": "secret"}
+
+
+def _storage() -> MemoryTokenStorage:
+    return MemoryTokenStorage(Token(access_token="tok", expires_at=time.time() + 3600))
+
+
+def _client(cache: ResponseCache) -> HttpClient:
+    with patch.dict(os.environ, _ENV, clear=True):
+        settings = ABConnectSettings(require_credentials=False)
+    return HttpClient("https://example.com/api", settings, _storage(), response_cache=cache)
+
+
+def _response(payload=None, status: int = 200, headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = {"Content-Type": "application/json", **(headers or {})}
+    resp.text = json.dumps(payload) if payload is not None else ""
+    resp.content = resp.text.encode()
+    resp.json.return_value = payload
+    return resp
+
+
+class TestHttpClientCache:
+    def test_fresh_entry_skips_the_network(self):
+        client = _client(ResponseCache())
+        with patch.object(client._session, "request", return_value=_response([{"a": 1}])) as mock_req:
+            first = client.request("GET", "/lookup/countries", cache_ttl=60)
+            second = client.request("GET", "/lookup/countries", cache_ttl=60)
+        assert first == second == [{"a": 1}]
+        assert first is not second  # decoded per hit; callers never share objects
+        assert mock_req.call_count == 1
+
+    def test_stale_entry_revalidates_with_validators(self):
+        cache = ResponseCache()
+        client = _client(cache)
+        etag = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jun 2026 00:00:00 GMT"}
+        with patch.object(client._session, "request", return_value=_response([1], headers=etag)):
+            client.request("GET", "/x", cache_ttl=0)
+
+        with patch.object(client._session, "request", return_value=_response(status=304)) as mock_req:
+            assert client.request("GET", "/x", cache_ttl=0) == [1]
+        sent = mock_req.call_args.kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert sent["If-Modified-Since"] == "Mon, 01 Jun 2026 00:00:00 GMT"
+
+    def test_uncacheable_requests_bypass_the_cache(self):
+        cache = ResponseCache()
+        client = _client(cache)
+        with patch.object(client._session, "request", return_value=_response({"ok": True})) as mock_req:
+            client.request("GET", "/x")
+            client.request("POST", "/x", cache_ttl=60)
+            client.request("GET", "/x", cache_ttl=60, raw=True)
+        assert mock_req.call_count == 3
+        assert len(cache) == 0
+
+    def test_query_params_are_part_of_the_key(self):
+        assert ResponseCache.key("GET", "/x", {"b": 2, "a": 1, "c": None}) == "GET /x?a=1&b=2"
+
+
+class TestResponseCache:
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, CachedResponse("[]", stored_at=time.time()))
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+
+    def test_disk_store_survives_new_instances(self, tmp_path):
+        path = tmp_path / "http.sqlite"
+        ResponseCache(path=path).put("k", CachedResponse('{"v": 1}', etag='"e"', stored_at=time.time()))
+        entry = ResponseCache(path=path).get("k")
+        assert entry.decode() == {"v": 1}
+        assert entry.etag == '"e"'
+
+
+class TestRouteCachePolicy:
+    def test_bind_keeps_cache_ttl(self):
+        assert Route("GET", "/lookup/{k}", cache_ttl=60).bind(k="x").cache_ttl == 60
+
+    def test_declared_routes_are_cached_when_enabled(self):
+        with patch.dict(os.environ, {**_ENV, "ABCONNECT_HTTP_CACHE": "true"}, clear=True):
+            api = ABConnectAPI(token_storage=_storage())
+        payload = [{"id": "US", "name": "United States"}]
+        with patch.object(api._acportal._session, "request", return_value=_response(payload)) as mock_req:
+            countries = api.lookup.get_countries()
+            api.lookup.get_countries()
+        assert isinstance(countries[0], CountryCodeDto)
+        assert mock_req.call_count == 1
+
+    def test_disabled_by_default(self):
+        with patch.dict(os.environ, _ENV, clear=True):
+            api = ABConnectAPI(token_storage=_storage())
+        assert api._acportal._response_cache is None
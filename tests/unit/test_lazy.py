@@ -0,0 +1,128 @@
+"""Unit tests for lazy, dict-backed response views."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ab import ABConnectAPI
+from ab.api.lazy import LazyList, ModelView
+from ab.api.models.jobs import Job, JobContactDetails
+from ab.api.models.lots import LotDataDto
+from ab.api.models.shared import PaginatedList
+from ab.auth import MemoryTokenStorage
+from ab.auth.base import Token
+
+_ENV = {"ABCONNECT_CLIENT_ID": "cid", "ABCONNECT_CLIENT_SECRET": "secret"}
+_FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+
+
+def _job_payload() -> dict:
+    return json.loads((_FIXTURES / "Job.json").read_text())
+
+
+def _api() -> ABConnectAPI:
+    storage = MemoryTokenStorage(Token(access_token="tok", expires_at=time.time() + 3600))
+    with patch.dict(os.environ, _ENV, clear=True):
+        return ABConnectAPI(token_storage=storage)
+
+
+def _response(payload):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.headers = {"Content-Type": "application/json"}
+    resp.text = json.dumps(payload)
+    resp.content = resp.text.encode()
+    return resp
+
+
+class TestModelView:
+    def test_fields_match_the_validated_model(self):
+        raw = _job_payload()
+        view, model = ModelView(Job, raw), Job.model_validate(raw)
+        assert view.job_display_id == model.job_display_id
+        assert isinstance(view.modified_date, datetime.datetime)
+        assert view.modified_date == model.modified_date
+
+    def test_nested_models_and_lists_are_views(self):
+        view = ModelView(Job, _job_payload())
+        assert isinstance(view.customer_contact, ModelView)
+        assert view.customer_contact.model_class is JobContactDetails
+        assert isinstance(view.freight_items, LazyList)
+
+    def test_only_read_fields_are_built(self):
+        view = ModelView(Job, _job_payload())
+        view.job_display_id
+        assert view._full is None
+        assert set(view._values) == {"job_display_id"}
+
+    def test_non_fields_delegate_to_the_full_model(self):
+        raw = _job_payload()
+        view = ModelView(Job, raw)
+        assert view.model_dump() == Job.model_validate(raw).model_dump()
+        assert view == Job.model_validate(raw)
+
+    def test_missing_optional_field_uses_default(self):
+        assert ModelView(Job, {}).job_display_id is None
+
+    def test_field_validators_still_apply(self):
+        assert ModelView(LotDataDto, {"Qty": ""}).qty is None
+
+    def test_read_only(self):
+        with pytest.raises(AttributeError, match="read-only"):
+            ModelView(Job, {}).job_display_id = 1
+
+
+class TestLazyList:
+    def test_items_built_on_access_and_cached(self):
+        rows = LazyList(Job, [{"jobDisplayId": 1}, {"jobDisplayId": 2}])
+        assert rows._views == [None, None]
+        assert rows[1].job_display_id == 2
+        assert rows[1] is rows[1]
+        assert rows._views[0] is None
+        assert [r.job_display_id for r in rows[:1]] == [1]
+
+    def test_to_models(self):
+        models = LazyList(Job, [{"jobDisplayId": 1}]).to_models()
+        assert isinstance(models, list) and isinstance(models[0], Job)
+
+
+class TestEndpointLazyMode:
+    def test_list_responses_become_lazy_lists(self):
+        api = _api()
+        resp = _response([{"id": "US", "name": "United States"}])
+        with patch.object(api._acportal._session, "request", return_value=resp), api.lazy():
+            countries = api.lookup.get_countries()
+        assert isinstance(countries, LazyList)
+        assert countries[0].id == "US"
+        resp.json.assert_not_called()
+
+    def test_pages_keep_lazy_items(self):
+        api = _api()
+        body = {"items": [{"id": 1, "title": "Fall"}], "pageNumber": 1, "totalPages": 1, "totalItems": 1}
+        with patch.object(api._catalog._session, "request", return_value=_response(body)), api.lazy():
+            page = api.catalog.list()
+        assert isinstance(page, PaginatedList)
+        assert isinstance(page.items, LazyList)
+        assert page.items[0].title == "Fall"
+
+    def test_default_mode_unchanged(self):
+        api = _api()
+        with patch.object(api._acportal._session, "request", return_value=_response([{"id": "US"}])):
+            assert isinstance(api.lookup.get_countries(), list)
+
+    def test_batch_calls_inherit_the_mode(self):
+        api = _api()
+        def reply(*args, **kwargs):
+            return _response({"jobDisplayId": 7})
+
+        with patch.object(api._acportal._session, "request", side_effect=reply):
+            with api.lazy(), api.batch(max_workers=2) as batch:
+                jobs = batch.map(api.jobs.get, [7, 7])
+        assert all(isinstance(j, ModelView) for j in jobs)
@@ -0,0 +1,98 @@
+"""Unit tests for paginate() prefetching and iter_items()."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from ab.api.lazy import lazy_enabled, lazy_responses
+from ab.api.models.shared import PaginatedList
+from ab.api.pagination import iter_items, paginate
+
+
+class _FakeList:
+    """Stands in for ``api.catalog.list``: *total* items, *size* per page."""
+
+    def __init__(self, total: int, size: int, delay: float = 0.0) -> None:
+        self.total = total
+        self.size = size
+        self.delay = delay
+        self.calls: list[int] = []
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def __call__(self, *, page_number: int, page_size: int | None = None) -> PaginatedList:
+        with self._lock:
+            self.calls.append(page_number)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        pages = -(-self.total // self.size)
+        start = (page_number - 1) * self.size
+        items = list(range(start, min(start + self.size, self.total)))
+        return PaginatedList(
+            items=items,
+            page_number=page_number,
+            total_pages=pages,
+            total_items=self.total,
+            has_previous_page=page_number > 1,
+            has_next_page=page_number < pages,
+        )
+
+
+class TestPaginate:
+    def test_sequential_default(self):
+        fake = _FakeList(total=25, size=10)
+        pages = list(paginate(fake))
+        assert [p.page_number for p in pages] == [1, 2, 3]
+        assert fake.peak == 1
+
+    def test_prefetch_yields_in_order_with_bounded_window(self):
+        fake = _FakeList(total=100, size=10, delay=0.01)
+        pages = list(paginate(fake, prefetch=3))
+        assert [p.page_number for p in pages] == list(range(1, 11))
+        assert sorted(fake.calls) == list(range(1, 11))
+        assert 1 < fake.peak <= 3
+
+    def test_prefetch_honours_start_page_and_filters(self):
+        fake = _FakeList(total=50, size=10)
+        pages = list(paginate(fake, prefetch=2, page_number=3, page_size=10))
+        assert [p.page_number for p in pages] == [3, 4, 5]
+
+    def test_prefetched_pages_inherit_the_callers_mode(self):
+        fake = _FakeList(total=40, size=10)
+        modes = []
+
+        def list_fn(**kwargs):
+            modes.append(lazy_enabled())
+            return fake(**kwargs)
+
+        with lazy_responses():
+            pages = list(paginate(list_fn, prefetch=2))
+        assert len(pages) == 4
+        assert modes == [True, True, True, True]
+
+    def test_negative_prefetch_rejected(self):
+        with pytest.raises(ValueError):
+            list(paginate(_FakeList(total=1, size=1), prefetch=-1))
+
+
+class TestIterItems:
+    def test_flattens_pages(self):
+        assert list(iter_items(_FakeList(total=23, size=5), prefetch=2)) == list(range(23))
+
+    def test_checkpoint_and_resume(self):
+        completed: list[int] = []
+        stream = iter_items(_FakeList(total=30, size=10), on_page=completed.append)
+        consumed = [next(stream) for _ in range(15)]
+        assert consumed == list(range(15))
+        assert completed == [1]  # page 2 only partly consumed
+        stream.close()
+
+        resumed = list(iter_items(_FakeList(total=30, size=10), page_number=completed[-1] + 1))
+        assert resumed == list(range(10, 30))
@@ -0,0 +1,153 @@
+"""Unit tests for the adaptive per-surface RateLimiter."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ab.auth.base import Token, TokenStorage
+from ab.config import ABConnectSettings
+from ab.exceptions import RequestError
+from ab.http import HttpClient
+from ab.ratelimit import RateLimiter, jittered, parse_retry_after
+
+
+class _Storage(TokenStorage):
+    def get_token(self):
+        return Token(access_token="t", expires_at=time.time() + 3600)
+
+    def save_token(self, token):
+        pass
+
+    def clear_token(self):
+        pass
+
+
+def _client(limiter: RateLimiter) -> HttpClient:
+    env = {"ABCONNECT_CLIENT_ID": "c", "ABCONNECT_CLIENT_SECRET": "s"}
+    with patch.dict(os.environ, env, clear=True):
+        settings = ABConnectSettings(require_credentials=False)
+    return HttpClient("https://example.com/api", settings, _Storage(), rate_limiter=limiter)
+
+
+def _resp(status: int, headers: dict | None = None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = {"Content-Type": "application/json", **(headers or {})}
+    resp.content = b"{}"
+    resp.text = "{}"
+    resp.json.return_value = {}
+    return resp
+
+
+class TestParseRetryAfter:
+    def test_delta_seconds(self):
+        assert parse_retry_after("12") == 12.0
+
+    def test_http_date(self):
+        from email.utils import formatdate
+
+        assert 0 < parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+
+    def test_garbage(self):
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestRateLimiter:
+    def test_burst_then_paced(self):
+        limiter = RateLimiter(rate=10, burst=2)
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+        assert limiter.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_throttle_halves_rate_and_success_recovers(self):
+        limiter = RateLimiter(rate=10)
+        limiter.on_throttled()
+        assert limiter.rate == 5
+        for _ in range(100):
+            limiter.on_success()
+        assert limiter.rate == 10
+
+    def test_retry_after_pauses_unlimited_surface(self):
+        limiter = RateLimiter()
+        assert limiter.reserve() == 0
+        limiter.on_throttled(retry_after=2)
+        assert 1.9 < limiter.reserve() <= 2.3
+
+    def test_unlimited_surface_seeds_rate_from_observed_throughput(self):
+        limiter = RateLimiter()
+        for _ in range(20):
+            limiter.reserve()
+        limiter.on_throttled()
+        assert limiter.rate == 10  # 20 req in under a second, halved
+        for _ in range(100):
+            limiter.on_success()
+        assert limiter.rate == 20
+        limiter.on_throttled()
+        assert limiter.rate == 10
+
+    def test_success_checks_state_under_the_lock(self):
+        limiter = RateLimiter()
+        with limiter._lock:
+            worker = threading.Thread(target=limiter.on_success)
+            worker.start()
+            worker.join(0.05)
+            # A 429 seeds and halves the rate while on_success waits for the lock.
+            limiter._seed_rate()
+            limiter._rate = limiter._max_rate / 2
+        worker.join()
+        assert limiter.rate > limiter._max_rate / 2
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+    def test_jitter_bounds(self):
+        for _ in range(50):
+            assert 5 <= jittered(10) <= 10
+
+
+class TestHttpClientIntegration:
+    def test_429_with_retry_after_waits_via_limiter(self):
+        limiter = RateLimiter(rate=100)
+        client = _client(limiter)
+        with patch.object(client._session, "request", side_effect=[_resp(429, {"Retry-After": "3"}), _resp(200)]), \
+             patch("ab.http.time.sleep") as mock_sleep, \
+             patch("ab.ratelimit.time.sleep") as limiter_sleep:
+            assert client.request("GET", "/x") == {}
+        mock_sleep.assert_not_called()
+        waited = limiter_sleep.call_args.args[0]
+        assert 2.9 < waited <= 3.4
+        assert limiter.rate < 100
+
+    def test_429_without_retry_after_uses_jittered_backoff(self):
+        client = _client(RateLimiter())
+        with patch.object(client._session, "request", side_effect=[_resp(429), _resp(200)]), \
+             patch("ab.http.time.sleep") as mock_sleep:
+            client.request("GET", "/x")
+        assert 1 <= mock_sleep.call_args.args[0] <= 2
+
+    def test_only_2xx_responses_recover_the_rate(self):
+        limiter = RateLimiter(rate=10)
+        limiter.on_throttled()
+        client = _client(limiter)
+        with patch.object(client._session, "request", return_value=_resp(404)):
+            with pytest.raises(RequestError):
+                client.request("GET", "/x")
+        assert limiter.rate == 5
+        with patch.object(client._session, "request", return_value=_resp(200)):
+            client.request("GET", "/x")
+        assert limiter.rate > 5
+
+    def test_settings_rate_limit_per_surface(self):
+        env = {"ABCONNECT_CLIENT_ID": "c", "ABCONNECT_CLIENT_SECRET": "s", "ABCONNECT_ACPORTAL_RATE_LIMIT": "25"}
+        with patch.dict(os.environ, env, clear=True):
+            settings = ABConnectSettings(require_credentials=False)
+        assert settings.rate_limit_for("acportal") == 25.0
+        assert settings.rate_limit_for("abc") is None
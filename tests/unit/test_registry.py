@@ -0,0 +1,95 @@
+"""Unit tests for ab.api.registry and the manifest it is cached in."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from ab import manifest
+from ab.api.endpoints.jobs import JobsEndpoint
+from ab.api.registry import RouteRegistry, class_key, load_class, normalize_path, registry, scan_class
+from ab.api.route import Route
+
+
+class TestLookups:
+    def test_route_for_group_method(self):
+        route = registry.route_for("jobs", "get")
+        assert route == Route("GET", "/job/{jobDisplayId}", response_model="Job")
+        assert registry.route_for("jobs", "get_timeline") is None
+        assert registry.route_for("no_such_group", "get") is None
+
+    def test_lookup_ignores_placeholder_names(self):
+        routes = registry.lookup("get", "/job/{id}")
+        assert Route("GET", "/job/{jobDisplayId}", response_model="Job") in routes
+        assert registry.lookup("GET", "/no/such/path") == []
+
+    def test_group_for(self):
+        assert registry.group_for("GET", "/job/{x}") == "jobs"
+
+    def test_subgroups_follow_their_parent(self):
+        groups = list(registry.groups())
+        subgroups = [name for name in groups if name.startswith("jobs.")]
+        assert subgroups
+        assert groups.index("jobs") < min(groups.index(name) for name in subgroups)
+
+    def test_groups_name_importable_classes(self):
+        assert load_class(registry.groups()["jobs"]) is JobsEndpoint
+        assert class_key(JobsEndpoint) == f"{JobsEndpoint.__module__}:JobsEndpoint"
+
+    def test_matches_source_scan(self):
+        assert registry.routes_for_class(JobsEndpoint) == scan_class(JobsEndpoint)
+        assert registry.methods("jobs") == scan_class(JobsEndpoint)
+
+    def test_constant_lookup(self):
+        from ab.api.endpoints.jobs import _main
+
+        assert registry.constant(_main.__name__, "_GET") == _main._GET
+
+    def test_normalize_path(self):
+        assert normalize_path("/companies/{companyId}/details") == "/companies/{_}/details"
+
+
+class TestManifest:
+    @pytest.fixture
+    def manifest_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ABCONNECT_MANIFEST_DIR", str(tmp_path))
+        return tmp_path
+
+    def test_round_trip(self, manifest_dir):
+        built = RouteRegistry()
+        assert built.route_for("jobs", "get") is not None
+        (path,) = manifest_dir.glob("routes-*.json")
+        assert json.loads(path.read_text())["version"] == manifest.package_version()
+
+        cached = RouteRegistry()
+        assert cached.to_manifest() == built.to_manifest()
+        assert cached.routes() == built.routes()
+        assert cached.groups() == built.groups()
+
+    def test_data_argument_skips_disk(self, manifest_dir):
+        data = RouteRegistry(use_manifest=False).to_manifest()
+        assert not list(manifest_dir.iterdir())
+        assert RouteRegistry(data, use_manifest=False).methods("jobs") == registry.methods("jobs")
+
+    def test_stale_fingerprint_is_ignored(self, manifest_dir):
+        manifest.store("routes", {"routes": [], "classes": {}, "groups": []})
+        assert manifest.load("routes") is not None
+        path = next(manifest_dir.glob("routes-*.json"))
+        payload = json.loads(path.read_text())
+        payload["fingerprint"] = "stale"
+        path.write_text(json.dumps(payload))
+        assert manifest.load("routes") is None
+        assert RouteRegistry().route_for("jobs", "get") is not None
+
+    def test_off_disables_cache(self, monkeypatch):
+        monkeypatch.setenv("ABCONNECT_MANIFEST_DIR", "off")
+        assert manifest.manifest_dir() is None
+        assert manifest.store("routes", {}) is None
+        assert manifest.load("routes") is None
+
+    def test_reset_reloads(self, manifest_dir):
+        reg = RouteRegistry()
+        first = reg.routes()
+        reg.reset()
+        assert reg.routes() == first
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import pytest
 
-from ab.api.route import Route
+from ab.api.route import _BOUND_CACHE_SIZE, Route
+from ab.exceptions import ValidationError
 
 
 class TestRoute:
@@ -44,3 +45,37 @@ class TestRoute:
         r = Route("GET", "/test", response_model="CompanySimple")
         assert r.response_model == "CompanySimple"
         assert isinstance(r.response_model, str)
+
+    def test_bind_url_encodes_values(self):
+        r = Route("GET", "/documents/get/{docPath}")
+        assert r.bind(docPath="job 1/a?b#c.pdf").path == "/documents/get/job%201/a%3Fb%23c.pdf"
+        assert r.bind(docPath="job/file%20name.pdf").path == "/documents/get/job/file%20name.pdf"
+
+    def test_bind_rejects_missing_none_and_unknown_params(self):
+        r = Route("GET", "/companies/{companyId}/contacts/{contactId}")
+        with pytest.raises(ValidationError, match="missing: contactId"):
+            r.bind(companyId="c1")
+        with pytest.raises(ValidationError, match="None: contactId"):
+            r.bind(companyId="c1", contactId=None)
+        with pytest.raises(ValidationError, match="unknown: extra"):
+            r.bind(companyId="c1", contactId="c2", extra="x")
+
+    def test_bound_routes_are_memoised(self):
+        r = Route("GET", "/job/{jobDisplayId}")
+        assert r.bind(jobDisplayId=1) is r.bind(jobDisplayId=1)
+        assert r.bind(jobDisplayId=1) is not r.bind(jobDisplayId=2)
+        assert r.bind(jobDisplayId=1) == Route("GET", "/job/1")
+
+    def test_memo_distinguishes_equal_values_of_other_types(self):
+        r = Route("GET", "/job/{jobDisplayId}")
+        assert r.bind(jobDisplayId=True).path == "/job/True"
+        assert r.bind(jobDisplayId=1.0).path == "/job/1.0"
+        assert r.bind(jobDisplayId=1).path == "/job/1"
+
+    def test_bound_route_cache_is_bounded(self):
+        r = Route("GET", "/job/{jobDisplayId}")
+        first = r.bind(jobDisplayId=0)
+        for i in range(1, _BOUND_CACHE_SIZE + 1):
+            r.bind(jobDisplayId=i)
+        assert len(r._bound) == _BOUND_CACHE_SIZE
+        assert r.bind(jobDisplayId=0) is not first
@@ -0,0 +1,119 @@
+"""Unit tests for lazy model loading, ``ab.warmup()``, ``import ab`` and CLI startup time."""
+
+from __future__ import annotations
+
+import ast
+import dataclasses
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+import ab
+import ab.api.models as models_pkg
+from ab.api.base import _response_adapter
+from ab.cli.discovery import discover_endpoints_from_class, endpoints_from_manifest, endpoints_to_manifest
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _import_ab(*flags: str, code: str = "import ab", **env_overrides: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": str(_REPO_ROOT), **env_overrides}
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, env=env, cwd=_REPO_ROOT, check=True
+    )
+
+
+class TestLazyModels:
+    def test_exports_match_type_checking_imports(self):
+        tree = ast.parse(Path(models_pkg.__file__).read_text())
+        imported = {
+            alias.name: node.module.rsplit(".", 1)[1]
+            for node in ast.walk(tree)
+            if isinstance(node, ast.ImportFrom) and node.module and node.module.startswith("ab.api.models.")
+            for alias in node.names
+        }
+        assert imported == models_pkg._EXPORTS
+        assert set(models_pkg.__all__) == set(imported)
+
+    def test_names_resolve_from_their_submodule(self):
+        assert models_pkg.Job.__module__ == "ab.api.models.jobs"
+        assert "Job" in dir(models_pkg)
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError, match="NoSuchModel"):
+            models_pkg.NoSuchModel  # noqa: B018
+
+    def test_import_ab_leaves_domain_models_unloaded(self):
+        code = "import ab, sys; print(' '.join(sorted(m for m in sys.modules if m.startswith('ab.api.models.'))))"
+        loaded = set(_import_ab(code=code).stdout.split())
+        assert {"ab.api.models.jobs", "ab.api.models.companies", "ab.api.models.contacts"}.isdisjoint(loaded)
+
+
+class TestWarmup:
+    def test_builds_every_model_and_route_adapter(self):
+        count = ab.warmup()
+        classes = [c for c in models_pkg.load_all() if isinstance(c, type) and issubclass(c, BaseModel)]
+        assert count == len(classes)
+        assert all(c.__pydantic_complete__ for c in classes)
+        assert _response_adapter.cache_info().currsize > 0
+
+
+class TestImportTime:
+    def test_import_ab_importtime(self, record_property):
+        """Track ``python -X importtime -c "import ab"``; set ABCONNECT_IMPORT_BUDGET_MS to enforce a budget."""
+        lines = _import_ab("-X", "importtime").stderr.splitlines()
+        cumulative = {
+            name.strip(): int(total)
+            for _, total, name in (line.split("|") for line in lines if line.startswith("import time:") and "|" in line)
+            if total.strip().isdigit()
+        }
+        total_ms = cumulative["ab"] / 1000
+        record_property("import_ab_ms", total_ms)
+        assert "ab.api.models.jobs" not in cumulative
+        budget = os.environ.get("ABCONNECT_IMPORT_BUDGET_MS")
+        if budget:
+            assert total_ms <= float(budget), f"import ab took {total_ms:.0f} ms (budget {budget} ms)"
+
+
+def _run_cli(*args: str, manifest_dir: Path) -> tuple[float, set[str]]:
+    """Run ``ab <args>``; return its wall time in ms and the ``ab.*``/pydantic modules it imported."""
+    code = f"import sys; sys.argv = ['ab', *{list(args)!r}]; from ab.cli import main_prod; main_prod()"
+    start = time.perf_counter()
+    lines = _import_ab("-X", "importtime", code=code, ABCONNECT_MANIFEST_DIR=str(manifest_dir)).stderr.splitlines()
+    elapsed = (time.perf_counter() - start) * 1e3
+    names = {line.rsplit("|", 1)[1].strip() for line in lines if line.startswith("import time:") and "|" in line}
+    return elapsed, {name for name in names if name.startswith(("ab.", "pydantic"))}
+
+
+class TestCliStartup:
+    def test_manifest_round_trip_matches_discovery(self):
+        def plain(endpoints):
+            out = {}
+            for name, info in endpoints.items():
+                data = dataclasses.asdict(info)
+                del data["endpoint_class"]
+                for method in data["methods"]:
+                    del method["callable"]
+                out[name] = data
+            return out
+
+        live = discover_endpoints_from_class()
+        cached = endpoints_from_manifest(json.loads(json.dumps(endpoints_to_manifest(live))))
+        assert plain(cached) == plain(live)
+
+    @pytest.mark.parametrize("args", [("--list",), ("jobs", "--list"), ("jobs", "note", "--help")])
+    def test_listing_imports_no_endpoint_modules(self, args, tmp_path, record_property):
+        """Benchmark ``ab`` listings; set ABCONNECT_CLI_BUDGET_MS to enforce a wall-time budget."""
+        _run_cli(*args, manifest_dir=tmp_path)  # builds the manifest
+        elapsed, imported = _run_cli(*args, manifest_dir=tmp_path)
+        record_property(f"ab_{'_'.join(a.strip('-') for a in args)}_ms", elapsed)
+        assert not {m for m in imported if m.startswith(("ab.api.endpoints", "ab.client", "pydantic"))}
+        budget = os.environ.get("ABCONNECT_CLI_BUDGET_MS")
+        if budget:
+            assert elapsed <= float(budget), f"ab {' '.join(args)} took {elapsed:.0f} ms (budget {budget} ms)"
@@ -0,0 +1,168 @@
+"""Unit tests for streamed list responses (ab.api.streaming)."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from ab import ABConnectAPI
+from ab.api.lazy import ModelView
+from ab.api.models.users import User
+from ab.api.streaming import ItemStream, iter_array_items
+from ab.auth import MemoryTokenStorage
+from ab.auth.base import Token
+from ab.exceptions import RequestError
+
+_ENV = {"ABCONNECT_CLIENT_ID": "cid", "ABCONNECT_CLIENT_SECRET": "secret"}
+_USERS = [{"id": f"u{i}", "username": f"User \"{i}\" [x], {{y}}"} for i in range(25)]
+
+
+def _api() -> ABConnectAPI:
+    storage = MemoryTokenStorage(Token(access_token="tok", expires_at=time.time() + 3600))
+    with patch.dict(os.environ, _ENV, clear=True):
+        return ABConnectAPI(token_storage=storage)
+
+
+class _Raw(io.BytesIO):
+    """A response body that arrives *size* bytes at a time."""
+
+    def __init__(self, body: bytes, size: int) -> None:
+        super().__init__(body)
+        self._size = size
+
+    def read(self, n: int = -1, **kwargs) -> bytes:
+        return super().read(min(n, self._size) if n and n > 0 else self._size)
+
+
+def _response(body: bytes, status: int = 200, size: int = 7) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers["Content-Type"] = "application/json"
+    resp.raw = _Raw(body, size)
+    return resp
+
+
+def _chunks(body: bytes, size: int):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 10_000])
+def test_elements_survive_any_chunk_boundary(size):
+    data = [{"a": i, "s": 'q"[{,}]\\'} for i in range(10)] + [None, 1.5, "x"]
+    body = json.dumps({"modifiedDate": "2026-01-01", "meta": {"n": [0]}, "items": data}).encode()
+    assert [json.loads(raw) for raw in iter_array_items(_chunks(body, size))] == data
+
+
+@pytest.mark.parametrize("body", [b"[1,,2]", b"[1,]", b'[{"a": 1}', b'{"items": [1, 2'])
+def test_malformed_or_truncated_body_raises(body):
+    with pytest.raises(RequestError, match="not valid JSON"):
+        list(iter_array_items(_chunks(body, 2)))
+
+
+def test_list_route_yields_validated_models_one_at_a_time():
+    api = _api()
+    resp = _response(json.dumps(_USERS).encode())
+    with patch.object(api._acportal._session, "request", return_value=resp) as send, api.streaming():
+        users = api.users.list(data={"page": 1, "pageSize": 25})
+    assert isinstance(users, ItemStream)
+    assert send.call_args.kwargs["stream"] is True
+    first = next(users)
+    assert isinstance(first, User) and first.username == _USERS[0]["username"]
+    assert resp.raw.tell() < len(resp.raw.getvalue())  # the rest is still unread
+    assert [u.id for u in users] == [u["id"] for u in _USERS[1:]]
+    assert resp.raw.closed
+
+
+def test_items_wrapper_is_unwrapped():
+    api = _api()
+    body = json.dumps({"modifiedDate": "2026-01-01", "items": _USERS[:3]}).encode()
+    with patch.object(api._acportal._session, "request", return_value=_response(body)), api.streaming():
+        assert [u.id for u in api.users.list(data={})] == ["u0", "u1", "u2"]
+
+
+def test_wrapper_streams_the_first_array_not_the_model_named_one(caplog):
+    # Documented difference from the whole-body path, which would pick "users".
+    body = json.dumps({"tags": [{"id": "t0"}], "users": _USERS[:2]}).encode()
+    api = _api()
+    with patch.object(api._acportal._session, "request", return_value=_response(body)):
+        assert [u.id for u in api.users.list(data={})] == ["u0", "u1"]
+        with api.streaming():
+            assert [u.id for u in api.users.list(data={})] == ["t0"]
+    assert "unwrapped from key 'tags'" in caplog.text
+
+
+def test_closing_early_releases_the_connection():
+    api = _api()
+    resp = _response(json.dumps(_USERS).encode())
+    with patch.object(api._acportal._session, "request", return_value=resp), api.streaming():
+        users = api.users.list(data={})
+    with users:
+        next(users)
+    assert resp.raw.closed
+
+
+def test_lazy_and_streaming_yield_views():
+    api = _api()
+    with patch.object(api._acportal._session, "request", return_value=_response(json.dumps(_USERS).encode())):
+        with api.streaming(), api.lazy():
+            users = list(api.users.list(data={}))
+    assert all(isinstance(u, ModelView) for u in users)
+    assert users[3].id == "u3"
+
+
+def test_error_status_raises_before_streaming():
+    api = _api()
+    with patch.object(api._acportal._session, "request", return_value=_response(b'{"message": "no"}', status=400)):
+        with api.streaming(), pytest.raises(RequestError) as info:
+            api.users.list(data={})
+    assert info.value.status_code == 400
+
+
+def test_passthrough_lists_are_unaffected():
+    api = _api()
+    resp = _response(json.dumps(["Admin", "Agent"]).encode())
+    with patch.object(api._acportal._session, "request", return_value=resp) as send, api.streaming():
+        assert api.users.get_roles() == ["Admin", "Agent"]
+    assert send.call_args.kwargs["stream"] is False
+
+
+def test_async_client_streams_with_async_for():
+    httpx = pytest.importorskip("httpx")
+    from ab import AsyncABConnectAPI
+
+    storage = MemoryTokenStorage(Token(access_token="tok", expires_at=time.time() + 3600))
+    with patch.dict(os.environ, _ENV, clear=True):
+        api = AsyncABConnectAPI(token_storage=storage)
+    body = json.dumps({"items": _USERS}).encode()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    api._acportal._async_session = httpx.AsyncClient(transport=transport)
+
+    async def run():
+        async with api:
+            with api.streaming():
+                users = await api.users.list(data={})
+            return [u.id async for u in users]
+
+    assert asyncio.run(run()) == [u["id"] for u in _USERS]
+
+
+def test_internal_list_calls_are_not_streamed():
+    api = _api()
+    plans = [
+        {"jobShipmentID": "del-1", "transportType": "Delivery"},
+        {"jobShipmentID": "ltl-1", "transportType": "LTL"},
+    ]
+    pdf = _response(b"%PDF-1.4")
+    pdf.headers["Content-Type"] = "application/pdf"
+    replies = [_response(json.dumps(plans).encode()), pdf]
+    with patch.object(api._acportal._session, "request", side_effect=replies) as send, api.streaming():
+        assert api.jobs.form.dbl(100) == {"dbl_100.pdf": b"%PDF-1.4"}
+    assert send.call_args_list[0].kwargs["stream"] is False
+    assert send.call_args_list[1].kwargs["params"] == {"shipmentPlanId": "del-1"}
@@ -0,0 +1,107 @@
+"""Unit tests for the shared, single-flight TokenManager."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from ab import ABConnectAPI
+from ab.auth import MemoryTokenStorage, TokenManager
+from ab.auth.base import Token
+from ab.config import ABConnectSettings
+
+_ENV = {"ABCONNECT_CLIENT_ID": "cid", "ABCONNECT_CLIENT_SECRET": "secret"}
+
+
+def _settings() -> ABConnectSettings:
+    with patch.dict(os.environ, _ENV, clear=True):
+        return ABConnectSettings(require_credentials=False)
+
+
+def _grant_response(access_token: str):
+    resp = MagicMock()
+    resp.ok = True
+    resp.json.return_value = {"access_token": access_token, "refresh_token": "r2", "expires_in": 3600}
+    return resp
+
+
+class TestSingleFlight:
+    def test_concurrent_expired_callers_refresh_once(self):
+        storage = MemoryTokenStorage(Token(access_token="old", refresh_token="r", expires_at=time.time() - 1))
+        manager = TokenManager(_settings(), storage)
+        calls = []
+
+        def slow_post(*args, **kwargs):
+            calls.append(kwargs["data"]["grant_type"])
+            time.sleep(0.05)
+            return _grant_response("new")
+
+        results = []
+        with patch("ab.auth.manager.requests.post", side_effect=slow_post):
+            threads = [threading.Thread(target=lambda: results.append(manager.get_token())) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert calls == ["refresh_token"]
+        assert {t.access_token for t in results} == {"new"}
+
+    def test_surfaces_share_one_manager(self):
+        storage = MemoryTokenStorage(Token(access_token="tok", expires_at=time.time() + 3600))
+        with patch.dict(os.environ, _ENV, clear=True):
+            api = ABConnectAPI(token_storage=storage)
+        assert api._acportal._token_manager is api._catalog._token_manager is api._abc._token_manager
+
+
+class TestRefreshAhead:
+    def test_near_expiry_returns_current_token_and_refreshes_in_background(self):
+        storage = MemoryTokenStorage(Token(access_token="old", refresh_token="r", expires_at=time.time() + 30))
+        manager = TokenManager(_settings(), storage, refresh_ahead=120)
+        released = threading.Event()
+
+        def post(*args, **kwargs):
+            released.wait(1)
+            return _grant_response("new")
+
+        with patch("ab.auth.manager.requests.post", side_effect=post) as mock_post:
+            assert manager.get_token().access_token == "old"
+            assert manager.get_token().access_token == "old"
+            released.set()
+            for _ in range(100):
+                if storage.get_token().access_token == "new":
+                    break
+                time.sleep(0.01)
+
+        assert storage.get_token().access_token == "new"
+        assert mock_post.call_count == 1
+
+    def test_fresh_token_does_not_refresh(self):
+        storage = MemoryTokenStorage(Token(access_token="tok", refresh_token="r", expires_at=time.time() + 3600))
+        manager = TokenManager(_settings(), storage)
+        with patch("ab.auth.manager.requests.post") as mock_post:
+            assert manager.get_token().access_token == "tok"
+        mock_post.assert_not_called()
+
+    def test_session_storage_is_not_refreshed_in_background(self):
+        from ab.auth.session import SessionTokenStorage
+
+        near = Token(access_token="old", refresh_token="r", expires_at=time.time() + 30)
+        request = MagicMock()
+        request.session = {"ab_token": near.as_dict()}
+        manager = TokenManager(_settings(), SessionTokenStorage(request), refresh_ahead=120)
+        with patch("ab.auth.manager.requests.post") as mock_post:
+            assert manager.get_token().access_token == "old"
+        mock_post.assert_not_called()
+        assert manager._lock.acquire(blocking=False)
+
+    def test_background_failure_keeps_current_token(self):
+        storage = MemoryTokenStorage(Token(access_token="old", refresh_token="r", expires_at=time.time() + 30))
+        manager = TokenManager(_settings(), storage)
+        with patch("ab.auth.manager.requests.post", side_effect=ConnectionError("down")):
+            assert manager.get_token().access_token == "old"
+            with manager._lock:  # waits for the background attempt to finish
+                pass
+        assert storage.get_token().access_token == "old"
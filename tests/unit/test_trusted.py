@@ -0,0 +1,161 @@
+"""Unit tests for unvalidated response construction (``api.trusted()``)."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from ab import ABConnectAPI
+from ab.api.lazy import ModelView, _model_in
+from ab.api.models.catalog import CatalogExpandedDto
+from ab.api.models.companies import CompanyDetails
+from ab.api.models.jobs import Job, JobContactDetails
+from ab.api.models.sellers import SellerDto
+from ab.api.models.shared import PaginatedList
+from ab.api.trusted import trusted_validator
+from ab.auth import MemoryTokenStorage
+from ab.auth.base import Token
+
+_ENV = {"ABCONNECT_CLIENT_ID": "cid", "ABCONNECT_CLIENT_SECRET": "secret"}
+_FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+
+
+def _job_payload() -> dict:
+    return json.loads((_FIXTURES / "Job.json").read_text())
+
+
+def _api() -> ABConnectAPI:
+    storage = MemoryTokenStorage(Token(access_token="tok", expires_at=time.time() + 3600))
+    with patch.dict(os.environ, _ENV, clear=True):
+        return ABConnectAPI(token_storage=storage)
+
+
+def _response(payload):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.headers = {"Content-Type": "application/json"}
+    resp.text = json.dumps(payload)
+    resp.content = resp.text.encode()
+    return resp
+
+
+class TestTrustedValidator:
+    def test_nested_models_are_typed_and_scalars_kept_as_sent(self):
+        raw = _job_payload()
+        job, model = trusted_validator(Job).validate_python(raw), Job.model_validate(raw)
+        assert isinstance(job, Job)
+        assert isinstance(job.customer_contact, JobContactDetails)
+        assert job.job_display_id == model.job_display_id
+        assert isinstance(model.modified_date, datetime.datetime)
+        assert job.modified_date == raw["modifiedDate"]  # not parsed
+        assert job.model_fields_set == model.model_fields_set
+        assert job.model_dump(mode="json", warnings=False) == model.model_dump(mode="json")
+
+    def test_nothing_is_checked(self):
+        raw = {"id": "not-an-int", "title": "  Fall  ", "sellers": [{"id": 3, "name": "S"}], "surprise": 1}
+        with pytest.raises(ValidationError):
+            CatalogExpandedDto.model_validate(raw)
+        catalog = trusted_validator(CatalogExpandedDto).validate_python(raw)
+        assert catalog.id == "not-an-int"
+        assert catalog.title == "  Fall  "
+        assert isinstance(catalog.sellers[0], SellerDto)
+        assert catalog.model_extra == {"surprise": 1}
+
+    def test_wrong_shapes_and_missing_fields(self):
+        catalog = trusted_validator(CatalogExpandedDto).validate_python({"sellers": "n/a", "lots": [None]})
+        assert catalog.sellers == "n/a"
+        assert catalog.lots == [None]
+        assert catalog.id is None  # required, but absent
+
+    def test_defaults_are_not_shared(self):
+        first = trusted_validator(PaginatedList).validate_python({})
+        first.items.append(1)
+        assert trusted_validator(PaginatedList).validate_python({}).items == []
+
+    def test_model_classes_are_left_untouched_across_threads(self):
+        def classes(model, seen):
+            if model not in seen:
+                seen.add(model)
+                for info in model.model_fields.values():
+                    kind, target = _model_in(info.annotation)
+                    if kind != "value":
+                        classes(target, seen)
+            return seen
+
+        roots = [Job, CompanyDetails, CatalogExpandedDto]
+        touched = set().union(*(classes(model, set()) for model in roots))
+        for model in touched:
+            model.model_rebuild()
+        trusted_validator.cache_clear()
+        raw, seen_incomplete, done = _job_payload(), set(), threading.Event()
+
+        def incomplete():
+            return {m.__name__ for m in touched if m.__dict__.get("__pydantic_complete__") is not True}
+
+        def watch():
+            while not done.is_set():
+                seen_incomplete.update(incomplete())
+
+        def work(i):
+            if i % 2:
+                trusted_validator(roots[i % len(roots)], ("model", "list", "page")[i % 3])
+            else:
+                Job.model_validate(raw)
+
+        watcher = threading.Thread(target=watch)
+        watcher.start()
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(work, range(48)))
+        finally:
+            done.set()
+            watcher.join()
+        assert seen_incomplete == set()
+        assert incomplete() == set()
+        with pytest.raises(ValidationError):
+            CompanyDetails.model_validate({"id": []})
+
+
+class TestEndpointTrustedMode:
+    def test_list_routes_build_unvalidated_models(self):
+        api = _api()
+        resp = _response([{"id": "US", "name": "United States", "extra": True}])
+        with patch.object(api._acportal._session, "request", return_value=resp), api.trusted():
+            countries = api.lookup.get_countries()
+        assert countries[0].id == "US"
+        assert countries[0].model_extra == {"extra": True}
+        resp.json.assert_not_called()
+
+    def test_pages_hold_constructed_items(self):
+        api = _api()
+        body = {"items": [{"id": "7", "title": "Fall"}], "pageNumber": 1, "totalPages": 1, "totalItems": 1}
+        with patch.object(api._catalog._session, "request", return_value=_response(body)), api.trusted():
+            page = api.catalog.list()
+        assert isinstance(page, PaginatedList)
+        assert isinstance(page.items[0], CatalogExpandedDto)
+        assert page.items[0].id == "7"
+        assert page.total_items == 1
+
+    def test_lazy_takes_precedence(self):
+        api = _api()
+        with patch.object(api._acportal._session, "request", return_value=_response({"jobDisplayId": 7})):
+            with api.trusted(), api.lazy():
+                assert isinstance(api.jobs.get(7), ModelView)
+
+    def test_default_mode_validates(self):
+        api = _api()
+        body = {"id": "7", "startDate": "2026-01-01T00:00:00", "endDate": "2026-01-02T00:00:00", "isCompleted": False}
+        with patch.object(api._catalog._session, "request", return_value=_response(body)):
+            assert api.catalog.get(7).id == 7
+            with api.trusted():
+                assert api.catalog.get(7).id == "7"
+            assert api.catalog.get(7).id == 7  # the class validator is untouched